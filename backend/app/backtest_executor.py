@@ -0,0 +1,304 @@
+"""
+심볼별 백테스트 병렬 실행 엔진
+
+/api/backtests/run 요청의 심볼들을 프로세스 풀로 분산 실행하고,
+완료되는 순서대로 심볼 결과를 비동기 스트림으로 반환합니다.
+데이터 로드와 전략 실행은 CPU 바운드 pandas 작업이므로 이벤트 루프 밖에서 수행됩니다.
+
+- 워커 수: BACKTEST_MAX_WORKERS 환경변수 (기본값: CPU 코어 수)
+- BACKTEST_MAX_WORKERS=1 이면 프로세스 풀 대신 스레드 한 개에서 순차 실행
+- 워커 프로세스는 재사용되므로 각 프로세스의 OHLCV 프레임 캐시도 유지됩니다.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException
+
+from backend.app.data_loader import load_ohlcv_data
+from backend.app.strategies.metrics import TradeArrays
+from backend.app.strategy_factory import StrategyFactory
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolBacktestError(Exception):
+    """
+    워커 프로세스에서 발생한 심볼 백테스트 오류
+
+    HTTPException은 pickle이 불가능하므로 상태 코드와 메시지만 전달합니다.
+    """
+
+    def __init__(self, symbol: str, status_code: int, detail: str):
+        super().__init__(symbol, status_code, detail)
+        self.symbol = symbol
+        self.status_code = status_code
+        self.detail = detail
+
+    def to_http_exception(self) -> HTTPException:
+        return HTTPException(status_code=self.status_code, detail=self.detail)
+
+
+def run_symbol_backtest(
+    run_id: str,
+    strategy_name: str,
+    params: Dict[str, Any],
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    timeframe: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    단일 심볼 백테스트 실행 (워커 프로세스 진입점)
+
+    Args:
+        run_id: 백테스트 실행 ID (로그용)
+        strategy_name: 전략명
+        params: 전략 파라미터
+        symbol: 심볼
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        timeframe: 타임프레임
+
+    Returns:
+        SymbolResult 호환 dict (signals, 지표, performance_curve, samples)
+        데이터가 없으면 None
+
+    Raises:
+        SymbolBacktestError: 데이터 로드 또는 전략 실행 실패
+    """
+    try:
+        strategy = StrategyFactory.create(strategy_name)
+
+        # 데이터 로드
+        data_load_start = time.time()
+        df = load_ohlcv_data(
+            symbols=[symbol],
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        data_load_time = time.time() - data_load_start
+        logger.info(
+            f"[{run_id}] Data loaded for {symbol}: {len(df)} rows, "
+            f"load_time={data_load_time:.2f}s"
+        )
+
+        if df.empty:
+            logger.warning(f"[{run_id}] No data found for {symbol}, skipping")
+            return None
+
+        # 전략 실행
+        strategy_start = time.time()
+        result = strategy.run(df, params)
+        strategy_time = time.time() - strategy_start
+        logger.info(
+            f"[{run_id}] Strategy executed for {symbol}: "
+            f"signals={result.samples}, strategy_time={strategy_time:.2f}s"
+        )
+
+    except HTTPException as e:
+        logger.error(f"[{run_id}] HTTP error for {symbol}: {e.detail}")
+        raise SymbolBacktestError(symbol, e.status_code, str(e.detail))
+    except Exception as e:
+        logger.error(f"[{run_id}] Strategy execution failed for {symbol}: {e}")
+        raise SymbolBacktestError(
+            symbol, 500, f"Strategy execution failed for {symbol}: {str(e)}"
+        )
+
+    # 내부 Signal을 API 신호 dict로 변환 (Step 4 신호 테이블용)
+    signals: List[Dict[str, Any]] = []
+    performance_curve = None
+    trades = result.trades
+    if trades is None and result.signals and result.returns:
+        # 거래 배열을 제공하지 않는 전략은 리스트 결과로 배열 구성
+        count = min(len(result.signals), len(result.returns), len(result.entry_exit_pairs or []))
+        returns = np.asarray(result.returns[:count], dtype=float)
+        pairs = np.asarray(result.entry_exit_pairs[:count], dtype=float).reshape(-1, 2)
+        trades = TradeArrays(
+            signal_indices=np.arange(count),
+            entry_prices=pairs[:, 0],
+            exit_prices=pairs[:, 1],
+            returns=returns,
+            equity=np.cumprod(1.0 + returns / 100.0),
+            drawdown=np.zeros(count),
+        )
+
+    if trades is not None and len(trades) > 0:
+        count = len(trades)
+        timestamps = pd.DatetimeIndex([signal.timestamp for signal in result.signals[:count]])
+        sides = [signal.side.lower() for signal in result.signals[:count]]  # BUY -> buy, SELL -> sell
+
+        signals = [
+            {
+                "symbol": symbol,
+                "type": side,
+                "timestamp": timestamp,  # ISO 8601 형식
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "return_pct": return_pct,  # % -> 소수점
+            }
+            for side, timestamp, entry_price, exit_price, return_pct in zip(
+                sides,
+                [ts.isoformat() for ts in timestamps],
+                trades.entry_prices.tolist(),
+                trades.exit_prices.tolist(),
+                (trades.returns / 100.0).tolist(),
+            )
+        ]
+
+        # Equity Curve (성과곡선) (Phase 3 차트용)
+        performance_curve = [
+            {"timestamp": timestamp, "equity": equity}
+            for timestamp, equity in zip(
+                timestamps.strftime('%Y-%m-%d').tolist(),
+                trades.equity.tolist(),
+            )
+        ]
+
+    return {
+        "symbol": symbol,
+        "signals": signals,
+        "win_rate": result.win_rate,
+        "avg_return": result.avg_return,
+        "max_drawdown": result.max_drawdown,
+        "avg_hold_bars": result.avg_hold_bars,
+        "performance_curve": performance_curve,
+        "samples": result.samples,
+    }
+
+
+class BacktestExecutor:
+    """
+    심볼별 백테스트 실행기 (프로세스 풀 기반)
+
+    풀은 첫 실행 시 생성되어 재사용되며, shutdown()으로 종료합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: 최대 워커 수 (None이면 BACKTEST_MAX_WORKERS 또는 CPU 코어 수)
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("BACKTEST_MAX_WORKERS", os.cpu_count() or 1))
+        self.max_workers = max(1, max_workers)
+        self._pool: Optional[Executor] = None
+
+    def _get_pool(self) -> Optional[Executor]:
+        """프로세스 풀 반환 (워커 1개면 None -> 기본 스레드 실행기 사용)"""
+        if self.max_workers == 1:
+            return None
+        if self._pool is None:
+            # fork는 이벤트 루프/Redis 스레드의 락 상태를 복제하므로 spawn 사용
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Backtest process pool started (max_workers={self.max_workers})")
+        return self._pool
+
+    async def run_symbols(
+        self,
+        run_id: str,
+        strategy_name: str,
+        params: Dict[str, Any],
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        timeframe: str,
+    ) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """
+        심볼별 백테스트를 병렬 실행하고 완료 순서대로 결과 반환
+
+        Args:
+            run_id: 백테스트 실행 ID
+            strategy_name: 전략명
+            params: 전략 파라미터
+            symbols: 심볼 목록
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            timeframe: 타임프레임
+
+        Yields:
+            (요청 내 심볼 인덱스, 심볼 결과 dict 또는 None)
+
+        Raises:
+            SymbolBacktestError: 심볼 하나라도 실패하면 나머지 작업을 취소하고 전달
+        """
+        for index, symbol in enumerate(symbols):
+            logger.info(f"[{run_id}] Queued symbol: {symbol} ({index + 1}/{len(symbols)})")
+
+        calls = [
+            (run_id, strategy_name, params, symbol, start_date, end_date, timeframe)
+            for symbol in symbols
+        ]
+        async for item in self.map_unordered(run_symbol_backtest, calls):
+            yield item
+
+    async def map_unordered(
+        self,
+        fn: Callable[..., Any],
+        calls: List[Tuple[Any, ...]],
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        모듈 수준 함수를 풀에서 병렬 실행하고 완료 순서대로 결과 반환
+
+        Args:
+            fn: 워커에서 실행할 함수 (pickle 가능해야 함)
+            calls: 호출별 위치 인자 튜플 목록
+
+        Yields:
+            (calls 내 인덱스, 함수 반환값)
+
+        Raises:
+            Exception: 호출 하나라도 실패하면 나머지 작업을 취소하고 전달
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+
+        async def _run(index: int, args: Tuple[Any, ...]) -> Tuple[int, Any]:
+            result = await loop.run_in_executor(pool, fn, *args)
+            return index, result
+
+        tasks = [asyncio.ensure_future(_run(i, args)) for i, args in enumerate(calls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("Backtest process pool stopped")
+
+
+# 전역 실행기 인스턴스
+_backtest_executor: Optional[BacktestExecutor] = None
+
+
+def get_backtest_executor() -> BacktestExecutor:
+    """전역 백테스트 실행기 반환"""
+    global _backtest_executor
+    if _backtest_executor is None:
+        _backtest_executor = BacktestExecutor()
+    return _backtest_executor
+
+
+def close_backtest_executor() -> None:
+    """전역 백테스트 실행기 종료"""
+    global _backtest_executor
+    if _backtest_executor is not None:
+        _backtest_executor.shutdown()
+        _backtest_executor = None
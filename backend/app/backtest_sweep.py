@@ -0,0 +1,327 @@
+"""
+파라미터 스윕 (그리드 서치) 백테스트
+
+하나의 전략에 대해 파라미터 그리드의 모든 조합을 실행하고 순위표를 반환합니다.
+
+- 조합은 심볼별로 청크로 나뉘어 BacktestExecutor의 프로세스 풀에서 실행됩니다.
+- 각 청크는 심볼 데이터를 한 번만 로드하고, 청크 내 조합끼리 전략의 중간 시리즈
+  (예: vol_ma_window별 거래량 이동평균, 매물대 저항선 배열)를 공유합니다.
+- 같은 중간 시리즈를 쓰는 조합이 같은 청크에 모이도록 전략의 SWEEP_SHARED_PARAMS로
+  조합을 그룹화합니다.
+- 최대 조합 수: SWEEP_MAX_COMBINATIONS 환경변수 (기본값: 1000)
+"""
+
+import os
+import time
+import inspect
+import logging
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from backend.app.backtest_executor import BacktestExecutor, SymbolBacktestError
+from backend.app.data_loader import load_ohlcv_data
+from backend.app.strategy_factory import StrategyFactory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_COMBINATIONS = 1000
+
+# 순위 지표 -> 내림차순 여부 (max_drawdown은 작을수록 좋음)
+RANK_METRICS: Dict[str, bool] = {
+    "avg_return": True,
+    "win_rate": True,
+    "total_signals": True,
+    "max_drawdown": False,
+}
+
+
+def get_max_combinations() -> int:
+    """허용되는 최대 조합 수"""
+    return int(os.getenv("SWEEP_MAX_COMBINATIONS", DEFAULT_MAX_COMBINATIONS))
+
+
+def expand_param_grid(
+    base_params: Dict[str, Any],
+    param_grid: Dict[str, List[Any]],
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 그리드를 조합 목록으로 전개
+
+    Args:
+        base_params: 모든 조합에 공통으로 적용할 파라미터
+        param_grid: 파라미터명 -> 후보값 목록
+
+    Returns:
+        List[Dict[str, Any]]: 조합별 전략 파라미터 (마지막 키가 가장 빠르게 변함)
+
+    Raises:
+        ValueError: 빈 그리드 또는 빈 후보값 목록
+    """
+    if not param_grid:
+        raise ValueError("param_grid must not be empty")
+
+    keys = list(param_grid.keys())
+    for key in keys:
+        if not isinstance(param_grid[key], list) or len(param_grid[key]) == 0:
+            raise ValueError(f"param_grid['{key}'] must be a non-empty list")
+
+    return [
+        {**base_params, **dict(zip(keys, values))}
+        for values in itertools.product(*(param_grid[key] for key in keys))
+    ]
+
+
+def _chunk_combinations(
+    strategy_name: str,
+    combinations: List[Dict[str, Any]],
+    num_chunks: int,
+) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """
+    중간 시리즈를 공유하는 조합끼리 모아 청크로 분할
+
+    Args:
+        strategy_name: 전략명 (SWEEP_SHARED_PARAMS 조회용)
+        combinations: 조합 목록
+        num_chunks: 목표 청크 수
+
+    Returns:
+        List[List[Tuple[int, Dict]]]: (조합 인덱스, 파라미터) 청크 목록
+    """
+    shared_params = StrategyFactory.create(strategy_name).SWEEP_SHARED_PARAMS
+
+    groups: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+    for index, params in enumerate(combinations):
+        group_key = repr([params.get(name) for name in shared_params])
+        groups.setdefault(group_key, []).append((index, params))
+
+    ordered = [item for group in groups.values() for item in group]
+    num_chunks = max(1, min(num_chunks, len(ordered)))
+    chunk_size = -(-len(ordered) // num_chunks)
+
+    return [ordered[i:i + chunk_size] for i in range(0, len(ordered), chunk_size)]
+
+
+def run_sweep_chunk(
+    run_id: str,
+    strategy_name: str,
+    combinations: List[Tuple[int, Dict[str, Any]]],
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    timeframe: str,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    한 심볼에 대해 조합 청크 실행 (워커 프로세스 진입점)
+
+    Args:
+        run_id: 스윕 실행 ID (로그용)
+        strategy_name: 전략명
+        combinations: (조합 인덱스, 전략 파라미터) 목록
+        symbol: 심볼
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        timeframe: 타임프레임
+
+    Returns:
+        조합별 지표 dict 목록 (index, samples, win_rate, avg_return, max_drawdown, error)
+        데이터가 없으면 None
+
+    Raises:
+        SymbolBacktestError: 데이터 로드 실패
+    """
+    try:
+        strategy = StrategyFactory.create(strategy_name)
+        df = load_ohlcv_data(
+            symbols=[symbol],
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except HTTPException as e:
+        logger.error(f"[{run_id}] HTTP error for {symbol}: {e.detail}")
+        raise SymbolBacktestError(symbol, e.status_code, str(e.detail))
+
+    if df.empty:
+        logger.warning(f"[{run_id}] No data found for {symbol}, skipping")
+        return None
+
+    # 같은 df에 대한 중간 시리즈를 청크 내 조합끼리 공유
+    cache: Optional[Dict] = None
+    if "cache" in inspect.signature(strategy.run).parameters:
+        cache = {}
+
+    chunk_start = time.time()
+    rows: List[Dict[str, Any]] = []
+    for index, params in combinations:
+        try:
+            if cache is not None:
+                result = strategy.run(df, params, cache=cache)
+            else:
+                result = strategy.run(df, params)
+        except ValueError as e:
+            # 잘못된 조합은 순위표에서 오류로 표시하고 계속 진행
+            rows.append({"index": index, "error": str(e)})
+            continue
+
+        rows.append({
+            "index": index,
+            "samples": result.samples,
+            "win_rate": result.win_rate,
+            "avg_return": result.avg_return,
+            "max_drawdown": result.max_drawdown,
+            "error": None,
+        })
+
+    logger.info(
+        f"[{run_id}] Sweep chunk for {symbol}: combinations={len(combinations)}, "
+        f"time={time.time() - chunk_start:.2f}s"
+    )
+    return rows
+
+
+def rank_sweep_results(
+    combinations: List[Dict[str, Any]],
+    chunk_results: List[List[Dict[str, Any]]],
+    rank_by: str = "avg_return",
+    top_n: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    심볼별 청크 결과를 조합 단위로 합산하여 순위표 생성
+
+    win_rate, avg_return은 심볼별 신호 수로 가중 평균하고,
+    max_drawdown은 심볼 중 최댓값을 사용합니다.
+    오류가 있는 조합과 신호가 없는 조합은 뒤로 정렬됩니다.
+
+    Args:
+        combinations: 조합 목록 (expand_param_grid 결과)
+        chunk_results: run_sweep_chunk 결과 목록 (None 제외)
+        rank_by: 순위 지표 (RANK_METRICS 키)
+        top_n: 상위 N개만 반환 (None이면 전체)
+
+    Returns:
+        List[Dict[str, Any]]: rank, params, total_signals, win_rate, avg_return,
+            max_drawdown, symbols_with_signals, error
+    """
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"Unsupported rank_by: {rank_by}. Supported: {list(RANK_METRICS)}")
+
+    totals = [
+        {"signals": 0, "wins": 0.0, "returns": 0.0, "max_drawdown": 0.0, "symbols": 0, "error": None}
+        for _ in combinations
+    ]
+    for rows in chunk_results:
+        for row in rows:
+            total = totals[row["index"]]
+            if row["error"] is not None:
+                total["error"] = row["error"]
+                continue
+            samples = row["samples"]
+            if samples == 0:
+                continue
+            total["signals"] += samples
+            total["wins"] += row["win_rate"] * samples
+            total["returns"] += row["avg_return"] * samples
+            total["max_drawdown"] = max(total["max_drawdown"], row["max_drawdown"])
+            total["symbols"] += 1
+
+    table = []
+    for params, total in zip(combinations, totals):
+        signals = total["signals"]
+        table.append({
+            "params": params,
+            "total_signals": signals,
+            "win_rate": total["wins"] / signals if signals else 0.0,
+            "avg_return": total["returns"] / signals if signals else 0.0,
+            "max_drawdown": total["max_drawdown"],
+            "symbols_with_signals": total["symbols"],
+            "error": total["error"],
+        })
+
+    descending = RANK_METRICS[rank_by]
+
+    def sort_key(row: Dict[str, Any]) -> Tuple[int, float]:
+        invalid = row["error"] is not None or row["total_signals"] == 0
+        value = row[rank_by]
+        return (1 if invalid else 0, -value if descending else value)
+
+    table.sort(key=sort_key)  # 동률은 그리드 순서 유지
+    for rank, row in enumerate(table, start=1):
+        row["rank"] = rank
+
+    return table[:top_n] if top_n is not None else table
+
+
+async def run_parameter_sweep(
+    executor: BacktestExecutor,
+    run_id: str,
+    strategy_name: str,
+    base_params: Dict[str, Any],
+    param_grid: Dict[str, List[Any]],
+    symbols: List[str],
+    start_date: str,
+    end_date: str,
+    timeframe: str,
+    rank_by: str = "avg_return",
+    top_n: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    파라미터 스윕 실행
+
+    Args:
+        executor: 백테스트 실행기 (프로세스 풀)
+        run_id: 스윕 실행 ID
+        strategy_name: 전략명
+        base_params: 공통 파라미터
+        param_grid: 파라미터 그리드
+        symbols: 심볼 목록
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        timeframe: 타임프레임
+        rank_by: 순위 지표
+        top_n: 상위 N개만 반환
+
+    Returns:
+        Dict[str, Any]: total_combinations, symbols_processed, results(순위표)
+
+    Raises:
+        ValueError: 그리드/순위 지표 오류 또는 최대 조합 수 초과
+        SymbolBacktestError: 심볼 데이터 로드 실패
+    """
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"Unsupported rank_by: {rank_by}. Supported: {list(RANK_METRICS)}")
+
+    combinations = expand_param_grid(base_params, param_grid)
+    max_combinations = get_max_combinations()
+    if len(combinations) > max_combinations:
+        raise ValueError(
+            f"Too many parameter combinations: {len(combinations)} (max: {max_combinations})"
+        )
+
+    # 워커 수만큼 작업이 생기도록 심볼별 청크 수 결정
+    chunks_per_symbol = max(1, -(-executor.max_workers // len(symbols)))
+    chunks = _chunk_combinations(strategy_name, combinations, chunks_per_symbol)
+
+    calls = [
+        (run_id, strategy_name, chunk, symbol, start_date, end_date, timeframe)
+        for symbol in symbols
+        for chunk in chunks
+    ]
+    logger.info(
+        f"[{run_id}] Parameter sweep: strategy={strategy_name}, "
+        f"combinations={len(combinations)}, symbols={len(symbols)}, tasks={len(calls)}"
+    )
+
+    chunk_results: List[List[Dict[str, Any]]] = []
+    processed_symbols = set()
+    async for index, rows in executor.map_unordered(run_sweep_chunk, calls):
+        if rows is not None:
+            chunk_results.append(rows)
+            processed_symbols.add(calls[index][3])
+
+    return {
+        "total_combinations": len(combinations),
+        "symbols_processed": len(processed_symbols),
+        "results": rank_sweep_results(combinations, chunk_results, rank_by, top_n),
+    }
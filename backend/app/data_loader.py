@@ -8,6 +8,16 @@
 - 입력 타임스탬프는 KST로 간주되며, 내부 처리는 UTC로 통일
 - symbol, timeframe이 파일 경로에만 포함된 경우, DataFrame에 주입
 - 필수 컬럼 검증: open, high, low, close, volume, timestamp
+
+로더 모드 (DATA_LOADER_MODE 환경변수 또는 mode 인자):
+- 'pandas': 연도 파일 전체를 pd.read_parquet으로 읽은 뒤 pandas에서 기간 필터링 (기본값)
+- 'dataset': pyarrow.dataset으로 기간 필터와 OHLCV 컬럼을 row group 단위로 푸시다운
+
+'pandas' 모드에서는 정규화된 연도 프레임을 프로세스 전역 LRU 캐시(ohlcv_cache)에
+보관하므로, 같은 심볼을 반복 조회하는 파라미터 스윕에서 I/O와 타임존 변환을 생략합니다.
+
+최근 N봉 조회(load_ohlcv_tail)는 최신 연도 파일부터 마지막 row group만 읽으므로
+I/O와 메모리가 히스토리 길이가 아니라 요청한 봉 수에 비례합니다 (조건 검색/지표 계산용).
 """
 
 import os
@@ -15,16 +25,29 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
 from fastapi import HTTPException
 import pytz
 
+from backend.app.ohlcv_cache import get_ohlcv_cache
+
 logger = logging.getLogger(__name__)
 
 # 타임존 정의
 KST = pytz.timezone('Asia/Seoul')
 UTC = pytz.UTC
 
+# 로더 모드
+LOADER_MODE_PANDAS = 'pandas'
+LOADER_MODE_DATASET = 'dataset'
+SUPPORTED_LOADER_MODES = (LOADER_MODE_PANDAS, LOADER_MODE_DATASET)
+
+# dataset 모드에서 읽어올 컬럼 (파일에 존재하는 컬럼만 프로젝션)
+DATASET_COLUMNS = ['timestamp', 'symbol', 'timeframe', 'open', 'high', 'low', 'close', 'volume']
+
 
 def _normalize_timezone(date_str: str) -> pd.Timestamp:
     """
@@ -120,12 +143,228 @@ def _validate_dataframe(df: pd.DataFrame, symbol: str, timeframe: str) -> None:
         raise HTTPException(status_code=400, detail=error_msg)
 
 
+def _normalize_frame(
+    df: pd.DataFrame,
+    file_path: Path,
+    symbol_upper: str,
+    timeframe_upper: str,
+) -> pd.DataFrame:
+    """
+    parquet에서 읽은 프레임을 검증하고 UTC timestamp, symbol, timeframe을 정규화
+
+    Args:
+        df: parquet에서 읽은 DataFrame
+        file_path: 원본 파일 경로 (에러 메시지용)
+        symbol_upper: 심볼명 (대문자)
+        timeframe_upper: 타임프레임 (대문자)
+
+    Returns:
+        정규화된 DataFrame
+
+    Raises:
+        HTTPException(400): 필수 컬럼 또는 timestamp 누락
+    """
+    # 필수 컬럼 검증
+    _validate_dataframe(df, symbol_upper, timeframe_upper)
+
+    # timestamp 컬럼 준비
+    if 'timestamp' not in df.columns:
+        if isinstance(df.index, pd.DatetimeIndex):
+            df['timestamp'] = df.index
+        else:
+            error_msg = f"No timestamp column or index in {file_path}"
+            logger.error(error_msg)
+            raise HTTPException(status_code=400, detail=error_msg)
+
+    # timestamp를 UTC로 정규화
+    if df['timestamp'].dt.tz is None:
+        # 타임존 정보 없음 -> KST로 간주
+        df['timestamp'] = df['timestamp'].dt.tz_localize(KST).dt.tz_convert(UTC)
+    else:
+        # 타임존 정보 있음 -> UTC로 변환
+        df['timestamp'] = df['timestamp'].dt.tz_convert(UTC)
+
+    # symbol과 timeframe 주입 (파일 경로에서만 정보 있는 경우)
+    if 'symbol' not in df.columns:
+        df['symbol'] = symbol_upper
+    if 'timeframe' not in df.columns:
+        df['timeframe'] = timeframe_upper
+
+    return df
+
+
+def _read_parquet_pushdown(
+    file_path: Path,
+    start_date_utc: pd.Timestamp,
+    end_date_utc: pd.Timestamp,
+) -> pd.DataFrame:
+    """
+    pyarrow.dataset으로 기간 필터와 컬럼 프로젝션을 푸시다운하여 parquet 파일 읽기
+
+    row group 통계(min/max)로 기간 밖의 row group은 디코딩하지 않습니다.
+    timestamp가 컬럼이 아닌 경우(인덱스로 저장됨)에는 전체 읽기로 대체합니다.
+
+    Args:
+        file_path: parquet 파일 경로
+        start_date_utc: 시작 시각 (UTC)
+        end_date_utc: 종료 시각 (UTC)
+
+    Returns:
+        기간 내 행만 포함한 DataFrame (timestamp 정규화 전)
+    """
+    dataset = ds.dataset(str(file_path), format='parquet')
+    schema = dataset.schema
+
+    if 'timestamp' not in schema.names or not pa.types.is_timestamp(schema.field('timestamp').type):
+        logger.debug(f"Pushdown not applicable (no timestamp column): {file_path}")
+        return pd.read_parquet(file_path)
+
+    ts_type = schema.field('timestamp').type
+
+    # 파일의 timestamp 표현에 맞춰 경계값 변환 (naive -> KST 기준 naive)
+    if ts_type.tz is None:
+        lower = start_date_utc.tz_convert(KST).tz_localize(None)
+        upper = end_date_utc.tz_convert(KST).tz_localize(None)
+    else:
+        lower = start_date_utc
+        upper = end_date_utc
+
+    columns = [col for col in DATASET_COLUMNS if col in schema.names]
+    row_filter = (
+        (ds.field('timestamp') >= pa.scalar(lower, type=ts_type))
+        & (ds.field('timestamp') <= pa.scalar(upper, type=ts_type))
+    )
+
+    table = dataset.to_table(columns=columns, filter=row_filter)
+    return table.to_pandas()
+
+
+def _read_parquet_tail(file_path: Path, bars: int) -> pd.DataFrame:
+    """
+    parquet 파일의 마지막 row group부터 bars개 이상의 행이 모일 때까지만 읽기
+
+    연도 파일은 timestamp 순으로 저장되므로 뒤쪽 row group이 최신 봉입니다.
+    timestamp가 컬럼이 아닌 경우(인덱스로 저장됨)에는 전체 읽기로 대체합니다.
+
+    Args:
+        file_path: parquet 파일 경로
+        bars: 필요한 행 수
+
+    Returns:
+        마지막 row group들의 DataFrame (timestamp 정규화 전, bars개 이상일 수 있음)
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    names = parquet_file.schema_arrow.names
+
+    if 'timestamp' not in names:
+        logger.debug(f"Tail read not applicable (no timestamp column): {file_path}")
+        return pd.read_parquet(file_path)
+
+    metadata = parquet_file.metadata
+    row_groups = []
+    rows = 0
+    for index in reversed(range(metadata.num_row_groups)):
+        row_groups.append(index)
+        rows += metadata.row_group(index).num_rows
+        if rows >= bars:
+            break
+
+    columns = [col for col in DATASET_COLUMNS if col in names]
+    table = parquet_file.read_row_groups(sorted(row_groups), columns=columns)
+    return table.to_pandas()
+
+
+def load_ohlcv_tail(
+    symbol: str,
+    bars: int,
+    timeframe: str = "1d",
+    data_root: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    심볼의 최근 N봉 로드
+
+    최신 연도 파일부터 거꾸로, 파일마다 마지막 row group만 읽어 bars개가 모이면 멈춥니다.
+
+    Args:
+        symbol: 심볼 (예: "BTC_KRW")
+        bars: 봉 수 (1 이상)
+        timeframe: 타임프레임 (기본값: "1d")
+        data_root: 데이터 루트 디렉토리 (기본값: 환경변수 DATA_ROOT 또는 ./data)
+
+    Returns:
+        DataFrame: 컬럼 [timestamp, symbol, timeframe, open, high, low, close, volume]
+                  timestamp는 UTC 기준, 시간순 마지막 bars개 (히스토리가 짧으면 전체)
+
+    Raises:
+        HTTPException(422): bars가 1 미만
+        HTTPException(404): 데이터 파일이 없음
+        HTTPException(400): 파일 스키마 오류 (필수 컬럼 누락)
+
+    Examples:
+        >>> df = load_ohlcv_tail("BTC_KRW", bars=60, timeframe="1D")
+        >>> assert len(df) <= 60
+    """
+    if bars < 1:
+        raise HTTPException(status_code=422, detail=f"bars must be >= 1: {bars}")
+
+    if data_root is None:
+        data_root = os.getenv('DATA_ROOT', './data')
+
+    symbol_upper = symbol.upper()
+    timeframe_upper = timeframe.upper()
+    symbol_dir = Path(data_root) / symbol_upper / timeframe_upper
+
+    # 연도 파일 (최신 연도부터)
+    year_files = sorted(
+        (path for path in symbol_dir.glob("*.parquet") if path.stem.isdigit()),
+        key=lambda path: int(path.stem),
+        reverse=True,
+    )
+
+    dfs = []
+    rows = 0
+    for file_path in year_files:
+        try:
+            df = _normalize_frame(
+                _read_parquet_tail(file_path, bars - rows),
+                file_path, symbol_upper, timeframe_upper,
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            error_msg = f"Failed to read {file_path}: {e}"
+            logger.error(error_msg)
+            raise HTTPException(status_code=400, detail=error_msg)
+
+        if not df.empty:
+            dfs.append(df)
+            rows += len(df)
+        if rows >= bars:
+            break
+
+    if not dfs:
+        error_msg = f"No data found for {symbol_upper}/{timeframe_upper} in {data_root}"
+        logger.warning(error_msg)
+        raise HTTPException(status_code=404, detail=error_msg)
+
+    result_df = pd.concat(dfs[::-1], ignore_index=True)
+
+    required_cols = ['timestamp', 'symbol', 'timeframe', 'open', 'high', 'low', 'close', 'volume']
+    available_cols = [col for col in required_cols if col in result_df.columns]
+    result_df = result_df[available_cols].sort_values('timestamp').tail(bars).reset_index(drop=True)
+
+    logger.debug(f"Loaded tail {symbol_upper}/{timeframe_upper}: {len(result_df)} rows")
+
+    return result_df
+
+
 def load_ohlcv_data(
     symbols: List[str],
     start_date: str,
     end_date: str,
     timeframe: str = "1d",
-    data_root: Optional[str] = None
+    data_root: Optional[str] = None,
+    mode: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     로컬 parquet 파일에서 OHLCV 데이터를 로드합니다.
@@ -138,6 +377,7 @@ def load_ohlcv_data(
         end_date: 종료 날짜 (ISO8601, 예: "2024-12-31")
         timeframe: 타임프레임 (기본값: "1d", 예: "1M", "5M", "1H", "1D")
         data_root: 데이터 루트 디렉토리 (기본값: 환경변수 DATA_ROOT 또는 ./data)
+        mode: 로더 모드 ('pandas' 또는 'dataset', 기본값: 환경변수 DATA_LOADER_MODE 또는 'pandas')
 
     Returns:
         DataFrame: 컬럼 [timestamp, symbol, timeframe, open, high, low, close, volume]
@@ -163,6 +403,13 @@ def load_ohlcv_data(
 
     data_root_path = Path(data_root)
 
+    # 로더 모드 결정
+    mode = mode or os.getenv('DATA_LOADER_MODE', LOADER_MODE_PANDAS)
+    if mode not in SUPPORTED_LOADER_MODES:
+        error_msg = f"Unsupported loader mode: {mode}. Supported: {list(SUPPORTED_LOADER_MODES)}"
+        logger.error(error_msg)
+        raise HTTPException(status_code=422, detail=error_msg)
+
     if not data_root_path.exists():
         error_msg = f"DATA_ROOT directory not found: {data_root_path}"
         logger.error(error_msg)
@@ -204,34 +451,20 @@ def load_ohlcv_data(
                 continue
 
             try:
-                # Parquet 파일 읽기
-                df = pd.read_parquet(file_path)
-
-                # 필수 컬럼 검증
-                _validate_dataframe(df, symbol_upper, timeframe_upper)
-
-                # timestamp 컬럼 준비
-                if 'timestamp' not in df.columns:
-                    if isinstance(df.index, pd.DatetimeIndex):
-                        df['timestamp'] = df.index
-                    else:
-                        error_msg = f"No timestamp column or index in {file_path}"
-                        logger.error(error_msg)
-                        raise HTTPException(status_code=400, detail=error_msg)
-
-                # timestamp를 UTC로 정규화
-                if df['timestamp'].dt.tz is None:
-                    # 타임존 정보 없음 -> KST로 간주
-                    df['timestamp'] = df['timestamp'].dt.tz_localize(KST).dt.tz_convert(UTC)
+                # Parquet 파일 읽기 + 정규화
+                if mode == LOADER_MODE_DATASET:
+                    df = _normalize_frame(
+                        _read_parquet_pushdown(file_path, start_date_utc, end_date_utc),
+                        file_path, symbol_upper, timeframe_upper,
+                    )
                 else:
-                    # 타임존 정보 있음 -> UTC로 변환
-                    df['timestamp'] = df['timestamp'].dt.tz_convert(UTC)
-
-                # symbol과 timeframe 주입 (파일 경로에서만 정보 있는 경우)
-                if 'symbol' not in df.columns:
-                    df['symbol'] = symbol_upper
-                if 'timeframe' not in df.columns:
-                    df['timeframe'] = timeframe_upper
+                    # 연도 파일 전체를 정규화하여 캐시 (mtime/size 변경 시 재로딩)
+                    df = get_ohlcv_cache().get_or_load(
+                        file_path,
+                        lambda: _normalize_frame(
+                            pd.read_parquet(file_path), file_path, symbol_upper, timeframe_upper
+                        ),
+                    )
 
                 # 날짜 범위 필터링
                 df = df[(df['timestamp'] >= start_date_utc) & (df['timestamp'] <= end_date_utc)]
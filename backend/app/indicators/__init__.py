@@ -4,6 +4,6 @@
 HTS 스타일 조건 검색을 위한 기술 지표 계산 로직
 """
 
-from .calculator import IndicatorCalculator
+from .calculator import IndicatorCalculator, stack_tails
 
-__all__ = ['IndicatorCalculator']
+__all__ = ['IndicatorCalculator', 'stack_tails']
@@ -2,16 +2,78 @@
 기술 지표 계산 모듈 (Feature Breakdown #23, Task 4)
 
 상승률, 거래량, 거래대금, 이동평균선 이격도, 이동평균선 정배열/역배열 등을 계산합니다.
+
+calculate_all / calculate_batch는 모든 지표를 한 번에 계산합니다.
+- 가장 긴 지표 창(MA60)만큼의 마지막 봉만 사용 (히스토리 길이와 무관한 O(TAIL_WINDOW))
+- close/volume 배열을 한 번만 꺼내 합계/이동평균을 공유
+- 여러 심볼을 (심볼 수, TAIL_WINDOW) 2차원 배열로 쌓아 한 번에 계산
 """
 
 import logging
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# 가장 긴 지표 창 (MA60)
+TAIL_WINDOW = 60
+
+# 기간별 비교 봉 위치 (상승률: 뒤에서 N번째 종가) / 합산 봉 수 (거래량/거래대금)
+PERIOD_LOOKBACK = {'1d': 2, '1w': 7, '1m': 20}
+PERIOD_SUM_WINDOW = {'1d': 1, '1w': 7, '1m': 20}
+
+# 이격도/정배열 이동평균 기간
+MA_PERIODS = (5, 20, 60)
+MA_DIVERGENCE_PERIODS = (20, 60)
+
+# calculate_all 결과 키
+ALL_INDICATOR_KEYS = (
+    'change_rate_1d', 'change_rate_1w', 'change_rate_1m',
+    'volume_1d', 'volume_1w', 'volume_1m',
+    'trade_amount_1d', 'trade_amount_1w', 'trade_amount_1m',
+    'ma_divergence_20', 'ma_divergence_60',
+    'ma_alignment',
+)
+
+
+def stack_tails(
+    frames: Sequence[pd.DataFrame],
+    window: int = TAIL_WINDOW
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    심볼별 OHLCV의 마지막 window개 봉을 2차원 배열로 쌓기
+
+    Args:
+        frames: 심볼별 OHLCV 데이터 (close, volume 필드 필수)
+        window: 봉 수
+
+    Returns:
+        (close, volume, lengths)
+        - close, volume: (심볼 수, window), 오른쪽 정렬 (마지막 열이 최신, 빈 칸은 NaN)
+        - lengths: 심볼별 유효 봉 수
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 close/volume 컬럼 누락
+    """
+    close = np.full((len(frames), window), np.nan)
+    volume = np.full((len(frames), window), np.nan)
+    lengths = np.zeros(len(frames), dtype=np.int64)
+
+    for i, df in enumerate(frames):
+        if df is None or df.empty:
+            raise ValueError("DataFrame is empty")
+        if 'close' not in df.columns or 'volume' not in df.columns:
+            raise ValueError("'close' and 'volume' columns are required")
+
+        tail = min(len(df), window)
+        close[i, window - tail:] = df['close'].to_numpy(dtype=np.float64)[-tail:]
+        volume[i, window - tail:] = df['volume'].to_numpy(dtype=np.float64)[-tail:]
+        lengths[i] = tail
+
+    return close, volume, lengths
+
 
 class IndicatorCalculator:
     """
@@ -381,14 +443,20 @@ class IndicatorCalculator:
         df: pd.DataFrame
     ) -> Dict[str, Any]:
         """
-        모든 기술 지표를 한 번에 계산
+        모든 기술 지표를 한 번에 계산 (단일 패스)
+
+        검증과 close/volume 추출은 한 번만 하고, 마지막 TAIL_WINDOW개 봉으로
+        calculate_batch를 호출합니다. 결과는 개별 calculate_* 메서드와 같습니다.
 
         Args:
-            df: OHLCV 데이터
+            df: OHLCV 데이터 (close, volume 필드 필수)
 
         Returns:
             모든 지표 정보 딕셔너리
 
+        Raises:
+            ValueError: 빈 DataFrame 또는 close/volume 컬럼 누락
+
         Example:
             {
                 'change_rate_1d': 0.05,
@@ -405,33 +473,99 @@ class IndicatorCalculator:
                 'ma_alignment': 'golden_cross'
             }
         """
-        result = {}
-
         try:
-            # 상승률
-            result['change_rate_1d'] = self.calculate_change_rate(df, '1D')
-            result['change_rate_1w'] = self.calculate_change_rate(df, '1W')
-            result['change_rate_1m'] = self.calculate_change_rate(df, '1M')
+            close, volume, lengths = stack_tails([df])
+            batch = self.calculate_batch(close, volume, lengths)
+        except Exception as e:
+            logger.error(f"Error calculating all indicators: {e}")
+            raise
 
-            # 거래량
-            result['volume_1d'] = self.calculate_volume(df, '1D')
-            result['volume_1w'] = self.calculate_volume(df, '1W')
-            result['volume_1m'] = self.calculate_volume(df, '1M')
+        result: Dict[str, Any] = {key: float(batch[key][0]) for key in ALL_INDICATOR_KEYS[:-1]}
+        result['ma_alignment'] = str(batch['ma_alignment'][0])
+        return result
+
+    def calculate_batch(
+        self,
+        close: np.ndarray,
+        volume: np.ndarray,
+        lengths: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        N개 심볼의 모든 기술 지표를 한 번에 계산
 
-            # 거래대금
-            result['trade_amount_1d'] = self.calculate_trade_amount(df, '1D')
-            result['trade_amount_1w'] = self.calculate_trade_amount(df, '1W')
-            result['trade_amount_1m'] = self.calculate_trade_amount(df, '1M')
+        Args:
+            close: (N, W) 종가, 오른쪽 정렬 (마지막 열이 최신, stack_tails 참고)
+            volume: (N, W) 거래량
+            lengths: 심볼별 유효 봉 수 (None이면 모두 W)
 
-            # 이동평균선 이격도
-            result['ma_divergence_20'] = self.calculate_ma_divergence(df, 20)
-            result['ma_divergence_60'] = self.calculate_ma_divergence(df, 60)
+        Returns:
+            지표명 -> (N,) 배열
+            - ALL_INDICATOR_KEYS (calculate_all과 같은 반올림)
+            - ma_5, ma_20, ma_60: 마지막 이동평균 (데이터 부족 시 NaN)
 
-            # 이동평균선 정배열/역배열
-            result['ma_alignment'] = self.check_ma_alignment(df, [5, 20, 60])
+        Note:
+            W가 TAIL_WINDOW보다 길면 마지막 TAIL_WINDOW개 열만 사용합니다.
+            데이터 부족 시 값은 개별 메서드와 같습니다 (상승률/이격도 0.0, 합계는 있는 봉만, 정배열 'mixed').
+        """
+        close = np.asarray(close, dtype=np.float64)[:, -TAIL_WINDOW:]
+        volume = np.asarray(volume, dtype=np.float64)[:, -TAIL_WINDOW:]
+        count, width = close.shape
+        if lengths is None:
+            lengths = np.full(count, width)
+        else:
+            lengths = np.minimum(np.asarray(lengths), width)
+
+        # 유효 봉 밖은 NaN (합계에서 제외)
+        valid = np.arange(width) >= (width - lengths)[:, None]
+        close = np.where(valid, close, np.nan)
+        volume = np.where(valid, volume, np.nan)
+        amount = close * volume
+        current = close[:, -1]
+
+        result: Dict[str, np.ndarray] = {}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 상승률: 현재 종가 / 뒤에서 N번째 종가 - 1
+            for suffix, lookback in PERIOD_LOOKBACK.items():
+                if lookback > width:
+                    result[f'change_rate_{suffix}'] = np.zeros(count)
+                    continue
+                previous = close[:, -lookback]
+                rate = (current - previous) / previous
+                rate = np.where((lengths >= lookback) & (previous != 0), rate, 0.0)
+                result[f'change_rate_{suffix}'] = np.round(rate, 6)
+
+            # 거래량/거래대금: 최근 N봉 합계 (부족하면 있는 봉만)
+            for suffix, window in PERIOD_SUM_WINDOW.items():
+                if window == 1:
+                    volume_sum, amount_sum = volume[:, -1], amount[:, -1]
+                else:
+                    volume_sum = np.nansum(volume[:, -window:], axis=1)
+                    amount_sum = np.nansum(amount[:, -window:], axis=1)
+                result[f'volume_{suffix}'] = np.round(volume_sum, 2)
+                result[f'trade_amount_{suffix}'] = np.round(amount_sum, 0)
 
-        except Exception as e:
-            logger.error(f"Error calculating all indicators: {e}")
-            raise
+            # 마지막 이동평균 (MA5/20/60 공유)
+            mas = {}
+            for period in MA_PERIODS:
+                if period > width:
+                    ma = np.full(count, np.nan)
+                else:
+                    ma = np.where(lengths >= period, close[:, -period:].mean(axis=1), np.nan)
+                mas[period] = result[f'ma_{period}'] = ma
+
+            # 이격도: (현재가 / MA - 1) × 100
+            for period in MA_DIVERGENCE_PERIODS:
+                ma = mas[period]
+                divergence = (current / ma - 1.0) * 100
+                divergence = np.where(np.isnan(ma) | (ma == 0), 0.0, divergence)
+                result[f'ma_divergence_{period}'] = np.round(divergence, 2)
+
+            # 정배열/역배열: MA5 > MA20 > MA60 / MA5 < MA20 < MA60 (NaN이면 혼조)
+            ordered = [mas[period] for period in MA_PERIODS]
+            golden = np.logical_and.reduce([a > b for a, b in zip(ordered, ordered[1:])])
+            dead = np.logical_and.reduce([a < b for a, b in zip(ordered, ordered[1:])])
+            result['ma_alignment'] = np.where(
+                golden, 'golden_cross', np.where(dead, 'dead_cross', 'mixed')
+            ).astype(object)
 
         return result
@@ -1,4 +1,5 @@
 """비동기 백테스트 작업 함수들"""
+import asyncio
 import logging
 import json
 import os
@@ -6,6 +7,8 @@ import time
 from typing import Dict, Any, Callable, Optional, List
 from datetime import datetime
 
+from .backtest_executor import BacktestExecutor
+from .backtest_sweep import run_parameter_sweep
 from .data_loader import load_ohlcv_data
 from .strategy_factory import StrategyFactory
 from .task_manager import TaskManager, TaskStatus
@@ -304,3 +307,103 @@ def run_backtest_job(
 
         TaskManager.set_error(task_id, error_msg)
         raise
+
+
+def run_sweep_job(
+    task_id: str,
+    strategy: str,
+    base_params: Dict[str, Any],
+    param_grid: Dict[str, List[Any]],
+    symbols: list,
+    start_date: str,
+    end_date: str,
+    timeframe: str = "1d",
+    rank_by: str = "avg_return",
+    top_n: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    비동기 파라미터 스윕 작업
+
+    RQ 워커 안에서 자체 프로세스 풀(BACKTEST_MAX_WORKERS)을 만들어 조합을 병렬 실행합니다.
+
+    Args:
+        task_id: 작업 ID
+        strategy: 전략명
+        base_params: 모든 조합에 공통으로 적용할 파라미터
+        param_grid: 파라미터명 -> 후보값 목록
+        symbols: 심볼 목록
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        timeframe: 타임프레임
+        rank_by: 순위 지표
+        top_n: 상위 N개만 반환
+
+    Returns:
+        스윕 결과 (SweepResponse 호환)
+    """
+    data_root = os.getenv("DATA_ROOT", "/data")
+    start_time = time.perf_counter()
+    executor = BacktestExecutor()
+
+    try:
+        logger.info(f"[Task {task_id}] Starting parameter sweep: {strategy}")
+
+        TaskManager.update_status(task_id, TaskStatus.RUNNING)
+        TaskManager.set_progress(task_id, 0.0)
+
+        sweep = asyncio.run(
+            run_parameter_sweep(
+                executor=executor,
+                run_id=task_id,
+                strategy_name=strategy,
+                base_params=base_params,
+                param_grid=param_grid,
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                timeframe=timeframe,
+                rank_by=rank_by,
+                top_n=top_n,
+            )
+        )
+        TaskManager.set_progress(task_id, 0.95)
+
+        result_data = {
+            "run_id": task_id,
+            "strategy": strategy,
+            "start_date": start_date,
+            "end_date": end_date,
+            "timeframe": timeframe,
+            "rank_by": rank_by,
+            "total_combinations": sweep["total_combinations"],
+            "symbols_processed": sweep["symbols_processed"],
+            "results": sweep["results"],
+            "execution_time": time.perf_counter() - start_time,
+        }
+
+        # 결과 파일 저장 (${DATA_ROOT}/tasks/<task_id>/sweep.json)
+        result_file = ResultManager.save_result_file(
+            data_root=data_root,
+            task_id=task_id,
+            result_data=result_data,
+            filename="sweep.json",
+        )
+
+        TaskManager.set_result(task_id, result_data)
+        TaskManager.set_progress(task_id, 1.0)
+
+        logger.info(
+            f"[Task {task_id}] Parameter sweep completed successfully. "
+            f"combinations={sweep['total_combinations']}, Result: {result_file}"
+        )
+
+        return result_data
+
+    except Exception as e:
+        error_msg = f"Sweep failed: {str(e)}"
+        logger.error(f"[Task {task_id}] {error_msg}", exc_info=True)
+        TaskManager.set_error(task_id, error_msg)
+        raise
+
+    finally:
+        executor.shutdown()
@@ -16,6 +16,10 @@ from .data_ingestion import (
     enqueue_batch_fetch,
     DataIngestionStatus,
 )
+from .indicator_materialization import (
+    materialize_indicators_job,
+    enqueue_materialize_indicators,
+)
 
 
 def run_backtest_job(
@@ -65,5 +69,7 @@ __all__ = [
     'enqueue_fetch_candles',
     'enqueue_batch_fetch',
     'DataIngestionStatus',
+    'materialize_indicators_job',
+    'enqueue_materialize_indicators',
     'run_backtest_job',
 ]
@@ -3,18 +3,22 @@
 
 Upbit 캔들 데이터를 자동으로 수집하고 저장하는 비동기 작업들을 정의합니다.
 Redis Queue (RQ)를 통해 스케줄링하고 실행합니다.
+
+수집은 프로세스 내 비동기 수집기(market_data.candle_fetcher)가 담당하며,
+배치 작업은 모든 스트림을 HTTP 연결 풀과 토큰 버킷 하나를 공유해 동시에 수집합니다.
 """
 
+import asyncio
 import logging
-import subprocess
 import os
-import sys
-from pathlib import Path
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Optional
 from rq import get_current_job
 from rq.job import JobStatus
 
+from backend.app.market_data.candle_fetcher import fetch_candle_streams
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +43,28 @@ class DataIngestionStatus:
         }
 
 
+def _run_async(coro):
+    """
+    동기 작업에서 코루틴 실행
+
+    이미 이벤트 루프가 실행 중이면(API 즉시 실행 등) 별도 스레드의 새 루프에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _write_log_file(log_file: str, results: List[Dict]) -> None:
+    """저장된 파일 목록을 로그 파일에 기록"""
+    with open(log_file, 'a') as f:
+        for result in results:
+            for file_path in result.get('files', []):
+                f.write(f"{datetime.now().isoformat()} - 저장: {file_path}\n")
+
+
 def fetch_candles_job(
     symbol: str,
     timeframe: str,
@@ -63,85 +89,10 @@ def fetch_candles_job(
     logger.info(f"[작업 시작] {symbol} {timeframe} (최근 {days}일, Job ID: {job.id if job else 'N/A'})")
 
     try:
-        # 스크립트 경로 (절대경로)
-        # __file__ = /backend/app/jobs/data_ingestion.py
-        # parents[3] = project root
-        script_path = Path(__file__).resolve().parents[3] / "scripts" / "fetch_upbit_candles.py"
-
-        if not script_path.exists():
-            error_msg = f"스크립트를 찾을 수 없음: {script_path}"
-            logger.error(error_msg)
-            return {
-                'success': False,
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'error': error_msg
-            }
-
-        # 시작/종료 날짜 계산
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
-
-        # 명령어 구성 (sys.executable 사용)
-        cmd = [
-            sys.executable,
-            str(script_path),
-            '--symbol', symbol,
-            '--timeframe', timeframe,
-            '--start', start_date.isoformat(),
-            '--end', end_date.isoformat(),
-            '--verbose'
-        ]
-
-        if overwrite:
-            cmd.append('--overwrite')
-
+        result = _run_async(fetch_candle_streams([symbol], [timeframe], days=days, overwrite=overwrite))[0]
         if log_file:
-            cmd.extend(['--log-file', log_file])
-
-        logger.info(f"실행 중: {' '.join(cmd)}")
-
-        # 스크립트 실행
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5분 타임아웃
-        )
-
-        if result.returncode != 0:
-            error_msg = f"스크립트 실패: {result.stderr}"
-            logger.error(error_msg)
-            return {
-                'success': False,
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'error': error_msg,
-                'stdout': result.stdout,
-                'stderr': result.stderr
-            }
-
-        logger.info(f"작업 완료: {symbol} {timeframe}")
-        logger.info(f"출력:\n{result.stdout}")
-
-        return {
-            'success': True,
-            'symbol': symbol,
-            'timeframe': timeframe,
-            'message': f'{symbol} {timeframe} 데이터 수집 완료',
-            'timestamp': datetime.now().isoformat(),
-            'stdout': result.stdout
-        }
-
-    except subprocess.TimeoutExpired:
-        error_msg = f"타임아웃: {symbol} {timeframe} 수집에 5분 이상 소요"
-        logger.error(error_msg)
-        return {
-            'success': False,
-            'symbol': symbol,
-            'timeframe': timeframe,
-            'error': error_msg
-        }
+            _write_log_file(log_file, [result])
+        return result
 
     except Exception as e:
         error_msg = f"작업 실패: {str(e)}"
@@ -163,6 +114,9 @@ def batch_fetch_candles_job(
     """
     여러 심볼과 타임프레임에 대한 일괄 수집 작업
 
+    모든 (심볼, 타임프레임) 스트림을 한 프로세스에서 동시에 수집하며,
+    요청 속도는 수집기의 공유 토큰 버킷(Upbit 초당/분당 한도)으로 제한됩니다.
+
     Args:
         symbols: 심볼 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
         timeframes: 타임프레임 리스트 (예: ['1H', '1D'])
@@ -183,36 +137,26 @@ def batch_fetch_candles_job(
         'details': []
     }
 
-    for symbol in symbols:
-        for timeframe in timeframes:
-            try:
-                result = fetch_candles_job(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    days=days,
-                    overwrite=overwrite
-                )
-
-                if result['success']:
-                    results['completed'] += 1
-                else:
-                    results['failed'] += 1
-                    results['success'] = False
-
-                results['details'].append(result)
-
-            except Exception as e:
-                logger.error(f"배치 작업 중 오류: {symbol} {timeframe} - {str(e)}")
-                results['failed'] += 1
-                results['success'] = False
-                results['details'].append({
-                    'success': False,
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'error': str(e)
-                })
+    try:
+        details = _run_async(fetch_candle_streams(symbols, timeframes, days=days, overwrite=overwrite))
+    except Exception as e:
+        logger.error(f"배치 작업 중 오류: {str(e)}", exc_info=True)
+        details = [
+            {'success': False, 'symbol': symbol, 'timeframe': timeframe, 'error': str(e)}
+            for symbol in symbols
+            for timeframe in timeframes
+        ]
+
+    for result in details:
+        if result['success']:
+            results['completed'] += 1
+        else:
+            results['failed'] += 1
+            results['success'] = False
+        results['details'].append(result)
 
     logger.info(f"[배치 작업 완료] 성공: {results['completed']}, 실패: {results['failed']}")
+    results['indicators'] = chain_indicator_materialization(results['details'])
     results['timestamp'] = datetime.now().isoformat()
     return results
 
@@ -236,12 +180,51 @@ def refresh_latest_candles_job(
     logger.info(f"[새로고침] {symbol} {timeframe} (최근 {days}일)")
 
     # 기존 파일을 덮어쓰기로 최신 데이터로 업데이트
-    return fetch_candles_job(
+    result = fetch_candles_job(
         symbol=symbol,
         timeframe=timeframe,
         days=days,
         overwrite=True  # 최신 데이터로 업데이트
     )
+    result['indicators'] = chain_indicator_materialization([result])
+    return result
+
+
+def chain_indicator_materialization(results: List[Dict]) -> Optional[Dict]:
+    """
+    수집에 성공한 1D 심볼의 지표 구체화 작업 연결
+
+    RQ 작업 안에서는 같은 큐에 후속 작업으로 추가하고, 그 외(즉시 실행)에는 바로 실행합니다.
+    지표 구체화 실패는 수집 결과에 영향을 주지 않습니다.
+
+    Args:
+        results: fetch_candles_job 결과 목록
+
+    Returns:
+        {'job_id', 'symbols'} (큐 추가), 구체화 작업 결과 (즉시 실행) 또는 None (대상 없음/실패)
+    """
+    from backend.app.jobs.indicator_materialization import (
+        INDICATOR_TIMEFRAME,
+        enqueue_materialize_indicators,
+        materialize_indicators_job,
+    )
+
+    symbols = list(dict.fromkeys(
+        result['symbol'] for result in results
+        if result.get('success') and str(result.get('timeframe', '')).upper() == INDICATOR_TIMEFRAME
+    ))
+    if not symbols:
+        return None
+
+    try:
+        job = get_current_job()
+        if job is not None:
+            follow_up = enqueue_materialize_indicators(job.connection, symbols)
+            return {'job_id': follow_up.id, 'symbols': symbols}
+        return materialize_indicators_job(symbols)
+    except Exception as e:
+        logger.error(f"지표 구체화 연결 실패: {e}", exc_info=True)
+        return None
 
 
 def get_default_symbols() -> List[str]:
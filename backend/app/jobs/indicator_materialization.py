@@ -0,0 +1,130 @@
+"""
+지표 구체화 백그라운드 작업 (RQ)
+
+캔들 수집 작업(batch_fetch_candles_job / refresh_latest_candles_job) 직후 실행되어,
+원본 파일이 바뀐 심볼만 IndicatorCalculator 지표를 다시 계산하고
+구체화된 지표 저장소(IndicatorStore)에 반영합니다.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+from rq import get_current_job
+
+from backend.app.data_loader import load_ohlcv_tail
+from backend.app.indicators.calculator import TAIL_WINDOW
+from backend.app.services.indicator_store import IndicatorStore
+from backend.app.services.screener_engine import indicator_rows
+from backend.app.services.screener_service import convert_symbol_to_data_format
+
+logger = logging.getLogger(__name__)
+
+# 조건 검색이 사용하는 캔들 타임프레임
+INDICATOR_TIMEFRAME = '1D'
+
+
+def materialize_indicators_job(
+    symbols: Optional[List[str]] = None,
+    timeframe: str = INDICATOR_TIMEFRAME,
+    force: bool = False,
+    data_root: Optional[str] = None
+) -> Dict:
+    """
+    심볼별 지표 계산 후 저장소 반영
+
+    Args:
+        symbols: 대상 심볼 (예: ['KRW-BTC'], None이면 기본 수집 심볼)
+        timeframe: 캔들 타임프레임
+        force: True면 원본 파일 변경 여부와 관계없이 모두 재계산
+        data_root: 데이터 루트 (기본: 환경변수 DATA_ROOT)
+
+    Returns:
+        작업 결과 딕셔너리
+    """
+    job = get_current_job()
+    store = IndicatorStore(data_root, timeframe)
+
+    if symbols is None:
+        from backend.app.jobs.data_ingestion import get_default_symbols
+        symbols = get_default_symbols()
+
+    targets = list(symbols) if force else store.stale_symbols(symbols)
+    logger.info(
+        f"[지표 구체화 시작] {len(targets)}/{len(symbols)}개 심볼 {timeframe} "
+        f"(Job ID: {job.id if job else 'N/A'})"
+    )
+
+    frames: Dict[str, pd.DataFrame] = {}
+    mtimes: Dict[str, Optional[float]] = {}
+    failed: List[Dict] = []
+
+    for symbol in targets:
+        try:
+            # 로드 전에 mtime 기록 (로드 중 파일이 바뀌면 다음 실행에서 재계산)
+            mtimes[symbol] = store.source_mtime(symbol)
+            frames[symbol] = load_ohlcv_tail(
+                convert_symbol_to_data_format(symbol),
+                bars=TAIL_WINDOW,
+                timeframe=timeframe,
+                data_root=str(store.data_root)
+            )
+        except Exception as e:
+            logger.warning(f"캔들 로드 실패: {symbol} {timeframe} - {e}")
+            failed.append({'symbol': symbol, 'error': str(e)})
+
+    # 대상 심볼 전체를 한 번에 계산
+    rows = {symbol: row for symbol, row in indicator_rows(frames).items() if row is not None}
+    failed.extend(
+        {'symbol': symbol, 'error': 'close/volume columns are required'}
+        for symbol in frames if symbol not in rows
+    )
+
+    version = store.write(rows, mtimes) if rows else store.version
+
+    logger.info(f"[지표 구체화 완료] 갱신: {len(rows)}, 실패: {len(failed)}, 버전: {version}")
+    return {
+        'success': not failed,
+        'timeframe': timeframe,
+        'requested': len(symbols),
+        'updated': list(rows),
+        'skipped': len(symbols) - len(targets),
+        'failed': failed,
+        'version': version,
+        'timestamp': datetime.now().isoformat(),
+    }
+
+
+def enqueue_materialize_indicators(
+    connection,
+    symbols: List[str],
+    depends_on=None,
+    job_timeout: int = 600
+):
+    """
+    지표 구체화 작업을 RQ 큐에 추가
+
+    Args:
+        connection: Redis 연결
+        symbols: 대상 심볼
+        depends_on: 선행 작업 (완료 후 실행)
+        job_timeout: 작업 타임아웃 (초)
+
+    Returns:
+        Job 객체
+    """
+    from rq import Queue
+
+    queue = Queue('data_ingestion', connection=connection)
+
+    job = queue.enqueue(
+        materialize_indicators_job,
+        symbols=symbols,
+        depends_on=depends_on,
+        job_timeout=job_timeout,
+        result_ttl=600,  # 결과 저장 10분
+    )
+
+    logger.info(f"지표 구체화 작업 큐 추가: {job.id} ({len(symbols)}개 심볼)")
+    return job
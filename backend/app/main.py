@@ -6,7 +6,7 @@ Coin Backtesting API
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field, validator
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -16,8 +16,13 @@ import json
 import uuid
 import time
 
-from backend.app.data_loader import load_ohlcv_data
 from backend.app.strategy_factory import StrategyFactory
+from backend.app.backtest_executor import (
+    SymbolBacktestError,
+    get_backtest_executor,
+    close_backtest_executor,
+)
+from backend.app.backtest_sweep import RANK_METRICS, run_parameter_sweep
 from backend.app.task_manager import TaskManager, TaskStatus
 from backend.app.result_manager import ResultManager
 from backend.app.strategy_preset_manager import StrategyPresetManager
@@ -287,6 +292,70 @@ class TaskStatusResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="에러 메시지 (실패 또는 취소 시)")
 
 
+class SweepRequest(BacktestRequest):
+    """파라미터 스윕 요청 모델
+
+    params는 모든 조합에 공통으로 적용되며, param_grid의 값이 조합별로 덮어씁니다.
+    """
+
+    param_grid: Dict[str, List[Any]] = Field(
+        ...,
+        description="파라미터명 -> 후보값 목록 (예: {'volume_window': [10, 20], 'breakout_buffer': [0.0, 0.01]})",
+    )
+    rank_by: str = Field(
+        default="avg_return",
+        description="순위 지표 (avg_return, win_rate, total_signals, max_drawdown)",
+    )
+    top_n: Optional[int] = Field(default=None, ge=1, description="상위 N개만 반환 (기본값: 전체)")
+
+    @validator("param_grid")
+    def validate_param_grid(cls, v):
+        """빈 그리드/후보값 검증"""
+        if not v:
+            raise ValueError("param_grid must not be empty")
+        for key, values in v.items():
+            if len(values) == 0:
+                raise ValueError(f"param_grid['{key}'] must be a non-empty list")
+        return v
+
+    @validator("rank_by")
+    def validate_rank_by(cls, v):
+        """지원되는 순위 지표인지 검증"""
+        if v not in RANK_METRICS:
+            raise ValueError(
+                f"Unsupported rank_by: {v}. Supported: {list(RANK_METRICS)}"
+            )
+        return v
+
+
+class SweepResultRow(BaseModel):
+    """파라미터 조합별 스윕 결과"""
+
+    rank: int = Field(..., description="순위 (1부터)")
+    params: Dict[str, Any] = Field(..., description="조합의 전략 파라미터")
+    total_signals: int = Field(..., description="전체 심볼 신호 수 합계")
+    win_rate: float = Field(..., description="신호 수 가중 승률")
+    avg_return: float = Field(..., description="신호 수 가중 평균 수익률 (%)")
+    max_drawdown: float = Field(..., description="심볼 중 최대 낙폭 (%)")
+    symbols_with_signals: int = Field(..., description="신호가 발생한 심볼 수")
+    error: Optional[str] = Field(default=None, description="파라미터 오류 (해당 조합 실행 실패 시)")
+
+
+class SweepResponse(BaseModel):
+    """파라미터 스윕 응답 모델"""
+
+    run_id: str = Field(..., description="스윕 실행 ID (UUID)")
+    strategy: str = Field(..., description="사용된 전략명")
+    start_date: str = Field(..., description="백테스트 시작 날짜 (YYYY-MM-DD)")
+    end_date: str = Field(..., description="백테스트 종료 날짜 (YYYY-MM-DD)")
+    timeframe: str = Field(..., description="사용된 타임프레임")
+    rank_by: str = Field(..., description="순위 지표")
+    total_combinations: int = Field(..., description="실행한 파라미터 조합 수")
+    symbols_processed: int = Field(..., description="데이터가 있어 실행된 심볼 수")
+    results: List[SweepResultRow] = Field(..., description="순위표")
+    execution_time: float = Field(..., description="스윕 실행 시간 (초)")
+
+
 # ============================================================================
 # 실시간 시뮬레이션 관련 Pydantic 모델 (Phase 2)
 # ============================================================================
@@ -422,6 +491,8 @@ async def root():
         "endpoints": {
             "POST /api/backtests/run": "Run backtest (synchronous)",
             "POST /api/backtests/run-async": "Run backtest (asynchronous, returns task_id)",
+            "POST /api/backtests/sweep": "Run parameter sweep and return ranked table",
+            "POST /api/backtests/sweep-async": "Run parameter sweep (asynchronous, returns task_id)",
             "GET /api/backtests/{run_id}": "Get backtest result",
             "GET /api/backtests/latest": "Get latest backtest result (Phase 2)",
             "GET /api/backtests/history": "Get backtest history with pagination (Phase 2)",
@@ -477,7 +548,7 @@ async def run_backtest(request: BacktestRequest):
     백테스트 실행 (Phase 2 최적화 적용)
 
     주요 기능:
-    - 여러 심볼에 대한 동시 백테스트 실행
+    - 여러 심볼에 대한 동시 백테스트 실행 (프로세스 풀, BACKTEST_MAX_WORKERS)
     - 전략별 신호 생성 및 성과 분석
     - 실시간 검증 및 에러 처리
 
@@ -517,9 +588,9 @@ async def run_backtest(request: BacktestRequest):
         # 결과 디렉토리 생성
         os.makedirs(RESULTS_DIR, exist_ok=True)
 
-        # 전략 인스턴스 생성
+        # 전략 검증 (실제 인스턴스는 워커에서 심볼별로 생성)
         try:
-            strategy = StrategyFactory.create(request.strategy)
+            StrategyFactory.create(request.strategy)
         except ValueError as e:
             logger.error(f"[{run_id}] Strategy creation failed: {e}")
             raise HTTPException(
@@ -527,107 +598,49 @@ async def run_backtest(request: BacktestRequest):
                 detail=str(e),
             )
 
-        # 심볼별 백테스트 실행
+        # 심볼별 백테스트 실행 (프로세스 풀에서 병렬 실행, 완료 순서대로 수집)
+        results_by_index: Dict[int, Dict[str, Any]] = {}
+        try:
+            async for index, symbol_data in get_backtest_executor().run_symbols(
+                run_id=run_id,
+                strategy_name=request.strategy,
+                params=request.params,
+                symbols=request.symbols,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                timeframe=request.timeframe,
+            ):
+                if symbol_data is not None:
+                    results_by_index[index] = symbol_data
+        except SymbolBacktestError as e:
+            # 데이터 로더/전략에서 발생한 오류를 HTTPException으로 전달
+            logger.error(f"[{run_id}] Backtest failed for {e.symbol}: {e.detail}")
+            raise e.to_http_exception()
+
+        # 요청 순서대로 API 응답 모델 구성
         symbol_results = []
         total_signals = 0
 
-        for symbol in request.symbols:
-            logger.info(f"[{run_id}] Processing symbol: {symbol}")
-
-            try:
-                # 데이터 로드
-                data_load_start = time.time()
-                df = load_ohlcv_data(
-                    symbols=[symbol],
-                    timeframe=request.timeframe,
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                )
-                data_load_time = time.time() - data_load_start
-                logger.info(
-                    f"[{run_id}] Data loaded for {symbol}: {len(df)} rows, "
-                    f"load_time={data_load_time:.2f}s"
-                )
-
-                if df.empty:
-                    logger.warning(
-                        f"[{run_id}] No data found for {symbol}, skipping"
-                    )
-                    continue
-
-                # 전략 실행
-                strategy_start = time.time()
-                result = strategy.run(df, request.params)
-                strategy_time = time.time() - strategy_start
-                logger.info(
-                    f"[{run_id}] Strategy executed for {symbol}: "
-                    f"signals={result.samples}, strategy_time={strategy_time:.2f}s"
-                )
-
-                # 내부 Signal을 API용 APISignal로 변환 (Step 4 신호 테이블용)
-                api_signals: List[APISignal] = []
-                if result.signals and result.entry_exit_pairs and result.returns:
-                    for i, signal in enumerate(result.signals):
-                        if i < len(result.entry_exit_pairs) and i < len(result.returns):
-                            entry_price, exit_price = result.entry_exit_pairs[i]
-                            return_pct = result.returns[i] / 100.0  # % 형식에서 소수점 형식으로 변환
-
-                            api_signals.append(
-                                APISignal(
-                                    symbol=symbol,
-                                    type=signal.side.lower(),  # BUY -> buy, SELL -> sell
-                                    timestamp=signal.timestamp.isoformat(),  # ISO 8601 형식
-                                    entry_price=entry_price,
-                                    exit_price=exit_price,
-                                    return_pct=return_pct,
-                                )
-                            )
-
-                # Equity Curve (성과곡선) 계산 (Phase 3 차트용)
-                performance_curve = None
-                if result.signals and result.returns:
-                    performance_curve = []
-                    cumulative_equity = 1.0
-
-                    for i, signal in enumerate(result.signals):
-                        if i < len(result.returns):
-                            # 반환률을 소수점 형식으로 변환 (% to decimal)
-                            return_pct = result.returns[i] / 100.0
-                            cumulative_equity *= (1.0 + return_pct)
-
-                            performance_curve.append(
-                                PerformancePoint(
-                                    timestamp=signal.timestamp.strftime('%Y-%m-%d'),
-                                    equity=cumulative_equity
-                                )
-                            )
-
-                # 결과 추가
-                symbol_results.append(
-                    SymbolResult(
-                        symbol=symbol,
-                        signals=api_signals,
-                        win_rate=result.win_rate,
-                        avg_return=result.avg_return,
-                        max_drawdown=result.max_drawdown,
-                        avg_hold_bars=result.avg_hold_bars,
-                        performance_curve=performance_curve,
-                    )
-                )
-                total_signals += result.samples
-
-            except HTTPException as e:
-                # 데이터 로더/전략에서 발생한 HTTPException 그대로 전달
-                logger.error(f"[{run_id}] HTTP error for {symbol}: {e.detail}")
-                raise
-            except Exception as e:
-                logger.error(
-                    f"[{run_id}] Strategy execution failed for {symbol}: {e}"
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Strategy execution failed for {symbol}: {str(e)}",
+        for index in sorted(results_by_index):
+            symbol_data = results_by_index[index]
+            performance_curve = None
+            if symbol_data["performance_curve"] is not None:
+                performance_curve = [
+                    PerformancePoint(**point) for point in symbol_data["performance_curve"]
+                ]
+
+            symbol_results.append(
+                SymbolResult(
+                    symbol=symbol_data["symbol"],
+                    signals=[APISignal(**signal) for signal in symbol_data["signals"]],
+                    win_rate=symbol_data["win_rate"],
+                    avg_return=symbol_data["avg_return"],
+                    max_drawdown=symbol_data["max_drawdown"],
+                    avg_hold_bars=symbol_data["avg_hold_bars"],
+                    performance_curve=performance_curve,
                 )
+            )
+            total_signals += symbol_data["samples"]
 
         execution_time = time.time() - start_time
 
@@ -693,6 +706,95 @@ async def run_backtest(request: BacktestRequest):
         )
 
 
+@app.post(
+    "/api/backtests/sweep",
+    response_model=SweepResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def run_backtest_sweep(request: SweepRequest):
+    """
+    파라미터 스윕 (그리드 서치) 실행
+
+    Phase 2 파라미터 튜닝처럼 여러 조합을 한 번의 요청으로 실행합니다.
+    심볼 데이터는 워커 작업당 한 번만 로드되고, 같은 중간 시리즈를 쓰는 조합끼리
+    계산 결과를 공유합니다. (backend.app.backtest_sweep 참고)
+
+    Args:
+        request (SweepRequest): 스윕 요청
+            - strategy, symbols, start_date, end_date, timeframe: BacktestRequest와 동일
+            - params: 모든 조합에 공통으로 적용할 파라미터
+            - param_grid: 파라미터명 -> 후보값 목록
+            - rank_by: 순위 지표 (기본값: avg_return)
+            - top_n: 상위 N개만 반환
+
+    Returns:
+        SweepResponse: 조합별 순위표
+
+    Raises:
+        HTTPException: 조합 수 초과(400), 데이터 로드 실패 등
+    """
+    run_id = str(uuid.uuid4())
+    start_time = time.time()
+
+    logger.info(
+        f"[{run_id}] Starting parameter sweep: strategy={request.strategy}, "
+        f"grid={list(request.param_grid)}, symbols={request.symbols}"
+    )
+
+    try:
+        try:
+            sweep = await run_parameter_sweep(
+                executor=get_backtest_executor(),
+                run_id=run_id,
+                strategy_name=request.strategy,
+                base_params=request.params,
+                param_grid=request.param_grid,
+                symbols=request.symbols,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                timeframe=request.timeframe,
+                rank_by=request.rank_by,
+                top_n=request.top_n,
+            )
+        except ValueError as e:
+            logger.error(f"[{run_id}] Invalid sweep request: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        except SymbolBacktestError as e:
+            logger.error(f"[{run_id}] Sweep failed for {e.symbol}: {e.detail}")
+            raise e.to_http_exception()
+
+        execution_time = time.time() - start_time
+        logger.info(
+            f"[{run_id}] Parameter sweep completed: "
+            f"combinations={sweep['total_combinations']}, execution_time={execution_time:.2f}s"
+        )
+
+        return SweepResponse(
+            run_id=run_id,
+            strategy=request.strategy,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            timeframe=request.timeframe,
+            rank_by=request.rank_by,
+            total_combinations=sweep["total_combinations"],
+            symbols_processed=sweep["symbols_processed"],
+            results=[SweepResultRow(**row) for row in sweep["results"]],
+            execution_time=execution_time,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[{run_id}] Unexpected error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unexpected error: {str(e)}",
+        )
+
+
 @app.get(
     "/api/backtests/latest",
     response_model=BacktestResponse,
@@ -1005,21 +1107,32 @@ async def download_backtest_result(run_id: str):
     """
     try:
         result_file = os.path.join(RESULTS_DIR, f"{run_id}.json")
+        headers = {"Content-Disposition": f'attachment; filename="backtest_{run_id}.json"'}
+
+        if os.path.exists(result_file):
+            logger.info(f"Downloading backtest result: {run_id}")
+            return FileResponse(
+                path=result_file,
+                filename=f"backtest_{run_id}.json",
+                media_type="application/json",
+                headers=headers,
+            )
 
-        if not os.path.exists(result_file):
+        # Parquet 형식으로 저장된 결과는 JSON으로 복원하여 전달
+        result_data = ResultManager.get_result(DATA_ROOT, run_id)
+        if not result_data:
             logger.warning(f"Download file not found: {run_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Backtest result not found: {run_id}",
             )
 
-        logger.info(f"Downloading backtest result: {run_id}")
+        logger.info(f"Downloading backtest result (parquet): {run_id}")
 
-        return FileResponse(
-            path=result_file,
-            filename=f"backtest_{run_id}.json",
+        return Response(
+            content=json.dumps(result_data, indent=2, ensure_ascii=False, default=str),
             media_type="application/json",
-            headers={"Content-Disposition": f'attachment; filename="backtest_{run_id}.json"'},
+            headers=headers,
         )
 
     except HTTPException:
@@ -1052,33 +1165,24 @@ async def get_backtest_result(run_id: str):
     """
     logger.info(f"[{run_id}] Retrieving backtest result")
 
-    result_file = os.path.join(RESULTS_DIR, f"{run_id}.json")
-
-    if not os.path.exists(result_file):
-        logger.warning(f"[{run_id}] Result file not found: {result_file}")
+    if not ResultManager.result_exists(DATA_ROOT, run_id):
+        logger.warning(f"[{run_id}] Result not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Backtest result not found: {run_id}",
         )
 
-    try:
-        with open(result_file, "r", encoding="utf-8") as f:
-            result_data = json.load(f)
-        logger.info(f"[{run_id}] Result retrieved successfully")
-        return BacktestResponse(**result_data)
-    except json.JSONDecodeError as e:
-        logger.error(f"[{run_id}] Invalid JSON in result file: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Invalid result file format: {str(e)}",
-        )
-    except Exception as e:
-        logger.error(f"[{run_id}] Failed to read result file: {e}")
+    result_data = ResultManager.get_result(DATA_ROOT, run_id)
+    if result_data is None:
+        logger.error(f"[{run_id}] Failed to read result")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to read result: {str(e)}",
+            detail=f"Failed to read result: {run_id}",
         )
 
+    logger.info(f"[{run_id}] Result retrieved successfully")
+    return BacktestResponse(**result_data)
+
 
 # ============================================================================
 # 비동기 API 엔드포인트 (Phase 3 - 운영 안정성)
@@ -1161,6 +1265,79 @@ async def run_backtest_async(request: BacktestRequest):
         )
 
 
+@app.post(
+    "/api/backtests/sweep-async",
+    response_model=AsyncBacktestResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def run_backtest_sweep_async(request: SweepRequest):
+    """
+    비동기 파라미터 스윕 실행
+
+    /api/backtests/sweep과 같은 스윕을 RQ 워커에서 실행합니다.
+    진행 상태와 순위표는 /api/backtests/status/{task_id}로 조회합니다.
+
+    Args:
+        request (SweepRequest): 스윕 요청
+
+    Returns:
+        AsyncBacktestResponse: task_id와 상태 정보
+    """
+    try:
+        task_id = TaskManager.create_task(
+            strategy=request.strategy,
+            params=request.params,
+            symbols=request.symbols,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            timeframe=request.timeframe,
+        )
+
+        logger.info(f"[{task_id}] Async sweep task created")
+
+        try:
+            from backend.app.jobs import run_sweep_job
+            job = rq_queue.enqueue(
+                run_sweep_job,
+                task_id=task_id,
+                strategy=request.strategy,
+                base_params=request.params,
+                param_grid=request.param_grid,
+                symbols=request.symbols,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                timeframe=request.timeframe,
+                rank_by=request.rank_by,
+                top_n=request.top_n,
+                job_id=task_id,
+                timeout=3600,
+            )
+            logger.info(f"[{task_id}] Sweep job enqueued to RQ: {job.id}")
+        except Exception as e:
+            logger.error(f"[{task_id}] Failed to enqueue sweep job: {e}")
+            TaskManager.set_error(task_id, f"Failed to enqueue job: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to enqueue sweep job: {str(e)}",
+            )
+
+        task = TaskManager.get_task(task_id)
+        return AsyncBacktestResponse(
+            task_id=task_id,
+            status=task.get("status", TaskStatus.QUEUED.value),
+            created_at=task.get("created_at"),
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in async sweep: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unexpected error: {str(e)}",
+        )
+
+
 @app.delete(
     "/api/backtests/tasks/{task_id}",
     response_model=AsyncBacktestResponse,
@@ -1698,10 +1875,8 @@ async def get_trade_history(
                 lose_count=0,
             )
 
-        # Run DB call in thread pool to avoid blocking event loop
-        import asyncio
-        trades = await asyncio.to_thread(
-            position_manager.get_closed_trades,
+        # 비동기 DB 백엔드로 조회 (이벤트 루프를 막지 않음)
+        trades = await position_manager.get_closed_trades_async(
             symbol,
             strategy_name,
             limit,
@@ -1794,6 +1969,9 @@ async def shutdown_scheduler():
     except Exception as e:
         logger.error(f"❌ 스케줄러 종료 중 오류: {e}")
 
+    # 백테스트 프로세스 풀 종료
+    close_backtest_executor()
+
 
 @app.get("/api/scheduler/status")
 async def get_scheduler_status_endpoint():
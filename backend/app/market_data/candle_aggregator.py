@@ -0,0 +1,368 @@
+"""
+다중 타임프레임 캔들 집계 (캐스케이드)
+
+체결은 기준 타임프레임(기본 1m) 캔들로 한 번만 집계하고, 상위 타임프레임(5m/15m/1h 등)은
+완성된 기준 캔들을 합쳐서 만듭니다. 타임프레임 수만큼 체결을 반복 집계하지 않습니다.
+
+- 심볼마다 슬롯 번호를 부여하고, 타임프레임별 OHLCV를 array 컬럼(슬롯 인덱스)으로 보관
+- 캔들 구간은 정수 epoch 초로 계산 (datetime 변환은 캔들이 완성될 때 한 번만, UTC 기준)
+- 상위 캔들은 구간의 마지막 기준 캔들이 완성되면 바로 완성 (중간이 비면 다음 구간 시작 시 완성)
+- 재시작 시 저장된 기준 캔들로 진행 중인 상위 구간을 복원 (restore_history),
+  복원할 수 없는 구간(재시작 전 구간 일부 누락)은 완성되어도 내보내지 않음
+"""
+
+import logging
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from backend.app.market_data.candle_builder import CandleBuilder, CandleData
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_CANDLES: Sequence[CandleData] = ()
+_EMPTY = -1  # 진행 중인 캔들이 없는 슬롯의 시작 시각
+
+
+def epoch_to_utc(epoch_seconds: int) -> datetime:
+    """epoch 초 → UTC naive datetime"""
+    return _EPOCH + timedelta(seconds=epoch_seconds)
+
+
+def utc_to_epoch(timestamp: datetime) -> int:
+    """UTC datetime → epoch 초 (naive는 UTC로 간주)"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+class _TimeframeColumns:
+    """타임프레임 하나의 심볼별 진행 중 캔들 (array 컬럼)"""
+
+    __slots__ = ('timeframe', 'seconds', 'start', 'open', 'high', 'low', 'close', 'volume', 'partial')
+
+    def __init__(self, timeframe: str, capacity: int):
+        self.timeframe = timeframe
+        self.seconds = CandleBuilder.TIMEFRAME_SECONDS[timeframe]
+        self.start = array('q', [_EMPTY]) * capacity
+        self.open = array('d', [0.0]) * capacity
+        self.high = array('d', [0.0]) * capacity
+        self.low = array('d', [0.0]) * capacity
+        self.close = array('d', [0.0]) * capacity
+        self.volume = array('d', [0.0]) * capacity
+        # 구간 일부를 보지 못한 캔들 (완성되어도 내보내지 않음)
+        self.partial = array('b', [0]) * capacity
+
+    def grow(self, capacity: int) -> None:
+        """슬롯 수 확장"""
+        extra = capacity - len(self.start)
+        self.start.extend(array('q', [_EMPTY]) * extra)
+        self.partial.extend(array('b', [0]) * extra)
+        for column in (self.open, self.high, self.low, self.close, self.volume):
+            column.extend(array('d', [0.0]) * extra)
+
+    def reset(self, slot: int) -> None:
+        self.start[slot] = _EMPTY
+        self.partial[slot] = 0
+
+    def merge(self, slot: int, bucket: int, open_price: float, high: float,
+              low: float, close: float, volume: float) -> None:
+        """완성된 하위 캔들을 구간 캔들에 합침 (구간이 바뀌면 새로 시작)"""
+        if self.start[slot] == bucket:
+            if high > self.high[slot]:
+                self.high[slot] = high
+            if low < self.low[slot]:
+                self.low[slot] = low
+            self.close[slot] = close
+            self.volume[slot] += volume
+        else:
+            self.start[slot] = bucket
+            self.open[slot] = open_price
+            self.high[slot] = high
+            self.low[slot] = low
+            self.close[slot] = close
+            self.volume[slot] = volume
+
+    def to_candle(self, symbol: str, slot: int) -> CandleData:
+        return CandleData(
+            symbol=symbol,
+            timeframe=self.timeframe,
+            timestamp=epoch_to_utc(self.start[slot]),
+            open=self.open[slot],
+            high=self.high[slot],
+            low=self.low[slot],
+            close=self.close[slot],
+            volume=self.volume[slot],
+        )
+
+
+class CascadingCandleAggregator:
+    """
+    체결 → 기준 타임프레임 캔들 → 상위 타임프레임 캔들 집계
+
+    Example:
+        >>> aggregator = CascadingCandleAggregator(['KRW-BTC'], '1m', ['5m', '1h'])
+        >>> for candle in aggregator.add_trade('KRW-BTC', 1704067200, 50000.0, 0.1):
+        ...     save(candle)
+    """
+
+    __slots__ = (
+        'base_timeframe', 'rollup_timeframes', '_base', '_rollups', '_slots',
+        '_symbols', '_free_slots', '_capacity', 'trades_processed', 'late_trades',
+    )
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, symbols: Iterable[str] = (), base_timeframe: str = '1m',
+                 rollup_timeframes: Iterable[str] = ()):
+        """
+        Args:
+            symbols: 초기 심볼 목록 (add_trade 시 새 심볼은 자동 추가)
+            base_timeframe: 체결로 직접 집계하는 타임프레임
+            rollup_timeframes: 기준 캔들을 합쳐 만드는 상위 타임프레임 (기준의 배수)
+
+        Raises:
+            ValueError: 지원하지 않거나 기준의 배수가 아닌 타임프레임
+        """
+        if base_timeframe not in CandleBuilder.TIMEFRAME_SECONDS:
+            raise ValueError(f"Unsupported timeframe: {base_timeframe}")
+        base_seconds = CandleBuilder.TIMEFRAME_SECONDS[base_timeframe]
+
+        rollups = []
+        for timeframe in dict.fromkeys(rollup_timeframes):
+            if timeframe == base_timeframe:
+                continue
+            seconds = CandleBuilder.TIMEFRAME_SECONDS.get(timeframe)
+            if seconds is None:
+                raise ValueError(f"Unsupported timeframe: {timeframe}")
+            if seconds % base_seconds != 0:
+                raise ValueError(
+                    f"Rollup timeframe {timeframe} must be a multiple of {base_timeframe}"
+                )
+            rollups.append(timeframe)
+
+        self.base_timeframe = base_timeframe
+        self.rollup_timeframes = sorted(rollups, key=CandleBuilder.TIMEFRAME_SECONDS.get)
+        self._capacity = self.INITIAL_CAPACITY
+        self._base = _TimeframeColumns(base_timeframe, self._capacity)
+        self._rollups = [_TimeframeColumns(tf, self._capacity) for tf in self.rollup_timeframes]
+        self._slots: Dict[str, int] = {}  # symbol -> slot
+        self._symbols: List[Optional[str]] = []  # slot -> symbol
+        self._free_slots: List[int] = []
+        self.trades_processed = 0
+        self.late_trades = 0  # 진행 중 캔들보다 이전 구간의 체결 (무시)
+
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._slots
+
+    @property
+    def timeframes(self) -> List[str]:
+        """집계하는 모든 타임프레임 (기준 포함)"""
+        return [self.base_timeframe, *self.rollup_timeframes]
+
+    def add_symbol(self, symbol: str) -> int:
+        """심볼 슬롯 할당 (이미 있으면 기존 슬롯)"""
+        slot = self._slots.get(symbol)
+        if slot is not None:
+            return slot
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._symbols[slot] = symbol
+        else:
+            slot = len(self._symbols)
+            if slot == self._capacity:
+                self._capacity *= 2
+                for columns in (self._base, *self._rollups):
+                    columns.grow(self._capacity)
+            self._symbols.append(symbol)
+
+        for columns in (self._base, *self._rollups):
+            columns.reset(slot)
+        self._slots[symbol] = slot
+        return slot
+
+    def remove_symbol(self, symbol: str) -> None:
+        """심볼 제거 (진행 중 캔들은 버림)"""
+        slot = self._slots.pop(symbol, None)
+        if slot is not None:
+            self._symbols[slot] = None
+            self._free_slots.append(slot)
+
+    def seed(self, symbol: str, epoch_start: int, open_price: float, high: float,
+             low: float, close: float, volume: float) -> None:
+        """
+        진행 중인 기준 캔들 복원 (히스토리 로드 시)
+
+        Args:
+            epoch_start: 캔들 시작 시각 (epoch 초)
+        """
+        slot = self.add_symbol(symbol)
+        base = self._base
+        base.start[slot] = epoch_start - epoch_start % base.seconds
+        base.open[slot] = open_price
+        base.high[slot] = high
+        base.low[slot] = low
+        base.close[slot] = close
+        base.volume[slot] = volume
+
+    def restore_history(self, symbol: str, candles: Sequence[Sequence[float]], now_epoch: int,
+                        complete: bool = True) -> None:
+        """
+        재시작 시 저장된 기준 캔들로 진행 중 상태 복원
+
+        - 마지막 캔들이 현재 구간이면 진행 중 기준 캔들로 이어서 집계
+        - 진행 중인 상위 구간은 그 구간의 저장된 기준 캔들을 합쳐 복원
+        - 저장된 캔들이 현재 시각 직전까지 이어지지 않거나(중단 기간 있음),
+          조회 범위가 상위 구간 시작보다 짧으면 그 구간은 완성되어도 내보내지 않음
+
+        Args:
+            candles: (epoch 시작, open, high, low, close, volume) 시간순 목록
+            now_epoch: 현재 시각 (epoch 초)
+            complete: candles가 저장된 전체 이력인지 (조회 개수 제한에 걸리지 않음)
+        """
+        slot = self.add_symbol(symbol)
+        base = self._base
+        current = now_epoch - now_epoch % base.seconds
+
+        completed = [candle for candle in candles if int(candle[0]) < current]
+        if candles and int(candles[-1][0]) >= current:
+            self.seed(symbol, current, *map(float, candles[-1][1:6]))
+
+        # 직전 기준 구간까지 저장되어 있어야 중단 없이 이어진 것으로 간주
+        continuous = bool(completed) and int(completed[-1][0]) >= current - base.seconds
+        oldest = int(completed[0][0]) if completed else current
+
+        for columns in self._rollups:
+            columns.reset(slot)
+            bucket = current - current % columns.seconds
+            if bucket == current:
+                continue  # 현재 기준 캔들부터 시작하는 구간
+            if not continuous or (not complete and oldest > bucket):
+                columns.start[slot] = bucket
+                columns.partial[slot] = 1
+                continue
+            # 구간 내 저장된 캔들이 없으면(체결 없던 구간) 첫 기준 캔들부터 시작
+            for start, open_price, high, low, close, volume in completed:
+                if int(start) >= bucket:
+                    columns.merge(slot, bucket, float(open_price), float(high), float(low),
+                                  float(close), float(volume))
+
+    def add_trade(self, symbol: str, epoch_seconds: int, price: float,
+                  volume: float) -> Sequence[CandleData]:
+        """
+        체결 추가
+
+        Args:
+            symbol: 심볼 (처음 보는 심볼은 자동 추가)
+            epoch_seconds: 체결 시각 (epoch 초)
+            price: 체결가
+            volume: 체결량
+
+        Returns:
+            이번 체결로 완성된 캔들 (기준 캔들, 이어서 상위 타임프레임 캔들 순)
+        """
+        self.trades_processed += 1
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self.add_symbol(symbol)
+
+        base = self._base
+        bucket = epoch_seconds - epoch_seconds % base.seconds
+        start = base.start[slot]
+
+        # 진행 중 캔들에 누적 (대부분의 체결)
+        if bucket == start:
+            if price > base.high[slot]:
+                base.high[slot] = price
+            elif price < base.low[slot]:
+                base.low[slot] = price
+            base.close[slot] = price
+            base.volume[slot] += volume
+            return _NO_CANDLES
+
+        if bucket < start:
+            self.late_trades += 1
+            return _NO_CANDLES
+
+        completed = _NO_CANDLES
+        if start != _EMPTY:
+            completed = [base.to_candle(symbol, slot)]
+            if self._rollups:
+                self._roll_up(symbol, slot, completed)
+
+        # 새 기준 캔들 시작
+        base.start[slot] = bucket
+        base.open[slot] = price
+        base.high[slot] = price
+        base.low[slot] = price
+        base.close[slot] = price
+        base.volume[slot] = volume
+        return completed
+
+    def _roll_up(self, symbol: str, slot: int, completed: List[CandleData]) -> None:
+        """완성된 기준 캔들을 상위 타임프레임 캔들에 합침"""
+        base = self._base
+        base_start = base.start[slot]
+        base_end = base_start + base.seconds
+
+        for columns in self._rollups:
+            bucket = base_start - base_start % columns.seconds
+            current = columns.start[slot]
+
+            if current == bucket:
+                if base.high[slot] > columns.high[slot]:
+                    columns.high[slot] = base.high[slot]
+                if base.low[slot] < columns.low[slot]:
+                    columns.low[slot] = base.low[slot]
+                columns.close[slot] = base.close[slot]
+                columns.volume[slot] += base.volume[slot]
+            else:
+                # 이전 구간이 마지막 기준 캔들 없이 끝난 경우 여기서 완성
+                if current != _EMPTY and current < bucket and not columns.partial[slot]:
+                    completed.append(columns.to_candle(symbol, slot))
+                columns.partial[slot] = 0
+                columns.start[slot] = bucket
+                columns.open[slot] = base.open[slot]
+                columns.high[slot] = base.high[slot]
+                columns.low[slot] = base.low[slot]
+                columns.close[slot] = base.close[slot]
+                columns.volume[slot] = base.volume[slot]
+
+            # 구간의 마지막 기준 캔들이면 바로 완성 (일부만 본 구간은 버림)
+            if base_end == bucket + columns.seconds:
+                if not columns.partial[slot]:
+                    completed.append(columns.to_candle(symbol, slot))
+                columns.reset(slot)
+
+    def get_current_candle(self, symbol: str, timeframe: Optional[str] = None) -> Optional[CandleData]:
+        """
+        진행 중인 캔들 조회 (미완성)
+
+        상위 타임프레임은 완성된 기준 캔들까지만 반영된 값입니다.
+        """
+        slot = self._slots.get(symbol)
+        if slot is None:
+            return None
+        if timeframe is None or timeframe == self.base_timeframe:
+            columns = self._base
+        else:
+            columns = next((c for c in self._rollups if c.timeframe == timeframe), None)
+            if columns is None:
+                return None
+        if columns.start[slot] == _EMPTY:
+            return None
+        return columns.to_candle(symbol, slot)
+
+    def get_metrics(self) -> Dict:
+        """집계 지표"""
+        return {
+            'symbols': len(self._slots),
+            'timeframes': self.timeframes,
+            'trades_processed': self.trades_processed,
+            'late_trades': self.late_trades,
+        }
@@ -0,0 +1,413 @@
+"""
+Upbit REST 캔들 수집기 (프로세스 내 비동기)
+
+여러 (심볼, 타임프레임) 스트림을 한 이벤트 루프에서 동시에 수집합니다.
+
+- 모든 요청이 전역 토큰 버킷 하나(초당 10회, 분당 600회)를 공유하므로
+  동시 스트림 수와 관계없이 Upbit 요청 한도를 지킵니다
+- HTTP 연결은 httpx.AsyncClient 하나로 재사용 (스트림마다 프로세스/세션 생성 없음)
+- 429 응답은 잠시 대기 후 재시도
+- 수집 결과는 scripts/fetch_upbit_candles.py와 같은 구조로 바로 저장
+  (DATA_ROOT/{SYMBOL}/{timeframe}/{year}.parquet, 기존 파일과 timestamp 기준 병합)
+
+REST 엔드포인트는 base_url(기본: 환경변수 UPBIT_API_URL)로 바꿀 수 있어
+테스트에서는 로컬 스텁 서버나 httpx 전송 계층을 연결합니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.upbit.com/v1"
+DEFAULT_REQUESTS_PER_SECOND = 10
+DEFAULT_REQUESTS_PER_MINUTE = 600
+
+# Upbit API 최대 캔들 수 (요청 1회)
+BATCH_SIZE = 200
+# 429 응답 재시도 횟수 / 대기 시간 (초)
+MAX_RETRIES = 3
+RETRY_DELAY = 1.0
+
+# 타임프레임 -> 캔들 엔드포인트 (fetch_upbit_candles.TIMEFRAME_CONFIG와 동일)
+TIMEFRAME_ENDPOINTS = {
+    '1M': 'candles/minutes/1',
+    '5M': 'candles/minutes/5',
+    '10M': 'candles/minutes/10',
+    '15M': 'candles/minutes/15',
+    '30M': 'candles/minutes/30',
+    '1H': 'candles/minutes/60',
+    '4H': 'candles/minutes/240',
+    '1D': 'candles/days',
+    '1W': 'candles/weeks',
+    '1Mo': 'candles/months',
+}
+
+
+class TokenBucket:
+    """
+    여러 구간 한도를 함께 지키는 비동기 토큰 버킷
+
+    한도마다 (요청 수, 구간 초) 버킷을 두고, 모든 버킷에 토큰이 있을 때만 요청을 허용합니다.
+    대기 중인 요청은 도착 순서대로 처리됩니다.
+
+    Example:
+        >>> bucket = TokenBucket([(10, 1.0), (600, 60.0)])
+        >>> await bucket.acquire()
+    """
+
+    def __init__(self, limits: Sequence[Tuple[int, float]], clock=time.monotonic):
+        """
+        Args:
+            limits: (구간당 최대 요청 수, 구간 초) 목록
+            clock: 단조 증가 시계 (테스트용)
+        """
+        if not limits:
+            raise ValueError("At least one rate limit is required")
+        self._capacity = [float(count) for count, _ in limits]
+        self._rate = [count / period for count, period in limits]
+        self._tokens = list(self._capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        self.acquired = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        for i, capacity in enumerate(self._capacity):
+            self._tokens[i] = min(capacity, self._tokens[i] + elapsed * self._rate[i])
+
+    def _wait_time(self) -> float:
+        """모든 버킷에 토큰 1개가 생길 때까지 남은 시간 (초)"""
+        return max(
+            (1.0 - tokens) / rate
+            for tokens, rate in zip(self._tokens, self._rate)
+        )
+
+    async def acquire(self) -> None:
+        """요청 1회분 토큰 획득 (한도 초과 시 대기)"""
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            for i in range(len(self._tokens)):
+                self._tokens[i] -= 1.0
+            self.acquired += 1
+
+
+def create_upbit_rate_limiter(
+    per_second: Optional[int] = None,
+    per_minute: Optional[int] = None
+) -> TokenBucket:
+    """
+    Upbit 요청 한도 토큰 버킷 생성
+
+    Args:
+        per_second: 초당 요청 수 (None이면 UPBIT_REQUESTS_PER_SECOND)
+        per_minute: 분당 요청 수 (None이면 UPBIT_REQUESTS_PER_MINUTE)
+    """
+    if per_second is None:
+        per_second = int(os.getenv("UPBIT_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND))
+    if per_minute is None:
+        per_minute = int(os.getenv("UPBIT_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE))
+    return TokenBucket([(max(1, per_second), 1.0), (max(1, per_minute), 60.0)])
+
+
+def _parse_utc(value: Optional[str]) -> Optional[datetime]:
+    """Upbit candle_date_time_utc (naive ISO 8601) → UTC datetime"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        logger.warning(f"DateTime 파싱 실패: {value}")
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def candles_to_frame(candles: List[Dict]) -> pd.DataFrame:
+    """
+    Upbit 캔들 응답 → OHLCV DataFrame (timestamp UTC, 오래된 순)
+
+    Args:
+        candles: Upbit 캔들 응답 항목 목록
+    """
+    if not candles:
+        return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+
+    raw = pd.DataFrame(candles)
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(raw['candle_date_time_utc'], utc=True),
+        'open': raw['opening_price'].astype(float),
+        'high': raw['high_price'].astype(float),
+        'low': raw['low_price'].astype(float),
+        'close': raw['trade_price'].astype(float),
+        'volume': raw['candle_acc_trade_volume'].astype(float),
+    })
+    return df.sort_values('timestamp').reset_index(drop=True)
+
+
+def save_candles_by_year(
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    data_root: str,
+    overwrite: bool = False
+) -> List[str]:
+    """
+    캔들을 연도별 parquet 파일에 저장 (fetch_upbit_candles.save_to_parquet_by_year와 동일 규칙)
+
+    Args:
+        df: OHLCV DataFrame (timestamp UTC)
+        symbol: 심볼 (예: KRW-BTC)
+        timeframe: 타임프레임 (예: 1H)
+        data_root: 데이터 루트
+        overwrite: True면 기존 파일을 병합하지 않고 교체
+
+    Returns:
+        저장된 파일 경로 리스트
+    """
+    if df.empty:
+        return []
+
+    save_dir = Path(data_root) / symbol.upper() / timeframe
+    save_dir.mkdir(parents=True, exist_ok=True)
+    saved_files = []
+
+    for year, year_df in df.groupby(df['timestamp'].dt.year):
+        file_path = save_dir / f"{year}.parquet"
+
+        if file_path.exists() and not overwrite:
+            existing_df = pd.read_parquet(file_path)
+            if existing_df['timestamp'].dt.tz is None:
+                existing_df['timestamp'] = existing_df['timestamp'].dt.tz_localize('UTC')
+            existing_df['timestamp'] = existing_df['timestamp'].dt.tz_convert('UTC')
+            year_df = pd.concat([existing_df, year_df])
+            year_df = year_df.drop_duplicates(subset=['timestamp'], keep='last')  # 최신 데이터 우선
+            year_df = year_df.sort_values('timestamp')
+
+        year_df.reset_index(drop=True).to_parquet(file_path, index=False)
+        saved_files.append(str(file_path))
+        logger.debug(f"저장 완료: {file_path} ({len(year_df)}개 행)")
+
+    return saved_files
+
+
+class UpbitCandleFetcher:
+    """
+    Upbit 캔들 비동기 수집기
+
+    Example:
+        >>> async with UpbitCandleFetcher() as fetcher:
+        ...     results = await fetcher.fetch_many(['KRW-BTC', 'KRW-ETH'], ['1H', '1D'], days=7)
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        data_root: Optional[str] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            base_url: REST API 주소 (None이면 UPBIT_API_URL 또는 https://api.upbit.com/v1)
+            rate_limiter: 요청 한도 토큰 버킷 (None이면 create_upbit_rate_limiter)
+            data_root: 데이터 루트 (None이면 DATA_ROOT 또는 /data)
+            timeout: 요청 타임아웃 (초)
+            transport: httpx 전송 계층 (테스트 스텁용)
+        """
+        self.base_url = (base_url or os.getenv("UPBIT_API_URL", DEFAULT_API_URL)).rstrip('/')
+        self.rate_limiter = rate_limiter or create_upbit_rate_limiter()
+        self.data_root = data_root or os.getenv("DATA_ROOT", "/data")
+        self.timeout = timeout
+        self.transport = transport
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> 'UpbitCandleFetcher':
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=self.transport,
+            headers={'Accept': 'application/json'},
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def _get(self, path: str, params: Dict) -> List[Dict]:
+        """토큰 획득 후 GET (429는 대기 후 재시도)"""
+        for attempt in range(MAX_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            response = await self.client.get(path, params=params)
+            if response.status_code == 429 and attempt < MAX_RETRIES:
+                logger.warning(f"요청 한도 초과(429): {path} {params.get('market')}, {RETRY_DELAY}초 후 재시도")
+                await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                continue
+            response.raise_for_status()
+            return response.json()
+        return []
+
+    async def fetch_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> pd.DataFrame:
+        """
+        기간 내 캔들 수집 (최신부터 200개씩 역방향 페이지 조회)
+
+        Args:
+            symbol: 심볼 (예: KRW-BTC)
+            timeframe: 타임프레임 (TIMEFRAME_ENDPOINTS 키)
+            start_date: 시작 시각 (UTC, 미포함)
+            end_date: 종료 시각 (UTC)
+
+        Returns:
+            OHLCV DataFrame (오래된 순)
+
+        Raises:
+            ValueError: 지원하지 않는 타임프레임
+            httpx.HTTPError: 요청 실패
+        """
+        path = TIMEFRAME_ENDPOINTS.get(timeframe)
+        if path is None:
+            raise ValueError(f"지원하지 않는 타임프레임: {timeframe}")
+
+        candles: List[Dict] = []
+        current_to = end_date
+        while current_to > start_date:
+            data = await self._get(path, {
+                'market': symbol,
+                'count': BATCH_SIZE,
+                'to': current_to.isoformat(),
+            })
+            if not data:
+                break
+
+            filtered = [
+                candle for candle in data
+                if (_parse_utc(candle.get('candle_date_time_utc')) or start_date) > start_date
+            ]
+            candles.extend(filtered)
+            # 시작 시각에 도달했거나 마지막 페이지
+            if len(filtered) < len(data) or len(data) < BATCH_SIZE:
+                break
+
+            last_time = _parse_utc(data[-1].get('candle_date_time_utc'))
+            if last_time is None:
+                break
+            current_to = last_time - timedelta(seconds=1)
+
+        return candles_to_frame(candles)
+
+    async def fetch_and_save(
+        self,
+        symbol: str,
+        timeframe: str,
+        days: int = 30,
+        overwrite: bool = False
+    ) -> Dict:
+        """
+        최근 N일 캔들 수집 후 저장 (fetch_candles_job과 같은 결과 형식)
+
+        Args:
+            symbol: 심볼
+            timeframe: 타임프레임
+            days: 수집 기간 (최근 N일)
+            overwrite: 기존 파일 덮어쓰기 여부
+
+        Returns:
+            작업 결과 딕셔너리
+        """
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=days)
+        try:
+            df = await self.fetch_candles(symbol, timeframe, start_date, end_date)
+            if df.empty:
+                raise ValueError("수집된 데이터가 없습니다.")
+            saved_files = await asyncio.to_thread(
+                save_candles_by_year, df, symbol, timeframe, self.data_root, overwrite
+            )
+        except Exception as e:
+            error_msg = f"작업 실패: {e}"
+            logger.error(f"{symbol} {timeframe} {error_msg}")
+            return {
+                'success': False,
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'error': error_msg,
+            }
+
+        logger.info(f"작업 완료: {symbol} {timeframe} ({len(df)}개 캔들)")
+        return {
+            'success': True,
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'message': f'{symbol} {timeframe} 데이터 수집 완료',
+            'records': len(df),
+            'files': saved_files,
+            'timestamp': datetime.now().isoformat(),
+        }
+
+    async def fetch_many(
+        self,
+        symbols: Iterable[str],
+        timeframes: Iterable[str],
+        days: int = 30,
+        overwrite: bool = False
+    ) -> List[Dict]:
+        """
+        심볼 × 타임프레임 스트림 동시 수집
+
+        Returns:
+            스트림별 작업 결과 (symbols × timeframes 순서)
+        """
+        timeframes = list(timeframes)
+        return list(await asyncio.gather(*(
+            self.fetch_and_save(symbol, timeframe, days, overwrite)
+            for symbol in symbols
+            for timeframe in timeframes
+        )))
+
+
+async def fetch_candle_streams(
+    symbols: Iterable[str],
+    timeframes: Iterable[str],
+    days: int = 30,
+    overwrite: bool = False,
+    **fetcher_options
+) -> List[Dict]:
+    """
+    수집기 하나(연결 풀/토큰 버킷 공유)로 심볼 × 타임프레임 수집
+
+    Args:
+        symbols: 심볼 목록
+        timeframes: 타임프레임 목록
+        days: 수집 기간
+        overwrite: 덮어쓰기 여부
+        **fetcher_options: UpbitCandleFetcher 인자 (base_url, data_root 등)
+
+    Returns:
+        스트림별 작업 결과
+    """
+    async with UpbitCandleFetcher(**fetcher_options) as fetcher:
+        return await fetcher.fetch_many(symbols, timeframes, days, overwrite)
@@ -0,0 +1,210 @@
+"""
+캔들 쓰기 버퍼 (write-behind)
+
+완성된 캔들을 바로 한 건씩 저장하지 않고 버퍼에 모았다가 한 번에 처리합니다.
+
+- Postgres: 다중 행 INSERT ... ON CONFLICT 한 번 (스레드 전환 1회, 커밋 1회)
+- Redis: 파이프라인으로 XADD 묶음 전송 (왕복 1회)
+- 플러시 조건: 버퍼가 CANDLE_WRITE_BATCH_SIZE(기본 500)개에 도달하거나,
+  첫 캔들이 들어온 후 CANDLE_WRITE_MAX_DELAY_MS(기본 50ms)가 지났을 때
+
+매 분 정각에 구독 심볼의 캔들이 한꺼번에 마감되어도 심볼 수만큼 왕복하지 않으므로,
+전략에 캔들이 전달되기까지의 지연은 최대 지연 시간 + 배치 1회 저장 시간으로 제한됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from backend.app.database import DatabaseManager
+from backend.app.market_data.candle_builder import CandleData
+
+logger = logging.getLogger(__name__)
+
+# 플러시 기준
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_DELAY_MS = 50
+
+
+class CandleWriteBuffer:
+    """완성된 캔들을 모아 Postgres/Redis에 일괄 기록하는 버퍼"""
+
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        redis_client: Optional[object] = None,
+        on_flushed: Optional[Callable[[List[CandleData]], Awaitable[None]]] = None,
+        batch_size: Optional[int] = None,
+        max_delay_ms: Optional[float] = None,
+    ):
+        """
+        Args:
+            db: 데이터베이스 관리자 (None이면 저장 생략)
+            redis_client: Redis 클라이언트 (None이면 브로드캐스트 생략)
+            on_flushed: 저장된 캔들 배치를 받는 콜백 (전략 실행 등)
+            batch_size: 배치 최대 캔들 수 (None이면 CANDLE_WRITE_BATCH_SIZE)
+            max_delay_ms: 첫 캔들 이후 플러시까지 최대 대기 시간 (None이면 CANDLE_WRITE_MAX_DELAY_MS)
+        """
+        if batch_size is None:
+            batch_size = int(os.getenv("CANDLE_WRITE_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+        if max_delay_ms is None:
+            max_delay_ms = float(os.getenv("CANDLE_WRITE_MAX_DELAY_MS", DEFAULT_MAX_DELAY_MS))
+
+        self.db = db
+        self.redis_client = redis_client
+        self.on_flushed = on_flushed
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max(0.0, max_delay_ms) / 1000
+
+        self._pending: List[CandleData] = []
+        self._first_enqueued_at: Optional[float] = None
+        self._batch_ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._draining = False  # flush() 중에는 시간 조건을 기다리지 않음
+
+        # 지표
+        self.max_queue_depth = 0
+        self.batches_flushed = 0
+        self.candles_flushed = 0
+        self.failed_batches = 0
+        self.last_batch_size = 0
+        self.last_flush_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """플러시 대기 중인 캔들 수"""
+        return len(self._pending)
+
+    def add(self, candle: CandleData) -> None:
+        """
+        캔들을 버퍼에 추가 (실행 중인 이벤트 루프에서 호출)
+
+        Args:
+            candle: 완성된 캔들
+        """
+        if not self._pending:
+            self._first_enqueued_at = time.monotonic()
+        self._pending.append(candle)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._pending))
+
+        if len(self._pending) >= self.batch_size:
+            self._batch_ready.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """버퍼가 빌 때까지 크기/시간 조건에 맞춰 플러시"""
+        while self._pending:
+            if len(self._pending) < self.batch_size and not self._draining:
+                remaining = self._first_enqueued_at + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    try:
+                        await asyncio.wait_for(self._batch_ready.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+
+            self._batch_ready.clear()
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            self._first_enqueued_at = time.monotonic() if self._pending else None
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[CandleData]) -> None:
+        """
+        캔들 배치 저장 → 브로드캐스트 → 콜백
+
+        저장에 실패한 배치는 브로드캐스트/콜백하지 않습니다.
+        """
+        started = time.monotonic()
+        try:
+            if self.db:
+                await self.db.insert_candles_async([
+                    (c.symbol, c.timeframe, c.timestamp, c.open, c.high, c.low, c.close, c.volume)
+                    for c in batch
+                ])
+        except Exception as e:
+            self.failed_batches += 1
+            logger.error(f"Failed to save candle batch ({len(batch)} candles): {e}")
+            return
+
+        await self._broadcast_to_redis(batch)
+
+        self.batches_flushed += 1
+        self.candles_flushed += len(batch)
+        self.last_batch_size = len(batch)
+        self.last_flush_ms = (time.monotonic() - started) * 1000
+        logger.debug(f"Flushed {len(batch)} candles in {self.last_flush_ms:.1f}ms")
+
+        if self.on_flushed:
+            try:
+                await self.on_flushed(batch)
+            except Exception as e:
+                logger.error(f"Error in candle batch callback: {e}")
+
+    async def _broadcast_to_redis(self, batch: List[CandleData]) -> None:
+        """Redis Stream으로 캔들 배치 브로드캐스트 (파이프라인 1회 왕복)"""
+        if not self.redis_client:
+            return
+
+        def _xadd_all():
+            entries = [
+                (
+                    # Redis Stream 키: market_candles:{symbol}:{timeframe}
+                    f"market_candles:{c.symbol}:{c.timeframe}",
+                    {
+                        'timestamp': c.timestamp.isoformat(),
+                        'open': str(c.open),
+                        'high': str(c.high),
+                        'low': str(c.low),
+                        'close': str(c.close),
+                        'volume': str(c.volume),
+                    },
+                )
+                for c in batch
+            ]
+            pipeline_factory = getattr(self.redis_client, 'pipeline', None)
+            if pipeline_factory is None:
+                for stream_key, fields in entries:
+                    self.redis_client.xadd(stream_key, fields)
+                return
+            pipe = pipeline_factory(transaction=False)
+            for stream_key, fields in entries:
+                pipe.xadd(stream_key, fields)
+            pipe.execute()
+
+        try:
+            await asyncio.to_thread(_xadd_all)
+        except AttributeError:
+            logger.warning("Redis client does not have xadd method")
+        except Exception as e:
+            logger.error(f"Failed to broadcast candle batch to Redis: {e}")
+
+    async def flush(self) -> None:
+        """대기 중인 캔들을 모두 즉시 플러시 (서비스 종료 시)"""
+        self._draining = True
+        try:
+            while self._pending or (self._task and not self._task.done()):
+                self._batch_ready.set()
+                if self._task is None or self._task.done():
+                    self._task = asyncio.create_task(self._run())
+                await self._task
+        finally:
+            self._draining = False
+
+    def get_metrics(self) -> Dict:
+        """버퍼 지표 조회"""
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'batches_flushed': self.batches_flushed,
+            'candles_flushed': self.candles_flushed,
+            'failed_batches': self.failed_batches,
+            'last_batch_size': self.last_batch_size,
+            'last_flush_ms': round(self.last_flush_ms, 3),
+            'batch_size': self.batch_size,
+            'max_delay_ms': self.max_delay * 1000,
+        }
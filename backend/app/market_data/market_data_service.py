@@ -7,11 +7,15 @@ WebSocket 클라이언트, 캔들 빌더, 데이터베이스를 조율하여
 
 import asyncio
 import logging
+import os
+import time
 from typing import List, Optional, Callable, Dict
 from datetime import datetime
 
 from backend.app.database import DatabaseManager, get_db
-from backend.app.market_data.candle_builder import CandleBuilder, CandleData
+from backend.app.market_data.candle_aggregator import CascadingCandleAggregator, utc_to_epoch
+from backend.app.market_data.candle_builder import CandleData
+from backend.app.market_data.candle_writer import CandleWriteBuffer
 from backend.app.market_data.upbit_websocket import UpbitWebSocketClient
 
 logger = logging.getLogger(__name__)
@@ -22,38 +26,55 @@ class MarketDataService:
     실시간 시장 데이터 수집 및 처리 서비스
 
     - WebSocket으로 체결 데이터 수신
-    - 캔들 집계 (기본 1분봉)
-    - Postgres에 영속 저장
-    - Redis Stream으로 브로드캐스트
+    - 캔들 집계 (기본 1분봉, MARKET_DATA_ROLLUP_TIMEFRAMES 지정 시 상위 타임프레임도 기준 캔들에서 합산)
+    - Postgres에 영속 저장, Redis Stream으로 브로드캐스트 (CandleWriteBuffer로 일괄 처리)
+    - 저장된 캔들 배치를 콜백으로 전달 (on_candles_complete 또는 캔들별 on_candle_complete)
+      전략/손익 평가는 기준 타임프레임 기준이므로 콜백에는 기준 타임프레임 캔들만 전달
     """
 
-    def __init__(self, symbols: List[str], timeframe: str = '1m', redis_client: Optional[object] = None):
+    # 재시작 시 조회하는 최근 기준 캔들 수
+    HISTORY_LIMIT = 200
+
+    def __init__(self, symbols: List[str], timeframe: str = '1m', redis_client: Optional[object] = None,
+                 rollup_timeframes: Optional[List[str]] = None):
         """
         Args:
             symbols: 구독할 심볼 목록
             timeframe: 캔들 타임프레임 (기본: '1m')
             redis_client: Redis 클라이언트 (의존성 주입, 선택사항)
+            rollup_timeframes: 기준 캔들을 합쳐 만들 상위 타임프레임
+                (None이면 MARKET_DATA_ROLLUP_TIMEFRAMES, 예: "5m,15m,1h")
         """
+        if rollup_timeframes is None:
+            rollup_timeframes = [
+                tf.strip() for tf in os.getenv("MARKET_DATA_ROLLUP_TIMEFRAMES", "").split(",") if tf.strip()
+            ]
+
         self.symbols = symbols
         self.timeframe = timeframe
         self.ws_client = UpbitWebSocketClient(symbols)
-        self.candle_builders: Dict[str, CandleBuilder] = {}
+        self.aggregator = CascadingCandleAggregator(symbols, timeframe, rollup_timeframes)
         self.db: Optional[DatabaseManager] = None
         self.redis_client = redis_client  # Redis 클라이언트 의존성 주입
         self.is_running = False
-        self.on_candle_complete: Optional[Callable] = None
+        self.on_candle_complete: Optional[Callable] = None  # async (candle) -> None
+        self.on_candles_complete: Optional[Callable] = None  # async (candles) -> None, 설정 시 우선
+        self.write_buffer: Optional[CandleWriteBuffer] = None
 
     async def initialize(self) -> None:
         """서비스 초기화"""
         try:
             # 데이터베이스 연결
             self.db = get_db()
+            self.write_buffer = CandleWriteBuffer(
+                db=self.db,
+                redis_client=self.redis_client,
+                on_flushed=self._on_candles_flushed,
+            )
 
-            # 캔들 빌더 초기화
+            # 심볼별 히스토리 로드 (진행 중 캔들 복원)
             for symbol in self.symbols:
-                self.candle_builders[symbol] = CandleBuilder(symbol, self.timeframe)
-
-                # 히스토리 로드 (최근 200개)
+                self.aggregator.add_symbol(symbol)
                 await self._load_history(symbol)
 
             # WebSocket 콜백 설정
@@ -66,39 +87,43 @@ class MarketDataService:
 
     async def _load_history(self, symbol: str, max_retries: int = 3) -> None:
         """과거 데이터 로드 (재시도 로직 포함)"""
-        import pandas as pd
-
         for attempt in range(max_retries):
             try:
                 if not self.db:
                     logger.error("Database not initialized")
                     return
 
-                # Postgres에서 최근 캔들 로드 (비동기)
+                # Postgres에서 최근 캔들 로드 (비동기, 최신 HISTORY_LIMIT개를 시간순으로)
                 recent_candles = await self.db.fetch_all_async(
                     """
                     SELECT timestamp, open, high, low, close, volume
                     FROM market_candles
                     WHERE symbol = %s AND timeframe = %s
-                    ORDER BY timestamp ASC
-                    LIMIT 200
+                    ORDER BY timestamp DESC
+                    LIMIT %s
                     """,
-                    (symbol, self.timeframe)
+                    (symbol, self.timeframe, self.HISTORY_LIMIT)
+                )
+                recent_candles = list(reversed(recent_candles or []))
+
+                # 진행 중인 기준/상위 캔들 복원
+                # (이미 끝난 캔들은 복원하지 않아 첫 체결에서 다시 완성되지 않음)
+                self.aggregator.restore_history(
+                    symbol,
+                    [
+                        (utc_to_epoch(row['timestamp']), float(row['open']), float(row['high']),
+                         float(row['low']), float(row['close']), float(row['volume']))
+                        for row in recent_candles
+                    ],
+                    int(time.time()),
+                    complete=len(recent_candles) < self.HISTORY_LIMIT,
                 )
 
                 if recent_candles:
-                    # DataFrame으로 변환
-                    df = pd.DataFrame(recent_candles)
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-
-                    # 캔들 빌더에 히스토리 로드
-                    self.candle_builders[symbol].load_from_dataframe(df)
                     logger.info(f"Loaded {len(recent_candles)} historical candles for {symbol}")
-                    return
-
                 else:
                     logger.info(f"No historical candles found for {symbol}")
-                    return
+                return
 
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -120,83 +145,43 @@ class MarketDataService:
             timestamp: 체결 시간 (UTC)
         """
         try:
-            if symbol not in self.candle_builders:
+            if symbol not in self.aggregator:
                 logger.warning(f"Unknown symbol: {symbol}")
                 return
 
-            builder = self.candle_builders[symbol]
-
-            # 캔들 집계
-            completed_candle = builder.add_trade(timestamp, price, volume)
+            # 캔들 집계 (기준 캔들 + 상위 타임프레임 합산)
+            completed = self.aggregator.add_trade(symbol, int(timestamp.timestamp()), price, volume)
 
             # 완성된 캔들이 있으면 저장
-            if completed_candle:
-                await self._save_candle(completed_candle)
+            for candle in completed:
+                await self._save_candle(candle)
 
         except Exception as e:
             logger.error(f"Error in trade callback: {e}")
 
     async def _save_candle(self, candle: CandleData) -> None:
-        """캔들을 저장하고 브로드캐스트"""
-        try:
-            if not self.db:
-                logger.error("Database not initialized")
-                return
-
-            # Postgres에 저장 (비동기, 전용 메서드 사용)
-            candle_id = await self.db.insert_candle_async(
-                candle.symbol,
-                candle.timeframe,
-                candle.timestamp,
-                candle.open,
-                candle.high,
-                candle.low,
-                candle.close,
-                candle.volume
-            )
-
-            logger.debug(f"Saved candle: {candle.symbol} {candle.timestamp} (id: {candle_id})")
-
-            # Redis Stream으로 브로드캐스트
-            await self._broadcast_to_redis(candle)
-
-            # 콜백 호출
-            if self.on_candle_complete:
-                await self.on_candle_complete(candle)
-
-        except Exception as e:
-            logger.error(f"Failed to save candle: {e}")
-
-    async def _broadcast_to_redis(self, candle: CandleData) -> None:
-        """Redis Stream으로 캔들 브로드캐스트"""
-        try:
-            if not self.redis_client:
-                logger.debug("Redis client not configured, skipping broadcast")
-                return
-
-            # Redis Stream 키: market_candles:{symbol}:{timeframe}
-            stream_key = f"market_candles:{candle.symbol}:{candle.timeframe}"
-
-            # Redis Stream에 추가 (비동기 처리)
-            await asyncio.to_thread(
-                self.redis_client.xadd,
-                stream_key,
-                {
-                    'timestamp': candle.timestamp.isoformat(),
-                    'open': str(candle.open),
-                    'high': str(candle.high),
-                    'low': str(candle.low),
-                    'close': str(candle.close),
-                    'volume': str(candle.volume)
-                }
-            )
-
-            logger.debug(f"Broadcasted candle to Redis: {stream_key}")
-
-        except AttributeError:
-            logger.warning("Redis client does not have xadd method")
-        except Exception as e:
-            logger.error(f"Failed to broadcast to Redis: {e}")
+        """캔들을 쓰기 버퍼에 추가 (저장/브로드캐스트/콜백은 배치 단위로 처리)"""
+        if not self.write_buffer:
+            logger.error("Database not initialized")
+            return
+
+        self.write_buffer.add(candle)
+
+    async def _on_candles_flushed(self, candles: List[CandleData]) -> None:
+        """저장된 캔들 배치 중 기준 타임프레임 캔들을 콜백으로 전달 (상위 타임프레임은 저장/브로드캐스트만)"""
+        base_timeframe = self.aggregator.base_timeframe
+        candles = [candle for candle in candles if candle.timeframe == base_timeframe]
+        if not candles:
+            return
+
+        if self.on_candles_complete:
+            await self.on_candles_complete(candles)
+        elif self.on_candle_complete:
+            for candle in candles:
+                try:
+                    await self.on_candle_complete(candle)
+                except Exception as e:
+                    logger.error(f"Error in candle callback for {candle.symbol}: {e}")
 
     async def start(self) -> None:
         """서비스 시작"""
@@ -216,13 +201,15 @@ class MarketDataService:
         """서비스 중지"""
         self.is_running = False
         await self.ws_client.stop()
+        if self.write_buffer:
+            await self.write_buffer.flush()
         logger.info("MarketDataService stopped")
 
     def add_symbol(self, symbol: str) -> None:
         """심볼 추가"""
         if symbol not in self.symbols:
             self.symbols.append(symbol)
-            self.candle_builders[symbol] = CandleBuilder(symbol, self.timeframe)
+            self.aggregator.add_symbol(symbol)
             self.ws_client.subscribe_symbols([symbol])
             logger.info(f"Added symbol: {symbol}")
 
@@ -230,17 +217,13 @@ class MarketDataService:
         """심볼 제거"""
         if symbol in self.symbols:
             self.symbols.remove(symbol)
-            if symbol in self.candle_builders:
-                del self.candle_builders[symbol]
+            self.aggregator.remove_symbol(symbol)
             self.ws_client.unsubscribe_symbols([symbol])
             logger.info(f"Removed symbol: {symbol}")
 
     def get_current_candle(self, symbol: str) -> Optional[Dict]:
         """현재 구성 중인 캔들 조회"""
-        if symbol not in self.candle_builders:
-            return None
-
-        candle = self.candle_builders[symbol].get_current_candle()
+        candle = self.aggregator.get_current_candle(symbol)
         return candle.to_dict() if candle else None
 
     def get_status(self) -> Dict:
@@ -250,6 +233,8 @@ class MarketDataService:
             'is_connected': self.ws_client.is_connected,
             'symbols': self.symbols,
             'timeframe': self.timeframe,
+            'aggregator': self.aggregator.get_metrics(),
+            'write_buffer': self.write_buffer.get_metrics() if self.write_buffer else None,
             'current_candles': {
                 symbol: self.get_current_candle(symbol)
                 for symbol in self.symbols
@@ -0,0 +1,286 @@
+"""
+공유 시세 허브 (/ws/tickers/krw)
+
+프로세스당 업비트 ticker 구독을 하나만 유지하고, 수신한 시세를 한 번 파싱/직렬화하여
+모든 로컬 구독자(브라우저 WebSocket)에게 멀티캐스트합니다.
+
+- 최신 시세 테이블(market -> ticker) 유지
+- 구독자별 대기열은 마켓 단위로 합쳐짐 (느린 구독자는 마켓별 최신 시세만 받음)
+- 첫 구독자가 들어오면 업스트림 연결, 마지막 구독자가 나가면 종료
+- 업스트림 피드 교체 가능 (테스트/개발용 MockTickerFeed)
+
+스냅샷 + 델타 프로토콜 (mode=delta):
+- snapshot: 전체 KRW 시세를 컬럼/행 형식 메시지 1개로 전송
+- delta: 주기마다 바뀐 마켓의 바뀐 필드만 묶어 전송
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+# 구독자에게 전달하는 시세 필드
+TICKER_FIELDS = ("trade_price", "change_rate", "acc_trade_volume_24h", "acc_trade_price_24h")
+
+
+def normalize_ticker(data: Dict) -> Dict:
+    """
+    업비트 ticker 메시지(또는 REST 시세)를 구독자용 시세로 변환
+
+    Args:
+        data: 업비트 ticker 데이터 (code 또는 market 필드 포함)
+
+    Returns:
+        {"market": ..., "trade_price": ..., "change_rate": ..., ...}
+    """
+    ticker = {"market": data.get("code") or data.get("market")}
+    for name in TICKER_FIELDS:
+        ticker[name] = float(data.get(name, 0) or 0)
+    return ticker
+
+
+def ticker_snapshot(tickers: List[Dict]) -> Dict:
+    """
+    컬럼/행 형식 스냅샷 메시지 생성
+
+    Args:
+        tickers: 구독자용 시세 목록 (normalize_ticker 결과)
+
+    Returns:
+        {"type": "snapshot", "fields": [...], "data": [[market, ...], ...]}
+    """
+    return {
+        "type": "snapshot",
+        "fields": ["market", *TICKER_FIELDS],
+        "data": [[t["market"], *(t[name] for name in TICKER_FIELDS)] for t in tickers],
+    }
+
+
+def ticker_delta(state: Dict[str, Dict], tickers: List[Dict]) -> Dict[str, Dict]:
+    """
+    클라이언트가 마지막으로 받은 시세 대비 바뀐 필드 계산 (state 갱신)
+
+    Args:
+        state: market -> 클라이언트에 마지막으로 전송한 시세
+        tickers: 새 시세 목록
+
+    Returns:
+        market -> {바뀐 필드: 값} (바뀐 마켓만)
+    """
+    changes: Dict[str, Dict] = {}
+    for ticker in tickers:
+        market = ticker["market"]
+        previous = state.get(market)
+        if previous is None:
+            diff = {name: ticker[name] for name in TICKER_FIELDS}
+        else:
+            diff = {name: ticker[name] for name in TICKER_FIELDS if previous.get(name) != ticker[name]}
+        if diff:
+            changes[market] = diff
+            state[market] = ticker
+    return changes
+
+
+class UpbitTickerFeed:
+    """업비트 WebSocket ticker 피드"""
+
+    WS_URL = "wss://api.upbit.com/websocket/v1"
+
+    async def stream(self, market_codes: List[str]) -> AsyncIterator[Dict]:
+        """
+        ticker 구독 후 수신한 시세를 변환하여 전달
+
+        Args:
+            market_codes: 구독할 마켓 코드 목록
+        """
+        async with websockets.connect(self.WS_URL) as upbit_ws:
+            subscription_message = [
+                {"ticket": "ticker-hub"},
+                {
+                    "type": "ticker",
+                    "codes": market_codes,
+                    "isOnlyRealtime": True
+                }
+            ]
+            await upbit_ws.send(json.dumps(subscription_message))
+            logger.info(f"Ticker hub subscribed to {len(market_codes)} markets")
+
+            async for message in upbit_ws:
+                try:
+                    data = json.loads(message)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON from Upbit: {e}")
+                    continue
+
+                # 티커 데이터만 처리
+                if data.get("type") == "ticker":
+                    yield normalize_ticker(data)
+
+
+class MockTickerFeed(UpbitTickerFeed):
+    """테스트/개발용 피드 (push한 시세를 그대로 전달)"""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.connections = 0  # stream() 호출 횟수 (업스트림 연결 수)
+
+    def push(self, data: Dict) -> None:
+        """시세 추가 (업비트 ticker 형식)"""
+        self.queue.put_nowait(data)
+
+    async def stream(self, market_codes: List[str]) -> AsyncIterator[Dict]:
+        self.connections += 1
+        while True:
+            data = await self.queue.get()
+            yield normalize_ticker(data)
+
+
+class TickerSubscription:
+    """
+    허브 구독자 대기열
+
+    마켓별 최신 시세만 보관하므로 구독자가 느려도 대기열이 마켓 수 이상 커지지 않습니다.
+    """
+
+    def __init__(self):
+        # market -> (ticker, 직렬화된 "ticker" 메시지)
+        self._pending: Dict[str, Tuple[Dict, str]] = {}
+        self._ready = asyncio.Event()
+        self.coalesced = 0  # 전달 전에 더 최신 시세로 대체된 수
+
+    def push(self, ticker: Dict, frame: str) -> None:
+        market = ticker["market"]
+        if market in self._pending:
+            self.coalesced += 1
+        self._pending[market] = (ticker, frame)
+        self._ready.set()
+
+    def drain(self) -> List[Tuple[Dict, str]]:
+        """대기 중인 시세를 모두 꺼냄 (기다리지 않음)"""
+        batch = list(self._pending.values())
+        self._pending = {}
+        self._ready.clear()
+        return batch
+
+    async def next_batch(self) -> List[Tuple[Dict, str]]:
+        """시세가 들어올 때까지 기다렸다가 대기 중인 시세를 모두 꺼냄"""
+        await self._ready.wait()
+        return self.drain()
+
+
+class TickerHub:
+    """업스트림 ticker 구독 1개를 로컬 구독자에게 멀티캐스트하는 허브"""
+
+    RECONNECT_DELAY = 5  # 초
+
+    def __init__(
+        self,
+        markets_provider: Callable[[], Awaitable[List[str]]],
+        feed: Optional[UpbitTickerFeed] = None,
+    ):
+        """
+        Args:
+            markets_provider: 구독할 마켓 코드 목록을 반환하는 비동기 함수
+            feed: 업스트림 피드 (None이면 업비트 WebSocket)
+        """
+        self.markets_provider = markets_provider
+        self.feed = feed or UpbitTickerFeed()
+        self.latest: Dict[str, Dict] = {}  # market -> 최신 시세
+        self._subscribers: Set[TickerSubscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.messages_received = 0
+        self.upstream_connects = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> TickerSubscription:
+        """구독자 추가 (업스트림이 없으면 연결 시작)"""
+        subscription = TickerSubscription()
+        self._subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: TickerSubscription) -> None:
+        """구독자 제거 (마지막 구독자면 업스트림 종료)"""
+        self._subscribers.discard(subscription)
+        if not self._subscribers and self._task and not self._task.done():
+            self._task.cancel()
+            self._task = None
+
+    def _publish(self, ticker: Dict) -> None:
+        """최신 시세 갱신 + 구독자 대기열에 추가 (직렬화 1회)"""
+        self.latest[ticker["market"]] = ticker
+        frame = json.dumps({"type": "ticker", **ticker})
+        for subscription in self._subscribers:
+            subscription.push(ticker, frame)
+
+    async def _run(self) -> None:
+        """업스트림 수신 루프 (끊기면 재연결)"""
+        while self._subscribers:
+            try:
+                market_codes = await self.markets_provider()
+                if not market_codes:
+                    logger.error("No markets available for ticker hub")
+                else:
+                    self.upstream_connects += 1
+                    async for ticker in self.feed.stream(market_codes):
+                        self.messages_received += 1
+                        self._publish(ticker)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ticker hub upstream error: {e}")
+
+            if self._subscribers:
+                logger.info(f"Ticker hub reconnecting in {self.RECONNECT_DELAY}s")
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def close(self) -> None:
+        """업스트림 종료 및 구독자 정리"""
+        self._subscribers.clear()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_status(self) -> Dict:
+        """허브 상태 조회"""
+        return {
+            "subscribers": self.subscriber_count,
+            "upstream_running": self._task is not None and not self._task.done(),
+            "upstream_connects": self.upstream_connects,
+            "messages_received": self.messages_received,
+            "markets": len(self.latest),
+        }
+
+
+# 전역 허브 인스턴스
+_ticker_hub: Optional[TickerHub] = None
+
+
+def get_ticker_hub(markets_provider: Optional[Callable[[], Awaitable[List[str]]]] = None) -> TickerHub:
+    """전역 TickerHub 인스턴스 반환 (첫 호출 시 markets_provider 필요)"""
+    global _ticker_hub
+    if _ticker_hub is None:
+        if markets_provider is None:
+            raise RuntimeError("markets_provider is required to create the ticker hub")
+        _ticker_hub = TickerHub(markets_provider)
+    return _ticker_hub
+
+
+async def close_ticker_hub() -> None:
+    """TickerHub 종료"""
+    global _ticker_hub
+    if _ticker_hub:
+        await _ticker_hub.close()
+        _ticker_hub = None
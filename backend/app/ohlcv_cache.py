@@ -0,0 +1,178 @@
+"""
+정규화된 OHLCV 프레임 LRU 캐시
+
+load_ohlcv_data가 읽은 연도 파일(DATA_ROOT/{symbol}/{timeframe}/{year}.parquet)을
+KST→UTC 변환, symbol/timeframe 주입까지 마친 상태로 프로세스 메모리에 보관합니다.
+
+- 무효화: 파일 mtime(ns)과 크기가 바뀌면 다시 읽음
+- 축출: 바이트 예산(OHLCV_CACHE_MAX_BYTES)을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 통계: hits, misses, evictions, invalidations, 현재 바이트/항목 수
+
+OHLCV_CACHE_MAX_BYTES=0 이면 캐시를 사용하지 않습니다.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 바이트 예산: 256MB
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class _CacheEntry:
+    """캐시 항목 (파일 버전 + 정규화된 프레임)"""
+    mtime_ns: int
+    size: int
+    frame: pd.DataFrame
+    nbytes: int
+
+
+class OHLCVFrameCache:
+    """
+    연도별 정규화 OHLCV 프레임 LRU 캐시 (스레드 안전)
+
+    키는 파일 경로(= data_root + symbol + timeframe + year)이며,
+    저장된 프레임은 읽기 전용으로 취급합니다. 호출 측은 필터링 등으로
+    새 프레임을 만들어 사용해야 합니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes: 캐시 바이트 예산 (0이면 비활성화)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get_or_load(self, file_path: Path, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        캐시된 프레임 반환, 없거나 파일이 변경되었으면 loader로 읽어 저장
+
+        Args:
+            file_path: parquet 파일 경로
+            loader: 정규화된 프레임을 반환하는 함수 (캐시 미스 시 호출)
+
+        Returns:
+            정규화된 프레임 (수정 금지)
+        """
+        if not self.enabled:
+            return loader()
+
+        key = str(file_path)
+        stat = os.stat(file_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.frame
+
+                # 파일이 변경됨 -> 무효화
+                self._remove(key)
+                self._invalidations += 1
+                logger.debug(f"OHLCV cache invalidated: {key}")
+
+            self._misses += 1
+
+        # I/O와 정규화는 락 밖에서 수행
+        frame = loader()
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+
+        if nbytes > self.max_bytes:
+            logger.debug(f"OHLCV frame too large to cache ({nbytes} bytes): {key}")
+            return frame
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                frame=frame,
+                nbytes=nbytes,
+            )
+            self._current_bytes += nbytes
+            self._evict_if_needed()
+
+        return frame
+
+    def _remove(self, key: str) -> None:
+        """항목 제거 (락 보유 상태에서 호출)"""
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.nbytes
+
+    def _evict_if_needed(self) -> None:
+        """바이트 예산 초과 시 LRU 축출 (락 보유 상태에서 호출)"""
+        while self._current_bytes > self.max_bytes and self._entries:
+            key, entry = self._entries.popitem(last=False)
+            self._current_bytes -= entry.nbytes
+            self._evictions += 1
+            logger.debug(f"OHLCV cache evicted: {key} ({entry.nbytes} bytes)")
+
+    def clear(self) -> None:
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            hits, misses, hit_rate, evictions, invalidations, entries, current_bytes, max_bytes
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "current_bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# 전역 캐시 인스턴스
+_ohlcv_cache: Optional[OHLCVFrameCache] = None
+
+
+def get_ohlcv_cache() -> OHLCVFrameCache:
+    """전역 OHLCV 프레임 캐시 반환 (OHLCV_CACHE_MAX_BYTES로 예산 설정)"""
+    global _ohlcv_cache
+    if _ohlcv_cache is None:
+        max_bytes = int(os.getenv("OHLCV_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        _ohlcv_cache = OHLCVFrameCache(max_bytes=max_bytes)
+        logger.info(f"OHLCV frame cache initialized (max_bytes={max_bytes})")
+    return _ohlcv_cache
+
+
+def reset_ohlcv_cache() -> None:
+    """전역 캐시 폐기 (다음 get_ohlcv_cache 호출 시 재생성)"""
+    global _ohlcv_cache
+    _ohlcv_cache = None
@@ -0,0 +1,313 @@
+"""
+백테스트 실행 히스토리 인덱스 (SQLite)
+
+ResultManager.save_result가 실행마다 집계 지표(전략, 기간, 신호 수, 평균 수익률)를
+RESULTS_DIR/index.db에 기록하고, /api/backtests/history의 필터링/정렬/페이지네이션을
+SQL 인덱스로 처리합니다. 수익률 필터도 결과 파일을 열지 않고 저장된 avg_return으로
+판정하므로, 조회 비용이 저장된 실행 수에 비례해 늘어나지 않습니다.
+
+실행 목록의 유일한 저장소이며, 최신 실행 ID(get_latest_run_id)도 여기서 조회합니다.
+
+- 정렬: 최초 저장 순서의 역순 (index.json과 동일, 덮어쓰기 시 순서 유지)
+- 스키마: 프로세스마다 DB 경로별로 한 번만 생성 (이후 연결은 바로 사용)
+- 마이그레이션: index.db가 없고 기존 index.json/index.journal이 있으면 최초 연결 시 한 번 채움
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 히스토리 항목으로 반환하는 컬럼 (index.json 항목과 동일한 키)
+ITEM_COLUMNS = [
+    "run_id",
+    "strategy",
+    "symbols",
+    "start_date",
+    "end_date",
+    "timeframe",
+    "total_signals",
+    "execution_time",
+    "timestamp",
+]
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id TEXT NOT NULL UNIQUE,
+        strategy TEXT,
+        symbols TEXT,
+        start_date TEXT,
+        end_date TEXT,
+        timeframe TEXT,
+        total_signals INTEGER,
+        execution_time REAL,
+        timestamp TEXT,
+        avg_return REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs (strategy, seq);
+    CREATE INDEX IF NOT EXISTS idx_runs_avg_return ON runs (avg_return);
+    CREATE INDEX IF NOT EXISTS idx_runs_total_signals ON runs (total_signals);
+    CREATE INDEX IF NOT EXISTS idx_runs_dates ON runs (start_date, end_date);
+"""
+
+# 이 프로세스에서 스키마를 생성한 DB 경로
+_initialized_paths = set()
+_initialized_lock = threading.Lock()
+
+
+class ResultIndex:
+    """RESULTS_DIR/index.db 기반 실행 히스토리 인덱스"""
+
+    DB_FILENAME = "index.db"
+    CONNECT_TIMEOUT = 30.0  # 동시 쓰기 시 잠금 대기 (초)
+
+    @staticmethod
+    def get_db_path(data_root: str) -> str:
+        """
+        인덱스 DB 경로 반환
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+
+        Returns:
+            인덱스 DB 경로 (RESULTS_DIR/index.db)
+        """
+        return os.path.join(data_root, "results", ResultIndex.DB_FILENAME)
+
+    @staticmethod
+    def _connect(data_root: str) -> sqlite3.Connection:
+        """
+        인덱스 DB 연결 (DB 경로별 최초 1회 스키마 생성 및 기존 인덱스 마이그레이션)
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+
+        Returns:
+            sqlite3 연결
+        """
+        db_path = ResultIndex.get_db_path(data_root)
+        if db_path in _initialized_paths and os.path.exists(db_path):
+            conn = sqlite3.connect(db_path, timeout=ResultIndex.CONNECT_TIMEOUT)
+            conn.row_factory = sqlite3.Row
+            return conn
+
+        with _initialized_lock:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            is_new = not os.path.exists(db_path)
+
+            conn = sqlite3.connect(db_path, timeout=ResultIndex.CONNECT_TIMEOUT)
+            conn.row_factory = sqlite3.Row
+            if is_new:
+                # 읽기와 쓰기가 서로 막지 않도록 WAL 사용 (DB 파일에 유지됨)
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+            if is_new:
+                ResultIndex._backfill_from_json_index(conn, data_root)
+            _initialized_paths.add(db_path)
+        return conn
+
+    @staticmethod
+    def _backfill_from_json_index(conn: sqlite3.Connection, data_root: str) -> None:
+        """
+        기존 index.json/index.journal 항목으로 인덱스 채우기 (평균 수익률은 결과 요약에서 계산)
+
+        Args:
+            conn: 인덱스 DB 연결
+            data_root: 데이터 루트 디렉토리
+        """
+        from backend.app.result_manager import ResultManager
+
+        items = ResultManager._read_index(data_root).get("items", [])
+        if not items:
+            return
+
+        logger.info(f"Backfilling result index from legacy index: {len(items)} runs")
+        # 기존 인덱스는 최신순이므로 오래된 항목부터 넣어 저장 순서(seq) 유지
+        for item in reversed(items):
+            summaries = ResultManager.get_symbol_summaries(
+                data_root, item.get("run_id"), columns=["avg_return"]
+            )
+            ResultIndex._upsert(conn, item, ResultIndex.average_return(summaries), replace=False)
+        conn.commit()
+
+    @staticmethod
+    def average_return(symbols: Optional[List[Any]]) -> Optional[float]:
+        """
+        심볼별 avg_return의 평균 (히스토리 수익률 필터 기준)
+
+        Args:
+            symbols: 심볼 결과 dict 목록
+
+        Returns:
+            평균 수익률 (%) 또는 None (심볼 결과 없음)
+        """
+        rows = [sym for sym in (symbols or []) if isinstance(sym, dict)]
+        if not rows:
+            return None
+        return sum(sym.get("avg_return") or 0 for sym in rows) / len(rows)
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection,
+        metadata: Dict[str, Any],
+        avg_return: Optional[float],
+        replace: bool = True,
+    ) -> None:
+        """실행 항목 추가 또는 갱신 (갱신 시 seq 유지)"""
+        values = [
+            metadata.get("run_id"),
+            metadata.get("strategy"),
+            json.dumps(metadata.get("symbols") or [], ensure_ascii=False),
+            metadata.get("start_date"),
+            metadata.get("end_date"),
+            metadata.get("timeframe"),
+            metadata.get("total_signals"),
+            metadata.get("execution_time"),
+            metadata.get("timestamp"),
+            avg_return,
+        ]
+        conflict = (
+            """DO UPDATE SET
+                strategy = excluded.strategy,
+                symbols = excluded.symbols,
+                start_date = excluded.start_date,
+                end_date = excluded.end_date,
+                timeframe = excluded.timeframe,
+                total_signals = excluded.total_signals,
+                execution_time = excluded.execution_time,
+                timestamp = excluded.timestamp,
+                avg_return = excluded.avg_return"""
+            if replace
+            else "DO NOTHING"
+        )
+        conn.execute(
+            f"""
+            INSERT INTO runs (
+                run_id, strategy, symbols, start_date, end_date, timeframe,
+                total_signals, execution_time, timestamp, avg_return
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (run_id) {conflict}
+            """,
+            values,
+        )
+
+    @staticmethod
+    def upsert(data_root: str, metadata: Dict[str, Any], avg_return: Optional[float]) -> bool:
+        """
+        실행 항목 기록
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+            metadata: index.json 항목과 같은 실행 메타데이터
+            avg_return: 심볼 평균 수익률 (%, average_return 결과)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            conn = ResultIndex._connect(data_root)
+            try:
+                with conn:
+                    ResultIndex._upsert(conn, metadata, avg_return)
+            finally:
+                conn.close()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to update result index: {e}")
+            return False
+
+    @staticmethod
+    def latest_run_id(data_root: str) -> Optional[str]:
+        """
+        가장 최근에 추가된 실행 ID (덮어쓰기는 순서를 바꾸지 않음)
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+
+        Returns:
+            run_id 또는 None (저장된 실행 없음)
+        """
+        conn = ResultIndex._connect(data_root)
+        try:
+            row = conn.execute("SELECT run_id FROM runs ORDER BY seq DESC LIMIT 1").fetchone()
+        finally:
+            conn.close()
+        return row["run_id"] if row else None
+
+    @staticmethod
+    def query(
+        data_root: str,
+        limit: int = 10,
+        offset: int = 0,
+        strategy: Optional[str] = None,
+        min_return: Optional[float] = None,
+        max_return: Optional[float] = None,
+        min_signals: Optional[int] = None,
+        max_signals: Optional[int] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        필터 조건에 맞는 실행 목록 조회 (최신순 페이지네이션)
+
+        심볼 결과가 없는 실행(avg_return 없음)은 수익률 필터에서 제외하지 않습니다.
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+            limit, offset: 페이지네이션
+            strategy, min_return, max_return, min_signals, max_signals, date_from, date_to:
+                ResultManager.get_history 필터
+
+        Returns:
+            (필터 적용 후 전체 개수, 현재 페이지 항목 목록)
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if strategy:
+            clauses.append("strategy = ?")
+            params.append(strategy)
+        if min_signals is not None:
+            clauses.append("COALESCE(total_signals, 0) >= ?")
+            params.append(min_signals)
+        if max_signals is not None:
+            clauses.append("COALESCE(total_signals, 0) <= ?")
+            params.append(max_signals)
+        if date_from:
+            clauses.append("start_date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("end_date <= ?")
+            params.append(date_to)
+        if min_return is not None:
+            clauses.append("(avg_return IS NULL OR avg_return >= ?)")
+            params.append(min_return)
+        if max_return is not None:
+            clauses.append("(avg_return IS NULL OR avg_return <= ?)")
+            params.append(max_return)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        conn = ResultIndex._connect(data_root)
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(ITEM_COLUMNS)} FROM runs {where} "
+                f"ORDER BY seq DESC LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        finally:
+            conn.close()
+
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["symbols"] = json.loads(item["symbols"]) if item["symbols"] else []
+            items.append(item)
+        return total, items
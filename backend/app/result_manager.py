@@ -1,13 +1,18 @@
 """결과 파일 관리 모듈"""
 import json
 import os
+import uuid
+import shutil
 import logging
 import hashlib
-from datetime import datetime, timedelta
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import fcntl
 
+from backend.app.result_index import ResultIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +26,13 @@ class ResultManager:
     - 'json-only': JSON 파일만 사용 (기본값)
     - 'dual-write': PostgreSQL + Parquet과 JSON 파일 모두 저장 (마이그레이션 중)
     - 'postgres-only': PostgreSQL + Parquet만 사용 (전환 완료)
+
+    실행 결과 파일 형식 (RESULT_FILE_FORMAT 환경변수, save_result/get_result):
+    - 'json': results/{run_id}.json 단일 파일 (기본값)
+    - 'parquet': results/{run_id}/ 디렉토리에 run.json(실행 메타데이터) +
+      symbol_summary/symbol_signals/performance_curve Parquet 테이블
+      (스키마는 storage/converters와 동일, 조회 시 필요한 컬럼만 읽음)
+    조회는 설정과 무관하게 두 형식을 모두 지원합니다.
     """
 
     # Storage mode constants
@@ -28,6 +40,21 @@ class ResultManager:
     MODE_DUAL_WRITE = 'dual-write'
     MODE_POSTGRES_ONLY = 'postgres-only'
 
+    # Result file format constants
+    FORMAT_JSON = 'json'
+    FORMAT_PARQUET = 'parquet'
+
+    # Parquet 결과 디렉토리 구성 파일
+    PARQUET_HEADER_FILE = 'run.json'
+    PARQUET_SUMMARY_FILE = 'symbol_summary.parquet'
+    PARQUET_SIGNALS_FILE = 'symbol_signals.parquet'
+    PARQUET_CURVE_FILE = 'performance_curve.parquet'
+
+    # API 응답(SymbolResult)에 필요한 컬럼
+    SUMMARY_COLUMNS = ['symbol', 'win_rate', 'avg_return', 'max_drawdown', 'avg_hold_bars']
+    SIGNAL_COLUMNS = ['symbol', 'timestamp', 'type', 'entry_price', 'exit_price', 'return_pct']
+    CURVE_COLUMNS = ['symbol', 'timestamp', 'equity', 'drawdown']
+
     def __init__(self, storage=None, data_root: Optional[str] = None, storage_mode: Optional[str] = None):
         """
         ResultManager 초기화 (의존성 주입 + Dual-write 지원)
@@ -344,83 +371,361 @@ class ResultManager:
         return None
 
     @staticmethod
-    def _get_index_file_path(data_root: str) -> str:
+    def _read_index(data_root: str) -> Dict[str, Any]:
         """
-        인덱스 파일 경로 반환
+        기존 실행 인덱스 읽기 (index.json 스냅샷 + index.journal 추가분, 마이그레이션용)
+
+        실행 목록은 ResultIndex(RESULTS_DIR/index.db)에만 기록하며, 이 함수는
+        index.db가 없을 때 이전 형식의 인덱스를 옮겨 담는 데만 사용합니다.
 
         Args:
             data_root: 데이터 루트 디렉토리
 
         Returns:
-            인덱스 파일 경로 (RESULTS_DIR/index.json)
+            인덱스 데이터 dict ({"items": [...]}, 최신순, 같은 run_id는 최초 위치 유지)
         """
         results_dir = os.path.join(data_root, "results")
-        return os.path.join(results_dir, "index.json")
+        snapshot_file = os.path.join(results_dir, "index.json")
+        journal_file = os.path.join(results_dir, "index.journal")
+
+        try:
+            items: List[Dict[str, Any]] = []
+            if os.path.exists(snapshot_file):
+                with open(snapshot_file, "r", encoding="utf-8") as f:
+                    items = list(reversed(json.load(f).get("items", [])))
+
+            if os.path.exists(journal_file):
+                positions = {item.get("run_id"): i for i, item in enumerate(items)}
+                with open(journal_file, "r", encoding="utf-8") as f:
+                    f.readline()  # {"generation": g} 헤더
+                    for line in f:
+                        if not line.endswith("\n"):
+                            break
+                        item = json.loads(line)
+                        position = positions.get(item.get("run_id"))
+                        if position is None:
+                            positions[item.get("run_id")] = len(items)
+                            items.append(item)
+                        else:
+                            items[position] = item
+
+            return {"items": list(reversed(items))}
+        except Exception as e:
+            logger.error(f"Error reading legacy index: {e}")
+            return {"items": []}
 
     @staticmethod
-    def _read_index(data_root: str) -> Dict[str, Any]:
+    def get_result_format() -> str:
+        """
+        실행 결과 저장 형식 반환 (RESULT_FILE_FORMAT 환경변수)
+
+        Returns:
+            'json' 또는 'parquet'
         """
-        index.json 파일 읽기 (원자적 읽기)
+        result_format = os.getenv("RESULT_FILE_FORMAT", ResultManager.FORMAT_JSON).lower()
+        if result_format not in (ResultManager.FORMAT_JSON, ResultManager.FORMAT_PARQUET):
+            logger.warning(f"Unknown RESULT_FILE_FORMAT '{result_format}', using json")
+            return ResultManager.FORMAT_JSON
+        return result_format
+
+    @staticmethod
+    def _get_parquet_result_dir(data_root: str, run_id: str) -> str:
+        """
+        Parquet 결과 디렉토리 경로 반환
 
         Args:
             data_root: 데이터 루트 디렉토리
+            run_id: 실행 ID
 
         Returns:
-            인덱스 데이터 dict
+            결과 디렉토리 경로 (RESULTS_DIR/{run_id})
         """
-        index_file = ResultManager._get_index_file_path(data_root)
+        return os.path.join(data_root, "results", run_id)
 
-        if not os.path.exists(index_file):
-            return {"items": []}
+    @staticmethod
+    def result_exists(data_root: str, run_id: str) -> bool:
+        """
+        실행 결과 존재 여부 (JSON/Parquet 형식 모두 확인)
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+            run_id: 실행 ID
+
+        Returns:
+            존재 여부
+        """
+        parquet_dir = ResultManager._get_parquet_result_dir(data_root, run_id)
+        if os.path.exists(os.path.join(parquet_dir, ResultManager.PARQUET_HEADER_FILE)):
+            return True
+        return os.path.exists(os.path.join(data_root, "results", f"{run_id}.json"))
+
+    @staticmethod
+    def _save_json_result(results_dir: str, run_id: str, result_data: Dict[str, Any]) -> bool:
+        """
+        실행 결과를 results/{run_id}.json으로 저장 (원자적 쓰기)
+
+        Args:
+            results_dir: 결과 디렉토리
+            run_id: 실행 ID
+            result_data: 결과 데이터 (BacktestResponse dict)
+
+        Returns:
+            성공 여부
+        """
+        result_file = os.path.join(results_dir, f"{run_id}.json")
+        temp_file = result_file + ".tmp"
 
         try:
-            with open(index_file, "r", encoding="utf-8") as f:
-                # 읽기 잠금 설정 (비차단)
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            # 임시 파일에 데이터 쓰기
+            with open(temp_file, "w", encoding="utf-8") as f:
+                # 쓰기 잠금 설정 (비차단)
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
-                    data = json.load(f)
+                    json.dump(result_data, f, indent=2, ensure_ascii=False, default=str)
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in index file: {e}")
-            return {"items": []}
+
+            # 원자적 이름 변경 (실패하지 않음)
+            os.replace(temp_file, result_file)
+            logger.info(f"Result file saved (atomic): {result_file}")
         except Exception as e:
-            logger.error(f"Error reading index file: {e}")
-            return {"items": []}
+            logger.error(f"Failed to save result file: {e}")
+            if os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except Exception as cleanup_err:
+                    logger.warning(f"Failed to cleanup temp file: {cleanup_err}")
+            return False
+
+        # 형식 전환 시 남아 있는 Parquet 결과 제거
+        parquet_dir = os.path.join(results_dir, run_id)
+        if os.path.isdir(parquet_dir):
+            shutil.rmtree(parquet_dir, ignore_errors=True)
+        return True
+
+    @staticmethod
+    def _to_utc_timestamp(value: Any) -> Optional[datetime]:
+        """ISO 8601 문자열을 UTC 기준 naive datetime으로 변환 (Parquet timestamp 컬럼용)"""
+        if not value:
+            return None
+        try:
+            ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            logger.warning(f"Failed to parse timestamp: {value}")
+            return None
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+        return ts
 
     @staticmethod
-    def _write_index(data_root: str, index_data: Dict[str, Any]) -> bool:
+    def _save_parquet_result(results_dir: str, run_id: str, result_data: Dict[str, Any]) -> bool:
         """
-        index.json 파일 쓰기 (원자적 쓰기)
+        실행 결과를 results/{run_id}/ 아래 Parquet 테이블로 저장
+
+        심볼 결과는 storage/converters의 symbol_summary, symbol_signals,
+        performance_curve 스키마로 컬럼 단위 변환하고, 나머지 실행 메타데이터와
+        심볼 순서/활성 상태는 run.json에 저장합니다.
+        임시 디렉토리에 모두 쓴 후 교체하므로 부분적으로 쓰인 결과는 노출되지 않습니다.
 
         Args:
-            data_root: 데이터 루트 디렉토리
-            index_data: 인덱스 데이터
+            results_dir: 결과 디렉토리
+            run_id: 실행 ID
+            result_data: 결과 데이터 (BacktestResponse dict)
 
         Returns:
             성공 여부
         """
-        results_dir = os.path.join(data_root, "results")
-        os.makedirs(results_dir, exist_ok=True)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from backend.app.storage.converters import (
+            get_symbol_summary_schema,
+            get_symbol_signals_schema,
+            get_performance_curve_schema,
+        )
 
-        index_file = ResultManager._get_index_file_path(data_root)
-        temp_file = index_file + ".tmp"
+        symbols = [
+            {"symbol": sym} if isinstance(sym, str) else sym
+            for sym in (result_data.get("symbols") or [])
+        ]
+
+        summary = {name: [] for name in get_symbol_summary_schema().names}
+        signals = {name: [] for name in get_symbol_signals_schema().names}
+        curve = {name: [] for name in get_performance_curve_schema().names}
+
+        for sym in symbols:
+            symbol = sym.get("symbol", "")
+            for name in summary:
+                summary[name].append(symbol if name == "symbol" else sym.get(name))
+
+            sym_signals = sym.get("signals") or []
+            for name in signals:
+                if name == "symbol":
+                    signals[name].extend([symbol] * len(sym_signals))
+                elif name == "signal_index":
+                    signals[name].extend(range(len(sym_signals)))
+                elif name == "timestamp":
+                    signals[name].extend(
+                        ResultManager._to_utc_timestamp(sig.get("timestamp")) for sig in sym_signals
+                    )
+                else:
+                    signals[name].extend(sig.get(name) for sig in sym_signals)
+
+            sym_curve = sym.get("performance_curve") or []
+            for name in curve:
+                if name == "symbol":
+                    curve[name].extend([symbol] * len(sym_curve))
+                elif name == "idx":
+                    curve[name].extend(range(len(sym_curve)))
+                elif name == "timestamp":
+                    curve[name].extend(
+                        ResultManager._to_utc_timestamp(point.get("timestamp")) for point in sym_curve
+                    )
+                else:
+                    curve[name].extend(point.get(name) for point in sym_curve)
 
-        try:
-            # 임시 파일에 쓰기
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+        header = {key: value for key, value in result_data.items() if key != "symbols"}
+        header["symbols"] = [
+            {"symbol": sym.get("symbol", ""), "is_active": sym.get("is_active", True)}
+            for sym in symbols
+        ]
 
-            # 원자적 이름 변경
-            os.replace(temp_file, index_file)
-            logger.info(f"Index file updated: {index_file}")
-            return True
+        result_dir = os.path.join(results_dir, run_id)
+        temp_dir = os.path.join(results_dir, f".{run_id}.{uuid.uuid4().hex}.tmp")
+        old_dir = temp_dir + ".old"
+
+        try:
+            os.makedirs(temp_dir)
+            tables = [
+                (ResultManager.PARQUET_SUMMARY_FILE, summary, get_symbol_summary_schema()),
+                (ResultManager.PARQUET_SIGNALS_FILE, signals, get_symbol_signals_schema()),
+                (ResultManager.PARQUET_CURVE_FILE, curve, get_performance_curve_schema()),
+            ]
+            for filename, columns, schema in tables:
+                table = pa.Table.from_pydict(columns, schema=schema)
+                pq.write_table(table, os.path.join(temp_dir, filename), compression="snappy")
+
+            with open(os.path.join(temp_dir, ResultManager.PARQUET_HEADER_FILE), "w", encoding="utf-8") as f:
+                json.dump(header, f, ensure_ascii=False, default=str)
+
+            # 디렉토리는 덮어쓰기 rename이 불가하므로 기존 결과를 옮긴 후 교체
+            if os.path.isdir(result_dir):
+                os.replace(result_dir, old_dir)
+            os.replace(temp_dir, result_dir)
+            logger.info(f"Result saved as parquet: {result_dir}")
         except Exception as e:
-            logger.error(f"Error writing index file: {e}")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            logger.error(f"Failed to save parquet result: {e}")
+            if os.path.isdir(old_dir) and not os.path.exists(result_dir):
+                os.replace(old_dir, result_dir)
+            shutil.rmtree(temp_dir, ignore_errors=True)
             return False
+        finally:
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+        # 형식 전환 시 남아 있는 JSON 결과 제거
+        json_file = os.path.join(results_dir, f"{run_id}.json")
+        if os.path.exists(json_file):
+            os.remove(json_file)
+        return True
+
+    @staticmethod
+    def _read_parquet_table(
+        result_dir: str,
+        filename: str,
+        columns: List[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        Parquet 테이블에서 지정 컬럼만 읽기
+
+        Args:
+            result_dir: Parquet 결과 디렉토리
+            filename: 테이블 파일명
+            columns: 읽을 컬럼 목록
+
+        Returns:
+            컬럼명 -> 값 목록 (파일이 없으면 빈 목록)
+        """
+        import pyarrow.parquet as pq
+
+        path = os.path.join(result_dir, filename)
+        if not os.path.exists(path):
+            return {name: [] for name in columns}
+        return pq.read_table(path, columns=columns).to_pydict()
+
+    @staticmethod
+    def _read_parquet_result(
+        result_dir: str,
+        include_signals: bool = True,
+        include_performance_curve: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Parquet 결과 디렉토리를 BacktestResponse 호환 dict로 복원
+
+        Args:
+            result_dir: Parquet 결과 디렉토리
+            include_signals: symbol_signals 테이블 포함 여부
+            include_performance_curve: performance_curve 테이블 포함 여부
+
+        Returns:
+            결과 데이터 dict
+        """
+        with open(os.path.join(result_dir, ResultManager.PARQUET_HEADER_FILE), "r", encoding="utf-8") as f:
+            result_data = json.load(f)
+
+        summary = ResultManager._read_parquet_table(
+            result_dir, ResultManager.PARQUET_SUMMARY_FILE, ResultManager.SUMMARY_COLUMNS
+        )
+        symbols: Dict[str, Dict[str, Any]] = {}
+        for i, symbol in enumerate(summary["symbol"]):
+            symbols[symbol] = {
+                name: summary[name][i] for name in ResultManager.SUMMARY_COLUMNS
+            }
+            symbols[symbol]["signals"] = []
+            symbols[symbol]["performance_curve"] = []
+
+        if include_signals:
+            signals = ResultManager._read_parquet_table(
+                result_dir, ResultManager.PARQUET_SIGNALS_FILE, ResultManager.SIGNAL_COLUMNS
+            )
+            for i, symbol in enumerate(signals["symbol"]):
+                timestamp = signals["timestamp"][i]
+                symbols[symbol]["signals"].append({
+                    "symbol": symbol,
+                    "type": signals["type"][i],
+                    "timestamp": (
+                        timestamp.replace(tzinfo=timezone.utc).isoformat() if timestamp else None
+                    ),
+                    "entry_price": signals["entry_price"][i],
+                    "exit_price": signals["exit_price"][i],
+                    "return_pct": signals["return_pct"][i],
+                })
+
+        if include_performance_curve:
+            curve = ResultManager._read_parquet_table(
+                result_dir, ResultManager.PARQUET_CURVE_FILE, ResultManager.CURVE_COLUMNS
+            )
+            for i, symbol in enumerate(curve["symbol"]):
+                timestamp = curve["timestamp"][i]
+                symbols[symbol]["performance_curve"].append({
+                    "timestamp": timestamp.strftime("%Y-%m-%d") if timestamp else None,
+                    "equity": curve["equity"][i],
+                    "drawdown": curve["drawdown"][i],
+                })
+
+        # run.json의 심볼 순서/활성 상태 기준으로 병합
+        merged = []
+        for sym in result_data.get("symbols", []):
+            symbol_result = symbols.get(sym["symbol"], {"symbol": sym["symbol"], "signals": []})
+            if not symbol_result.get("performance_curve"):
+                symbol_result["performance_curve"] = None
+            if not include_signals:
+                symbol_result.pop("signals", None)
+            if not include_performance_curve:
+                symbol_result.pop("performance_curve", None)
+            symbol_result["is_active"] = sym.get("is_active", True)
+            merged.append(symbol_result)
+        result_data["symbols"] = merged
+
+        return result_data
 
     @staticmethod
     def save_result(
@@ -433,6 +738,7 @@ class ResultManager:
 
         PATCH API 동시 호출 시에도 데이터 무결성 보장을 위해 fcntl.flock으로 쓰기 잠금을 잡고
         임시 파일에 쓴 후 os.replace()로 원자적으로 교체합니다.
+        실행 목록은 ResultIndex(index.db) 한 곳에만 기록하므로 저장 비용이 히스토리 크기와 무관합니다.
 
         Args:
             data_root: 데이터 루트 디렉토리
@@ -446,39 +752,22 @@ class ResultManager:
         results_dir = os.path.join(data_root, "results")
         os.makedirs(results_dir, exist_ok=True)
 
-        result_file = os.path.join(results_dir, f"{run_id}.json")
-        temp_file = result_file + ".tmp"
-
-        try:
-            # 임시 파일에 데이터 쓰기
-            with open(temp_file, "w", encoding="utf-8") as f:
-                # 쓰기 잠금 설정 (비차단)
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(result_data, f, indent=2, ensure_ascii=False, default=str)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-            # 원자적 이름 변경 (실패하지 않음)
-            os.replace(temp_file, result_file)
-            logger.info(f"Result file saved (atomic): {result_file}")
-        except Exception as e:
-            logger.error(f"Failed to save result file: {e}")
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except Exception as cleanup_err:
-                    logger.warning(f"Failed to cleanup temp file: {cleanup_err}")
+        if ResultManager.get_result_format() == ResultManager.FORMAT_PARQUET:
+            saved = ResultManager._save_parquet_result(results_dir, run_id, result_data)
+        else:
+            saved = ResultManager._save_json_result(results_dir, run_id, result_data)
+        if not saved:
             return False
 
-        # 2. 인덱스 업데이트
-        index_data = ResultManager._read_index(data_root)
-
+        # 2. 인덱스 업데이트 (덮어쓰기 시 기존 위치 유지)
         # 메타데이터 추출
         metadata = {
             "run_id": run_id,
             "strategy": result_data.get("strategy"),
-            "symbols": result_data.get("symbols", []) if isinstance(result_data.get("symbols"), list) else [s["symbol"] for s in result_data.get("symbols", [])],
+            "symbols": [
+                s["symbol"] if isinstance(s, dict) else s
+                for s in (result_data.get("symbols") or [])
+            ],
             "start_date": result_data.get("start_date"),
             "end_date": result_data.get("end_date"),
             "timeframe": result_data.get("timeframe"),
@@ -487,18 +776,10 @@ class ResultManager:
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
 
-        # 기존 항목 확인 (덮어쓰기 시)
-        items = index_data.get("items", [])
-        existing_idx = next((i for i, item in enumerate(items) if item["run_id"] == run_id), None)
-
-        if existing_idx is not None:
-            items[existing_idx] = metadata
-        else:
-            items.insert(0, metadata)  # 최신순으로 앞에 추가
-
-        index_data["items"] = items
-
-        return ResultManager._write_index(data_root, index_data)
+        # 필터/페이지네이션용 집계 지표(심볼 평균 수익률) 포함
+        return ResultIndex.upsert(
+            data_root, metadata, ResultIndex.average_return(result_data.get("symbols"))
+        )
 
     @staticmethod
     def get_latest_run_id(data_root: str) -> Optional[str]:
@@ -511,12 +792,11 @@ class ResultManager:
         Returns:
             최신 run_id 또는 None
         """
-        index_data = ResultManager._read_index(data_root)
-        items = index_data.get("items", [])
-
-        if items:
-            return items[0]["run_id"]
-        return None
+        try:
+            return ResultIndex.latest_run_id(data_root)
+        except sqlite3.Error as e:
+            logger.error(f"Error reading result index: {e}")
+            return None
 
     @staticmethod
     def get_history(
@@ -534,6 +814,9 @@ class ResultManager:
         """
         백테스트 히스토리 조회 (페이지네이션 + 필터링 지원, Task 3.3-3)
 
+        필터/정렬/페이지네이션은 히스토리 인덱스(ResultIndex, RESULTS_DIR/index.db)에서
+        처리하며, 수익률 필터는 저장 시 기록한 심볼 평균 수익률을 사용합니다.
+
         Args:
             data_root: 데이터 루트 디렉토리
             limit: 조회 개수 (기본: 10, 최대: 100)
@@ -553,52 +836,18 @@ class ResultManager:
                 - offset: 시작 위치
                 - items: 결과 배열 (페이지네이션 적용)
         """
-        index_data = ResultManager._read_index(data_root)
-        items = index_data.get("items", [])
-
-        # 1. 전략 필터 적용
-        if strategy:
-            items = [item for item in items if item.get("strategy") == strategy]
-
-        # 2. 신호 개수 필터 적용
-        if min_signals is not None:
-            items = [item for item in items if item.get("total_signals", 0) >= min_signals]
-        if max_signals is not None:
-            items = [item for item in items if item.get("total_signals", 0) <= max_signals]
-
-        # 3. 기간 필터 적용
-        if date_from:
-            items = [item for item in items if item.get("start_date", "") >= date_from]
-        if date_to:
-            items = [item for item in items if item.get("end_date", "") <= date_to]
-
-        # 4. 수익률 필터 적용 (각 항목의 메타데이터에서 평균 수익률 계산)
-        if min_return is not None or max_return is not None:
-            filtered_items = []
-            for item in items:
-                # 백테스트 결과 파일 읽기 (메모리 효율성을 위해 캐싱 가능)
-                result_file = os.path.join(data_root, f"{item.get('run_id')}.json")
-                try:
-                    if os.path.exists(result_file):
-                        with open(result_file, 'r', encoding='utf-8') as f:
-                            result_data = json.load(f)
-                            # 심볼별 평균 수익률 계산
-                            symbols = result_data.get("symbols", [])
-                            if symbols:
-                                avg_return = sum(s.get("avg_return", 0) for s in symbols) / len(symbols)
-                                # 수익률 필터 확인
-                                if min_return is not None and avg_return < min_return:
-                                    continue
-                                if max_return is not None and avg_return > max_return:
-                                    continue
-                        filtered_items.append(item)
-                except (json.JSONDecodeError, IOError):
-                    # 파일 읽기 실패시 항목 제외
-                    continue
-            items = filtered_items
-
-        total = len(items)
-        paginated_items = items[offset : offset + limit]
+        total, paginated_items = ResultIndex.query(
+            data_root,
+            limit=limit,
+            offset=offset,
+            strategy=strategy,
+            min_return=min_return,
+            max_return=max_return,
+            min_signals=min_signals,
+            max_signals=max_signals,
+            date_from=date_from,
+            date_to=date_to,
+        )
 
         return {
             "total": total,
@@ -628,19 +877,39 @@ class ResultManager:
         return symbol_dict
 
     @staticmethod
-    def get_result(data_root: str, run_id: str) -> Optional[Dict[str, Any]]:
+    def get_result(
+        data_root: str,
+        run_id: str,
+        include_signals: bool = True,
+        include_performance_curve: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """
         특정 실행 결과 조회 (Phase 2: 하위 호환성 지원)
 
         기존 JSON 파일의 is_active 필드 누락 시 기본값을 자동 주입합니다.
+        Parquet 형식으로 저장된 결과는 필요한 테이블/컬럼만 읽습니다.
 
         Args:
             data_root: 데이터 루트 디렉토리
             run_id: 실행 ID
+            include_signals: 심볼별 signals 포함 여부
+            include_performance_curve: 심볼별 performance_curve 포함 여부
 
         Returns:
             결과 데이터 dict 또는 None (is_active 필드 정규화됨)
         """
+        parquet_dir = ResultManager._get_parquet_result_dir(data_root, run_id)
+        if os.path.exists(os.path.join(parquet_dir, ResultManager.PARQUET_HEADER_FILE)):
+            try:
+                return ResultManager._read_parquet_result(
+                    parquet_dir,
+                    include_signals=include_signals,
+                    include_performance_curve=include_performance_curve,
+                )
+            except Exception as e:
+                logger.error(f"Error reading parquet result {parquet_dir}: {e}")
+                return None
+
         results_dir = os.path.join(data_root, "results")
         result_file = os.path.join(results_dir, f"{run_id}.json")
 
@@ -657,12 +926,63 @@ class ResultManager:
                     ResultManager._normalize_symbol_result(sym)
                     for sym in result_data["symbols"]
                 ]
+                for sym in result_data["symbols"]:
+                    if not include_signals:
+                        sym.pop("signals", None)
+                    if not include_performance_curve:
+                        sym.pop("performance_curve", None)
 
             return result_data
         except Exception as e:
             logger.error(f"Error reading result file {result_file}: {e}")
             return None
 
+    @staticmethod
+    def get_symbol_summaries(
+        data_root: str,
+        run_id: str,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        심볼별 요약 지표만 조회 (signals/performance_curve 제외)
+
+        Parquet 형식은 symbol_summary 테이블의 지정 컬럼만 읽습니다.
+
+        Args:
+            data_root: 데이터 루트 디렉토리
+            run_id: 실행 ID
+            columns: 조회할 요약 컬럼 (None이면 SUMMARY_COLUMNS, symbol은 항상 포함)
+
+        Returns:
+            심볼별 요약 dict 목록 또는 None (결과 없음)
+        """
+        columns = ["symbol"] + [c for c in (columns or ResultManager.SUMMARY_COLUMNS) if c != "symbol"]
+
+        parquet_dir = ResultManager._get_parquet_result_dir(data_root, run_id)
+        if os.path.exists(os.path.join(parquet_dir, ResultManager.PARQUET_HEADER_FILE)):
+            try:
+                table = ResultManager._read_parquet_table(
+                    parquet_dir, ResultManager.PARQUET_SUMMARY_FILE, columns
+                )
+            except Exception as e:
+                logger.error(f"Error reading parquet summary {parquet_dir}: {e}")
+                return None
+            return [
+                {name: table[name][i] for name in columns}
+                for i in range(len(table["symbol"]))
+            ]
+
+        result_data = ResultManager.get_result(
+            data_root, run_id, include_signals=False, include_performance_curve=False
+        )
+        if result_data is None:
+            return None
+        return [
+            {name: sym.get(name) for name in columns}
+            for sym in result_data.get("symbols", [])
+            if isinstance(sym, dict)
+        ]
+
     def cleanup_old_results(
         self,
         data_root: str,
@@ -13,12 +13,20 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import logging
+import os
 import httpx
 import asyncio
 import json
-import websockets
 from functools import lru_cache
 
+from backend.app.market_data.ticker_hub import (
+    close_ticker_hub,
+    get_ticker_hub,
+    normalize_ticker,
+    ticker_delta,
+    ticker_snapshot,
+)
+
 # Redis import (캐싱용)
 try:
     from redis import Redis
@@ -44,6 +52,10 @@ MARKET_CACHE_TTL = 3600  # 1시간
 TICKER_CACHE_KEY = "tickers:krw"
 TICKER_CACHE_TTL = 3  # 3초
 
+# WebSocket 델타 모드 전송 주기 (ms)
+TICKER_DELTA_INTERVAL_MS = int(os.getenv("TICKER_DELTA_INTERVAL_MS", 250))
+MIN_TICKER_DELTA_INTERVAL_MS = 50
+
 # 최소 KRW 마켓 수 (설정값으로 관리)
 MIN_KRW_MARKETS = 80  # 업비트 실제 수량이 변할 수 있으므로 설정값으로 관리
 
@@ -331,6 +343,7 @@ async def startup_event():
 @router.on_event("shutdown")
 async def shutdown_event():
     """라우터 종료 이벤트"""
+    await close_ticker_hub()
     await close_http_client()
 
 
@@ -519,13 +532,15 @@ async def get_krw_tickers():
 # ============================================================================
 
 @router.websocket("/ws/tickers/krw")
-async def websocket_tickers_krw(websocket: WebSocket):
+async def websocket_tickers_krw(websocket: WebSocket, mode: str = "stream",
+                                interval_ms: Optional[int] = None):
     """
     WebSocket 엔드포인트: 실시간 시세 스트림 (업비트 중계)
 
-    연결 시:
+    mode=stream (기본):
     1. 캐시된 시세 데이터 먼저 전송
-    2. 업비트 WebSocket 연결하여 실시간 데이터 중계
+    2. 공유 시세 허브(TickerHub)를 구독하여 실시간 데이터 중계
+       (업비트 연결은 프로세스당 1개, 클라이언트 수와 무관)
 
     메시지 형식:
     {
@@ -536,9 +551,19 @@ async def websocket_tickers_krw(websocket: WebSocket):
         "acc_trade_volume_24h": 1234.56,
         "acc_trade_price_24h": 80000000000
     }
+
+    mode=delta: 전체 KRW 시세 스냅샷 1회 후 interval_ms(기본 TICKER_DELTA_INTERVAL_MS)마다
+    바뀐 필드만 묶어 전송
+    {"type": "snapshot", "fields": ["market", "trade_price", ...], "data": [["KRW-BTC", 65000000, ...], ...]}
+    {"type": "delta", "data": {"KRW-BTC": {"trade_price": 65010000}, ...}}
     """
+    if mode == "delta":
+        await _stream_ticker_deltas(websocket, interval_ms)
+        return
+
     await websocket.accept()
-    upbit_ws = None
+    hub = get_ticker_hub(_krw_market_codes_for_websocket)
+    subscription = None
 
     try:
         logger.info(f"WebSocket client connected: {websocket.client}")
@@ -550,14 +575,7 @@ async def websocket_tickers_krw(websocket: WebSocket):
                 logger.debug(f"Sending {len(cached_tickers)} cached tickers")
                 for ticker in cached_tickers[:10]:  # 처음 10개만 전송
                     try:
-                        await websocket.send_json({
-                            "type": "cached",
-                            "market": ticker.get("market"),
-                            "trade_price": float(ticker.get("trade_price", 0)),
-                            "change_rate": float(ticker.get("change_rate", 0)),
-                            "acc_trade_volume_24h": float(ticker.get("acc_trade_volume_24h", 0)),
-                            "acc_trade_price_24h": float(ticker.get("acc_trade_price_24h", 0))
-                        })
+                        await websocket.send_json({"type": "cached", **normalize_ticker(ticker)})
                     except Exception as e:
                         logger.warning(f"Error sending cached ticker: {e}")
                         continue
@@ -567,91 +585,90 @@ async def websocket_tickers_krw(websocket: WebSocket):
         except Exception as e:
             logger.warning(f"Error sending cached data: {e}")
 
-        # 2. 업비트 KRW 마켓 목록 조회
-        markets = await get_krw_markets_for_websocket()
-        if not markets:
-            logger.error("No markets available for WebSocket")
-            await websocket.send_json({"type": "error", "message": "No markets available"})
-            return
-
-        market_codes = [m["market"] for m in markets]
-        logger.info(f"Connecting to Upbit WebSocket with {len(market_codes)} markets")
-
-        # 3. 업비트 WebSocket 연결
-        async with websockets.connect("wss://api.upbit.com/websocket/v1") as upbit_ws:
-            # 3-1. 구독 메시지 전송
-            subscription_message = [
-                {"ticket": "unique-ticket"},
-                {
-                    "type": "ticker",
-                    "codes": market_codes,
-                    "isOnlyRealtime": True
-                }
-            ]
-
-            await upbit_ws.send(json.dumps(subscription_message))
-            logger.info("Subscription message sent to Upbit WebSocket")
-
-            # 3-2. 업비트에서 메시지 수신 및 클라이언트에 중계
-            async for message in upbit_ws:
-                try:
-                    data = json.loads(message)
-
-                    # 티커 데이터만 처리
-                    if data.get("type") == "ticker":
-                        ticker = {
-                            "type": "ticker",
-                            "market": data.get("code"),
-                            "trade_price": float(data.get("trade_price", 0)),
-                            "change_rate": float(data.get("change_rate", 0)),
-                            "acc_trade_volume_24h": float(data.get("acc_trade_volume_24h", 0)),
-                            "acc_trade_price_24h": float(data.get("acc_trade_price_24h", 0))
-                        }
-
-                        # 클라이언트에 전송
-                        await websocket.send_json(ticker)
-
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON from Upbit: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Error processing Upbit message: {e}")
-                    continue
+        # 2. 공유 허브 구독 후 직렬화된 시세 중계
+        # (느린 클라이언트는 마켓별 최신 시세만 받음)
+        subscription = hub.subscribe()
+        while True:
+            for _, frame in await subscription.next_batch():
+                await websocket.send_text(frame)
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket client disconnected: {websocket.client}")
 
-    except websockets.exceptions.WebSocketException as e:
-        logger.error(f"Upbit WebSocket error: {e}")
+    except Exception as e:
+        logger.error(f"WebSocket error: {e}", exc_info=True)
         try:
             await websocket.send_json({
                 "type": "error",
-                "message": "Connection to market data failed"
+                "message": str(e)
             })
         except Exception:
             pass
 
+    finally:
+        # 정리
+        if subscription is not None:
+            hub.unsubscribe(subscription)
+
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+        logger.info(f"WebSocket connection closed: {websocket.client}")
+
+
+async def _stream_ticker_deltas(websocket: WebSocket, interval_ms: Optional[int]) -> None:
+    """스냅샷 + 델타 프로토콜로 시세 전송 (mode=delta)"""
+    await websocket.accept()
+    hub = get_ticker_hub(_krw_market_codes_for_websocket)
+    interval = max(interval_ms or TICKER_DELTA_INTERVAL_MS, MIN_TICKER_DELTA_INTERVAL_MS) / 1000
+    # 스냅샷 이후 시세를 놓치지 않도록 먼저 구독
+    subscription = hub.subscribe()
+
+    try:
+        logger.info(f"WebSocket delta client connected: {websocket.client} (interval: {interval}s)")
+
+        # 1. 스냅샷: 캐시된 전체 시세 + 허브의 더 최신 시세
+        tickers: Dict[str, Dict] = {}
+        try:
+            for ticker in await get_cached_tickers() or []:
+                normalized = normalize_ticker(ticker)
+                tickers[normalized["market"]] = normalized
+        except Exception as e:
+            logger.warning(f"Error reading cached tickers for snapshot: {e}")
+        tickers.update(hub.latest)
+        await websocket.send_json(ticker_snapshot(list(tickers.values())))
+
+        # 2. 주기마다 바뀐 필드만 전송
+        while True:
+            await asyncio.sleep(interval)
+            changes = ticker_delta(tickers, [ticker for ticker, _ in subscription.drain()])
+            if changes:
+                await websocket.send_json({"type": "delta", "data": changes})
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket delta client disconnected: {websocket.client}")
+
     except Exception as e:
-        logger.error(f"WebSocket error: {e}", exc_info=True)
+        logger.error(f"WebSocket delta error: {e}", exc_info=True)
         try:
-            await websocket.send_json({
-                "type": "error",
-                "message": str(e)
-            })
+            await websocket.send_json({"type": "error", "message": str(e)})
         except Exception:
             pass
 
     finally:
-        # 정리
+        hub.unsubscribe(subscription)
         try:
             await websocket.close()
         except Exception:
             pass
 
-        if upbit_ws:
-            await upbit_ws.close()
 
-        logger.info(f"WebSocket connection closed: {websocket.client}")
+async def _krw_market_codes_for_websocket() -> List[str]:
+    """시세 허브 구독 대상 마켓 코드"""
+    markets = await get_krw_markets_for_websocket()
+    return [m["market"] for m in markets]
 
 
 async def get_krw_markets_for_websocket() -> List[Dict[str, str]]:
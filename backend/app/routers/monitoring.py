@@ -293,6 +293,52 @@ async def get_scheduler_status() -> Dict[str, Any]:
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# 데이터 캐시 / DB 풀 엔드포인트
+# ═══════════════════════════════════════════════════════════════════════════
+
+@router.get("/cache/ohlcv")
+async def get_ohlcv_cache_stats() -> Dict[str, Any]:
+    """
+    OHLCV 프레임 캐시 통계 조회
+
+    Returns:
+        hits, misses, hit_rate, evictions, invalidations, entries, current_bytes, max_bytes
+    """
+    from backend.app.ohlcv_cache import get_ohlcv_cache
+
+    return {
+        "status": "success",
+        "data": get_ohlcv_cache().get_stats(),
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+@router.get("/database/pool")
+async def get_database_pool_metrics() -> Dict[str, Any]:
+    """
+    데이터베이스 연결 풀 지표 조회
+
+    Returns:
+        backend, pool_size, acquired, waiting, in_use, avg_wait_ms, max_wait_ms
+    """
+    from backend.app.database import get_db
+
+    try:
+        return {
+            "status": "success",
+            "data": get_db().get_pool_metrics(),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+    except Exception as e:
+        logger.error(f"DB 풀 지표 조회 실패: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 알림 설정 엔드포인트
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,227 @@
+"""
+구체화된 지표 저장소 (조건 검색용)
+
+캔들 수집 작업 직후 계산한 심볼별 최신 지표를 parquet 파일 하나에 보관합니다.
+조건 검색은 원본 캔들 대신 이 파일을 읽어 지표 패널을 만듭니다.
+
+파일 구조: DATA_ROOT/_indicators/{timeframe}.parquet
+- 행: 심볼 (KRW-BTC 형식)
+- 컬럼: 지표(NUMERIC_COLUMNS, ma_alignment), source_mtime(원본 파일 mtime), computed_at
+- 스키마 메타데이터: indicator_version (쓸 때마다 1 증가), schema_version
+
+쓰기는 임시 파일 작성 후 os.replace로 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.app.services.screener_engine import IndicatorPanel, NUMERIC_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = "_indicators"
+SCHEMA_VERSION = 1
+_VERSION_KEY = b"indicator_version"
+_SCHEMA_KEY = b"schema_version"
+
+
+class IndicatorStore:
+    """
+    심볼별 최신 지표 parquet 저장소
+
+    Example:
+        >>> store = IndicatorStore('/data')
+        >>> store.write({'KRW-BTC': indicator_row(df)}, {'KRW-BTC': store.source_mtime('KRW-BTC')})
+        >>> store.load_panel().screen(conditions)
+    """
+
+    def __init__(self, data_root: Optional[str] = None, timeframe: str = '1D'):
+        """
+        Args:
+            data_root: 데이터 루트 (기본: 환경변수 DATA_ROOT 또는 /data)
+            timeframe: 지표를 계산하는 캔들 타임프레임
+        """
+        self.data_root = Path(data_root or os.getenv("DATA_ROOT", "/data"))
+        self.timeframe = timeframe.upper()
+        self.path = self.data_root / STORE_DIRNAME / f"{self.timeframe}.parquet"
+        # 파일 mtime 기준 읽기 캐시
+        self._cached_key: Optional[tuple] = None
+        self._cached_frame: Optional[pd.DataFrame] = None
+        self._cached_version = 0
+        self._cached_panel: Optional[IndicatorPanel] = None
+
+    # ========================================================================
+    # 원본 캔들 파일
+    # ========================================================================
+
+    def source_dir(self, symbol: str) -> Path:
+        """심볼의 원본 캔들 디렉토리"""
+        from backend.app.services.screener_service import convert_symbol_to_data_format
+
+        return self.data_root / convert_symbol_to_data_format(symbol) / self.timeframe
+
+    def source_mtime(self, symbol: str) -> Optional[float]:
+        """심볼의 최신 연도 캔들 파일 mtime (파일이 없으면 None)"""
+        try:
+            files = sorted(self.source_dir(symbol).glob("*.parquet"))
+        except OSError:
+            return None
+        if not files:
+            return None
+        return files[-1].stat().st_mtime
+
+    # ========================================================================
+    # 읽기
+    # ========================================================================
+
+    def _file_key(self) -> Optional[tuple]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def read(self) -> Optional[pd.DataFrame]:
+        """
+        저장된 지표 조회 (index=심볼)
+
+        Returns:
+            DataFrame 또는 None (저장소 없음/읽기 실패)
+        """
+        key = self._file_key()
+        if key is None:
+            return None
+        if key == self._cached_key:
+            return self._cached_frame
+
+        try:
+            table = pq.read_table(self.path)
+        except Exception as e:
+            logger.warning(f"Failed to read indicator store {self.path}: {e}")
+            return None
+
+        metadata = table.schema.metadata or {}
+        if int(metadata.get(_SCHEMA_KEY, b"0")) != SCHEMA_VERSION:
+            logger.warning(f"Indicator store schema mismatch: {self.path}")
+            return None
+
+        self._cached_frame = table.to_pandas().set_index('symbol')
+        self._cached_version = int(metadata.get(_VERSION_KEY, b"0"))
+        self._cached_panel = None
+        self._cached_key = key
+        return self._cached_frame
+
+    @property
+    def version(self) -> int:
+        """저장소 버전 (쓸 때마다 증가, 저장소 없으면 0)"""
+        if self.read() is None:
+            return 0
+        return self._cached_version
+
+    def load_panel(self) -> Optional[IndicatorPanel]:
+        """저장된 지표로 만든 패널 (파일이 바뀌지 않았으면 재사용)"""
+        frame = self.read()
+        if frame is None:
+            return None
+        if self._cached_panel is None:
+            self._cached_panel = IndicatorPanel.from_frame(frame)
+        return self._cached_panel
+
+    def covers(self, symbols: Iterable[str]) -> bool:
+        """
+        저장소로 조건 검색이 가능한지
+
+        저장소에 없는 심볼은 원본 캔들 파일도 없어야 합니다 (어차피 매칭되지 않음).
+        """
+        frame = self.read()
+        if frame is None:
+            return False
+        return all(
+            symbol in frame.index or self.source_mtime(symbol) is None
+            for symbol in symbols
+        )
+
+    def stale_symbols(self, symbols: Iterable[str]) -> List[str]:
+        """
+        지표를 다시 계산해야 하는 심볼
+
+        원본 파일이 있고, 저장소에 없거나 저장 당시보다 원본이 새로운 심볼입니다.
+        """
+        frame = self.read()
+        stale = []
+        for symbol in symbols:
+            mtime = self.source_mtime(symbol)
+            if mtime is None:
+                continue
+            if frame is None or symbol not in frame.index or frame.at[symbol, 'source_mtime'] < mtime:
+                stale.append(symbol)
+        return stale
+
+    # ========================================================================
+    # 쓰기
+    # ========================================================================
+
+    def write(self, rows: Dict[str, Dict[str, Any]], source_mtimes: Dict[str, Optional[float]]) -> int:
+        """
+        심볼별 지표 저장 (기존 심볼은 교체, 나머지는 유지)
+
+        Args:
+            rows: 심볼 -> indicator_row 결과
+            source_mtimes: 심볼 -> 계산에 사용한 원본 파일 mtime
+
+        Returns:
+            새 저장소 버전
+        """
+        computed_at = datetime.now(timezone.utc).isoformat()
+        updates = pd.DataFrame.from_records([
+            {
+                'symbol': symbol,
+                **{name: row.get(name) for name in NUMERIC_COLUMNS},
+                'ma_alignment': row.get('ma_alignment'),
+                'source_mtime': source_mtimes.get(symbol) or 0.0,
+                'computed_at': computed_at,
+            }
+            for symbol, row in rows.items()
+        ], columns=['symbol', *NUMERIC_COLUMNS, 'ma_alignment', 'source_mtime', 'computed_at'])
+        updates = updates.set_index('symbol')
+
+        current = self.read()
+        version = self.version + 1
+        if current is not None:
+            updates = pd.concat([current.drop(index=updates.index, errors='ignore'), updates])
+        frame = updates.sort_index()
+        frame[list(NUMERIC_COLUMNS)] = frame[list(NUMERIC_COLUMNS)].astype('float64')
+
+        table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            _VERSION_KEY: str(version).encode(),
+            _SCHEMA_KEY: str(SCHEMA_VERSION).encode(),
+        })
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, self.path)
+
+        logger.info(f"Indicator store updated: {len(rows)} symbols, version {version} ({self.path})")
+        return version
+
+
+# 전역 저장소 인스턴스 (1D)
+_indicator_store: Optional[IndicatorStore] = None
+
+
+def get_indicator_store() -> IndicatorStore:
+    """전역 IndicatorStore 인스턴스 반환"""
+    global _indicator_store
+    if _indicator_store is None:
+        _indicator_store = IndicatorStore()
+    return _indicator_store
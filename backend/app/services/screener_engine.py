@@ -0,0 +1,295 @@
+"""
+조건 검색 엔진 (심볼 전체 벡터 평가)
+
+KRW 마켓 전체의 최신 지표 값을 컬럼 형식 패널(지표 -> 심볼 배열)로 보관하고,
+조건 목록을 심볼 전체에 대한 boolean 마스크로 한 번에 평가합니다.
+
+- 패널은 IndicatorCalculator.calculate_batch로 심볼 전체를 한 번에 계산
+- 조건 1개 = 배열 비교 1번 (심볼 수와 무관하게 Python 루프 없음)
+- 지표가 없는 심볼(데이터 없음/계산 실패)은 NaN → 모든 비교에서 False
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.app.indicators.calculator import (
+    ALL_INDICATOR_KEYS,
+    MA_PERIODS,
+    IndicatorCalculator,
+    stack_tails,
+)
+
+logger = logging.getLogger(__name__)
+
+# 패널 숫자 컬럼 (calculate_all 결과 키 + 꼬리 이동평균)
+NUMERIC_COLUMNS = (
+    *ALL_INDICATOR_KEYS[:-1],
+    *(f'ma_{period}' for period in MA_PERIODS),
+)
+
+# 기간별 컬럼이 있는 조건 타입
+_PERIOD_CONDITIONS = ('change_rate', 'volume', 'trade_amount')
+_PERIOD_SUFFIX = {'1D': '1d', '1W': '1w', '1M': '1m'}
+
+
+def indicator_rows(
+    frames: Dict[str, Optional[pd.DataFrame]],
+    calculator: Optional[IndicatorCalculator] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    심볼 전체의 패널 행을 한 번에 계산 (calculate_batch)
+
+    Args:
+        frames: 심볼 -> OHLCV 데이터 (None이면 지표 없음)
+        calculator: 지표 계산기 (None이면 새로 생성)
+
+    Returns:
+        심볼 -> calculate_all 결과 + ma_{기간} (데이터 없음/형식 오류는 None)
+    """
+    calculator = calculator or IndicatorCalculator()
+    rows: Dict[str, Optional[Dict[str, Any]]] = {symbol: None for symbol in frames}
+
+    usable = {}
+    for symbol, df in frames.items():
+        if df is None or df.empty or 'close' not in df.columns or 'volume' not in df.columns:
+            logger.debug(f"No usable OHLCV data for {symbol}")
+            continue
+        usable[symbol] = df
+    if not usable:
+        return rows
+
+    batch = calculator.calculate_batch(*stack_tails(list(usable.values())))
+    for i, symbol in enumerate(usable):
+        row: Dict[str, Any] = {name: float(batch[name][i]) for name in NUMERIC_COLUMNS}
+        row['ma_alignment'] = str(batch['ma_alignment'][i])
+        rows[symbol] = row
+    return rows
+
+
+def indicator_row(df: pd.DataFrame, calculator: Optional[IndicatorCalculator] = None) -> Dict[str, Any]:
+    """
+    심볼 하나의 패널 행 계산
+
+    Args:
+        df: OHLCV 데이터 (close, volume 필드 필수)
+        calculator: 지표 계산기 (None이면 새로 생성)
+
+    Returns:
+        calculate_all 결과 + ma_{기간} (데이터 부족 시 NaN)
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 close/volume 컬럼 누락
+    """
+    row = indicator_rows({'': df}, calculator)['']
+    if row is None:
+        raise ValueError("'close' and 'volume' columns are required")
+    return row
+
+
+class IndicatorPanel:
+    """
+    심볼 전체의 최신 지표 패널 (컬럼 형식)
+
+    Example:
+        >>> panel = IndicatorPanel.from_rows({'KRW-BTC': indicator_row(df)})
+        >>> panel.screen([{'type': 'change_rate', 'operator': '>', 'value': 0.05}])
+        ['KRW-BTC']
+    """
+
+    def __init__(self, symbols: List[str], columns: Dict[str, np.ndarray], alignment: np.ndarray):
+        """
+        Args:
+            symbols: 심볼 목록 (행 순서)
+            columns: 지표명 -> float64 배열 (len(symbols))
+            alignment: MA 정배열/역배열 문자열 배열 (len(symbols))
+        """
+        self.symbols = symbols
+        self.columns = columns
+        self.alignment = alignment
+        self._index = {symbol: i for i, symbol in enumerate(symbols)}
+
+    @classmethod
+    def from_rows(cls, rows: Dict[str, Optional[Dict[str, Any]]]) -> 'IndicatorPanel':
+        """
+        심볼별 지표 딕셔너리로 패널 생성
+
+        Args:
+            rows: 심볼 -> indicator_row 결과 (None이면 지표 없음)
+        """
+        symbols = list(rows)
+        columns = {name: np.full(len(symbols), np.nan) for name in NUMERIC_COLUMNS}
+        alignment = np.full(len(symbols), None, dtype=object)
+
+        for i, row in enumerate(rows.values()):
+            if not row:
+                continue
+            for name, column in columns.items():
+                value = row.get(name)
+                if value is not None:
+                    column[i] = value
+            alignment[i] = row.get('ma_alignment')
+
+        return cls(symbols, columns, alignment)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'IndicatorPanel':
+        """
+        심볼 인덱스 DataFrame으로 패널 생성 (구체화된 지표 저장소용)
+
+        Args:
+            frame: index=심볼, 컬럼=NUMERIC_COLUMNS + ma_alignment (없는 컬럼은 NaN)
+        """
+        columns = {
+            name: (
+                frame[name].to_numpy(dtype=np.float64, na_value=np.nan)
+                if name in frame.columns else np.full(len(frame), np.nan)
+            )
+            for name in NUMERIC_COLUMNS
+        }
+        if 'ma_alignment' in frame.columns:
+            alignment = frame['ma_alignment'].to_numpy(dtype=object)
+        else:
+            alignment = np.full(len(frame), None, dtype=object)
+        return cls(list(frame.index), columns, alignment)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def covers(self, symbols: Iterable[str]) -> bool:
+        """모든 심볼이 패널에 있는지"""
+        return all(symbol in self._index for symbol in symbols)
+
+    def row(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """심볼 하나의 지표 (디버깅/조회용)"""
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        row = {name: float(column[i]) for name, column in self.columns.items()}
+        row['ma_alignment'] = self.alignment[i]
+        return row
+
+    # ========================================================================
+    # 조건 평가
+    # ========================================================================
+
+    @staticmethod
+    def supports(condition: Dict[str, Any]) -> bool:
+        """
+        패널 컬럼만으로 평가 가능한 조건인지 여부
+
+        ma_alignment의 ma_periods가 패널 MA 기간(MA_PERIODS) 밖이면 False
+        (호출 측에서 심볼별 계산으로 평가)
+        """
+        if condition.get('type') != 'ma_alignment':
+            return True
+        return all(period in MA_PERIODS for period in condition.get('ma_periods') or MA_PERIODS)
+
+    def condition_mask(self, condition: Dict[str, Any]) -> np.ndarray:
+        """
+        조건 1개를 심볼 전체에 대해 평가
+
+        Args:
+            condition: {'type', 'operator', 'value', 'period', 'ma_periods'}
+
+        Returns:
+            심볼별 조건 만족 여부 (bool 배열)
+        """
+        condition_type = condition.get('type')
+        operator = condition.get('operator') or '>'
+        value = condition.get('value')
+        none = np.zeros(len(self.symbols), dtype=bool)
+
+        if condition_type == 'ma_alignment':
+            # MA 정배열/역배열은 문자열 비교만 지원
+            if operator != '==' or not isinstance(value, str):
+                return none
+            return self._alignment(condition.get('ma_periods')) == value
+
+        if condition_type in _PERIOD_CONDITIONS:
+            suffix = _PERIOD_SUFFIX.get(condition.get('period') or '1D')
+            if suffix is None:
+                logger.warning(f"Unknown period: {condition.get('period')}")
+                return none
+            values = self.columns[f'{condition_type}_{suffix}']
+        elif condition_type == 'ma_divergence':
+            values = self.columns['ma_divergence_20']
+        else:
+            logger.warning(f"Unknown condition type: {condition_type}")
+            return none
+
+        if not isinstance(value, (int, float)):
+            return none
+
+        # NaN(지표 없음)은 모든 비교에서 False
+        if operator == '>':
+            return values > value
+        elif operator == '<':
+            return values < value
+        elif operator == '>=':
+            return values >= value
+        elif operator == '<=':
+            return values <= value
+        elif operator == '==':
+            # 부동소수점 비교는 오차 범위 고려
+            return np.abs(values - value) < 0.01
+        return none
+
+    def _alignment(self, ma_periods: Optional[List[int]]) -> np.ndarray:
+        """요청한 MA 기간 조합의 정배열/역배열 배열"""
+        periods = sorted(ma_periods or MA_PERIODS)
+        if periods == list(MA_PERIODS):
+            return self.alignment
+
+        missing = [period for period in periods if period not in MA_PERIODS]
+        if missing:
+            logger.warning(f"MA periods {missing} are not in the indicator panel (see supports())")
+            return np.full(len(self.symbols), None, dtype=object)
+
+        # 작은 기간부터 MA 값 비교 (NaN이면 양쪽 모두 False → 혼조)
+        mas = [self.columns[f'ma_{period}'] for period in periods]
+        valid = np.logical_and.reduce([~np.isnan(ma) for ma in mas])
+        golden = valid.copy()
+        dead = valid.copy()
+        for shorter, longer in zip(mas, mas[1:]):
+            golden &= shorter > longer
+            dead &= shorter < longer
+        return np.where(golden, 'golden_cross', np.where(dead, 'dead_cross', 'mixed')).astype(object)
+
+    def screen(
+        self,
+        conditions: List[Dict[str, Any]],
+        logic: str = 'AND',
+        symbols: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        조건 목록으로 심볼 필터링
+
+        Args:
+            conditions: 조건 목록
+            logic: 'AND' 또는 'OR'
+            symbols: 대상 심볼 (None이면 패널 전체, 순서 유지)
+
+        Returns:
+            매칭된 심볼 목록
+        """
+        if logic not in ('AND', 'OR') or not conditions:
+            return []
+
+        masks = [self.condition_mask(condition) for condition in conditions]
+        if logic == 'AND':
+            matched = np.logical_and.reduce(masks)
+        else:
+            matched = np.logical_or.reduce(masks)
+
+        if symbols is None:
+            return [self.symbols[i] for i in np.flatnonzero(matched)]
+        return [
+            symbol for symbol in symbols
+            if symbol in self._index and matched[self._index[symbol]]
+        ]
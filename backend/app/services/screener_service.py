@@ -9,6 +9,7 @@ import os
 import json
 import hashlib
 import asyncio
+import time
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -21,8 +22,10 @@ try:
 except ImportError:
     HAS_REDIS = False
 
-from backend.app.data_loader import load_ohlcv_data
-from backend.app.indicators.calculator import IndicatorCalculator
+from backend.app.data_loader import load_ohlcv_tail
+from backend.app.indicators.calculator import IndicatorCalculator, TAIL_WINDOW
+from backend.app.services.screener_engine import IndicatorPanel, indicator_rows
+from backend.app.services.indicator_store import IndicatorStore, get_indicator_store
 from backend.app.routers.markets import (
     get_cached_markets,
     cache_markets,
@@ -38,6 +41,7 @@ logger = logging.getLogger(__name__)
 DATA_ROOT = os.getenv("DATA_ROOT", "/data")
 SCREENER_CACHE_TTL = 60  # 결과 캐시: 1분
 MARKET_DATA_CACHE_TTL = 300  # 마켓 데이터 캐시: 5분
+SCREENER_PANEL_TTL = float(os.getenv("SCREENER_PANEL_TTL", "60"))  # 지표 패널 재사용: 초
 
 # 기본 심볼 리스트 (폴백)
 DEFAULT_SYMBOLS = [
@@ -288,9 +292,10 @@ async def load_symbol_data(symbol: str) -> Optional[pd.DataFrame]:
         symbol: 심볼 (KRW-BTC)
 
     Returns:
-        OHLCV DataFrame 또는 None
+        최근 TAIL_WINDOW봉 OHLCV DataFrame 또는 None
 
     Note:
+        지표 계산에 필요한 만큼만 읽으므로 I/O가 히스토리 길이와 무관합니다.
         실패 시 로그를 남기고 None을 반환합니다 (graceful degradation).
     """
     try:
@@ -302,13 +307,8 @@ async def load_symbol_data(symbol: str) -> Optional[pd.DataFrame]:
         # 심볼 변환
         data_symbol = convert_symbol_to_data_format(symbol)
 
-        # 데이터 로드
-        df = load_ohlcv_data(
-            symbols=[data_symbol],
-            timeframe="1D",
-            start_date="2024-01-01",
-            end_date=datetime.now().strftime('%Y-%m-%d')
-        )
+        # 최근 TAIL_WINDOW봉만 로드 (가장 긴 지표 창)
+        df = load_ohlcv_tail(data_symbol, bars=TAIL_WINDOW, timeframe="1D")
 
         if df is None or df.empty:
             logger.debug(f"Empty data for {symbol}")
@@ -364,6 +364,11 @@ class ScreenerService:
     def __init__(self):
         """초기화"""
         self.calculator = IndicatorCalculator()
+        # 구체화된 지표 저장소 (수집 작업 후 갱신)
+        self.store: IndicatorStore = get_indicator_store()
+        # 저장소를 쓸 수 없을 때 원본 캔들로 계산한 패널 (SCREENER_PANEL_TTL 동안 재사용)
+        self._panel: Optional[IndicatorPanel] = None
+        self._panel_built_at = 0.0
         # Redis 초기화는 라우터의 startup 이벤트에서 처리
 
     async def get_available_symbols(self) -> List[str]:
@@ -459,12 +464,14 @@ class ScreenerService:
         logic: str = 'AND'
     ) -> List[str]:
         """
-        심볼 필터링 (병렬 처리 + 데이터 재사용)
+        심볼 필터링 (지표 패널 벡터 평가)
 
         **개선 사항**:
-        - 각 심볼의 DataFrame을 한 번만 로드하여 dict에 캐시
-        - 모든 조건 평가에서 동일 DF를 재사용 (반복 로드 제거)
-        - 데이터 로드 실패한 심볼은 메모이제이션으로 빠르게 스킵
+        - 심볼 전체의 최신 지표를 컬럼 형식 패널로 한 번 계산하여 재사용
+        - 조건은 심볼 전체에 대한 boolean 마스크로 한 번에 평가 (AND/OR)
+        - 수집 작업 후 구체화된 지표 저장소를 우선 사용 (조건과 무관하게 일정한 지연)
+        - 저장소가 없으면 원본 캔들로 계산한 패널을 SCREENER_PANEL_TTL 동안 재사용
+        - 패널에 없는 MA 기간 조합(ma_periods)은 심볼별 계산으로 평가
 
         Args:
             conditions: 조건 목록
@@ -491,43 +498,19 @@ class ScreenerService:
                 f"logic: {logic}"
             )
 
-            # 2. 모든 심볼의 DataFrame을 미리 로드 (재사용을 위해)
-            # 각 심볼당 한 번만 로드
-            symbol_data: Dict[str, Optional[pd.DataFrame]] = {}
-
-            logger.debug(f"Loading data for {len(symbols)} symbols...")
-            load_tasks = [
-                self._load_and_cache_symbol_data(symbol, symbol_data)
-                for symbol in symbols
-            ]
-            await asyncio.gather(*load_tasks, return_exceptions=True)
-
-            logger.debug(f"Data loaded for {len([d for d in symbol_data.values() if d is not None])} symbols")
-
-            # 3. 병렬 처리로 각 심볼 평가 (미리 로드된 데이터 사용)
-            tasks = [
-                self._evaluate_symbol_with_cached_data(
-                    symbol,
-                    symbol_data.get(symbol),
-                    conditions,
-                    logic
-                )
-                for symbol in symbols
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 4. 결과 수집
-            matched = []
-            for symbol, result in zip(symbols, results):
-                if isinstance(result, Exception):
-                    logger.debug(f"Exception for {symbol}: {result}")
-                    continue
-                if result:
-                    matched.append(symbol)
+            if all(IndicatorPanel.supports(condition) for condition in conditions):
+                # 2. 지표 패널 (없거나 만료/심볼 누락 시 재계산)
+                panel = await self.get_indicator_panel(symbols)
+
+                # 3. 벡터 평가
+                matched = panel.screen(conditions, logic, symbols)
+            else:
+                # 패널에 없는 MA 기간 조합은 심볼별 계산으로 평가
+                matched = await self._filter_symbols_per_symbol(conditions, symbols, logic)
 
             logger.info(f"Screening completed: {len(matched)} matches out of {len(symbols)} symbols")
 
-            # 5. 결과 캐시
+            # 4. 결과 캐시
             await set_cached_result(conditions, symbols, matched)
 
             return matched
@@ -536,6 +519,97 @@ class ScreenerService:
             logger.error(f"Error in filter_symbols: {e}", exc_info=True)
             return []
 
+    async def _filter_symbols_per_symbol(
+        self,
+        conditions: List[Dict[str, Any]],
+        symbols: List[str],
+        logic: str
+    ) -> List[str]:
+        """
+        심볼별 데이터를 한 번씩 로드하여 조건 평가 (패널이 지원하지 않는 조건용)
+
+        Args:
+            conditions: 조건 목록
+            symbols: 심볼 목록
+            logic: 'AND' 또는 'OR'
+
+        Returns:
+            매칭된 심볼 목록 (symbols 순서 유지)
+        """
+        symbol_data: Dict[str, Optional[pd.DataFrame]] = {}
+        await asyncio.gather(
+            *(self._load_and_cache_symbol_data(symbol, symbol_data) for symbol in symbols),
+            return_exceptions=True
+        )
+
+        results = await asyncio.gather(*(
+            self._evaluate_symbol_with_cached_data(symbol, symbol_data.get(symbol), conditions, logic)
+            for symbol in symbols
+        ))
+        return [symbol for symbol, result in zip(symbols, results) if result]
+
+    async def get_indicator_panel(self, symbols: List[str]) -> IndicatorPanel:
+        """
+        심볼 전체 지표 패널 조회
+
+        1. 구체화된 지표 저장소가 모든 심볼을 포함하면 저장소 패널 사용 (원본 캔들 읽지 않음)
+        2. 원본 캔들로 계산한 패널이 SCREENER_PANEL_TTL 이내이고 모든 심볼을 포함하면 재사용
+        3. 그 외에는 원본 캔들로 다시 계산
+
+        Args:
+            symbols: 패널에 포함할 심볼 목록
+
+        Returns:
+            IndicatorPanel
+        """
+        try:
+            if self.store.covers(symbols):
+                panel = self.store.load_panel()
+                if panel is not None:
+                    return panel
+        except Exception as e:
+            logger.warning(f"Indicator store unavailable, computing from candles: {e}")
+
+        panel = self._panel
+        if (
+            panel is not None
+            and time.monotonic() - self._panel_built_at < SCREENER_PANEL_TTL
+            and panel.covers(symbols)
+        ):
+            return panel
+
+        panel = await self.build_indicator_panel(symbols)
+        self._panel = panel
+        self._panel_built_at = time.monotonic()
+        return panel
+
+    async def build_indicator_panel(self, symbols: List[str]) -> IndicatorPanel:
+        """
+        심볼별 데이터를 한 번씩 로드하여 지표 패널 생성
+
+        Args:
+            symbols: 심볼 목록
+
+        Returns:
+            IndicatorPanel (데이터가 없거나 계산에 실패한 심볼은 NaN 행)
+        """
+        symbol_data: Dict[str, Optional[pd.DataFrame]] = {}
+
+        logger.debug(f"Loading data for {len(symbols)} symbols...")
+        load_tasks = [
+            self._load_and_cache_symbol_data(symbol, symbol_data)
+            for symbol in symbols
+        ]
+        await asyncio.gather(*load_tasks, return_exceptions=True)
+
+        rows = indicator_rows(
+            {symbol: symbol_data.get(symbol) for symbol in symbols},
+            self.calculator
+        )
+
+        logger.debug(f"Indicator panel built for {len([r for r in rows.values() if r])} symbols")
+        return IndicatorPanel.from_rows(rows)
+
     async def _load_and_cache_symbol_data(
         self,
         symbol: str,
@@ -567,7 +641,7 @@ class ScreenerService:
         logic: str
     ) -> bool:
         """
-        미리 로드된 DataFrame을 사용하여 심볼 평가
+        미리 로드된 DataFrame을 사용하여 심볼 하나 평가 (심볼 단위 평가용)
 
         Args:
             symbol: 심볼
@@ -668,7 +742,7 @@ class ScreenerService:
 
     # ========================================================================
     # [DEPRECATED] 다음 메서드들은 이제 사용되지 않습니다.
-    # filter_symbols()의 데이터 재사용 구조로 인해 직접 호출 제거됨.
+    # filter_symbols()는 지표 패널 벡터 평가(IndicatorPanel.screen)를 사용.
     # 기존 테스트 호환성을 위해 유지.
     # ========================================================================
 
@@ -680,7 +754,7 @@ class ScreenerService:
     ) -> bool:
         """
         [DEPRECATED] 직접 호출하지 마세요.
-        filter_symbols() 내에서 _evaluate_symbol_with_cached_data() 사용.
+        filter_symbols() 내에서 IndicatorPanel.screen() 사용.
 
         심볼이 모든/어느 조건을 만족하는지 평가
 
@@ -0,0 +1,110 @@
+"""
+WebSocket 이벤트 히스토리 링 버퍼
+
+이벤트마다 순번(seq)을 붙여 고정 크기 슬롯에 보관하고, event_id → seq 맵을 유지합니다.
+이벤트는 전송할 때 만든 JSON 문자열을 그대로 저장하므로 재연결 시 재직렬화가 필요 없고,
+특정 이벤트 이후의 재전송 대상은 검색 없이 슬롯 구간으로 바로 구합니다.
+
+- 추가/만료: O(1)
+- last_event_id 이후 조회: O(재전송 이벤트 수)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class HistoryEntry:
+    """히스토리 항목 (전송된 JSON 그대로 보관)"""
+    seq: int
+    event_id: str
+    event_type: str
+    symbol: Optional[str]
+    payload: str
+
+
+class EventRingBuffer:
+    """순번 기반 이벤트 링 버퍼"""
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: 보관할 최대 이벤트 수 (초과 시 가장 오래된 이벤트부터 만료)
+        """
+        self.capacity = max(1, capacity)
+        self._slots: List[Optional[HistoryEntry]] = [None] * self.capacity
+        self._offsets: Dict[str, int] = {}  # event_id -> seq
+        self.next_seq = 0
+
+    def __len__(self) -> int:
+        return self.next_seq - self.first_seq
+
+    @property
+    def first_seq(self) -> int:
+        """보관 중인 가장 오래된 이벤트 순번"""
+        return max(0, self.next_seq - self.capacity)
+
+    def append(self, event_id: str, event_type: str, payload: str,
+               symbol: Optional[str] = None) -> int:
+        """
+        이벤트 추가
+
+        Args:
+            event_id: 이벤트 ID
+            event_type: 이벤트 타입 값
+            payload: 전송한 JSON 문자열
+            symbol: 이벤트 심볼 (없으면 모든 구독자 대상)
+
+        Returns:
+            부여된 순번
+        """
+        seq = self.next_seq
+        slot = seq % self.capacity
+        expired = self._slots[slot]
+        if expired is not None:
+            self._offsets.pop(expired.event_id, None)
+
+        self._slots[slot] = HistoryEntry(seq, event_id, event_type, symbol, payload)
+        self._offsets[event_id] = seq
+        self.next_seq += 1
+        return seq
+
+    def latest(self) -> Optional[HistoryEntry]:
+        """가장 최근 이벤트"""
+        if self.next_seq == 0:
+            return None
+        return self._slots[(self.next_seq - 1) % self.capacity]
+
+    def contains(self, event_id: str) -> bool:
+        """히스토리에 남아 있는 이벤트인지 확인"""
+        return event_id in self._offsets
+
+    def _range(self, start_seq: int) -> List[HistoryEntry]:
+        """start_seq부터 마지막까지 (링 경계에서 두 구간으로 나눠 슬라이스)"""
+        start_seq = max(start_seq, self.first_seq)
+        if start_seq >= self.next_seq:
+            return []
+        start = start_seq % self.capacity
+        end = start + (self.next_seq - start_seq)
+        if end <= self.capacity:
+            return self._slots[start:end]
+        return self._slots[start:] + self._slots[:end - self.capacity]
+
+    def entries(self) -> List[HistoryEntry]:
+        """보관 중인 모든 이벤트 (오래된 순)"""
+        return self._range(self.first_seq)
+
+    def entries_after(self, event_id: str) -> Optional[List[HistoryEntry]]:
+        """
+        특정 이벤트 이후의 이벤트 조회
+
+        Args:
+            event_id: 기준 이벤트 ID (이 이벤트는 제외)
+
+        Returns:
+            이후 이벤트 목록 (오래된 순), 기준 이벤트가 만료/미존재면 None
+        """
+        seq = self._offsets.get(event_id)
+        if seq is None:
+            return None
+        return self._range(seq + 1)
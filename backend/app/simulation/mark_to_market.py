@@ -0,0 +1,197 @@
+"""
+포지션 평가(mark-to-market) 저장소
+
+오픈 포지션을 심볼별 NumPy 배열(진입가, 수량, 수수료, 현재가, 미실현 손익)로 보관하여,
+캔들 하나에 대한 미실현 손익을 포지션 수와 무관하게 배열 연산 한 번으로 계산합니다.
+
+- SymbolPositionBook: 심볼 하나의 배열 저장소 (슬롯 추가/삭제는 O(1), 삭제는 마지막 슬롯과 교체)
+- PositionBook: PositionManager.positions ("symbol:strategy_name" -> Position) 매핑
+  항목 추가/삭제 시 심볼별 저장소를 함께 갱신하므로 positions에 직접 대입해도 인덱스가 유지됨
+
+Position은 저장소에 연결된 동안 현재가/미실현 손익을 배열 슬롯에서 읽습니다.
+(position_manager.Position 참고)
+"""
+
+from collections.abc import ItemsView, Iterator, MutableMapping, ValuesView
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from backend.app.simulation.position_manager import Position
+
+
+class SymbolPositionBook:
+    """심볼 하나의 오픈 포지션 배열 저장소"""
+
+    INITIAL_CAPACITY = 8
+    _ARRAYS = (
+        'position_ids', 'entry_price', 'quantity', 'fee_amount',
+        'current_price', 'unrealized_pnl', 'unrealized_pnl_pct',
+    )
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.size = 0
+        self.positions: List["Position"] = []
+        self.position_ids = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)
+        self.entry_price = np.zeros(self.INITIAL_CAPACITY)
+        self.quantity = np.zeros(self.INITIAL_CAPACITY)
+        self.fee_amount = np.zeros(self.INITIAL_CAPACITY)
+        self.current_price = np.zeros(self.INITIAL_CAPACITY)
+        self.unrealized_pnl = np.zeros(self.INITIAL_CAPACITY)
+        self.unrealized_pnl_pct = np.zeros(self.INITIAL_CAPACITY)
+
+    def _grow(self) -> None:
+        """용량 2배 확장"""
+        for name in self._ARRAYS:
+            array = getattr(self, name)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+
+    def add(self, position: "Position") -> None:
+        """
+        포지션을 마지막 슬롯에 추가하고 저장소에 연결
+
+        Args:
+            position: 오픈 포지션 (현재가/손익 값은 슬롯으로 옮겨짐)
+        """
+        if self.size == len(self.entry_price):
+            self._grow()
+
+        slot = self.size
+        self.position_ids[slot] = position.position_id
+        self.entry_price[slot] = position.entry_price
+        self.quantity[slot] = position.quantity
+        self.fee_amount[slot] = position.fee_amount
+        self.current_price[slot] = position.current_price
+        self.unrealized_pnl[slot] = position.unrealized_pnl
+        self.unrealized_pnl_pct[slot] = position.unrealized_pnl_pct
+
+        self.positions.append(position)
+        self.size += 1
+        position._attach(self, slot)
+
+    def remove(self, position: "Position") -> None:
+        """
+        포지션을 저장소에서 분리 (마지막 슬롯을 빈 자리로 이동)
+
+        Args:
+            position: 이 저장소에 연결된 포지션 (값은 포지션 객체로 복사됨)
+        """
+        slot = position._slot
+        position._detach()
+
+        last = self.size - 1
+        if slot != last:
+            for name in self._ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.positions[last]
+            self.positions[slot] = moved
+            moved._slot = slot
+
+        self.positions.pop()
+        self.size -= 1
+
+    def mark(self, price: float) -> None:
+        """
+        모든 포지션을 현재가로 평가 (Position.update_price와 같은 계산의 배열 버전)
+
+        Args:
+            price: 현재가 (캔들 종가)
+        """
+        n = self.size
+        if n == 0:
+            return
+
+        entry = self.entry_price[:n]
+        quantity = self.quantity[:n]
+        self.current_price[:n] = price
+        pnl = quantity * (price - entry) - self.fee_amount[:n]
+        self.unrealized_pnl[:n] = pnl
+
+        notional = entry * quantity
+        positive = notional > 0
+        self.unrealized_pnl_pct[:n][positive] = (pnl[positive] / notional[positive]) * 100
+
+    def price_rows(self) -> List[Tuple[int, float]]:
+        """(position_id, 현재가) 목록 (일괄 DB 갱신용)"""
+        n = self.size
+        return list(zip(self.position_ids[:n].tolist(), self.current_price[:n].tolist()))
+
+    def total_unrealized_pnl(self) -> float:
+        """미실현 손익 합계"""
+        return float(self.unrealized_pnl[:self.size].sum())
+
+
+class PositionBook(MutableMapping):
+    """
+    오픈 포지션 매핑 ("symbol:strategy_name" -> Position) + 심볼별 배열 저장소
+
+    내부 dict를 감싸므로 모든 변경(setdefault/popitem/update/clear 포함)이
+    __setitem__/__delitem__을 거쳐 심볼별 저장소와 함께 갱신됩니다.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, "Position"] = {}
+        self._books: Dict[str, SymbolPositionBook] = {}
+
+    def _unindex(self, key: str) -> None:
+        position = self._positions.get(key)
+        if position is None or position._book is None:
+            return
+        book = position._book
+        book.remove(position)
+        if book.size == 0:
+            self._books.pop(book.symbol, None)
+
+    def __getitem__(self, key: str) -> "Position":
+        return self._positions[key]
+
+    def __setitem__(self, key: str, position: "Position") -> None:
+        self._unindex(key)
+        self._positions[key] = position
+        book = self._books.get(position.symbol)
+        if book is None:
+            book = self._books[position.symbol] = SymbolPositionBook(position.symbol)
+        book.add(position)
+
+    def __delitem__(self, key: str) -> None:
+        self._unindex(key)
+        del self._positions[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def __repr__(self) -> str:
+        return f"PositionBook({self._positions!r})"
+
+    def values(self) -> ValuesView:
+        return self._positions.values()
+
+    def items(self) -> ItemsView:
+        return self._positions.items()
+
+    def book(self, symbol: str) -> Optional[SymbolPositionBook]:
+        """
+        심볼의 배열 저장소 조회
+
+        Args:
+            symbol: 거래 심볼
+
+        Returns:
+            SymbolPositionBook 또는 None (오픈 포지션 없음)
+        """
+        return self._books.get(symbol)
+
+    def books(self) -> List[SymbolPositionBook]:
+        """오픈 포지션이 있는 모든 심볼 저장소"""
+        return list(self._books.values())
@@ -0,0 +1,77 @@
+"""
+시뮬레이션 성과 누적 집계
+
+포지션이 청산될 때마다 누적 값(총 손익, 승/패 수, 투입 자본, 누적 손익 최고점/최대 낙폭)을
+O(1)로 갱신하여, 성과 스냅샷을 거래 히스토리 조회/정렬 없이 바로 만들 수 있게 합니다.
+(조회 개수 제한 없이 세션의 모든 청산 거래가 반영됨)
+"""
+
+from typing import Dict
+
+
+class PerformanceAccumulator:
+    """청산 거래 누적 성과 집계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """집계 초기화 (새 세션 시작 시)"""
+        self.total_pnl = 0.0
+        self.total_trades = 0
+        self.win_count = 0
+        self.lose_count = 0
+        self.total_capital = 0.0  # 진입 금액(진입가 × 수량) 합계
+        self.peak_pnl = 0.0  # 누적 손익 최고점
+        self.max_drawdown = 0.0  # 최고점 대비 최대 하락폭
+
+    def record_trade(self, realized_pnl: float, entry_price: float, quantity: float) -> None:
+        """
+        청산 거래 반영
+
+        Args:
+            realized_pnl: 실현 손익
+            entry_price: 진입가
+            quantity: 수량
+        """
+        self.total_pnl += realized_pnl
+        self.total_trades += 1
+        if realized_pnl > 0:
+            self.win_count += 1
+        elif realized_pnl < 0:
+            self.lose_count += 1
+        self.total_capital += entry_price * quantity
+
+        # 청산 순서대로 누적 손익 곡선의 최고점/낙폭 갱신
+        if self.total_pnl > self.peak_pnl:
+            self.peak_pnl = self.total_pnl
+        drawdown = self.peak_pnl - self.total_pnl
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+
+    @property
+    def total_pnl_pct(self) -> float:
+        """투입 자본 대비 총 손익률 (%)"""
+        return (self.total_pnl / self.total_capital * 100) if self.total_capital > 0 else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """승률 (%)"""
+        return (self.win_count / self.total_trades * 100) if self.total_trades > 0 else 0.0
+
+    def snapshot(self) -> Dict:
+        """
+        성과 스냅샷 (PerformanceMetrics 필드, timestamp 제외)
+
+        Returns:
+            반올림된 성과 지표
+        """
+        return {
+            'total_pnl': round(self.total_pnl, 2),
+            'total_pnl_pct': round(self.total_pnl_pct, 2),
+            'win_rate': round(self.win_rate, 2),
+            'max_drawdown': round(self.max_drawdown, 2),
+            'total_trades': self.total_trades,
+            'win_count': self.win_count,
+            'lose_count': self.lose_count,
+        }
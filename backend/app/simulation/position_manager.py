@@ -4,19 +4,31 @@
 거래 신호를 수신하여 가상 포지션을 관리하고 손익을 계산합니다.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, List
+import os
+from typing import Optional, Dict, List, Set
 from datetime import datetime
 
 from backend.app.database import DatabaseManager, get_db
+from backend.app.simulation.mark_to_market import PositionBook, SymbolPositionBook
+from backend.app.simulation.performance_tracker import PerformanceAccumulator
 from backend.app.market_data.candle_builder import CandleData
 from backend.app.strategies.base import Signal
 
 logger = logging.getLogger(__name__)
 
+# 미실현 손익 DB 반영/이벤트 발행 주기 (이 주기 안의 캔들은 하나로 합침)
+DEFAULT_MARK_FLUSH_INTERVAL_MS = 1000
+
 
 class Position:
-    """포지션 정보"""
+    """
+    포지션 정보
+
+    PositionManager.positions(PositionBook)에 들어 있는 동안 현재가/미실현 손익은
+    심볼별 배열 저장소의 슬롯에서 읽고 씁니다. (mark_to_market 참고)
+    """
 
     def __init__(
         self,
@@ -35,13 +47,64 @@ class Position:
         self.entry_price = entry_price
         self.quantity = quantity
         self.fee_amount = fee_amount
-        self.current_price = entry_price
-        self.unrealized_pnl = 0.0
-        self.unrealized_pnl_pct = 0.0
+        self._book: Optional[SymbolPositionBook] = None
+        self._slot = -1
+        self._current_price = entry_price
+        self._unrealized_pnl = 0.0
+        self._unrealized_pnl_pct = 0.0
 
         # 초기 손익 계산 (현재가 = 진입가이므로 손익 = -수수료)
         self.update_price(entry_price)
 
+    def _attach(self, book: SymbolPositionBook, slot: int) -> None:
+        """배열 저장소 슬롯에 연결"""
+        self._book = book
+        self._slot = slot
+
+    def _detach(self) -> None:
+        """저장소 분리 (슬롯 값을 객체로 복사)"""
+        self._current_price = self.current_price
+        self._unrealized_pnl = self.unrealized_pnl
+        self._unrealized_pnl_pct = self.unrealized_pnl_pct
+        self._book = None
+        self._slot = -1
+
+    @property
+    def current_price(self) -> float:
+        if self._book is not None:
+            return float(self._book.current_price[self._slot])
+        return self._current_price
+
+    @current_price.setter
+    def current_price(self, value: float) -> None:
+        if self._book is not None:
+            self._book.current_price[self._slot] = value
+        self._current_price = value
+
+    @property
+    def unrealized_pnl(self) -> float:
+        if self._book is not None:
+            return float(self._book.unrealized_pnl[self._slot])
+        return self._unrealized_pnl
+
+    @unrealized_pnl.setter
+    def unrealized_pnl(self, value: float) -> None:
+        if self._book is not None:
+            self._book.unrealized_pnl[self._slot] = value
+        self._unrealized_pnl = value
+
+    @property
+    def unrealized_pnl_pct(self) -> float:
+        if self._book is not None:
+            return float(self._book.unrealized_pnl_pct[self._slot])
+        return self._unrealized_pnl_pct
+
+    @unrealized_pnl_pct.setter
+    def unrealized_pnl_pct(self, value: float) -> None:
+        if self._book is not None:
+            self._book.unrealized_pnl_pct[self._slot] = value
+        self._unrealized_pnl_pct = value
+
     def update_price(self, current_price: float) -> None:
         """현재 가격으로 미실현 손익 업데이트"""
         self.current_price = current_price
@@ -81,12 +144,18 @@ class PositionManager:
         """PositionManager 초기화"""
         self.db: Optional[DatabaseManager] = None
         self.session_id: Optional[str] = None
-        self.positions: Dict[str, Position] = {}  # (symbol, strategy_name) -> Position
+        self.positions: PositionBook = PositionBook()  # (symbol, strategy_name) -> Position
         self.fee_rate = 0.001  # 거래 수수료 0.1%
         self.slippage_rate = 0.0002  # 슬리피지 0.02%
         self.on_position_opened = None  # 포지션 진입 콜백
         self.on_position_closed = None  # 포지션 청산 콜백
         self.on_position_updated = None  # 포지션 미실현 손익 업데이트 콜백
+        self.mark_flush_interval = float(
+            os.getenv("POSITION_MARK_FLUSH_INTERVAL_MS", DEFAULT_MARK_FLUSH_INTERVAL_MS)
+        ) / 1000
+        self._dirty_symbols: Set[str] = set()  # 마지막 플러시 이후 평가된 심볼
+        self._mark_flush_task: Optional[asyncio.Task] = None
+        self.performance = PerformanceAccumulator()  # 세션 청산 거래 누적 성과
 
     async def initialize(self, session_id: str) -> None:
         """
@@ -98,6 +167,7 @@ class PositionManager:
         try:
             self.db = get_db()
             self.session_id = session_id
+            self.performance.reset()
             logger.info(f"PositionManager initialized (session: {session_id})")
         except Exception as e:
             logger.error(f"Failed to initialize PositionManager: {e}")
@@ -203,7 +273,7 @@ class PositionManager:
             if not self.db:
                 raise RuntimeError("Database not initialized")
 
-            position_id = self.db.insert_position(
+            position_id = await self.db.insert_position_async(
                 symbol=symbol,
                 strategy_name=strategy_name,
                 entry_time=timestamp,
@@ -305,7 +375,7 @@ class PositionManager:
             if not self.db:
                 raise RuntimeError("Database not initialized")
 
-            self.db.update_position_on_close(
+            await self.db.update_position_on_close_async(
                 position_id=position.position_id,
                 exit_time=timestamp,
                 exit_price=exit_price,
@@ -313,7 +383,7 @@ class PositionManager:
             )
 
             # 거래 기록 저장
-            trade_id = self.db.insert_trade(
+            trade_id = await self.db.insert_trade_async(
                 symbol=symbol,
                 strategy_name=strategy_name,
                 entry_time=position.entry_time,
@@ -327,8 +397,9 @@ class PositionManager:
                 slippage_amount=slippage_amount,
             )
 
-            # 메모리에서 포지션 제거
+            # 메모리에서 포지션 제거 + 누적 성과 반영
             del self.positions[key]
+            self.performance.record_trade(realized_pnl, position.entry_price, position.quantity)
 
             # 포지션 청산 콜백 실행
             if self.on_position_closed:
@@ -352,35 +423,78 @@ class PositionManager:
         """
         미실현 손익 업데이트
 
-        캔들 데이터를 수신하여 해당 심볼의 모든 오픈 포지션의
-        미실현 손익을 업데이트합니다.
+        캔들 데이터를 수신하여 해당 심볼의 모든 오픈 포지션을 배열 연산 한 번으로 평가합니다.
+        DB 반영과 POSITION_UPDATED 콜백은 mark_flush_interval마다 flush_marks()에서
+        한 번에 처리합니다. (주기 안에 여러 캔들이 와도 포지션당 1회)
 
         Args:
             candle: 캔들 데이터
         """
         try:
-            # 해당 심볼의 모든 포지션 업데이트
-            for key, position in list(self.positions.items()):
-                if position.symbol == candle.symbol:
-                    position.update_price(candle.close)
-
-                    # DB에도 업데이트
-                    if self.db:
-                        self.db.update_position_unrealized_pnl(
-                            position_id=position.position_id,
-                            current_price=candle.close,
-                        )
-
-                    # 포지션 업데이트 콜백 실행
-                    if self.on_position_updated:
-                        try:
-                            await self.on_position_updated(position)
-                        except Exception as e:
-                            logger.error(f"Error in position_updated callback for {key}: {e}")
+            book = self.positions.book(candle.symbol)
+            if book is None:
+                return
+
+            book.mark(candle.close)
+            self._dirty_symbols.add(candle.symbol)
+
+            if self.mark_flush_interval <= 0:
+                await self.flush_marks()
+            elif self._mark_flush_task is None or self._mark_flush_task.done():
+                self._mark_flush_task = asyncio.create_task(self._flush_marks_later())
 
         except Exception as e:
             logger.error(f"Error updating unrealized PnL for {candle.symbol}: {e}")
 
+    async def _flush_marks_later(self) -> None:
+        """플러시 주기 후 평가 결과 반영"""
+        await asyncio.sleep(self.mark_flush_interval)
+        await self.flush_marks()
+
+    async def flush_marks(self) -> int:
+        """
+        평가된 포지션의 미실현 손익을 DB에 일괄 반영하고 업데이트 콜백 실행
+
+        Returns:
+            반영된 포지션 수
+        """
+        task = self._mark_flush_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        self._mark_flush_task = None
+
+        # 그 사이 청산되어 저장소가 사라진 심볼은 제외
+        books = [
+            book for book in (self.positions.book(symbol) for symbol in self._dirty_symbols)
+            if book is not None
+        ]
+        self._dirty_symbols = set()
+        if not books:
+            return 0
+
+        rows = [row for book in books for row in book.price_rows()]
+        try:
+            if self.db:
+                await self.db.update_positions_unrealized_pnl_async(rows)
+        except Exception as e:
+            logger.error(f"Failed to persist unrealized PnL for {len(rows)} positions: {e}")
+
+        if self.on_position_updated:
+            for position in [position for book in books for position in book.positions]:
+                try:
+                    await self.on_position_updated(position)
+                except Exception as e:
+                    logger.error(
+                        f"Error in position_updated callback for "
+                        f"{position.symbol}:{position.strategy_name}: {e}"
+                    )
+
+        return len(rows)
+
+    async def close(self) -> None:
+        """남은 평가 결과 반영 (종료 시)"""
+        await self.flush_marks()
+
     def get_open_positions(
         self, symbol: Optional[str] = None, strategy_name: Optional[str] = None
     ) -> List[Dict]:
@@ -406,6 +520,27 @@ class PositionManager:
 
         return sorted(result, key=lambda x: x['entry_time'], reverse=True)
 
+    @staticmethod
+    def _format_trades(trades: List[Dict]) -> List[Dict]:
+        """거래 행을 API 응답 형식으로 변환"""
+        # ISO 형식 날짜로 변환
+        result = []
+        for trade in trades:
+            trade_dict = dict(trade)
+            if 'entry_time' in trade_dict and trade_dict['entry_time']:
+                trade_dict['entry_time'] = trade_dict['entry_time'].isoformat()
+            if 'exit_time' in trade_dict and trade_dict['exit_time']:
+                trade_dict['exit_time'] = trade_dict['exit_time'].isoformat()
+            if 'hold_duration' in trade_dict and trade_dict['hold_duration']:
+                trade_dict['hold_duration'] = str(trade_dict['hold_duration'])
+            # 소수점 반올림
+            for key in ['entry_price', 'exit_price', 'realized_pnl', 'realized_pnl_pct', 'fee_amount', 'slippage_amount']:
+                if key in trade_dict and isinstance(trade_dict[key], float):
+                    trade_dict[key] = round(trade_dict[key], 2)
+            result.append(trade_dict)
+
+        return result
+
     def get_closed_trades(
         self,
         symbol: Optional[str] = None,
@@ -413,7 +548,7 @@ class PositionManager:
         limit: int = 100,
     ) -> List[Dict]:
         """
-        클로즈된 거래 조회
+        클로즈된 거래 조회 (동기, 이벤트 루프 밖에서 사용)
 
         Args:
             symbol: 심볼 필터 (선택사항)
@@ -427,45 +562,34 @@ class PositionManager:
             return []
 
         try:
-            query = "SELECT * FROM simulation_trades WHERE 1=1"
-            params = []
-
-            if symbol:
-                query += " AND symbol = %s"
-                params.append(symbol)
-
-            if strategy_name:
-                query += " AND strategy_name = %s"
-                params.append(strategy_name)
-
-            query += " ORDER BY exit_time DESC LIMIT %s"
-            params.append(limit)
-
-            with self.db.get_conn() as conn:
-                from psycopg2.extras import RealDictCursor
-
-                with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(query, params)
-                    trades = cur.fetchall()
-
-            # ISO 형식 날짜로 변환
-            result = []
-            for trade in trades:
-                trade_dict = dict(trade)
-                if 'entry_time' in trade_dict and trade_dict['entry_time']:
-                    trade_dict['entry_time'] = trade_dict['entry_time'].isoformat()
-                if 'exit_time' in trade_dict and trade_dict['exit_time']:
-                    trade_dict['exit_time'] = trade_dict['exit_time'].isoformat()
-                if 'hold_duration' in trade_dict and trade_dict['hold_duration']:
-                    trade_dict['hold_duration'] = str(trade_dict['hold_duration'])
-                # 소수점 반올림
-                for key in ['entry_price', 'exit_price', 'realized_pnl', 'realized_pnl_pct', 'fee_amount', 'slippage_amount']:
-                    if key in trade_dict and isinstance(trade_dict[key], float):
-                        trade_dict[key] = round(trade_dict[key], 2)
-                result.append(trade_dict)
-
-            return result
+            return self._format_trades(self.db.get_closed_trades(symbol, strategy_name, limit))
+        except Exception as e:
+            logger.error(f"Error retrieving closed trades: {e}")
+            return []
+
+    async def get_closed_trades_async(
+        self,
+        symbol: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """
+        클로즈된 거래 비동기 조회 (이벤트 루프를 막지 않음)
+
+        Args:
+            symbol: 심볼 필터 (선택사항)
+            strategy_name: 전략명 필터 (선택사항)
+            limit: 조회 개수 제한
 
+        Returns:
+            거래 정보 딕셔너리 목록
+        """
+        if not self.db:
+            return []
+
+        try:
+            trades = await self.db.get_closed_trades_async(symbol, strategy_name, limit)
+            return self._format_trades(trades)
         except Exception as e:
             logger.error(f"Error retrieving closed trades: {e}")
             return []
@@ -478,7 +602,7 @@ class PositionManager:
             포지션 통계 정보
         """
         total_unrealized_pnl = sum(
-            position.unrealized_pnl for position in self.positions.values()
+            book.total_unrealized_pnl() for book in self.positions.books()
         )
         open_count = len(self.positions)
 
@@ -514,5 +638,5 @@ async def close_position_manager() -> None:
     """PositionManager 종료"""
     global _position_manager
     if _position_manager:
-        # 필요한 정리 작업 수행
+        await _position_manager.close()
         _position_manager = None
@@ -85,6 +85,7 @@ class SimulationOrchestrator:
             # 2. MarketDataService 시작
             self.market_data_service = MarketDataService(symbols, timeframe='1m', redis_client=redis_client)
             self.market_data_service.on_candle_complete = self._on_candle_complete
+            self.market_data_service.on_candles_complete = self._on_candles_complete
 
             # 백그라운드에서 시작
             asyncio.create_task(self.market_data_service.start())
@@ -146,6 +147,9 @@ class SimulationOrchestrator:
 
             # PositionManager 정리
             if self.position_manager:
+                # 남은 미실현 손익 반영
+                await self.position_manager.close()
+
                 # 포지션 요약 로깅
                 summary = self.position_manager.get_position_summary()
                 logger.info(
@@ -184,6 +188,27 @@ class SimulationOrchestrator:
         except Exception as e:
             logger.error(f"Error processing candle: {e}")
 
+    async def _on_candles_complete(self, candles: List[CandleData]) -> None:
+        """
+        같은 배치로 저장된 캔들 일괄 처리 (MarketDataService 배치 콜백)
+
+        포지션 미실현 손익을 캔들별로 갱신한 뒤 전략은 StrategyRunner.process_candles로 한 번에 평가
+        """
+        try:
+            if not self.strategy_runner or not self.is_running:
+                return
+
+            # 1. 포지션 미실현 손익 업데이트
+            if self.position_manager:
+                for candle in candles:
+                    await self.position_manager.update_unrealized_pnl(candle)
+
+            # 2. 전략 일괄 실행
+            await self.strategy_runner.process_candles(candles)
+
+        except Exception as e:
+            logger.error(f"Error processing candle batch: {e}")
+
     async def _on_signal(self, signal, symbol: str, strategy_name: str) -> None:
         """
         신호 생성 시 처리 (StrategyRunner 콜백)
@@ -312,70 +337,18 @@ class SimulationOrchestrator:
 
     async def _broadcast_performance_snapshot(self) -> None:
         """
-        성과 스냅샷 계산 및 브로드캐스트
+        성과 스냅샷 브로드캐스트
 
-        거래 히스토리를 기반으로 성과 지표를 계산합니다.
+        PositionManager의 누적 성과 집계를 읽어 만들므로 거래 히스토리를 조회하지 않습니다.
         """
         try:
-            if not self.position_manager or not self.db:
+            if not self.position_manager:
                 return
 
-            # 모든 거래 조회
-            closed_trades = self.position_manager.get_closed_trades()
-
-            if not closed_trades:
-                # 거래가 없으면 초기값으로 스냅샷 생성
-                metrics = PerformanceMetrics(
-                    timestamp=datetime.utcnow().isoformat(),
-                    total_pnl=0.0,
-                    total_pnl_pct=0.0,
-                    win_rate=0.0,
-                    max_drawdown=0.0,
-                    total_trades=0,
-                    win_count=0,
-                    lose_count=0,
-                )
-            else:
-                # 성과 지표 계산
-                total_pnl = sum(trade.get('realized_pnl', 0) for trade in closed_trades)
-                total_trades = len(closed_trades)
-                win_count = sum(1 for trade in closed_trades if trade.get('realized_pnl', 0) > 0)
-                lose_count = sum(1 for trade in closed_trades if trade.get('realized_pnl', 0) < 0)
-                break_even_count = total_trades - win_count - lose_count
-
-                # 손익률 계산 (초기 자본 가정: 모든 거래의 진입가 합계)
-                total_capital = sum(
-                    trade.get('entry_price', 0) * trade.get('quantity', 0)
-                    for trade in closed_trades
-                )
-                total_pnl_pct = (total_pnl / total_capital * 100) if total_capital > 0 else 0.0
-
-                # 승률 계산
-                win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0.0
-
-                # 최대 낙폭 계산 (간단한 방식)
-                cumulative_pnl = 0
-                max_cumulative = 0
-                max_drawdown = 0.0
-
-                for trade in sorted(closed_trades, key=lambda x: x.get('exit_time', '')):
-                    cumulative_pnl += trade.get('realized_pnl', 0)
-                    if cumulative_pnl > max_cumulative:
-                        max_cumulative = cumulative_pnl
-                    drawdown = max_cumulative - cumulative_pnl
-                    if drawdown > max_drawdown:
-                        max_drawdown = drawdown
-
-                metrics = PerformanceMetrics(
-                    timestamp=datetime.utcnow().isoformat(),
-                    total_pnl=round(total_pnl, 2),
-                    total_pnl_pct=round(total_pnl_pct, 2),
-                    win_rate=round(win_rate, 2),
-                    max_drawdown=round(max_drawdown, 2),
-                    total_trades=total_trades,
-                    win_count=win_count,
-                    lose_count=lose_count,
-                )
+            metrics = PerformanceMetrics(
+                timestamp=datetime.utcnow().isoformat(),
+                **self.position_manager.performance.snapshot(),
+            )
 
             # 성과 스냅샷 브로드캐스트
             await self.ws_server.broadcast_performance(metrics)
@@ -392,6 +365,7 @@ class SimulationOrchestrator:
             'market_data_status': self.market_data_service.get_status() if self.market_data_service else None,
             'strategy_runner_status': self.strategy_runner.get_status() if self.strategy_runner else None,
             'websocket_clients': self.ws_server.get_connected_clients_count(),
+            'websocket_client_metrics': self.ws_server.get_client_metrics(),
         }
 
 
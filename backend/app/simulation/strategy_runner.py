@@ -6,7 +6,8 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Callable
+from collections.abc import ItemsView, Iterator, MutableMapping, ValuesView
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 from datetime import datetime
 
 from backend.app.database import DatabaseManager, get_db
@@ -39,6 +40,77 @@ class StrategyConfig:
         return f"StrategyConfig({self.symbol}:{self.strategy_name})"
 
 
+class StrategyRegistry(MutableMapping):
+    """
+    등록된 전략 매핑 ("symbol:strategy_name" -> StrategyConfig) + 심볼별 디스패치 인덱스
+
+    dict를 상속하지 않고 내부 dict를 감싸므로, setdefault/popitem/update/clear 등
+    모든 변경이 __setitem__/__delitem__을 거쳐 심볼 인덱스와 함께 갱신됩니다.
+    캔들 하나를 처리할 때 전체 등록 목록을 훑지 않고 해당 심볼을 사용하는 전략만 조회합니다.
+    """
+
+    def __init__(self):
+        self._configs: Dict[str, StrategyConfig] = {}
+        self._by_symbol: Dict[str, Dict[str, StrategyConfig]] = {}
+
+    def _unindex(self, key: str) -> None:
+        config = self._configs.get(key)
+        if config is None:
+            return
+        configs = self._by_symbol.get(config.symbol)
+        if configs is not None:
+            configs.pop(key, None)
+            if not configs:
+                del self._by_symbol[config.symbol]
+
+    def __getitem__(self, key: str) -> StrategyConfig:
+        return self._configs[key]
+
+    def __setitem__(self, key: str, config: StrategyConfig) -> None:
+        self._unindex(key)
+        self._configs[key] = config
+        self._by_symbol.setdefault(config.symbol, {})[key] = config
+
+    def __delitem__(self, key: str) -> None:
+        self._unindex(key)
+        del self._configs[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._configs)
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._configs
+
+    def __repr__(self) -> str:
+        return f"StrategyRegistry({self._configs!r})"
+
+    def values(self) -> ValuesView:
+        return self._configs.values()
+
+    def items(self) -> ItemsView:
+        return self._configs.items()
+
+    def for_symbol(self, symbol: str) -> List[StrategyConfig]:
+        """
+        심볼을 사용하는 전략 목록 (등록 순서)
+
+        Args:
+            symbol: 거래 심볼
+
+        Returns:
+            StrategyConfig 목록
+        """
+        configs = self._by_symbol.get(symbol)
+        return list(configs.values()) if configs else []
+
+    def symbols(self) -> List[str]:
+        """전략이 등록된 심볼 목록"""
+        return list(self._by_symbol)
+
+
 class StrategyRunner:
     """
     실시간 전략 실행 엔진 (Task 3.5: 의존성 주입 지원)
@@ -61,7 +133,7 @@ class StrategyRunner:
         """
         self.result_manager = result_manager or ResultManager()
         self.position_manager = position_manager or PositionManager()
-        self.strategies: Dict[str, StrategyConfig] = {}  # (symbol, strategy_name) -> StrategyConfig
+        self.strategies: StrategyRegistry = StrategyRegistry()  # "symbol:strategy_name" -> StrategyConfig
         self.db: Optional[DatabaseManager] = None
         self.is_running = False
         self.on_signal: Optional[Callable] = None  # 신호 생성 시 콜백
@@ -158,14 +230,19 @@ class StrategyRunner:
                 (symbol, min_window)
             )
 
+            import pandas as pd
+
             if not recent_candles:
                 logger.warning(f"No historical candles found for {symbol}")
-                # 히스토리 없이도 진행 가능 (실시간만 수집)
+                # 히스토리 없이도 진행 가능 (등록 파라미터로 빈 윈도우에서 시작, 실시간만 수집)
+                config.strategy_instance.initialize_with_history(
+                    pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']),
+                    config.params,
+                )
                 config.is_initialized = True
                 return
 
             # 전략에 히스토리 로드
-            import pandas as pd
             df = pd.DataFrame(recent_candles)
             df['timestamp'] = pd.to_datetime(df['timestamp'])
 
@@ -189,44 +266,92 @@ class StrategyRunner:
             logger.error(f"Failed to initialize strategy {symbol}:{strategy_name}: {e}")
             raise
 
+    @staticmethod
+    def _candle_to_dict(candle: CandleData) -> Dict:
+        """전략 process_candle 입력 딕셔너리 (캔들당 한 번 생성하여 전략 간 공유)"""
+        return {
+            'timestamp': candle.timestamp,
+            'open': candle.open,
+            'high': candle.high,
+            'low': candle.low,
+            'close': candle.close,
+            'volume': candle.volume,
+        }
+
+    def evaluate_candle(self, candle: CandleData) -> List[Tuple[Signal, str, str]]:
+        """
+        캔들 심볼을 사용하는 전략만 실행하여 신호 수집 (저장/브로드캐스트 없음)
+
+        Args:
+            candle: 완성된 캔들 데이터
+
+        Returns:
+            (신호, 심볼, 전략 이름) 목록
+        """
+        symbol = candle.symbol
+        configs = self.strategies.for_symbol(symbol)
+        if not configs:
+            return []
+
+        candle_dict = self._candle_to_dict(candle)
+        generated: List[Tuple[Signal, str, str]] = []
+
+        for config in configs:
+            if not config.is_initialized:
+                logger.warning(f"Strategy not initialized: {symbol}:{config.strategy_name}")
+                continue
+
+            signal = config.strategy_instance.process_candle(candle_dict)
+            if signal:
+                generated.append((signal, symbol, config.strategy_name))
+
+        return generated
+
     async def process_candle(self, candle: CandleData) -> None:
         """
         캔들 처리
 
-        이 캔들을 사용하는 모든 전략을 실행합니다.
+        이 캔들 심볼을 사용하는 전략만 실행합니다. (심볼 인덱스 조회)
 
         Args:
             candle: 완성된 캔들 데이터
         """
         try:
-            symbol = candle.symbol
-
-            # 이 심볼을 사용하는 모든 전략 실행
-            for key, config in self.strategies.items():
-                if not config.symbol == symbol:
-                    continue
-
-                if not config.is_initialized:
-                    logger.warning(f"Strategy not initialized: {key}")
-                    continue
-
-                # 전략 실행
-                signal = config.strategy_instance.process_candle({
-                    'timestamp': candle.timestamp,
-                    'open': candle.open,
-                    'high': candle.high,
-                    'low': candle.low,
-                    'close': candle.close,
-                    'volume': candle.volume,
-                })
-
-                # 신호 생성 시 저장 및 브로드캐스트
-                if signal:
-                    await self._on_signal_generated(signal, symbol, config.strategy_name)
+            generated = self.evaluate_candle(candle)
+
+            # 신호 생성 시 저장 및 브로드캐스트
+            for signal, symbol, strategy_name in generated:
+                await self._on_signal_generated(signal, symbol, strategy_name)
 
         except Exception as e:
             logger.error(f"Error processing candle for {candle.symbol}: {e}")
 
+    async def process_candles(self, candles: Iterable[CandleData]) -> int:
+        """
+        같은 시점에 마감된 여러 캔들 일괄 처리
+
+        모든 캔들의 전략을 먼저 평가한 뒤 생성된 신호를 처리하므로, 한 심볼의 신호 저장/
+        브로드캐스트가 다른 심볼의 전략 평가를 지연시키지 않습니다.
+        한 캔들의 처리 오류는 다른 캔들에 영향을 주지 않습니다.
+
+        Args:
+            candles: 완성된 캔들 데이터 목록
+
+        Returns:
+            생성된 신호 수
+        """
+        generated: List[Tuple[Signal, str, str]] = []
+        for candle in candles:
+            try:
+                generated.extend(self.evaluate_candle(candle))
+            except Exception as e:
+                logger.error(f"Error processing candle for {candle.symbol}: {e}")
+
+        for signal, symbol, strategy_name in generated:
+            await self._on_signal_generated(signal, symbol, strategy_name)
+
+        return len(generated)
+
     async def _on_signal_generated(self, signal: Signal, symbol: str, strategy_name: str) -> None:
         """
         신호 생성 시 처리
@@ -244,7 +369,7 @@ class StrategyRunner:
 
             # 1. DB에 저장
             if self.db:
-                signal_id = self.db.insert_signal(
+                signal_id = await self.db.insert_signal_async(
                     symbol,
                     strategy_name,
                     signal.timestamp,
@@ -282,11 +407,9 @@ class StrategyRunner:
             전략 정보 딕셔너리 목록
         """
         result = []
+        configs = self.strategies.for_symbol(symbol) if symbol else self.strategies.values()
 
-        for key, config in self.strategies.items():
-            if symbol and config.symbol != symbol:
-                continue
-
+        for config in configs:
             result.append({
                 'symbol': config.symbol,
                 'strategy_name': config.strategy_name,
@@ -10,11 +10,14 @@ JWT 기반 인증과 재연결 로직을 포함합니다.
 import json
 import logging
 import asyncio
-from typing import Dict, Set, Optional, Callable
+import os
+import time
+from typing import Deque, Dict, List, Set, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 import uuid
+from collections import deque
 
 try:
     import jwt
@@ -24,6 +27,8 @@ except ImportError:
 import websockets
 from websockets.server import WebSocketServerProtocol, serve as ws_serve
 
+from backend.app.simulation.event_history import EventRingBuffer, HistoryEntry
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +104,13 @@ class ClientConnection:
     subscribed_symbols: Set[str] = field(default_factory=set)
     last_event_id: Optional[str] = None
     connected_at: datetime = field(default_factory=datetime.utcnow)
+    # 브로드캐스트 전송 큐 (클라이언트별 전송 태스크가 소비)
+    send_queue: Optional[asyncio.Queue] = None
+    sender_task: Optional[asyncio.Task] = None
+    sent_count: int = 0
+    dropped_count: int = 0
+    last_lag_ms: float = 0.0  # 마지막 이벤트의 큐 대기 + 전송 시간
+    max_lag_ms: float = 0.0
 
 
 class SimulationWebSocketServer:
@@ -109,13 +121,14 @@ class SimulationWebSocketServer:
     - JWT 기반 인증
     - 역할 기반 접근 제어 (RBAC)
     - 클라이언트 연결 관리
-    - 이벤트 브로드캐스트
+    - 이벤트 브로드캐스트 (1회 직렬화, 클라이언트별 전송 큐로 동시 전송)
     - 재연결 및 상태 복구 (이벤트 히스토리 기반)
     - 표준 WebSocket 스펙 준수
 
     이벤트 히스토리:
+    - 전체 최근 이벤트 10000개를 순번 링 버퍼에 직렬화된 JSON으로 보존
     - 각 심볼별 최근 이벤트 1000개 보존
-    - 재연결 시 마지막 이벤트 ID 이후의 이벤트 재전송
+    - 재연결 시 마지막 이벤트 ID 이후의 이벤트를 구간 조회하여 재전송
     """
 
     # JWT 설정
@@ -125,6 +138,11 @@ class SimulationWebSocketServer:
     # 하트비트 간격 (초)
     HEARTBEAT_INTERVAL = 30
 
+    # 브로드캐스트 전송 큐 설정
+    SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 256))  # 클라이언트당 대기 이벤트 상한
+    # 큐가 가득 찬 느린 클라이언트 처리: drop_oldest(가장 오래된 이벤트 폐기) | disconnect(연결 종료)
+    SLOW_CLIENT_POLICY = os.getenv("WS_SLOW_CLIENT_POLICY", "drop_oldest")
+
     # 이벤트 히스토리 설정
     MAX_EVENTS_PER_SYMBOL = 1000  # 심볼당 최대 이벤트 수
     MAX_GLOBAL_EVENTS = 10000     # 전체 최대 이벤트 수
@@ -133,8 +151,8 @@ class SimulationWebSocketServer:
         self.host = host
         self.port = port
         self.clients: Dict[str, ClientConnection] = {}
-        self.event_history: Dict[str, list] = {}  # symbol -> [event, ...]
-        self.global_event_list: list = []  # 모든 이벤트 순서대로 저장
+        self.event_history: Dict[str, Deque[HistoryEntry]] = {}  # symbol -> 최근 이벤트
+        self.global_events = EventRingBuffer(self.MAX_GLOBAL_EVENTS)  # 모든 이벤트 순서대로 저장
         self.is_running = False
         self.server = None
 
@@ -273,8 +291,7 @@ class SimulationWebSocketServer:
             )
         finally:
             # 클라이언트 정리
-            if client_id in self.clients:
-                del self.clients[client_id]
+            self._remove_client(client_id)
             logger.info(f"Client disconnected: {client_id}")
 
     async def _send_heartbeat(self, websocket: WebSocketServerProtocol) -> None:
@@ -388,30 +405,17 @@ class SimulationWebSocketServer:
         """
         try:
             resent_count = 0
-            event_found = False
-            start_sending = (last_event_id is None)  # last_event_id가 없으면 처음부터 전송
-
-            # 1단계: 히스토리에서 last_event_id 찾기
-            for event in self.global_event_list:
-                event_id = event.get('event_id')
-
-                # last_event_id 찾으면 다음부터 전송
-                if event_id == last_event_id:
-                    event_found = True
-                    start_sending = True
-                    continue
-
-                if not start_sending:
-                    continue
 
-                # 심볼 필터링
-                event_symbol = event.get('data', {}).get('symbol')
-                if symbols and event_symbol and event_symbol not in symbols:
-                    continue
+            # 1단계: 히스토리에서 last_event_id 이후 구간 조회 (id → 순번 맵)
+            if last_event_id is None:
+                # last_event_id가 없으면 처음부터 전송
+                entries = self.global_events.entries()
+            else:
+                entries = self.global_events.entries_after(last_event_id)
+            event_found = last_event_id is not None and entries is not None
 
-                # 이벤트 재전송
-                await websocket.send(json.dumps(event, default=str))
-                resent_count += 1
+            if entries is not None:
+                resent_count = await self._send_history_entries(websocket, entries, symbols)
 
             # 2단계: last_event_id를 찾지 못한 경우 처리
             # ============================================
@@ -419,21 +423,16 @@ class SimulationWebSocketServer:
             # last_event_id가 지정되었으나 히스토리에서 찾지 못한 경우
             # → 히스토리가 만료되었을 가능성이 높음
             # → 전체 히스토리를 재전송하여 최신 상태 복구
-            if last_event_id is not None and not event_found and resent_count == 0:
+            if last_event_id is not None and not event_found:
                 logger.warning(
                     f"Last event ID '{last_event_id}' not found in history (possibly truncated). "
                     f"Resending full history for client {client_id}"
                 )
 
                 # 전체 히스토리를 처음부터 재전송
-                for event in self.global_event_list:
-                    # 심볼 필터링
-                    event_symbol = event.get('data', {}).get('symbol')
-                    if symbols and event_symbol and event_symbol not in symbols:
-                        continue
-
-                    await websocket.send(json.dumps(event, default=str))
-                    resent_count += 1
+                resent_count = await self._send_history_entries(
+                    websocket, self.global_events.entries(), symbols
+                )
 
                 # 정책 안내 메시지 전송
                 await self._send_event(
@@ -490,29 +489,60 @@ class SimulationWebSocketServer:
                 {'message': str(e), 'code': 'SYNC_FAILED', 'reason': 'internal_error'}
             )
 
-    def _save_to_event_history(self, event_id: str, event_type: EventType, data: Dict, symbol: Optional[str] = None) -> None:
-        """이벤트를 히스토리에 저장"""
-        event = {
-            'event_id': event_id,
-            'type': event_type.value,
-            'data': data,
-            'timestamp': datetime.utcnow().isoformat()
-        }
+    @staticmethod
+    async def _send_history_entries(websocket: WebSocketServerProtocol,
+                                    entries: List[HistoryEntry], symbols: list) -> int:
+        """
+        히스토리 이벤트를 저장된 JSON 그대로 재전송
+
+        Args:
+            websocket: 클라이언트 WebSocket
+            entries: 재전송할 이벤트 (오래된 순)
+            symbols: 심볼 필터 (빈 리스트면 모든 심볼, 심볼 없는 이벤트는 항상 전송)
+
+        Returns:
+            재전송한 이벤트 수
+        """
+        symbol_filter = set(symbols) if symbols else None
+        sent = 0
+        for entry in entries:
+            if symbol_filter and entry.symbol and entry.symbol not in symbol_filter:
+                continue
+            await websocket.send(entry.payload)
+            sent += 1
+        return sent
+
+    def _save_to_event_history(self, event_id: str, event_type: EventType, data: Dict,
+                               symbol: Optional[str] = None, payload: Optional[str] = None) -> None:
+        """
+        이벤트를 히스토리에 저장
 
-        # 전역 이벤트 리스트에 추가
-        self.global_event_list.append(event)
-        if len(self.global_event_list) > self.MAX_GLOBAL_EVENTS:
-            self.global_event_list.pop(0)
+        Args:
+            payload: 전송한 JSON 문자열 (None이면 이벤트를 새로 직렬화)
+        """
+        if payload is None:
+            payload = json.dumps({
+                'event_id': event_id,
+                'type': event_type.value,
+                'data': data,
+                'timestamp': datetime.utcnow().isoformat()
+            }, default=str)
+
+        # 재전송 필터용 심볼 (지정되지 않으면 데이터의 심볼)
+        event_symbol = symbol
+        if event_symbol is None and isinstance(data, dict):
+            event_symbol = data.get('symbol')
+
+        # 전역 링 버퍼에 추가 (가득 차면 가장 오래된 이벤트 만료)
+        self.global_events.append(event_id, event_type.value, payload, event_symbol)
 
         # 심볼별 히스토리에 추가 (신호/포지션 이벤트만)
         if symbol and event_type in (EventType.SIGNAL_CREATED, EventType.POSITION_OPENED,
                                     EventType.POSITION_CLOSED, EventType.POSITION_UPDATED):
-            if symbol not in self.event_history:
-                self.event_history[symbol] = []
-
-            self.event_history[symbol].append(event)
-            if len(self.event_history[symbol]) > self.MAX_EVENTS_PER_SYMBOL:
-                self.event_history[symbol].pop(0)
+            history = self.event_history.get(symbol)
+            if history is None:
+                history = self.event_history[symbol] = deque(maxlen=self.MAX_EVENTS_PER_SYMBOL)
+            history.append(self.global_events.latest())
 
     async def _send_event(self, websocket: WebSocketServerProtocol,
                          event_type: EventType, data: Dict, symbol: Optional[str] = None) -> str:
@@ -531,11 +561,12 @@ class SimulationWebSocketServer:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
-            await websocket.send(json.dumps(message, default=str))
+            payload = json.dumps(message, default=str)
+            await websocket.send(payload)
             logger.debug(f"Sent event: {event_type.value} (id: {event_id})")
 
-            # 히스토리에 저장
-            self._save_to_event_history(event_id, event_type, data, symbol)
+            # 히스토리에 저장 (전송한 JSON 재사용)
+            self._save_to_event_history(event_id, event_type, data, symbol, payload)
 
             return event_id
 
@@ -546,88 +577,130 @@ class SimulationWebSocketServer:
 
         return None
 
-    async def broadcast_signal(self, signal: Signal, symbol: Optional[str] = None) -> None:
-        """신호를 구독한 클라이언트에 브로드캐스트"""
-        disconnected = []
+    def _remove_client(self, client_id: str) -> None:
+        """클라이언트 제거 및 전송 태스크 종료"""
+        client_conn = self.clients.pop(client_id, None)
+        if client_conn and client_conn.sender_task and not client_conn.sender_task.done():
+            if client_conn.sender_task is not asyncio.current_task():
+                client_conn.sender_task.cancel()
+
+    def _disconnect_slow_client(self, client_conn: ClientConnection) -> None:
+        """전송 큐가 가득 찬 클라이언트 연결 종료 (disconnect 정책)"""
+        logger.warning(
+            f"Disconnecting slow client {client_conn.client_id} "
+            f"(send queue full: {self.SEND_QUEUE_SIZE})"
+        )
+        self._remove_client(client_conn.client_id)
+        try:
+            asyncio.create_task(client_conn.websocket.close(code=1008, reason='slow consumer'))
+        except Exception as e:
+            logger.error(f"Error closing slow client {client_conn.client_id}: {e}")
 
-        for client_id, client_conn in list(self.clients.items()):
-            try:
-                # 심볼 구독 여부 확인
-                if symbol and symbol not in client_conn.subscribed_symbols:
-                    continue
-
-                event_id = await self._send_event(
-                    client_conn.websocket, EventType.SIGNAL_CREATED,
-                    signal.to_dict(),
-                    symbol=symbol
-                )
+    def _enqueue(self, client_conn: ClientConnection, event_id: str, payload: str) -> None:
+        """
+        클라이언트 전송 큐에 직렬화된 이벤트 추가
 
-                # 클라이언트 last_event_id 갱신
-                if event_id:
-                    client_conn.last_event_id = event_id
+        큐가 가득 차면 SLOW_CLIENT_POLICY에 따라 가장 오래된 이벤트를 버리거나 연결을 끊습니다.
+        """
+        if client_conn.send_queue is None:
+            client_conn.send_queue = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        if client_conn.sender_task is None or client_conn.sender_task.done():
+            client_conn.sender_task = asyncio.create_task(self._client_sender(client_conn))
+
+        queue = client_conn.send_queue
+        if queue.full():
+            if self.SLOW_CLIENT_POLICY == 'disconnect':
+                self._disconnect_slow_client(client_conn)
+                return
+            queue.get_nowait()
+            client_conn.dropped_count += 1
 
-            except Exception as e:
-                logger.error(f"Failed to broadcast signal to {client_id}: {e}")
-                disconnected.append(client_id)
+        queue.put_nowait((event_id, payload, time.monotonic()))
+
+    async def _client_sender(self, client_conn: ClientConnection) -> None:
+        """클라이언트 전송 큐 소비 (클라이언트마다 독립적으로 전송)"""
+        queue = client_conn.send_queue
+        try:
+            while True:
+                event_id, payload, enqueued_at = await queue.get()
+                await client_conn.websocket.send(payload)
 
-        # 끊긴 연결 제거
-        for client_id in disconnected:
-            if client_id in self.clients:
-                del self.clients[client_id]
+                client_conn.last_event_id = event_id
+                client_conn.sent_count += 1
+                client_conn.last_lag_ms = (time.monotonic() - enqueued_at) * 1000
+                client_conn.max_lag_ms = max(client_conn.max_lag_ms, client_conn.last_lag_ms)
 
-    async def broadcast_position(self, event_type: EventType, position: Position,
-                                symbol: Optional[str] = None) -> None:
-        """포지션 정보를 구독한 클라이언트에 브로드캐스트"""
-        disconnected = []
+        except asyncio.CancelledError:
+            pass
+        except websockets.exceptions.ConnectionClosed:
+            logger.debug(f"Connection closed while sending to {client_conn.client_id}")
+            self._remove_client(client_conn.client_id)
+        except Exception as e:
+            logger.error(f"Failed to send event to {client_conn.client_id}: {e}")
+            self._remove_client(client_conn.client_id)
 
-        for client_id, client_conn in list(self.clients.items()):
-            try:
-                # 심볼 구독 여부 확인
-                if symbol and symbol not in client_conn.subscribed_symbols:
-                    continue
-
-                event_id = await self._send_event(
-                    client_conn.websocket, event_type,
-                    position.to_dict(),
-                    symbol=symbol
-                )
+    async def _publish(self, event_type: EventType, data: Dict,
+                       symbol: Optional[str] = None) -> str:
+        """
+        이벤트를 한 번 직렬화하여 히스토리에 저장하고 구독 클라이언트 전송 큐에 추가
 
-                # 클라이언트 last_event_id 갱신
-                if event_id:
-                    client_conn.last_event_id = event_id
+        Args:
+            event_type: 이벤트 타입
+            data: 이벤트 데이터
+            symbol: 심볼 (None이면 모든 클라이언트 대상)
 
-            except Exception as e:
-                logger.error(f"Failed to broadcast position to {client_id}: {e}")
-                disconnected.append(client_id)
+        Returns:
+            event_id: 생성된 이벤트 ID
+        """
+        event_id = str(uuid.uuid4())
+        payload = json.dumps({
+            'event_id': event_id,
+            'type': event_type.value,
+            'data': data,
+            'timestamp': datetime.utcnow().isoformat()
+        }, default=str)
+        self._save_to_event_history(event_id, event_type, data, symbol, payload)
 
-        # 끊긴 연결 제거
-        for client_id in disconnected:
-            if client_id in self.clients:
-                del self.clients[client_id]
+        for client_conn in list(self.clients.values()):
+            # 심볼 구독 여부 확인
+            if symbol and symbol not in client_conn.subscribed_symbols:
+                continue
+            self._enqueue(client_conn, event_id, payload)
 
-    async def broadcast_performance(self, metrics: PerformanceMetrics) -> None:
-        """성과 지표를 모든 클라이언트에 브로드캐스트"""
-        disconnected = []
+        logger.debug(f"Published event: {event_type.value} (id: {event_id})")
+        return event_id
 
-        for client_id, client_conn in list(self.clients.items()):
-            try:
-                event_id = await self._send_event(
-                    client_conn.websocket, EventType.PERFORMANCE_SNAPSHOT,
-                    metrics.to_dict()
-                )
+    async def broadcast_signal(self, signal: Signal, symbol: Optional[str] = None) -> None:
+        """신호를 구독한 클라이언트에 브로드캐스트"""
+        await self._publish(EventType.SIGNAL_CREATED, signal.to_dict(), symbol=symbol)
+
+    async def broadcast_position(self, event_type: EventType, position: Position,
+                                symbol: Optional[str] = None) -> None:
+        """포지션 정보를 구독한 클라이언트에 브로드캐스트"""
+        await self._publish(event_type, position.to_dict(), symbol=symbol)
 
-                # 클라이언트 last_event_id 갱신
-                if event_id:
-                    client_conn.last_event_id = event_id
+    async def broadcast_performance(self, metrics: PerformanceMetrics) -> None:
+        """성과 지표를 모든 클라이언트에 브로드캐스트"""
+        await self._publish(EventType.PERFORMANCE_SNAPSHOT, metrics.to_dict())
 
-            except Exception as e:
-                logger.error(f"Failed to broadcast performance to {client_id}: {e}")
-                disconnected.append(client_id)
+    def get_client_metrics(self) -> Dict[str, Dict]:
+        """
+        클라이언트별 전송 지표
 
-        # 끊긴 연결 제거
-        for client_id in disconnected:
-            if client_id in self.clients:
-                del self.clients[client_id]
+        Returns:
+            client_id -> {queue_depth, sent, dropped, last_lag_ms, max_lag_ms, last_event_id}
+        """
+        return {
+            client_id: {
+                'queue_depth': client_conn.send_queue.qsize() if client_conn.send_queue else 0,
+                'sent': client_conn.sent_count,
+                'dropped': client_conn.dropped_count,
+                'last_lag_ms': round(client_conn.last_lag_ms, 3),
+                'max_lag_ms': round(client_conn.max_lag_ms, 3),
+                'last_event_id': client_conn.last_event_id,
+            }
+            for client_id, client_conn in self.clients.items()
+        }
 
     def generate_token(self, user_id: str, role: str = 'viewer') -> str:
         """JWT 토큰 생성"""
@@ -662,6 +735,7 @@ class SimulationWebSocketServer:
 
         # 모든 클라이언트 연결 종료
         for client_conn in list(self.clients.values()):
+            self._remove_client(client_conn.client_id)
             try:
                 await client_conn.websocket.close()
             except Exception as e:
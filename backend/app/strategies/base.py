@@ -7,9 +7,11 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Hashable, Optional, Tuple
 import pandas as pd
 
+from backend.app.strategies.metrics import TradeArrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +62,7 @@ class BacktestResult:
         avg_hold_duration (Optional[pd.Timedelta]): 평균 보유 시간 (타임프레임이 명확할 때만 계산)
         entry_exit_pairs (Optional[List[tuple]]): (진입가, 청산가) 쌍 (Step 4 API용)
         returns (Optional[List[float]]): 거래 수익률 배열 (%) (Step 4 API용)
+        trades (Optional[TradeArrays]): 진입/청산가, 수익률, 자본 곡선, 낙폭 배열 (API 변환용)
     """
     signals: List[Signal]
     samples: int
@@ -70,6 +73,7 @@ class BacktestResult:
     avg_hold_duration: Optional[pd.Timedelta] = None  # 타임프레임이 명확할 때만 사용
     entry_exit_pairs: Optional[List[tuple]] = None  # (진입가, 청산가) 쌍 - Step 4 신호 테이블용
     returns: Optional[List[float]] = None  # 거래 수익률 (%) - Step 4 신호 테이블용
+    trades: Optional[TradeArrays] = field(default=None, compare=False, repr=False)
 
     def __post_init__(self):
         """결과 데이터 검증"""
@@ -108,16 +112,26 @@ class Strategy(ABC):
         >>> class MyStrategy(Strategy):
         ...     def initialize_with_history(self, df: pd.DataFrame, params: Dict) -> None:
         ...         self.window = params.get('window', 20)
-        ...         self.data = df.tail(self.window)
-        ...         self.last_signal = None
+        ...         self.closes = deque(maxlen=self.window)  # 고정 크기 링 버퍼
+        ...         self.close_sum = 0.0  # 윈도우 합계 (증분 갱신)
+        ...         for close in df['close'].values:
+        ...             self._update(close)
         ...
         ...     def process_candle(self, candle: Dict) -> Optional[Signal]:
-        ...         self.data = pd.concat([self.data, [candle]])
-        ...         self.data = self.data.tail(self.window)
-        ...         signal = self._generate_signal()
+        ...         self._update(candle['close'])  # 캔들당 O(1)
+        ...         signal = self._generate_signal(candle)
         ...         return signal
+
+    Note:
+        process_candle은 매 캔들마다 호출되므로, 버퍼를 DataFrame으로 이어 붙여(pd.concat)
+        지표를 다시 계산하지 말고 링 버퍼(deque, NumPy 배열)와 누적 합계를 증분 갱신해야 합니다.
+        같은 데이터에 대해 run()과 동일한 신호를 생성해야 합니다.
+        (VolumeLongCandleStrategy, VolumeZoneBreakoutStrategy 참고)
     """
 
+    # 파라미터 스윕에서 중간 시리즈 공유 단위를 결정하는 파라미터 (backtest_sweep 참고)
+    SWEEP_SHARED_PARAMS: Tuple[str, ...] = ()
+
     @abstractmethod
     def run(self, df: pd.DataFrame, params: Dict) -> BacktestResult:
         """
@@ -140,9 +154,37 @@ class Strategy(ABC):
         Raises:
             ValueError: 입력 데이터 또는 파라미터 오류
             HTTPException: 외부 API 오류 등
+
+        Note:
+            파라미터 스윕처럼 같은 df로 여러 번 실행하는 경우, 구현체는 키워드 인자
+            cache (Dict)를 받아 파라미터 일부에만 의존하는 중간 시리즈
+            (예: 거래량 이동평균)를 재사용할 수 있습니다. (_get_cached 참고)
         """
         pass
 
+    @staticmethod
+    def _get_cached(
+        cache: Optional[Dict[Hashable, Any]],
+        key: Hashable,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        중간 계산 결과 조회 (없으면 계산 후 저장)
+
+        Args:
+            cache: 동일 df에 대한 공유 캐시 (None이면 캐시하지 않음)
+            key: 중간 결과를 결정하는 파라미터를 포함한 키
+            compute: 계산 함수
+
+        Returns:
+            Any: 캐시되었거나 새로 계산된 결과
+        """
+        if cache is None:
+            return compute()
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
     def initialize_with_history(self, df: pd.DataFrame, params: Dict) -> None:
         """
         실시간 전략 실행을 위해 히스토리 데이터로 전략을 초기화합니다.
@@ -169,9 +211,11 @@ class Strategy(ABC):
 
         Example:
             >>> def initialize_with_history(self, df, params):
-            ...     if len(df) < params.get('min_window', 20):
-            ...         raise ValueError(f"Need at least {params['min_window']} candles")
-            ...     self.data_buffer = df.tail(params['min_window']).copy()
+            ...     self.window = params.get('window', 20)
+            ...     self.volumes = deque(maxlen=self.window)
+            ...     self.volume_sum = 0.0
+            ...     for volume in df['volume'].values:
+            ...         self._update(volume)
             ...     self.params = params
         """
         pass
@@ -198,11 +242,9 @@ class Strategy(ABC):
 
         Example:
             >>> def process_candle(self, candle):
-            ...     row = pd.Series(candle)
-            ...     self.data_buffer = pd.concat([self.data_buffer, [row]])
-            ...     self.data_buffer = self.data_buffer.tail(self.window)
+            ...     self._update(candle['volume'])  # 링 버퍼 + 누적 합계 갱신 (O(1))
             ...
-            ...     if len(self.data_buffer) < self.window:
+            ...     if len(self.volumes) < self.window:
             ...         return None
             ...
             ...     signal_side = self._check_signal()
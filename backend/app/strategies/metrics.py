@@ -2,10 +2,14 @@
 백테스트 성과 지표 계산 공통 함수
 
 모든 전략이 공유하는 성과 지표 계산 로직을 정의합니다.
+
+신호가 많은 전략은 calculate_trade_arrays()로 진입/청산가, 수익률, 자본 곡선, 낙폭을
+NumPy 배열로 한 번에 계산하고, API 응답용 객체는 경계(API/워커 결과 변환)에서만 생성합니다.
 """
 
 import logging
-from typing import List, Dict, Tuple
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Sequence, Union
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -62,6 +66,111 @@ def calculate_metrics(
     }
 
 
+@dataclass
+class TradeArrays:
+    """
+    신호별 거래 결과 배열 (모든 배열은 신호 순서, 길이 동일)
+
+    Attributes:
+        signal_indices (np.ndarray): 신호 발생 위치 (int64)
+        entry_prices (np.ndarray): 진입가 (신호 바 종가)
+        exit_prices (np.ndarray): 청산가 (hold_period_bars 이후 종가, 마지막 바로 제한)
+        returns (np.ndarray): 거래 수익률 (%)
+        equity (np.ndarray): 복리 자본 곡선 (초기값 1.0, 거래별 누적)
+        drawdown (np.ndarray): 누적 수익률(%) 기준 낙폭 (0 이하)
+    """
+    signal_indices: np.ndarray
+    entry_prices: np.ndarray
+    exit_prices: np.ndarray
+    returns: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.signal_indices)
+
+    def entry_exit_pairs(self) -> List[Tuple[float, float]]:
+        """(진입가, 청산가) 튜플 리스트 (BacktestResult 호환)"""
+        return list(zip(self.entry_prices.tolist(), self.exit_prices.tolist()))
+
+
+def calculate_trade_arrays(
+    signal_indices: Union[Sequence[int], np.ndarray],
+    close_prices: np.ndarray,
+    hold_period_bars: int,
+) -> TradeArrays:
+    """
+    신호 인덱스 배열과 종가 배열로부터 거래 결과 배열을 한 번에 계산합니다.
+
+    calculate_entry_exit_prices() / calculate_returns() / calculate_metrics()의
+    배열 버전으로, 동일한 진입/청산가와 수익률을 반환합니다.
+
+    Args:
+        signal_indices: 신호 발생 위치 (0-based 위치 기반 인덱스)
+        close_prices (np.ndarray): 종가 배열
+        hold_period_bars (int): 신호당 보유 바 수
+
+    Returns:
+        TradeArrays: 진입/청산가, 수익률, 자본 곡선, 낙폭 배열
+    """
+    close_prices = np.asarray(close_prices, dtype=float)
+    indices = np.asarray(signal_indices, dtype=np.int64)
+
+    # 청산 인덱스 계산 (위치 기반, 마지막 바로 제한)
+    exit_indices = np.minimum(indices + hold_period_bars, len(close_prices) - 1)
+
+    entry_prices = close_prices[indices]
+    exit_prices = close_prices[exit_indices]
+    returns = ((exit_prices - entry_prices) / entry_prices) * 100
+
+    equity = np.cumprod(1.0 + returns / 100.0)
+
+    cumulative_returns = np.cumsum(returns)
+    drawdown = cumulative_returns - np.maximum.accumulate(cumulative_returns)
+
+    return TradeArrays(
+        signal_indices=indices,
+        entry_prices=entry_prices,
+        exit_prices=exit_prices,
+        returns=returns,
+        equity=equity,
+        drawdown=drawdown,
+    )
+
+
+def calculate_metrics_from_arrays(
+    trades: TradeArrays,
+    hold_period_bars: int,
+) -> Dict[str, float]:
+    """
+    거래 결과 배열로부터 성과 지표를 계산합니다. (calculate_metrics의 배열 버전)
+
+    Args:
+        trades (TradeArrays): calculate_trade_arrays() 결과
+        hold_period_bars (int): 신호당 평균 보유 바 수
+
+    Returns:
+        Dict[str, float]: calculate_metrics()와 동일한 키의 성과 지표
+
+    Raises:
+        ValueError: 입력 데이터 오류
+    """
+    if len(trades) == 0:
+        raise ValueError("trades must not be empty")
+
+    if hold_period_bars < 0:
+        raise ValueError("hold_period_bars must be non-negative")
+
+    count = len(trades)
+
+    return {
+        'win_rate': int(np.count_nonzero(trades.returns > 0)) / count,
+        'avg_return': float(trades.returns.sum()) / count,
+        'max_drawdown': abs(float(trades.drawdown.min())),
+        'avg_hold_bars': float(hold_period_bars),
+    }
+
+
 def calculate_entry_exit_prices(
     signal_indices: List[int],
     df,
@@ -5,19 +5,88 @@
 """
 
 import logging
-from typing import List, Dict, Optional
+from collections import deque
+from typing import Deque, List, Dict, Optional
+import numpy as np
 import pandas as pd
 
 from backend.app.strategies.base import Signal, BacktestResult, Strategy
 from backend.app.strategies.metrics import (
-    calculate_entry_exit_prices,
-    calculate_returns,
-    calculate_metrics,
+    calculate_trade_arrays,
+    calculate_metrics_from_arrays,
 )
 
 logger = logging.getLogger(__name__)
 
 
+class _RollingVolumeMean:
+    """
+    고정 윈도우 거래량 이동평균의 증분 계산 (실시간 모드용)
+
+    pandas rolling(window, min_periods=1).mean()과 같은 방식(제거 후 추가, 추가/제거별
+    Kahan 보정 합계, 부호 보정, 동일 값 연속 시 해당 값 반환)으로 갱신하므로
+    배치 결과와 비트 단위까지 같은 값을 냅니다.
+    """
+
+    def __init__(self, window: int):
+        self.values: Deque[float] = deque(maxlen=window)
+        self.total = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.neg_count = 0
+        self.consecutive_same = 0
+        self.prev_value = np.nan
+
+    def _remove(self, value: float) -> None:
+        y = -value - self.compensation_remove
+        t = self.total + y
+        self.compensation_remove = t - self.total - y
+        self.total = t
+        if np.signbit(value):
+            self.neg_count -= 1
+
+    def _add(self, value: float) -> None:
+        y = value - self.compensation_add
+        t = self.total + y
+        self.compensation_add = t - self.total - y
+        self.total = t
+        if np.signbit(value):
+            self.neg_count += 1
+
+        if value == self.prev_value:
+            self.consecutive_same += 1
+        else:
+            self.consecutive_same = 1
+        self.prev_value = value
+
+    def update(self, value: float) -> float:
+        """
+        새 값을 윈도우에 추가하고 현재 평균 반환 (O(1))
+
+        Args:
+            value: 새 캔들 거래량
+
+        Returns:
+            float: 새 값을 포함한 윈도우 평균
+        """
+        if len(self.values) == self.values.maxlen:
+            self._remove(self.values[0])
+
+        self.values.append(value)  # maxlen 초과 시 가장 오래된 값이 빠짐
+        self._add(value)
+
+        count = len(self.values)
+        if self.consecutive_same >= count:
+            return value
+        mean = self.total / count
+        # 모두 양수/음수인 윈도우의 부동소수점 오차로 부호가 바뀌지 않도록 보정
+        if self.neg_count == 0 and mean < 0:
+            return 0.0
+        if self.neg_count == count and mean > 0:
+            return 0.0
+        return mean
+
+
 class VolumeLongCandleStrategy(Strategy):
     """
     거래량 급증 + 장대양봉 전략
@@ -31,7 +100,10 @@ class VolumeLongCandleStrategy(Strategy):
         hold_period_bars (int): 신호 후 보유 바 수 (기본값: 1)
     """
 
-    def run(self, df: pd.DataFrame, params: Dict) -> BacktestResult:
+    # 파라미터 스윕 시 중간 시리즈(거래량 이동평균)를 결정하는 파라미터
+    SWEEP_SHARED_PARAMS = ('vol_ma_window',)
+
+    def run(self, df: pd.DataFrame, params: Dict, cache: Optional[Dict] = None) -> BacktestResult:
         """
         거래량 급증 + 장대양봉 전략 실행
 
@@ -47,6 +119,9 @@ class VolumeLongCandleStrategy(Strategy):
                 - body_pct: float (기본값: 0.02)
                 - hold_period_bars: int (기본값: 1)
 
+            cache (Optional[Dict]): 같은 df로 반복 실행할 때 공유하는 중간 결과 캐시
+                (거래량 이동평균은 vol_ma_window별, 캔들 몸통/꼬리 비율은 공통으로 재사용)
+
         Returns:
             BacktestResult: 백테스트 결과
 
@@ -73,19 +148,28 @@ class VolumeLongCandleStrategy(Strategy):
         df = df.copy().reset_index(drop=True)
 
         # 거래량 이동평균 계산
-        df['vol_ma'] = df['volume'].rolling(window=vol_ma_window, min_periods=1).mean()
+        df['vol_ma'] = self._get_cached(
+            cache,
+            ('vol_ma', vol_ma_window),
+            lambda: df['volume'].rolling(window=vol_ma_window, min_periods=1).mean(),
+        )
 
         # 거래량 급증 조건
         df['vol_surge'] = df['volume'] >= df['vol_ma'] * vol_multiplier
 
         # 캔들 몸통 비율 계산: (close - open) / open
-        df['body_pct_actual'] = (df['close'] - df['open']) / df['open']
-
         # 위/아래 꼬리 비율 계산
         # 위 꼬리: (high - close) / open
         # 아래 꼬리: (open - low) / open
-        df['upper_wick'] = (df['high'] - df['close']).clip(lower=0) / df['open']
-        df['lower_wick'] = (df['open'] - df['low']).clip(lower=0) / df['open']
+        df['body_pct_actual'], df['upper_wick'], df['lower_wick'] = self._get_cached(
+            cache,
+            ('candle_shape',),
+            lambda: (
+                (df['close'] - df['open']) / df['open'],
+                (df['high'] - df['close']).clip(lower=0) / df['open'],
+                (df['open'] - df['low']).clip(lower=0) / df['open'],
+            ),
+        )
 
         # 장대양봉 조건: 몸통이 충분히 크고, 위 꼬리가 작으며, 아래 꼬리도 작은 상태
         # 추가 조건: close > open (상승 캔들)
@@ -115,28 +199,25 @@ class VolumeLongCandleStrategy(Strategy):
             )
 
         # 진입/청산 가격 계산 및 수익률 산출
-        entry_exit_pairs = calculate_entry_exit_prices(signal_indices, df, hold_period_bars)
-        returns = calculate_returns(entry_exit_pairs)
+        trades = calculate_trade_arrays(signal_indices, df['close'].values, hold_period_bars)
 
         # 신호 객체 생성 (confidence는 거래량 배수 기반)
-        signals: List[Signal] = []
-        for idx, signal_idx in enumerate(signal_indices):
-            signal_price = entry_exit_pairs[idx][0]
-            signal_time = df.loc[signal_idx, 'timestamp']
-            vol_ratio = df.loc[signal_idx, 'volume'] / df.loc[signal_idx, 'vol_ma']
-            confidence = min(vol_ratio / vol_multiplier, 1.0)
-
-            signals.append(
-                Signal(
-                    timestamp=signal_time,
-                    side='BUY',
-                    price=signal_price,
-                    confidence=confidence,
-                )
+        signal_times = df['timestamp'].iloc[signal_indices].tolist()
+        vol_ratio = df['volume'].values[signal_indices] / df['vol_ma'].values[signal_indices]
+        confidences = np.minimum(vol_ratio / vol_multiplier, 1.0)
+
+        signals: List[Signal] = [
+            Signal(
+                timestamp=signal_times[idx],
+                side='BUY',
+                price=trades.entry_prices[idx],
+                confidence=confidences[idx],
             )
+            for idx in range(len(signal_indices))
+        ]
 
         # 성과 지표 계산 (공통 함수)
-        metrics = calculate_metrics(returns, hold_period_bars)
+        metrics = calculate_metrics_from_arrays(trades, hold_period_bars)
 
         logger.info(
             "VolumeLongCandle: signals=%s, win_rate=%.2f%%, avg_return=%.2f%%, max_drawdown=%.2f%%",
@@ -154,8 +235,81 @@ class VolumeLongCandleStrategy(Strategy):
             max_drawdown=metrics['max_drawdown'],
             avg_hold_bars=metrics['avg_hold_bars'],
             avg_hold_duration=None,
-            entry_exit_pairs=entry_exit_pairs,  # Step 4 신호 테이블용
-            returns=returns,  # Step 4 신호 테이블용
+            entry_exit_pairs=trades.entry_exit_pairs(),  # Step 4 신호 테이블용
+            returns=trades.returns.tolist(),  # Step 4 신호 테이블용
+            trades=trades,
         )
 
         return result
+
+    def initialize_with_history(self, df: pd.DataFrame, params: Dict) -> None:
+        """
+        실시간 모드 초기화 (히스토리 캔들로 거래량 이동평균 윈도우 채움)
+
+        Args:
+            df (pd.DataFrame): 과거→현재 순서의 OHLCV 데이터
+            params (Dict): run()과 같은 전략 파라미터
+
+        Raises:
+            ValueError: 파라미터 오류
+        """
+        vol_ma_window = params.get('vol_ma_window', 20)
+        vol_multiplier = params.get('vol_multiplier', 1.5)
+        body_pct = params.get('body_pct', 0.02)
+        hold_period_bars = params.get('hold_period_bars', 1)
+
+        if vol_ma_window < 1 or vol_multiplier <= 0 or body_pct <= 0 or hold_period_bars < 1:
+            raise ValueError("Invalid parameters")
+
+        self._vol_multiplier = vol_multiplier
+        self._body_pct = body_pct
+        self._vol_mean = _RollingVolumeMean(vol_ma_window)
+
+        # 히스토리 캔들은 이동평균 윈도우만 채우고 신호는 내보내지 않음
+        for volume in df['volume'].values:
+            self._vol_mean.update(volume)
+
+    def process_candle(self, candle: Dict) -> Optional[Signal]:
+        """
+        새 캔들 처리 (캔들당 O(1), run()과 동일한 신호 조건)
+
+        Args:
+            candle (Dict): timestamp, open, high, low, close, volume
+
+        Returns:
+            Optional[Signal]: 거래량 급증 + 장대양봉이면 BUY 신호
+
+        Raises:
+            RuntimeError: initialize_with_history()로 초기화하지 않은 경우
+        """
+        if getattr(self, '_vol_mean', None) is None:
+            raise RuntimeError("initialize_with_history() must be called before process_candle()")
+
+        open_price = candle['open']
+        close_price = candle['close']
+        volume = candle['volume']
+        body_pct = self._body_pct
+
+        vol_ma = self._vol_mean.update(volume)
+        vol_surge = volume >= vol_ma * self._vol_multiplier
+
+        body_pct_actual = (close_price - open_price) / open_price
+        upper_wick = max(candle['high'] - close_price, 0) / open_price
+        lower_wick = max(open_price - candle['low'], 0) / open_price
+
+        long_candle = (
+            body_pct_actual >= body_pct and
+            upper_wick < body_pct * 2 and
+            lower_wick < body_pct * 2 and
+            close_price > open_price
+        )
+
+        if not (vol_surge and long_candle):
+            return None
+
+        return Signal(
+            timestamp=candle['timestamp'],
+            side='BUY',
+            price=close_price,
+            confidence=min(volume / vol_ma / self._vol_multiplier, 1.0),
+        )
@@ -5,15 +5,15 @@
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
 
 from backend.app.strategies.base import Signal, BacktestResult, Strategy
 from backend.app.strategies.metrics import (
-    calculate_entry_exit_prices,
-    calculate_returns,
-    calculate_metrics,
+    calculate_trade_arrays,
+    calculate_metrics_from_arrays,
 )
 
 logger = logging.getLogger(__name__)
@@ -33,9 +33,23 @@ class VolumeZoneBreakoutStrategy(Strategy):
         hold_period_bars (int): 신호 후 보유 바 수 (기본값: 1)
         num_bins (int): 가격 구간 수 (기본값: 20)
         include_wicks (bool): 고가/저가를 가격 범위에 포함할지 여부 (기본값: True)
+        engine (str): 신호 생성 엔진 (기본값: 'vectorized')
+            - 'vectorized': bars×bins 기여도 행렬의 누적합으로 전체 구간의 저항선을 한 번에 계산
+            - 'loop': 바마다 bin을 증분 갱신하는 기존 Python 루프 (동일한 신호 생성)
+            윈도우 총 거래량이 0인 바는 두 엔진과 실시간 모드 모두 신호 없이 윈도우만 이동합니다.
     """
 
-    def run(self, df: pd.DataFrame, params: Dict) -> BacktestResult:
+    ENGINE_LOOP = 'loop'
+    ENGINE_VECTORIZED = 'vectorized'
+    SUPPORTED_ENGINES = (ENGINE_LOOP, ENGINE_VECTORIZED)
+
+    # 벡터화 엔진에서 한 번에 처리할 바 수 (bars×bins 행렬 메모리 상한)
+    VECTORIZED_CHUNK_BARS = 65536
+
+    # 파라미터 스윕 시 중간 결과(저항선 배열)를 결정하는 파라미터
+    SWEEP_SHARED_PARAMS = ('volume_window', 'top_percentile', 'num_bins', 'include_wicks', 'engine')
+
+    def run(self, df: pd.DataFrame, params: Dict, cache: Optional[Dict] = None) -> BacktestResult:
         """
         매물대 돌파 전략 실행
 
@@ -52,6 +66,10 @@ class VolumeZoneBreakoutStrategy(Strategy):
                 - hold_period_bars: int (기본값: 1)
                 - num_bins: int (기본값: 20)
                 - include_wicks: bool (기본값: True)
+                - engine: str (기본값: 'vectorized', 옵션: 'loop')
+
+            cache (Optional[Dict]): 같은 df로 반복 실행할 때 공유하는 중간 결과 캐시
+                (vectorized 엔진의 저항선 배열 재사용)
 
         Returns:
             BacktestResult: 백테스트 결과
@@ -66,6 +84,7 @@ class VolumeZoneBreakoutStrategy(Strategy):
         hold_period_bars = params.get('hold_period_bars', 1)
         num_bins = params.get('num_bins', 20)
         include_wicks = params.get('include_wicks', True)
+        engine = params.get('engine', self.ENGINE_VECTORIZED)
 
         # 입력 검증
         if df.empty:
@@ -77,9 +96,82 @@ class VolumeZoneBreakoutStrategy(Strategy):
         if volume_window < 1 or top_percentile <= 0 or breakout_buffer < 0 or hold_period_bars < 1 or num_bins < 1:
             raise ValueError("Invalid parameters")
 
+        if engine not in self.SUPPORTED_ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}. Supported: {list(self.SUPPORTED_ENGINES)}")
+
         # 데이터 복사 (원본 수정 방지)
         df = df.copy().reset_index(drop=True)
 
+        if engine == self.ENGINE_VECTORIZED:
+            signals, signal_indices = self._generate_signals_vectorized(
+                df, volume_window, top_percentile, breakout_buffer, num_bins, include_wicks,
+                cache=cache,
+            )
+        else:
+            signals, signal_indices = self._generate_signals_loop(
+                df, volume_window, top_percentile, breakout_buffer, num_bins, include_wicks,
+            )
+
+        if not signals:
+            logger.warning("No signals generated for volume_zone_breakout strategy")
+            return BacktestResult(
+                signals=[],
+                samples=0,
+                win_rate=0.0,
+                avg_return=0.0,
+                max_drawdown=0.0,
+                avg_hold_bars=0.0,
+                avg_hold_duration=None,
+                entry_exit_pairs=[],  # Step 4 신호 테이블용
+                returns=[],  # Step 4 신호 테이블용
+            )
+
+        # 공통 함수로 성과 지표 계산
+        trades = calculate_trade_arrays(signal_indices, df['close'].values, hold_period_bars)
+        metrics = calculate_metrics_from_arrays(trades, hold_period_bars)
+
+        logger.info(
+            "VolumeZoneBreakout: signals=%s, win_rate=%.2f%%, avg_return=%.2f%%, max_drawdown=%.2f%%",
+            len(signals),
+            metrics['win_rate'] * 100,
+            metrics['avg_return'],
+            metrics['max_drawdown'],
+        )
+
+        result = BacktestResult(
+            signals=signals,
+            samples=len(signals),
+            win_rate=metrics['win_rate'],
+            avg_return=metrics['avg_return'],
+            max_drawdown=metrics['max_drawdown'],
+            avg_hold_bars=metrics['avg_hold_bars'],
+            avg_hold_duration=None,
+            entry_exit_pairs=trades.entry_exit_pairs(),  # Step 4 신호 테이블용
+            returns=trades.returns.tolist(),  # Step 4 신호 테이블용
+            trades=trades,
+        )
+
+        return result
+
+    def _generate_signals_loop(
+        self,
+        df: pd.DataFrame,
+        volume_window: int,
+        top_percentile: float,
+        breakout_buffer: float,
+        num_bins: int,
+        include_wicks: bool,
+    ) -> Tuple[List[Signal], List[int]]:
+        """
+        바마다 bin 거래량을 증분 갱신하며 돌파 신호 생성 (loop 엔진)
+
+        Args:
+            df (pd.DataFrame): reset_index(drop=True)된 OHLCV 데이터
+            volume_window, top_percentile, breakout_buffer, num_bins, include_wicks: 전략 파라미터
+
+        Returns:
+            Tuple[List[Signal], List[int]]: (신호 목록, 신호 위치 인덱스)
+        """
         # 신호 생성
         signals: List[Signal] = []
         signal_indices: List[int] = []
@@ -113,42 +205,33 @@ class VolumeZoneBreakoutStrategy(Strategy):
                 top_percentile=top_percentile,
             )
 
-            if resistance_price is None:
-                continue
-
-            # 현재 캔들 데이터
-            current_close = close_prices[i]
-            current_high = high_prices[i]
-
-            # 돌파 조건 확인
-            breakout_level = resistance_price * (1 + breakout_buffer)
-
-            if current_high >= breakout_level:
-                # 돌파 신호 생성
-                signal_price = current_close
-                signal_time = df.loc[i, 'timestamp']
-
-                # 청산 인덱스 계산
-                exit_idx = i + hold_period_bars
-
-                if exit_idx >= len(df):
-                    exit_idx = len(df) - 1
-
-                exit_price = df.iloc[exit_idx]['close']
-
-                # 신호 객체 생성
-                # confidence는 breakout 강도로 설정
-                breakout_strength = (current_high - breakout_level) / breakout_level
-                confidence = min(0.5 + breakout_strength, 1.0)  # 0.5 ~ 1.0 범위
-
-                signal = Signal(
-                    timestamp=signal_time,
-                    side='BUY',
-                    price=signal_price,
-                    confidence=confidence,
-                )
-                signals.append(signal)
-                signal_indices.append(i)
+            # 윈도우 총 거래량이 0이면 저항선 없음 (신호 없이 윈도우만 슬라이드)
+            if resistance_price is not None:
+                # 현재 캔들 데이터
+                current_close = close_prices[i]
+                current_high = high_prices[i]
+
+                # 돌파 조건 확인
+                breakout_level = resistance_price * (1 + breakout_buffer)
+
+                if current_high >= breakout_level:
+                    # 돌파 신호 생성
+                    signal_price = current_close
+                    signal_time = df.loc[i, 'timestamp']
+
+                    # 신호 객체 생성
+                    # confidence는 breakout 강도로 설정
+                    breakout_strength = (current_high - breakout_level) / breakout_level
+                    confidence = min(0.5 + breakout_strength, 1.0)  # 0.5 ~ 1.0 범위
+
+                    signal = Signal(
+                        timestamp=signal_time,
+                        side='BUY',
+                        price=signal_price,
+                        confidence=confidence,
+                    )
+                    signals.append(signal)
+                    signal_indices.append(i)
 
             # 다음 반복을 위해 윈도우 슬라이드 (가장 오래된 캔들 제거, 새로운 캔들 추가)
             if i + 1 < len(df):
@@ -182,46 +265,242 @@ class VolumeZoneBreakoutStrategy(Strategy):
                     enter_height,
                 )
 
-        if not signals:
-            logger.warning("No signals generated for volume_zone_breakout strategy")
-            return BacktestResult(
-                signals=[],
-                samples=0,
-                win_rate=0.0,
-                avg_return=0.0,
-                max_drawdown=0.0,
-                avg_hold_bars=0.0,
-                avg_hold_duration=None,
-                entry_exit_pairs=[],  # Step 4 신호 테이블용
-                returns=[],  # Step 4 신호 테이블용
-            )
+        return signals, signal_indices
 
-        # 공통 함수로 성과 지표 계산
-        entry_exit_pairs = calculate_entry_exit_prices(signal_indices, df, hold_period_bars)
-        returns = calculate_returns(entry_exit_pairs)
-        metrics = calculate_metrics(returns, hold_period_bars)
+    def _generate_signals_vectorized(
+        self,
+        df: pd.DataFrame,
+        volume_window: int,
+        top_percentile: float,
+        breakout_buffer: float,
+        num_bins: int,
+        include_wicks: bool,
+        cache: Optional[Dict] = None,
+    ) -> Tuple[List[Signal], List[int]]:
+        """
+        전체 바의 저항선을 배열 연산으로 한 번에 계산하여 돌파 신호 생성 (vectorized 엔진)
 
-        logger.info(
-            "VolumeZoneBreakout: signals=%s, win_rate=%.2f%%, avg_return=%.2f%%, max_drawdown=%.2f%%",
-            len(signals),
-            metrics['win_rate'] * 100,
-            metrics['avg_return'],
-            metrics['max_drawdown'],
+        저항선 배열은 breakout_buffer/hold_period_bars와 무관하므로 cache가 주어지면
+        (volume_window, top_percentile, num_bins, include_wicks) 단위로 재사용합니다.
+
+        Args:
+            df (pd.DataFrame): reset_index(drop=True)된 OHLCV 데이터
+            volume_window, top_percentile, breakout_buffer, num_bins, include_wicks: 전략 파라미터
+            cache (Optional[Dict]): 동일 df에 대한 중간 결과 공유 캐시
+
+        Returns:
+            Tuple[List[Signal], List[int]]: (신호 목록, 신호 위치 인덱스)
+        """
+        if len(df) <= volume_window:
+            return [], []
+
+        profile = self._get_cached(
+            cache,
+            ('volume_profile', volume_window, top_percentile, num_bins, include_wicks),
+            lambda: self._calculate_resistance_profile(
+                df, volume_window, top_percentile, num_bins, include_wicks,
+            ),
         )
 
-        result = BacktestResult(
-            signals=signals,
-            samples=len(signals),
-            win_rate=metrics['win_rate'],
-            avg_return=metrics['avg_return'],
-            max_drawdown=metrics['max_drawdown'],
-            avg_hold_bars=metrics['avg_hold_bars'],
-            avg_hold_duration=None,
-            entry_exit_pairs=entry_exit_pairs,  # Step 4 신호 테이블용
-            returns=returns,  # Step 4 신호 테이블용
+        if profile is None:
+            # 가격 변동이 없는 초기 윈도우는 bin 경계가 퇴화하므로 loop 엔진으로 처리
+            return self._generate_signals_loop(
+                df, volume_window, top_percentile, breakout_buffer, num_bins, include_wicks,
+            )
+
+        resistance, valid, current_high = profile
+        close_prices = df['close'].values
+
+        # 돌파 조건 확인
+        breakout_level = resistance * (1 + breakout_buffer)
+        with np.errstate(invalid='ignore'):
+            is_breakout = valid & (current_high >= breakout_level)
+
+        offsets = np.flatnonzero(is_breakout)
+        signal_indices = (offsets + volume_window).tolist()
+        if not signal_indices:
+            return [], []
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            breakout_strength = (current_high[offsets] - breakout_level[offsets]) / breakout_level[offsets]
+        confidence = np.minimum(0.5 + breakout_strength, 1.0)  # 0.5 ~ 1.0 범위
+
+        timestamps = df['timestamp'].iloc[signal_indices].tolist()
+        signal_prices = close_prices[signal_indices]
+
+        signals = [
+            Signal(
+                timestamp=timestamps[j],
+                side='BUY',
+                price=signal_prices[j],
+                confidence=confidence[j],
+            )
+            for j in range(len(signal_indices))
+        ]
+
+        return signals, signal_indices
+
+    def _calculate_resistance_profile(
+        self,
+        df: pd.DataFrame,
+        volume_window: int,
+        top_percentile: float,
+        num_bins: int,
+        include_wicks: bool,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        바 volume_window 이후 모든 바의 저항선 배열 계산
+
+        loop 엔진과 같이 bin 경계는 첫 volume_window개 캔들로 고정됩니다.
+        캔들별 bin 기여도 행렬 C(bars×bins)를 만든 뒤, loop 엔진의 갱신 순서
+        (초기 윈도우 누적 → 가장 오래된 캔들 제거 → 새 캔들 추가)대로 행을 배치하여
+        누적합을 구하므로, 부동소수점 결과까지 loop 엔진과 동일합니다.
+        메모리는 VECTORIZED_CHUNK_BARS 단위로 나누어 제한합니다.
+
+        Args:
+            df (pd.DataFrame): reset_index(drop=True)된 OHLCV 데이터 (len(df) > volume_window)
+            volume_window, top_percentile, num_bins, include_wicks: 전략 파라미터
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+                (저항선, 유효 여부, 돌파 판정용 고가) - 바 volume_window부터의 배열
+                초기 윈도우 가격 범위가 0이면 None
+        """
+        n = len(df)
+
+        initial_window_df = df.iloc[0:volume_window]
+        if include_wicks:
+            price_min = initial_window_df['low'].min()
+            price_max = initial_window_df['high'].max()
+        else:
+            price_min = initial_window_df['open'].min()
+            price_max = max(initial_window_df['close'].max(), initial_window_df['open'].max())
+
+        if price_min == price_max:
+            # 가격 변동이 없는 초기 윈도우는 bin 경계가 퇴화함
+            return None
+
+        bins = np.linspace(price_min, price_max, num_bins + 1)
+
+        open_prices = df['open'].values
+        close_prices = df['close'].values
+        high_prices = df['high'].values
+        low_prices = df['low'].values
+        volumes = df['volume'].values
+
+        if not include_wicks:
+            low_prices = np.minimum(open_prices, close_prices)
+            high_prices = np.maximum(open_prices, close_prices)
+
+        def contributions(start: int, end: int) -> np.ndarray:
+            return self._bin_contributions(
+                low_prices[start:end], high_prices[start:end], volumes[start:end], bins, num_bins,
+            )
+
+        # 초기 윈도우 [0, volume_window) 누적
+        state = np.cumsum(contributions(0, volume_window), axis=0)[-1]
+
+        # 바 i = volume_window + k 에서 사용하는 윈도우 상태 S_k 를 청크 단위로 계산
+        # S_k = (S_{k-1} - C[k-1]) + C[volume_window + k - 1]
+        num_states = n - volume_window
+        chunk = self.VECTORIZED_CHUNK_BARS
+        resistance = np.empty(num_states)
+        valid = np.empty(num_states, dtype=bool)
+
+        for k0 in range(0, num_states, chunk):
+            k1 = min(k0 + chunk, num_states)
+            removed = contributions(k0, k1)
+            added = contributions(volume_window + k0, volume_window + k1)
+
+            ops = np.empty((2 * (k1 - k0) - 1, num_bins))
+            ops[0] = state
+            ops[1::2] = -removed[:-1]
+            ops[2::2] = added[:-1]
+            np.cumsum(ops, axis=0, out=ops)
+            states = ops[0::2]
+
+            resistance[k0:k1], valid[k0:k1] = self._resistance_from_bin_matrix(
+                states, bins, top_percentile,
+            )
+
+            if k1 < num_states:
+                state = (states[-1] - removed[-1]) + added[-1]
+
+        return resistance, valid, high_prices[volume_window:]
+
+    @staticmethod
+    def _bin_contributions(
+        low_prices: np.ndarray,
+        high_prices: np.ndarray,
+        volumes: np.ndarray,
+        bins: np.ndarray,
+        num_bins: int,
+    ) -> np.ndarray:
+        """
+        캔들별 bin 거래량 기여도 행렬 계산 (_add_candle_to_bins의 배열 버전)
+
+        Args:
+            low_prices, high_prices, volumes: 캔들 배열
+            bins (np.ndarray): bin 경계 배열 (num_bins + 1)
+            num_bins (int): bin 수
+
+        Returns:
+            np.ndarray: (캔들 수, num_bins) 기여도 행렬
+        """
+        candle_heights = high_prices - low_prices
+
+        overlap_start = np.maximum(low_prices[:, None], bins[None, :-1])
+        overlap_end = np.minimum(high_prices[:, None], bins[None, 1:])
+        overlap = overlap_end - overlap_start
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weighted = volumes[:, None] * (overlap / candle_heights[:, None])
+        contrib = np.where(overlap > 0, weighted, 0.0)
+
+        # 높이가 0인 캔들은 중앙 가격이 속한 bin에 전체 거래량 할당
+        flat = np.flatnonzero(candle_heights == 0)
+        if len(flat) > 0:
+            center = (low_prices[flat] + high_prices[flat]) / 2
+            bin_idx = np.searchsorted(bins, center, side='right') - 1
+            bin_idx = np.clip(bin_idx, 0, num_bins - 1)
+            contrib[flat] = 0.0
+            contrib[flat, bin_idx] = volumes[flat]
+
+        return contrib
+
+    @staticmethod
+    def _resistance_from_bin_matrix(
+        bin_matrix: np.ndarray,
+        bins: np.ndarray,
+        top_percentile: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        윈도우별 bin 거래량 행렬에서 저항선 계산 (_get_resistance_from_bins의 배열 버전)
+
+        Args:
+            bin_matrix (np.ndarray): (윈도우 수, num_bins) bin 거래량
+            bins (np.ndarray): bin 경계
+            top_percentile (float): 상위 백분위
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (저항선 가격, 유효 여부(총 거래량 != 0))
+        """
+        num_bins = bin_matrix.shape[1]
+        total_volume = bin_matrix.sum(axis=1)
+        threshold_volume = total_volume * top_percentile
+
+        # 가장 높은 가격부터 누적
+        cumulative_from_top = np.cumsum(bin_matrix[:, ::-1], axis=1)
+        reached = cumulative_from_top >= threshold_volume[:, None]
+
+        first_reached = reached.argmax(axis=1)
+        resistance = np.where(
+            reached.any(axis=1),
+            bins[num_bins - 1 - first_reached],
+            bins[-1],
         )
 
-        return result
+        return resistance, total_volume != 0
 
     def _calculate_bin_volumes(
         self,
@@ -536,3 +815,140 @@ class VolumeZoneBreakoutStrategy(Strategy):
 
         # 기본값: 최고가
         return df['high'].max()
+
+    def initialize_with_history(self, df: pd.DataFrame, params: Dict) -> None:
+        """
+        실시간 모드 초기화 (히스토리 캔들로 매물대 윈도우 구성)
+
+        loop 엔진과 같이 bin 경계는 첫 volume_window개 캔들로 고정되고,
+        이후 캔들은 _add_candle_to_bins/_remove_candle_from_bins로 윈도우를 민다.
+        히스토리 캔들에 대해서는 신호를 내보내지 않습니다.
+
+        Args:
+            df (pd.DataFrame): 과거→현재 순서의 OHLCV 데이터
+            params (Dict): run()과 같은 전략 파라미터
+
+        Raises:
+            ValueError: 파라미터 오류
+        """
+        volume_window = params.get('volume_window', 10)
+        top_percentile = params.get('top_percentile', 0.2)
+        breakout_buffer = params.get('breakout_buffer', 0.0)
+        hold_period_bars = params.get('hold_period_bars', 1)
+        num_bins = params.get('num_bins', 20)
+        include_wicks = params.get('include_wicks', True)
+
+        if volume_window < 1 or top_percentile <= 0 or breakout_buffer < 0 or hold_period_bars < 1 or num_bins < 1:
+            raise ValueError("Invalid parameters")
+
+        self._volume_window = volume_window
+        self._top_percentile = top_percentile
+        self._breakout_buffer = breakout_buffer
+        self._num_bins = num_bins
+        self._include_wicks = include_wicks
+
+        # bin 경계 확정 전 초기 윈도우 캔들 (open, high, low, close, volume)
+        self._warmup_candles: List[Tuple[float, float, float, float, float]] = []
+        # 현재 매물대 윈도우 (판정용 저가, 고가, 거래량) - 고정 크기 링 버퍼
+        self._window_candles: Deque[Tuple[float, float, float]] = deque(maxlen=volume_window)
+        self._bins: Optional[np.ndarray] = None
+        self._bin_volumes: Optional[np.ndarray] = None
+
+        for row in df[['open', 'high', 'low', 'close', 'volume']].itertuples(index=False):
+            self._update_stream(*row)
+
+    def _update_stream(
+        self,
+        open_price: float,
+        high_price: float,
+        low_price: float,
+        close_price: float,
+        volume: float,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        캔들 하나로 매물대 윈도우 갱신 (_generate_signals_loop의 한 반복)
+
+        Args:
+            open_price, high_price, low_price, close_price, volume: 캔들 데이터
+
+        Returns:
+            Optional[Tuple[float, float]]: 돌파 시 (돌파 판정용 고가, 돌파 기준가), 아니면 None
+        """
+        if self._include_wicks:
+            candle_low, candle_high = low_price, high_price
+        else:
+            candle_low, candle_high = min(open_price, close_price), max(open_price, close_price)
+
+        if self._bins is None:
+            # 초기 윈도우: volume_window개가 모이면 bin 경계 확정
+            self._warmup_candles.append((open_price, high_price, low_price, close_price, volume))
+            self._window_candles.append((candle_low, candle_high, volume))
+            if len(self._warmup_candles) == self._volume_window:
+                initial_window_df = pd.DataFrame(
+                    self._warmup_candles, columns=['open', 'high', 'low', 'close', 'volume'],
+                )
+                self._bin_volumes, self._bins = self._calculate_bin_volumes(
+                    initial_window_df,
+                    num_bins=self._num_bins,
+                    include_wicks=self._include_wicks,
+                )
+                self._warmup_candles = []
+            return None
+
+        # 직전 volume_window개 캔들의 매물대로 저항선 계산
+        breakout = None
+        resistance_price = self._get_resistance_from_bins(
+            self._bin_volumes,
+            self._bins,
+            top_percentile=self._top_percentile,
+        )
+        if resistance_price is not None:
+            breakout_level = resistance_price * (1 + self._breakout_buffer)
+            if candle_high >= breakout_level:
+                breakout = (candle_high, breakout_level)
+
+        # 윈도우 슬라이드 (가장 오래된 캔들 제거, 현재 캔들 추가)
+        exit_low, exit_high, exit_volume = self._window_candles[0]
+        self._remove_candle_from_bins(
+            self._bin_volumes, self._bins, exit_low, exit_high, exit_volume, exit_high - exit_low,
+        )
+        self._add_candle_to_bins(
+            self._bin_volumes, self._bins, candle_low, candle_high, volume, candle_high - candle_low,
+        )
+        self._window_candles.append((candle_low, candle_high, volume))
+
+        return breakout
+
+    def process_candle(self, candle: Dict) -> Optional[Signal]:
+        """
+        새 캔들 처리 (캔들당 O(num_bins), run()과 동일한 신호 조건)
+
+        Args:
+            candle (Dict): timestamp, open, high, low, close, volume
+
+        Returns:
+            Optional[Signal]: 상위 매물대 돌파 시 BUY 신호
+
+        Raises:
+            RuntimeError: initialize_with_history()로 초기화하지 않은 경우
+        """
+        if getattr(self, '_window_candles', None) is None:
+            raise RuntimeError("initialize_with_history() must be called before process_candle()")
+
+        breakout = self._update_stream(
+            candle['open'], candle['high'], candle['low'], candle['close'], candle['volume'],
+        )
+        if breakout is None:
+            return None
+
+        current_high, breakout_level = breakout
+        # confidence는 breakout 강도로 설정
+        breakout_strength = (current_high - breakout_level) / breakout_level
+        confidence = min(0.5 + breakout_strength, 1.0)  # 0.5 ~ 1.0 범위
+
+        return Signal(
+            timestamp=candle['timestamp'],
+            side='BUY',
+            price=candle['close'],
+            confidence=confidence,
+        )
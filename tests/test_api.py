@@ -251,6 +251,52 @@ class TestBacktestGet:
             assert "total_signals" in data
             assert "execution_time" in data
 
+    def test_get_and_download_parquet_result(self, temp_results_dir, monkeypatch):
+        """Parquet 형식으로 저장된 결과 조회/다운로드 테스트"""
+        from backend.app.result_manager import ResultManager
+
+        monkeypatch.setenv("RESULT_FILE_FORMAT", "parquet")
+        run_id = "parquet-api-run"
+        result_data = {
+            "version": "1.1.0",
+            "run_id": run_id,
+            "strategy": "volume_long_candle",
+            "params": {},
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "timeframe": "1d",
+            "symbols": [{
+                "symbol": "BTC_KRW",
+                "signals": [{
+                    "symbol": "BTC_KRW",
+                    "type": "buy",
+                    "timestamp": "2024-01-02T15:00:00+00:00",
+                    "entry_price": 100.0,
+                    "exit_price": 105.0,
+                    "return_pct": 0.05,
+                }],
+                "win_rate": 1.0,
+                "avg_return": 5.0,
+                "max_drawdown": 0.0,
+                "avg_hold_bars": 1.0,
+                "performance_curve": [{"timestamp": "2024-01-03", "equity": 1.05}],
+            }],
+            "total_signals": 1,
+            "execution_time": 0.1,
+        }
+        assert ResultManager.save_result(os.path.dirname(temp_results_dir), run_id, result_data)
+
+        get_response = client.get(f"/api/backtests/{run_id}")
+        assert get_response.status_code == 200
+        data = get_response.json()
+        assert data["symbols"][0]["signals"][0]["timestamp"] == "2024-01-02T15:00:00+00:00"
+        assert data["symbols"][0]["performance_curve"][0]["equity"] == 1.05
+
+        download_response = client.get(f"/api/backtests/{run_id}/download")
+        assert download_response.status_code == 200
+        assert "attachment" in download_response.headers["content-disposition"]
+        assert download_response.json()["run_id"] == run_id
+
 
 class TestParameterValidation:
     """파라미터 유효성 검사 테스트"""
@@ -325,6 +371,61 @@ class TestParameterValidation:
                 assert data["strategy"] == strategy_name
 
 
+class TestBacktestSweep:
+    """파라미터 스윕 엔드포인트 테스트"""
+
+    def test_valid_sweep_request(self):
+        """유효한 스윕 요청 테스트"""
+        payload = {
+            "strategy": "volume_long_candle",
+            "params": {"hold_period_bars": 1},
+            "param_grid": {"vol_ma_window": [10, 20], "vol_multiplier": [1.0, 1.5]},
+            "symbols": ["BTC_KRW"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "top_n": 3,
+        }
+
+        response = client.post("/api/backtests/sweep", json=payload)
+
+        # 데이터가 있으면 200, 없으면 404
+        if response.status_code == 200:
+            data = response.json()
+            assert data["total_combinations"] == 4
+            assert data["rank_by"] == "avg_return"
+            assert len(data["results"]) == 3
+            assert [row["rank"] for row in data["results"]] == [1, 2, 3]
+            for row in data["results"]:
+                assert row["params"]["hold_period_bars"] == 1
+
+    def test_invalid_rank_by(self):
+        """지원하지 않는 순위 지표 테스트"""
+        payload = {
+            "strategy": "volume_long_candle",
+            "param_grid": {"vol_ma_window": [10, 20]},
+            "symbols": ["BTC_KRW"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "rank_by": "sharpe",
+        }
+
+        response = client.post("/api/backtests/sweep", json=payload)
+        assert response.status_code == 422
+
+    def test_empty_param_grid(self):
+        """빈 파라미터 그리드 테스트"""
+        payload = {
+            "strategy": "volume_long_candle",
+            "param_grid": {"vol_ma_window": []},
+            "symbols": ["BTC_KRW"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+        }
+
+        response = client.post("/api/backtests/sweep", json=payload)
+        assert response.status_code == 422
+
+
 class TestErrorHandling:
     """에러 핸들링 테스트"""
 
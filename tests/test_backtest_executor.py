@@ -0,0 +1,130 @@
+"""
+backtest_executor 모듈 유닛 테스트
+
+심볼별 워커 함수의 결과 스키마, 오류 변환, 프로세스 풀 기반 병렬 실행을 검증합니다.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.app.backtest_executor import (
+    BacktestExecutor,
+    SymbolBacktestError,
+    run_symbol_backtest,
+)
+
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    """여러 심볼의 일봉 데이터가 있는 DATA_ROOT"""
+    np.random.seed(7)
+    dates = pd.date_range('2024-01-01', '2024-06-30', freq='D')
+
+    for symbol in ["BTC_KRW", "ETH_KRW", "XRP_KRW"]:
+        symbol_dir = tmp_path / symbol / "1D"
+        symbol_dir.mkdir(parents=True)
+        close = 100 + np.cumsum(np.random.randn(len(dates)))
+        open_ = close + np.random.randn(len(dates)) * 0.5
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': open_,
+            'high': np.maximum(open_, close) + 1,
+            'low': np.minimum(open_, close) - 1,
+            'close': close,
+            'volume': np.random.uniform(100, 1000, len(dates)),
+        })
+        df.to_parquet(symbol_dir / "2024.parquet")
+
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+    return tmp_path
+
+
+class TestRunSymbolBacktest:
+    """워커 진입점 테스트"""
+
+    def test_returns_symbol_result_dict(self, data_root):
+        """SymbolResult 호환 dict 반환"""
+        result = run_symbol_backtest(
+            "run-1", "volume_long_candle", {"vol_ma_window": 5},
+            "BTC_KRW", "2024-01-01", "2024-06-30", "1d",
+        )
+
+        assert result["symbol"] == "BTC_KRW"
+        for key in ("signals", "win_rate", "avg_return", "max_drawdown",
+                    "avg_hold_bars", "performance_curve", "samples"):
+            assert key in result
+        assert len(result["signals"]) == result["samples"]
+        for signal in result["signals"]:
+            assert signal["type"] in ("buy", "sell")
+
+    def test_missing_data_raises_picklable_error(self, data_root):
+        """데이터 없음은 상태 코드를 가진 SymbolBacktestError로 변환"""
+        with pytest.raises(SymbolBacktestError) as exc_info:
+            run_symbol_backtest(
+                "run-1", "volume_long_candle", {},
+                "UNKNOWN_KRW", "2024-01-01", "2024-06-30", "1d",
+            )
+
+        error = exc_info.value
+        assert error.status_code == 404
+        http_error = error.to_http_exception()
+        assert http_error.status_code == 404
+
+
+class TestBacktestExecutor:
+    """BacktestExecutor 병렬 실행 테스트"""
+
+    @staticmethod
+    async def _collect(executor, symbols):
+        results = {}
+        async for index, symbol_data in executor.run_symbols(
+            run_id="run-1",
+            strategy_name="volume_zone_breakout",
+            params={},
+            symbols=symbols,
+            start_date="2024-01-01",
+            end_date="2024-06-30",
+            timeframe="1d",
+        ):
+            results[index] = symbol_data
+        return results
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_results_match_sequential_execution(self, data_root, max_workers):
+        """병렬 실행 결과가 심볼별 순차 실행과 동일"""
+        symbols = ["BTC_KRW", "ETH_KRW", "XRP_KRW"]
+        executor = BacktestExecutor(max_workers=max_workers)
+        try:
+            results = asyncio.run(self._collect(executor, symbols))
+        finally:
+            executor.shutdown()
+
+        assert sorted(results) == [0, 1, 2]
+        for index, symbol in enumerate(symbols):
+            expected = run_symbol_backtest(
+                "run-1", "volume_zone_breakout", {},
+                symbol, "2024-01-01", "2024-06-30", "1d",
+            )
+            assert results[index] == expected
+
+    def test_symbol_failure_propagates(self, data_root):
+        """심볼 하나가 실패하면 SymbolBacktestError 전달"""
+        executor = BacktestExecutor(max_workers=2)
+        try:
+            with pytest.raises(SymbolBacktestError) as exc_info:
+                asyncio.run(self._collect(executor, ["BTC_KRW", "UNKNOWN_KRW"]))
+        finally:
+            executor.shutdown()
+
+        assert exc_info.value.symbol == "UNKNOWN_KRW"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
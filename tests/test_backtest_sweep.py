@@ -0,0 +1,201 @@
+"""
+backtest_sweep 모듈 유닛 테스트
+
+그리드 전개, 중간 시리즈 공유 시 결과 동일성, 순위표 집계, 병렬 스윕 실행을 검증합니다.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.app.backtest_executor import BacktestExecutor, SymbolBacktestError
+from backend.app.backtest_sweep import (
+    expand_param_grid,
+    rank_sweep_results,
+    run_parameter_sweep,
+    run_sweep_chunk,
+)
+from backend.app.data_loader import load_ohlcv_data
+from backend.app.strategy_factory import StrategyFactory
+
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    """여러 심볼의 일봉 데이터가 있는 DATA_ROOT"""
+    np.random.seed(11)
+    dates = pd.date_range('2024-01-01', '2024-06-30', freq='D')
+
+    for symbol in ["BTC_KRW", "ETH_KRW"]:
+        symbol_dir = tmp_path / symbol / "1D"
+        symbol_dir.mkdir(parents=True)
+        close = 100 + np.cumsum(np.random.randn(len(dates)))
+        open_ = close + np.random.randn(len(dates)) * 0.5
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': open_,
+            'high': np.maximum(open_, close) + 1,
+            'low': np.minimum(open_, close) - 1,
+            'close': close,
+            'volume': np.random.uniform(100, 1000, len(dates)),
+        })
+        df.to_parquet(symbol_dir / "2024.parquet")
+
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+    return tmp_path
+
+
+class TestExpandParamGrid:
+    """파라미터 그리드 전개 테스트"""
+
+    def test_cartesian_product_with_base_params(self):
+        """모든 조합 생성 및 공통 파라미터 병합"""
+        combinations = expand_param_grid(
+            {"hold_period_bars": 2},
+            {"vol_ma_window": [5, 10], "body_pct": [0.01, 0.02, 0.03]},
+        )
+
+        assert len(combinations) == 6
+        assert combinations[0] == {"hold_period_bars": 2, "vol_ma_window": 5, "body_pct": 0.01}
+        assert combinations[-1] == {"hold_period_bars": 2, "vol_ma_window": 10, "body_pct": 0.03}
+
+    def test_empty_values_raise(self):
+        """빈 후보값 목록은 ValueError"""
+        with pytest.raises(ValueError):
+            expand_param_grid({}, {"vol_ma_window": []})
+        with pytest.raises(ValueError):
+            expand_param_grid({}, {})
+
+
+class TestRunSweepChunk:
+    """청크 워커 테스트"""
+
+    @pytest.mark.parametrize("strategy_name,param_grid", [
+        ("volume_long_candle", {"vol_ma_window": [5, 10], "vol_multiplier": [1.0, 1.5]}),
+        ("volume_zone_breakout", {"volume_window": [10, 20], "breakout_buffer": [0.0, 0.01]}),
+    ])
+    def test_shared_cache_matches_individual_runs(self, data_root, strategy_name, param_grid):
+        """중간 시리즈를 공유해도 조합별 단독 실행과 결과 동일"""
+        combinations = expand_param_grid({}, param_grid)
+        rows = run_sweep_chunk(
+            "sweep-1", strategy_name, list(enumerate(combinations)),
+            "BTC_KRW", "2024-01-01", "2024-06-30", "1d",
+        )
+
+        df = load_ohlcv_data(["BTC_KRW"], "2024-01-01", "2024-06-30", "1d")
+        strategy = StrategyFactory.create(strategy_name)
+        for row, params in zip(rows, combinations):
+            expected = strategy.run(df, params)
+            assert row["error"] is None
+            assert row["samples"] == expected.samples
+            assert row["win_rate"] == expected.win_rate
+            assert row["avg_return"] == expected.avg_return
+            assert row["max_drawdown"] == expected.max_drawdown
+
+    def test_invalid_combination_reported_as_error(self, data_root):
+        """잘못된 조합은 오류 행으로 기록하고 나머지는 계속 실행"""
+        rows = run_sweep_chunk(
+            "sweep-1", "volume_long_candle",
+            [(0, {"vol_ma_window": 0}), (1, {"vol_ma_window": 5})],
+            "BTC_KRW", "2024-01-01", "2024-06-30", "1d",
+        )
+
+        assert rows[0]["error"] is not None
+        assert rows[1]["error"] is None
+
+    def test_missing_data_raises(self, data_root):
+        """데이터 없음은 SymbolBacktestError로 변환"""
+        with pytest.raises(SymbolBacktestError):
+            run_sweep_chunk(
+                "sweep-1", "volume_long_candle", [(0, {})],
+                "UNKNOWN_KRW", "2024-01-01", "2024-06-30", "1d",
+            )
+
+
+class TestRankSweepResults:
+    """순위표 집계 테스트"""
+
+    def test_weighted_aggregation_and_ordering(self):
+        """신호 수 가중 평균, 최대 낙폭, 무효 조합 후순위"""
+        combinations = [{"a": 1}, {"a": 2}, {"a": 3}]
+        chunk_results = [
+            [
+                {"index": 0, "samples": 2, "win_rate": 0.5, "avg_return": 1.0, "max_drawdown": 3.0, "error": None},
+                {"index": 1, "samples": 1, "win_rate": 1.0, "avg_return": 4.0, "max_drawdown": 1.0, "error": None},
+                {"index": 2, "error": "bad params"},
+            ],
+            [
+                {"index": 0, "samples": 2, "win_rate": 1.0, "avg_return": 3.0, "max_drawdown": 5.0, "error": None},
+                {"index": 1, "samples": 0, "win_rate": 0.0, "avg_return": 0.0, "max_drawdown": 0.0, "error": None},
+            ],
+        ]
+
+        table = rank_sweep_results(combinations, chunk_results, rank_by="avg_return")
+
+        assert [row["params"]["a"] for row in table] == [2, 1, 3]
+        assert [row["rank"] for row in table] == [1, 2, 3]
+        first_combo = table[1]
+        assert first_combo["total_signals"] == 4
+        assert first_combo["win_rate"] == pytest.approx(0.75)
+        assert first_combo["avg_return"] == pytest.approx(2.0)
+        assert first_combo["max_drawdown"] == 5.0
+        assert first_combo["symbols_with_signals"] == 2
+        assert table[2]["error"] == "bad params"
+
+        by_drawdown = rank_sweep_results(combinations, chunk_results, rank_by="max_drawdown", top_n=1)
+        assert len(by_drawdown) == 1
+        assert by_drawdown[0]["params"] == {"a": 2}
+
+
+class TestRunParameterSweep:
+    """병렬 스윕 실행 테스트"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_sweep_covers_all_combinations(self, data_root, max_workers):
+        """모든 조합이 순위표에 한 번씩 포함"""
+        executor = BacktestExecutor(max_workers=max_workers)
+        try:
+            sweep = asyncio.run(run_parameter_sweep(
+                executor=executor,
+                run_id="sweep-1",
+                strategy_name="volume_long_candle",
+                base_params={},
+                param_grid={"vol_ma_window": [5, 10, 20], "body_pct": [0.005, 0.01]},
+                symbols=["BTC_KRW", "ETH_KRW"],
+                start_date="2024-01-01",
+                end_date="2024-06-30",
+                timeframe="1d",
+            ))
+        finally:
+            executor.shutdown()
+
+        assert sweep["total_combinations"] == 6
+        assert sweep["symbols_processed"] == 2
+        params = sorted((row["params"]["vol_ma_window"], row["params"]["body_pct"]) for row in sweep["results"])
+        assert params == sorted((w, b) for w in [5, 10, 20] for b in [0.005, 0.01])
+
+    def test_too_many_combinations_rejected(self, data_root, monkeypatch):
+        """최대 조합 수 초과 시 ValueError"""
+        monkeypatch.setenv("SWEEP_MAX_COMBINATIONS", "3")
+        executor = BacktestExecutor(max_workers=1)
+        with pytest.raises(ValueError, match="Too many parameter combinations"):
+            asyncio.run(run_parameter_sweep(
+                executor=executor,
+                run_id="sweep-1",
+                strategy_name="volume_long_candle",
+                base_params={},
+                param_grid={"vol_ma_window": [5, 10], "body_pct": [0.005, 0.01]},
+                symbols=["BTC_KRW"],
+                start_date="2024-01-01",
+                end_date="2024-06-30",
+                timeframe="1d",
+            ))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,241 @@
+"""
+CascadingCandleAggregator 유닛 테스트
+
+기준 캔들 집계, 상위 타임프레임 합산, 늦은 체결 처리, 심볼 슬롯 관리를 검증합니다.
+"""
+
+import random
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from backend.app.market_data.candle_aggregator import CascadingCandleAggregator, epoch_to_utc
+from backend.app.market_data.market_data_service import MarketDataService
+
+T0 = 1704067200  # 2024-01-01 00:00:00 UTC
+
+
+def _random_trades(symbols, minutes, seed=3):
+    """(symbol, epoch, price, volume) 시간순 체결"""
+    rng = random.Random(seed)
+    trades = []
+    for second in range(0, minutes * 60, 7):
+        for symbol in symbols:
+            if rng.random() < 0.8:
+                trades.append((symbol, T0 + second, rng.uniform(90, 110), rng.uniform(0.1, 2)))
+    return trades
+
+
+def _reference_candles(trades, seconds, timeframe):
+    """체결을 타임프레임별로 직접 집계 (마지막 구간 제외)"""
+    buckets = {}
+    for symbol, ts, price, volume in trades:
+        key = (symbol, ts - ts % seconds)
+        candle = buckets.get(key)
+        if candle is None:
+            buckets[key] = [price, price, price, price, volume]
+        else:
+            candle[1] = max(candle[1], price)
+            candle[2] = min(candle[2], price)
+            candle[3] = price
+            candle[4] += volume
+    last_start = max(start for _, start in buckets)
+    return {
+        (symbol, timeframe, epoch_to_utc(start)): values
+        for (symbol, start), values in buckets.items()
+        if start != last_start
+    }
+
+
+class TestCascadingCandleAggregator:
+    """CascadingCandleAggregator 테스트"""
+
+    def test_rollups_match_direct_aggregation(self):
+        """상위 타임프레임 합산 결과가 체결 직접 집계와 동일"""
+        symbols = ['KRW-BTC', 'KRW-ETH', 'KRW-XRP']
+        trades = _random_trades(symbols, minutes=125)
+        aggregator = CascadingCandleAggregator(symbols, '1m', ['5m', '15m', '1h'])
+
+        produced = {}
+        for trade in trades:
+            for candle in aggregator.add_trade(*trade):
+                key = (candle.symbol, candle.timeframe, candle.timestamp)
+                assert key not in produced
+                produced[key] = [candle.open, candle.high, candle.low, candle.close, candle.volume]
+
+        for timeframe, seconds in [('1m', 60), ('5m', 300), ('15m', 900), ('1h', 3600)]:
+            expected = _reference_candles(trades, seconds, timeframe)
+            actual = {k: v for k, v in produced.items() if k[1] == timeframe}
+            assert actual.keys() == expected.keys()
+            for key, values in expected.items():
+                assert actual[key] == pytest.approx(values)
+
+    def test_rollup_completes_with_last_base_candle(self):
+        """상위 캔들은 구간 마지막 기준 캔들이 완성될 때 함께 완성"""
+        aggregator = CascadingCandleAggregator(['KRW-BTC'], '1m', ['5m'])
+        for minute in range(5):
+            aggregator.add_trade('KRW-BTC', T0 + minute * 60, 100.0 + minute, 1.0)
+
+        completed = aggregator.add_trade('KRW-BTC', T0 + 300, 200.0, 1.0)
+        assert [(c.timeframe, c.timestamp) for c in completed] == [
+            ('1m', datetime(2024, 1, 1, 0, 4)),
+            ('5m', datetime(2024, 1, 1, 0, 0)),
+        ]
+        five = completed[1]
+        assert (five.open, five.high, five.low, five.close, five.volume) == (100.0, 104.0, 100.0, 104.0, 5.0)
+
+    def test_rollup_with_missing_last_base_candle(self):
+        """구간 마지막 기준 캔들이 없으면 다음 구간 시작 시 완성"""
+        aggregator = CascadingCandleAggregator(['KRW-BTC'], '1m', ['5m'])
+        aggregator.add_trade('KRW-BTC', T0, 100.0, 1.0)
+        aggregator.add_trade('KRW-BTC', T0 + 60, 101.0, 1.0)
+
+        completed = aggregator.add_trade('KRW-BTC', T0 + 420, 102.0, 1.0)
+        assert [c.timeframe for c in completed] == ['1m']
+        completed = aggregator.add_trade('KRW-BTC', T0 + 480, 103.0, 1.0)
+        assert [(c.timeframe, c.timestamp) for c in completed] == [
+            ('1m', datetime(2024, 1, 1, 0, 7)),
+            ('5m', datetime(2024, 1, 1, 0, 0)),
+        ]
+        assert completed[1].volume == 2.0
+
+    def test_late_trade_is_ignored(self):
+        """진행 중 캔들보다 이전 구간 체결은 무시"""
+        aggregator = CascadingCandleAggregator(['KRW-BTC'])
+        aggregator.add_trade('KRW-BTC', T0 + 60, 100.0, 1.0)
+        assert aggregator.add_trade('KRW-BTC', T0 + 30, 50.0, 1.0) == ()
+        assert aggregator.late_trades == 1
+        assert aggregator.get_current_candle('KRW-BTC').low == 100.0
+
+    def test_slots_grow_and_reuse(self):
+        """심볼 수가 초기 용량을 넘어도 동작, 제거한 슬롯은 재사용"""
+        symbols = [f'KRW-C{i}' for i in range(40)]
+        aggregator = CascadingCandleAggregator(symbols, '1m', ['5m'])
+        for i, symbol in enumerate(symbols):
+            aggregator.add_trade(symbol, T0, float(i), 1.0)
+        assert aggregator.get_current_candle('KRW-C39').close == 39.0
+
+        aggregator.remove_symbol('KRW-C0')
+        assert 'KRW-C0' not in aggregator
+        assert aggregator.add_symbol('KRW-NEW') == 0
+        assert aggregator.get_current_candle('KRW-NEW') is None
+
+    def test_invalid_rollup_timeframe(self):
+        with pytest.raises(ValueError):
+            CascadingCandleAggregator([], '5m', ['1m'])
+        with pytest.raises(ValueError):
+            CascadingCandleAggregator([], '1m', ['2m'])
+
+    def test_many_symbols_and_timeframes(self):
+        """여러 심볼/타임프레임 체결 대량 처리"""
+        symbols = [f'KRW-C{i}' for i in range(200)]
+        aggregator = CascadingCandleAggregator(symbols, '1m', ['5m', '15m', '1h'])
+        trades = [
+            (symbols[i % 200], T0 + i // 100, 100.0 + (i % 7), 0.5)
+            for i in range(100_000)
+        ]
+
+        completed = sum(len(aggregator.add_trade(*trade)) for trade in trades)
+
+        assert aggregator.trades_processed == 100_000
+        # 1000초 → 심볼마다 1m 16개, 5m 3개, 15m 1개 완성
+        assert completed == 200 * (16 + 3 + 1)
+
+
+def _stored_rows(last_start, count=3):
+    """market_candles 조회 결과 (최신 순, ORDER BY timestamp DESC)"""
+    return [
+        {'timestamp': epoch_to_utc(last_start - i * 60), 'open': 100.0, 'high': 101.0,
+         'low': 99.0, 'close': 100.5, 'volume': 1.0}
+        for i in range(count)
+    ]
+
+
+class TestMarketDataServiceHistory:
+    """MarketDataService 히스토리 복원 테스트"""
+
+    async def _restart(self, rows, now, rollup_timeframes=()):
+        db = Mock()
+        db.fetch_all_async = AsyncMock(return_value=rows)
+        service = MarketDataService(['KRW-BTC'], rollup_timeframes=list(rollup_timeframes))
+        with patch('backend.app.market_data.market_data_service.get_db', return_value=db), \
+                patch('backend.app.market_data.market_data_service.time.time', return_value=now):
+            await service.initialize()
+        service.write_buffer = Mock()
+        return service, db
+
+    @pytest.mark.asyncio
+    async def test_restart_does_not_emit_stored_candle(self):
+        """재시작 후 첫 체결에서 이미 저장된 캔들을 다시 완성하지 않음"""
+        now = T0 + 3600
+        service, db = await self._restart(_stored_rows(T0 + 600), now)
+
+        assert 'ORDER BY timestamp DESC' in db.fetch_all_async.call_args[0][0]
+        assert service.aggregator.get_current_candle('KRW-BTC') is None
+
+        await service._on_trade('KRW-BTC', 100.0, 1.0, epoch_to_utc(now + 5))
+        service.write_buffer.add.assert_not_called()
+
+        # 다음 구간 체결 → 재시작 이후 집계한 캔들만 완성
+        await service._on_trade('KRW-BTC', 100.0, 1.0, epoch_to_utc(now + 65))
+        candles = [c.args[0] for c in service.write_buffer.add.call_args_list]
+        assert [c.timestamp for c in candles] == [epoch_to_utc(now)]
+
+    @pytest.mark.asyncio
+    async def test_restart_resumes_current_candle(self):
+        """마지막 저장 캔들이 현재 구간이면 진행 중 캔들로 이어서 집계"""
+        now = T0 + 3630
+        service, _ = await self._restart(_stored_rows(T0 + 3600), now)
+
+        await service._on_trade('KRW-BTC', 105.0, 2.0, epoch_to_utc(now))
+        current = service.aggregator.get_current_candle('KRW-BTC')
+        assert (current.open, current.high, current.volume) == (100.0, 105.0, 3.0)
+
+    def _emitted(self, service):
+        return [(c.timeframe, c.timestamp, c.volume) for c in
+                (call.args[0] for call in service.write_buffer.add.call_args_list)]
+
+    @pytest.mark.asyncio
+    async def test_restart_rebuilds_current_rollup(self):
+        """진행 중인 상위 구간은 저장된 기준 캔들로 복원되어 전체 구간으로 완성"""
+        # 10:00~10:02 저장, 10:03:30 재시작
+        now = T0 + 3600 + 210
+        service, _ = await self._restart(_stored_rows(T0 + 3600 + 120), now, ['5m'])
+
+        for minute in (3, 4, 5):
+            await service._on_trade('KRW-BTC', 100.0, 2.0, epoch_to_utc(T0 + 3600 + minute * 60))
+
+        assert ('5m', epoch_to_utc(T0 + 3600), 3 * 1.0 + 2 * 2.0) in self._emitted(service)
+
+    @pytest.mark.asyncio
+    async def test_restart_after_gap_skips_partial_rollup(self):
+        """중단 기간이 있으면 재시작 전에 시작한 상위 구간은 저장하지 않음"""
+        now = T0 + 3600 + 210
+        service, _ = await self._restart(_stored_rows(T0 + 600), now, ['5m'])
+
+        for minute in range(3, 11):
+            await service._on_trade('KRW-BTC', 100.0, 2.0, epoch_to_utc(T0 + 3600 + minute * 60))
+
+        rollups = [e for e in self._emitted(service) if e[0] == '5m']
+        assert rollups == [('5m', epoch_to_utc(T0 + 3900), 5 * 2.0)]
+
+    @pytest.mark.asyncio
+    async def test_strategies_only_receive_base_timeframe(self):
+        """상위 타임프레임 캔들은 저장만 하고 전략/손익 콜백에는 전달하지 않음"""
+        service, _ = await self._restart([], T0, ['5m', '15m'])
+        service.on_candles_complete = AsyncMock()
+
+        completed = []
+        for minute in range(16):
+            completed.extend(service.aggregator.add_trade('KRW-BTC', T0 + minute * 60, 100.0, 1.0))
+        assert {c.timeframe for c in completed} == {'1m', '5m', '15m'}
+
+        await service._on_candles_flushed(completed)
+
+        delivered = service.on_candles_complete.await_args[0][0]
+        assert delivered and {c.timeframe for c in delivered} == {'1m'}
+
+        service.on_candles_complete.reset_mock()
+        await service._on_candles_flushed([c for c in completed if c.timeframe == '5m'])
+        service.on_candles_complete.assert_not_awaited()
@@ -0,0 +1,219 @@
+"""
+UpbitCandleFetcher / TokenBucket 유닛 테스트
+
+로컬 스텁(httpx.MockTransport)으로 페이지 조회, 공유 토큰 버킷 한도,
+연도별 저장과 배치 작업 연결을 검증합니다.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pandas as pd
+import pytest
+
+from backend.app.jobs.data_ingestion import batch_fetch_candles_job, fetch_candles_job
+from backend.app.market_data.candle_fetcher import (
+    BATCH_SIZE,
+    TokenBucket,
+    UpbitCandleFetcher,
+    fetch_candle_streams,
+)
+
+STEP = {
+    'candles/minutes/60': timedelta(hours=1),
+    'candles/minutes/240': timedelta(hours=4),
+    'candles/days': timedelta(days=1),
+    'candles/weeks': timedelta(weeks=1),
+    'candles/months': timedelta(days=30),
+}
+
+
+class UpbitStub:
+    """Upbit 캔들 REST 스텁 (to 이전 캔들을 최신 순으로 count개 반환)"""
+
+    def __init__(self, status_codes=None):
+        self.requests = []
+        self.request_times = []
+        self.status_codes = list(status_codes or [])
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.request_times.append(time.monotonic())
+        if self.status_codes:
+            return httpx.Response(self.status_codes.pop(0), json=[])
+
+        path = request.url.path.split('/v1/', 1)[1]
+        step = STEP[path]
+        to = datetime.fromisoformat(request.url.params['to'])
+        count = int(request.url.params['count'])
+        # 캔들 시각은 step 단위로 정렬 (2024-01-01 기준)
+        origin = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        latest = origin + ((to - origin) // step) * step
+        candles = []
+        for i in range(count):
+            candle_time = latest - i * step
+            price = 100.0 + i
+            candles.append({
+                'market': request.url.params['market'],
+                'candle_date_time_utc': candle_time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'opening_price': price,
+                'high_price': price + 1,
+                'low_price': price - 1,
+                'trade_price': price,
+                'candle_acc_trade_volume': 10.0,
+            })
+        return httpx.Response(200, json=candles)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_shared(self):
+        """동시 요청 수와 관계없이 버스트 이후 초당 한도로 제한"""
+        bucket = TokenBucket([(10, 1.0), (600, 60.0)])
+
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(25)))
+        elapsed = time.monotonic() - started
+
+        # 버스트 10개 + 나머지 15개는 초당 10개
+        assert bucket.acquired == 25
+        assert 1.4 <= elapsed < 2.0
+
+    @pytest.mark.asyncio
+    async def test_tightest_limit_applies(self):
+        """분당 한도가 더 작으면 분당 한도로 대기"""
+        now = [0.0]
+        bucket = TokenBucket([(10, 1.0), (3, 60.0)], clock=lambda: now[0])
+
+        for _ in range(3):
+            await bucket.acquire()
+
+        async def advance(seconds):
+            now[0] += seconds
+
+        with patch('backend.app.market_data.candle_fetcher.asyncio.sleep', side_effect=advance) as mock_sleep:
+            await bucket.acquire()
+
+        assert mock_sleep.await_args[0][0] == pytest.approx(20.0)
+
+    def test_requires_limit(self):
+        with pytest.raises(ValueError):
+            TokenBucket([])
+
+
+class TestUpbitCandleFetcher:
+    """UpbitCandleFetcher 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pages_backwards_until_start(self):
+        """200개씩 역방향 조회 후 기간 내 캔들만 반환"""
+        stub = UpbitStub()
+        end = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        start = end - timedelta(hours=450)
+
+        async with UpbitCandleFetcher(base_url='http://stub/v1', transport=stub.transport(),
+                                      rate_limiter=TokenBucket([(1000, 1.0)])) as fetcher:
+            df = await fetcher.fetch_candles('KRW-BTC', '1H', start, end)
+
+        assert len(stub.requests) == 3
+        assert stub.requests[0].url.params['count'] == str(BATCH_SIZE)
+        assert len(df) == 450
+        assert df['timestamp'].is_monotonic_increasing
+        assert df['timestamp'].iloc[-1] == pd.Timestamp(end)
+        assert df['timestamp'].iloc[0] > pd.Timestamp(start)
+
+    @pytest.mark.asyncio
+    async def test_retries_after_429(self):
+        stub = UpbitStub(status_codes=[429])
+        end = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+        with patch('backend.app.market_data.candle_fetcher.RETRY_DELAY', 0):
+            async with UpbitCandleFetcher(base_url='http://stub/v1', transport=stub.transport()) as fetcher:
+                df = await fetcher.fetch_candles('KRW-BTC', '1D', end - timedelta(days=5), end)
+
+        assert len(stub.requests) == 2
+        assert len(df) == 5
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_per_stream(self, tmp_path):
+        """한 스트림의 실패가 다른 스트림에 영향을 주지 않음"""
+        stub = UpbitStub()
+
+        results = await fetch_candle_streams(
+            ['KRW-BTC'], ['1D', '3D'], days=3,
+            base_url='http://stub/v1', transport=stub.transport(), data_root=str(tmp_path),
+        )
+
+        assert [r['success'] for r in results] == [True, False]
+        assert '지원하지 않는 타임프레임' in results[1]['error']
+
+    @pytest.mark.asyncio
+    async def test_merges_with_existing_file(self, tmp_path):
+        """기존 파일과 timestamp 기준 병합 (새 데이터 우선)"""
+        stub = UpbitStub()
+        options = dict(base_url='http://stub/v1', transport=stub.transport(), data_root=str(tmp_path))
+
+        with patch('backend.app.market_data.candle_fetcher.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 3, 10, tzinfo=timezone.utc)
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            await fetch_candle_streams(['KRW-BTC'], ['1D'], days=5, **options)
+            mock_datetime.now.return_value = datetime(2024, 3, 12, tzinfo=timezone.utc)
+            results = await fetch_candle_streams(['KRW-BTC'], ['1D'], days=5, **options)
+
+        saved = pd.read_parquet(tmp_path / 'KRW-BTC' / '1D' / '2024.parquet')
+        assert results[0]['files'] == [str(tmp_path / 'KRW-BTC' / '1D' / '2024.parquet')]
+        assert len(saved) == 7
+        assert saved['timestamp'].is_unique and saved['timestamp'].is_monotonic_increasing
+
+
+class TestBatchFetchJob:
+    """batch_fetch_candles_job 테스트"""
+
+    def test_full_refresh_is_bound_by_rate_limit(self, tmp_path):
+        """9개 심볼 × 5개 타임프레임을 동시에 수집, 소요 시간은 요청 수 / 초당 한도"""
+        stub = UpbitStub()
+        symbols = [f'KRW-C{i}' for i in range(9)]
+        timeframes = ['1H', '4H', '1D', '1W', '1Mo']
+
+        async def fetch_streams(*args, **kwargs):
+            return await fetch_candle_streams(*args, **kwargs, transport=stub.transport())
+
+        with patch('backend.app.jobs.data_ingestion.fetch_candle_streams', side_effect=fetch_streams), \
+                patch.dict(os.environ, {'DATA_ROOT': str(tmp_path), 'UPBIT_API_URL': 'http://stub/v1',
+                                        'UPBIT_REQUESTS_PER_SECOND': '50'}):
+            started = time.monotonic()
+            result = batch_fetch_candles_job(symbols, timeframes, days=30)
+            elapsed = time.monotonic() - started
+
+        # 스트림당 요청: 1H 4페이지, 나머지 1페이지
+        assert result['completed'] == 45 and result['failed'] == 0
+        assert len(stub.requests) == 9 * (4 + 4)
+        # 버스트 50 이후 초당 50개 → (72 - 50) / 50 ≈ 0.44초
+        assert 0.35 <= elapsed < 1.5
+        window = [t for t in stub.request_times if t - stub.request_times[0] < 1.0]
+        assert len(window) <= 100
+        assert list((tmp_path / 'KRW-C8' / '1Mo').glob('*.parquet'))
+
+    @pytest.mark.asyncio
+    async def test_job_runs_inside_event_loop(self, tmp_path):
+        """이벤트 루프 실행 중(API 즉시 실행)에도 동기 작업 호출 가능"""
+        stub = UpbitStub()
+
+        async def fetch_streams(*args, **kwargs):
+            return await fetch_candle_streams(*args, **kwargs, transport=stub.transport())
+
+        with patch('backend.app.jobs.data_ingestion.fetch_candle_streams', side_effect=fetch_streams), \
+                patch.dict(os.environ, {'DATA_ROOT': str(tmp_path), 'UPBIT_API_URL': 'http://stub/v1'}):
+            result = fetch_candles_job('KRW-BTC', '1D', days=3)
+
+        assert result['success'] is True
+        assert result['records'] == 3
@@ -0,0 +1,126 @@
+"""
+CandleWriteBuffer 유닛 테스트
+
+크기/시간 기준 배치 플러시, Redis 파이프라인, 실패 처리, 지표를 검증합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from backend.app.market_data.candle_builder import CandleData
+from backend.app.market_data.candle_writer import CandleWriteBuffer
+
+
+def _candle(symbol, minute=0):
+    return CandleData(
+        symbol=symbol,
+        timeframe='1m',
+        timestamp=datetime(2024, 1, 1, 9, 0) + timedelta(minutes=minute),
+        open=100.0,
+        high=101.0,
+        low=99.0,
+        close=100.5,
+        volume=10.0,
+    )
+
+
+def _mock_db():
+    db = Mock()
+    db.insert_candles_async = AsyncMock(side_effect=lambda rows: len(rows))
+    return db
+
+
+class TestCandleWriteBuffer:
+    """CandleWriteBuffer 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_minute_burst_is_coalesced(self):
+        """같은 분에 마감된 캔들은 한 번의 INSERT/파이프라인/콜백으로 처리"""
+        db = _mock_db()
+        redis_client = MagicMock()
+        on_flushed = AsyncMock()
+        buffer = CandleWriteBuffer(
+            db=db, redis_client=redis_client, on_flushed=on_flushed,
+            batch_size=500, max_delay_ms=20,
+        )
+
+        for i in range(300):
+            buffer.add(_candle(f'KRW-C{i}'))
+        assert buffer.queue_depth == 300
+
+        await asyncio.sleep(0.1)
+
+        db.insert_candles_async.assert_awaited_once()
+        rows = db.insert_candles_async.call_args[0][0]
+        assert len(rows) == 300
+        assert rows[0][:2] == ('KRW-C0', '1m')
+
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe = redis_client.pipeline.return_value
+        assert pipe.xadd.call_count == 300
+        assert pipe.xadd.call_args_list[0][0][0] == 'market_candles:KRW-C0:1m'
+        pipe.execute.assert_called_once()
+
+        on_flushed.assert_awaited_once()
+        assert len(on_flushed.call_args[0][0]) == 300
+
+        metrics = buffer.get_metrics()
+        assert metrics['queue_depth'] == 0
+        assert metrics['max_queue_depth'] == 300
+        assert metrics['batches_flushed'] == 1
+        assert metrics['candles_flushed'] == 300
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size_without_waiting_deadline(self):
+        """배치 크기에 도달하면 지연 시간을 기다리지 않고 플러시"""
+        db = _mock_db()
+        buffer = CandleWriteBuffer(db=db, batch_size=10, max_delay_ms=60_000)
+
+        for i in range(25):
+            buffer.add(_candle('KRW-BTC', minute=i))
+        await asyncio.sleep(0.05)
+
+        assert [len(call.args[0]) for call in db.insert_candles_async.call_args_list] == [10, 10]
+        assert buffer.queue_depth == 5
+
+        # 종료 시 남은 캔들도 즉시 플러시
+        await asyncio.wait_for(buffer.flush(), timeout=1)
+        assert buffer.queue_depth == 0
+        assert buffer.candles_flushed == 25
+
+    @pytest.mark.asyncio
+    async def test_failed_save_skips_broadcast_and_callback(self):
+        """저장 실패 배치는 브로드캐스트/콜백하지 않고 다음 배치는 정상 처리"""
+        db = Mock()
+        db.insert_candles_async = AsyncMock(side_effect=[RuntimeError('db down'), 1])
+        redis_client = MagicMock()
+        on_flushed = AsyncMock()
+        buffer = CandleWriteBuffer(
+            db=db, redis_client=redis_client, on_flushed=on_flushed,
+            batch_size=1, max_delay_ms=0,
+        )
+
+        buffer.add(_candle('KRW-BTC', minute=0))
+        buffer.add(_candle('KRW-BTC', minute=1))
+        await buffer.flush()
+
+        assert buffer.failed_batches == 1
+        assert buffer.batches_flushed == 1
+        assert redis_client.pipeline.return_value.execute.call_count == 1
+        on_flushed.assert_awaited_once()
+        assert on_flushed.call_args[0][0][0].timestamp == datetime(2024, 1, 1, 9, 1)
+
+    @pytest.mark.asyncio
+    async def test_redis_without_pipeline(self):
+        """pipeline이 없는 클라이언트는 개별 xadd로 대체"""
+        redis_client = Mock(spec=['xadd'])
+        buffer = CandleWriteBuffer(redis_client=redis_client, batch_size=2, max_delay_ms=0)
+
+        buffer.add(_candle('KRW-BTC'))
+        buffer.add(_candle('KRW-ETH'))
+        await buffer.flush()
+
+        assert redis_client.xadd.call_count == 2
@@ -23,6 +23,10 @@ from backend.app.data_loader import (
     _normalize_timezone,
     _extract_years_from_range,
     _validate_dataframe,
+    _read_parquet_pushdown,
+    load_ohlcv_tail,
+    LOADER_MODE_DATASET,
+    LOADER_MODE_PANDAS,
 )
 
 
@@ -317,5 +321,157 @@ class TestLoadOhlcvData:
         assert (result['timestamp'].iloc[:-1].values <= result['timestamp'].iloc[1:].values).all()
 
 
+class TestDatasetLoaderMode:
+    """pyarrow.dataset 푸시다운 로더 모드 테스트"""
+
+    @pytest.fixture
+    def minute_data_dir(self):
+        """분봉 테스트 데이터 (여러 row group으로 저장)"""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+
+            naive_dir = tmpdir_path / "BTC_KRW" / "1M"
+            naive_dir.mkdir(parents=True)
+            dates = pd.date_range('2024-01-01', '2024-01-31', freq='min')
+            df_naive = pd.DataFrame({
+                'timestamp': dates,
+                'open': np.random.rand(len(dates)) * 100,
+                'high': np.random.rand(len(dates)) * 100,
+                'low': np.random.rand(len(dates)) * 100,
+                'close': np.random.rand(len(dates)) * 100,
+                'volume': np.random.rand(len(dates)) * 1000,
+                'extra': np.random.rand(len(dates)),
+            })
+            df_naive.to_parquet(naive_dir / '2024.parquet', row_group_size=10_000)
+
+            # timezone-aware timestamp 파일
+            aware_dir = tmpdir_path / "ETH_KRW" / "1M"
+            aware_dir.mkdir(parents=True)
+            df_aware = df_naive.copy()
+            df_aware['timestamp'] = df_aware['timestamp'].dt.tz_localize('UTC')
+            df_aware.to_parquet(aware_dir / '2024.parquet', row_group_size=10_000)
+
+            yield tmpdir_path
+
+    @pytest.mark.parametrize("symbol", ["BTC_KRW", "ETH_KRW"])
+    def test_dataset_mode_matches_pandas_mode(self, minute_data_dir, symbol):
+        """dataset 모드 결과가 pandas 모드와 동일"""
+        kwargs = dict(
+            symbols=[symbol],
+            start_date="2024-01-10T09:30:00+09:00",
+            end_date="2024-01-12T18:00:00+09:00",
+            timeframe="1m",
+            data_root=str(minute_data_dir),
+        )
+        expected = load_ohlcv_data(mode=LOADER_MODE_PANDAS, **kwargs)
+        result = load_ohlcv_data(mode=LOADER_MODE_DATASET, **kwargs)
+
+        assert len(result) > 0
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_pushdown_reads_only_requested_range(self, minute_data_dir):
+        """푸시다운 결과는 요청 기간과 필요한 컬럼만 포함"""
+        start = pd.Timestamp("2024-01-10", tz="Asia/Seoul").tz_convert("UTC")
+        end = pd.Timestamp("2024-01-10 23:59", tz="Asia/Seoul").tz_convert("UTC")
+
+        df = _read_parquet_pushdown(
+            minute_data_dir / "BTC_KRW" / "1M" / "2024.parquet", start, end
+        )
+
+        assert len(df) == 24 * 60
+        assert 'extra' not in df.columns
+
+    def test_mode_from_environment(self, minute_data_dir, monkeypatch):
+        """DATA_LOADER_MODE 환경변수로 모드 선택"""
+        monkeypatch.setenv("DATA_LOADER_MODE", LOADER_MODE_DATASET)
+        result = load_ohlcv_data(
+            symbols=["BTC_KRW"],
+            start_date="2024-01-10",
+            end_date="2024-01-10T00:09:00+09:00",
+            timeframe="1m",
+            data_root=str(minute_data_dir),
+        )
+        assert len(result) == 10
+
+    def test_unsupported_mode_raises_error(self, minute_data_dir):
+        """지원하지 않는 로더 모드"""
+        with pytest.raises(HTTPException) as exc_info:
+            load_ohlcv_data(
+                symbols=["BTC_KRW"],
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+                timeframe="1m",
+                data_root=str(minute_data_dir),
+                mode="unknown",
+            )
+        assert exc_info.value.status_code == 422
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestLoadOhlcvTail:
+    """최근 N봉 조회 테스트"""
+
+    @pytest.fixture
+    def daily_data_dir(self):
+        """2022~2024 일봉 (연도 파일별 여러 row group)"""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            data_dir = tmpdir_path / "BTC_KRW" / "1D"
+            data_dir.mkdir(parents=True)
+
+            dates = pd.date_range('2022-01-01', '2024-03-31', freq='D')
+            df = pd.DataFrame({
+                'timestamp': dates,
+                'open': np.arange(len(dates), dtype=float),
+                'high': np.arange(len(dates), dtype=float),
+                'low': np.arange(len(dates), dtype=float),
+                'close': np.arange(len(dates), dtype=float),
+                'volume': np.ones(len(dates)),
+            })
+            for year, year_df in df.groupby(df['timestamp'].dt.year):
+                year_df.to_parquet(data_dir / f'{year}.parquet', index=False, row_group_size=30)
+
+            yield tmpdir_path
+
+    @pytest.mark.parametrize("bars", [1, 60, 91, 120, 5000])
+    def test_matches_full_load_tail(self, daily_data_dir, bars):
+        """전체 로드의 마지막 N행과 동일 (연도 경계 포함)"""
+        expected = load_ohlcv_data(
+            symbols=["BTC_KRW"], start_date="2022-01-01", end_date="2024-12-31",
+            timeframe="1D", data_root=str(daily_data_dir),
+        ).tail(bars).reset_index(drop=True)
+
+        result = load_ohlcv_tail("BTC_KRW", bars, timeframe="1d", data_root=str(daily_data_dir))
+
+        assert len(result) == min(bars, len(expected))
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_reads_only_last_row_groups(self, daily_data_dir, monkeypatch):
+        """필요한 연도 파일의 마지막 row group만 읽음"""
+        import pyarrow.parquet as pq
+
+        reads = []
+        original = pq.ParquetFile.read_row_groups
+
+        def spy(self, row_groups, *args, **kwargs):
+            reads.append(list(row_groups))
+            return original(self, row_groups, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_groups', spy)
+        load_ohlcv_tail("BTC_KRW", 60, timeframe="1D", data_root=str(daily_data_dir))
+
+        # 2024년 (91행, row group 30/30/30/1) 마지막 3개만
+        assert reads == [[1, 2, 3]]
+
+    def test_missing_symbol_raises_404(self, daily_data_dir):
+        with pytest.raises(HTTPException) as exc_info:
+            load_ohlcv_tail("ETH_KRW", 60, data_root=str(daily_data_dir))
+        assert exc_info.value.status_code == 404
+
+    def test_invalid_bars_raises_422(self, daily_data_dir):
+        with pytest.raises(HTTPException) as exc_info:
+            load_ohlcv_tail("BTC_KRW", 0, data_root=str(daily_data_dir))
+        assert exc_info.value.status_code == 422
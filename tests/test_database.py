@@ -0,0 +1,217 @@
+"""
+DatabaseManager 비동기 백엔드 테스트
+
+동시 쿼리 상한과 대기 지표, asyncpg 백엔드의 쿼리 변환/실행, 백엔드 선택 설정을 검증합니다.
+(실제 PostgreSQL 없이 풀/연결을 대체하여 검증)
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app import database
+from backend.app.database import (
+    AsyncPGDatabaseManager,
+    DatabaseManager,
+    _to_asyncpg_query,
+    create_db_manager,
+)
+
+
+class FakeConnection:
+    """asyncpg 연결 대체 (호출 기록)"""
+
+    def __init__(self):
+        self.calls = []
+        self.in_transaction = False
+
+    async def execute(self, query, *args):
+        self.calls.append(('execute', query, args))
+
+    async def fetchrow(self, query, *args):
+        self.calls.append(('fetchrow', query, args))
+        return {'id': 1}
+
+    async def fetch(self, query, *args):
+        self.calls.append(('fetch', query, args))
+        return [{'id': 1}, {'id': 2}]
+
+    async def fetchval(self, query, *args):
+        self.calls.append(('fetchval', query, args))
+        return 42
+
+    async def executemany(self, query, rows):
+        self.calls.append(('executemany', query, rows, self.in_transaction))
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    def transaction(self):
+        return self._transaction()
+
+
+class FakePool:
+    """asyncpg 풀 대체"""
+
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def _acquire(self):
+        yield self.conn
+
+    def acquire(self):
+        return self._acquire()
+
+
+class TestThreadBackend:
+    """psycopg2 백엔드의 스레드 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_pool_size(self):
+        """동시에 스레드로 보내는 쿼리 수는 pool_size 이하, 대기 시간 기록"""
+        db = DatabaseManager(database_url='postgresql://test', pool_size=2)
+        lock = threading.Lock()
+        active = {'now': 0, 'max': 0}
+
+        def blocking_query():
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            time.sleep(0.05)
+            with lock:
+                active['now'] -= 1
+
+        await asyncio.gather(*(db._run_in_thread(blocking_query) for _ in range(6)))
+
+        assert active['max'] == 2
+        metrics = db.get_pool_metrics()
+        assert metrics['backend'] == 'psycopg2'
+        assert metrics['acquired'] == 6
+        assert metrics['waiting'] == 0
+        assert metrics['in_use'] == 0
+        assert metrics['max_wait_ms'] >= 40
+
+
+class TestAsyncPGBackend:
+    """asyncpg 백엔드 테스트"""
+
+    def test_placeholder_conversion(self):
+        """%s 플레이스홀더를 $n으로 변환"""
+        assert _to_asyncpg_query("SELECT * FROM t WHERE a = %s AND b = %s::uuid") == \
+            "SELECT * FROM t WHERE a = $1 AND b = $2::uuid"
+
+    @pytest.mark.asyncio
+    async def test_hot_path_methods_use_native_pool(self):
+        """핫패스 비동기 메서드는 스레드 없이 asyncpg 연결로 실행"""
+        db = AsyncPGDatabaseManager(database_url='postgresql://test')
+        pool = FakePool()
+        db.async_pool = pool
+
+        position_id = await db.insert_position_async('KRW-BTC', 's1', datetime(2024, 1, 1), 100.0, 0.1, 0.01)
+        await db.update_position_unrealized_pnl_async(42, 110.0)
+        trades = await db.get_closed_trades_async(symbol='KRW-BTC', limit=5)
+        saved = await db.insert_candles_async([
+            ('KRW-BTC', '1m', datetime(2024, 1, 1, 9, 0), 1, 2, 0.5, 1.5, 10),
+            ('KRW-BTC', '1m', datetime(2024, 1, 1, 9, 0), 1, 2, 0.5, 1.6, 11),
+            ('KRW-ETH', '1m', datetime(2024, 1, 1, 9, 0), 1, 2, 0.5, 1.5, 10),
+        ])
+
+        assert position_id == 42
+        assert trades == [{'id': 1}, {'id': 2}]
+        assert saved == 2
+
+        kinds = [call[0] for call in pool.conn.calls]
+        assert kinds == ['fetchval', 'execute', 'fetch', 'executemany']
+
+        _, query, args = pool.conn.calls[1]
+        assert '$4' in query and '%s' not in query
+        assert args == (110.0, 110.0, 110.0, 42)
+
+        _, query, args = pool.conn.calls[2]
+        assert 'symbol = $1' in query and 'LIMIT $2' in query
+        assert args == ('KRW-BTC', 5)
+
+        _, query, rows, in_transaction = pool.conn.calls[3]
+        assert 'VALUES ($1, $2, $3, $4, $5, $6, $7, $8)' in query
+        assert in_transaction
+        # 같은 키는 마지막 값만 저장
+        assert [row[6] for row in rows] == [1.6, 1.5]
+
+        assert db.get_pool_metrics()['acquired'] == 4
+
+
+    @pytest.mark.asyncio
+    async def test_naive_datetime_is_bound_as_utc(self, monkeypatch):
+        """naive datetime은 프로세스 시간대와 무관하게 UTC로 바인딩"""
+        monkeypatch.setenv('TZ', 'Asia/Seoul')
+        time.tzset()
+        try:
+            db = AsyncPGDatabaseManager(database_url='postgresql://test')
+            pool = FakePool()
+            db.async_pool = pool
+
+            naive = datetime(2024, 1, 1, 9, 0)
+            aware = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+            await db.insert_position_async('KRW-BTC', 's1', naive, 100.0, 0.1, 0.01)
+            await db.insert_candles_async([('KRW-BTC', '1m', naive, 1, 2, 0.5, 1.5, 10)])
+            await db.fetch_all_async("SELECT * FROM t WHERE ts >= %s", (aware,))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        _, _, args = pool.conn.calls[0]
+        _, _, rows, _ = pool.conn.calls[1]
+        _, _, fetch_args = pool.conn.calls[2]
+        for bound in (args[2], rows[0][2], fetch_args[0]):
+            # asyncpg 인코더와 같은 astimezone(utc) 변환에서 벽시계 시각 유지
+            assert bound.tzinfo is not None
+            assert bound.astimezone(timezone.utc) == aware
+
+
+class TestBackendSelection:
+    """DATABASE_BACKEND 설정 테스트"""
+
+    def test_default_backend(self, monkeypatch):
+        monkeypatch.delenv('DATABASE_BACKEND', raising=False)
+        monkeypatch.setenv('DATABASE_POOL_SIZE', '7')
+        db = create_db_manager()
+        assert type(db) is DatabaseManager
+        assert db.pool_size == 7
+
+    def test_asyncpg_backend(self, monkeypatch):
+        monkeypatch.setenv('DATABASE_BACKEND', 'asyncpg')
+        monkeypatch.setattr(database, 'HAS_ASYNCPG', True)
+        assert isinstance(create_db_manager(), AsyncPGDatabaseManager)
+
+    def test_asyncpg_missing_falls_back(self, monkeypatch):
+        monkeypatch.setenv('DATABASE_BACKEND', 'asyncpg')
+        monkeypatch.setattr(database, 'HAS_ASYNCPG', False)
+        assert type(create_db_manager()) is DatabaseManager
+
+
+class TestPoolMetricsEndpoint:
+    """DB 풀 지표 모니터링 API 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics_endpoint(self, monkeypatch):
+        from backend.app.routers.monitoring import get_database_pool_metrics
+
+        db = DatabaseManager(database_url='postgresql://test', pool_size=3)
+        monkeypatch.setattr(database, 'get_db', lambda: db)
+
+        response = await get_database_pool_metrics()
+
+        assert response['status'] == 'success'
+        assert response['data']['backend'] == 'psycopg2'
+        assert response['data']['pool_size'] == 3
+        assert response['data']['acquired'] == 0
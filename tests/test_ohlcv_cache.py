@@ -0,0 +1,170 @@
+"""
+ohlcv_cache 모듈 유닛 테스트
+
+정규화된 연도 프레임의 캐시 적중, mtime/size 기반 무효화, 바이트 예산 LRU 축출과
+load_ohlcv_data 연동을 검증합니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.app.data_loader import load_ohlcv_data
+from backend.app.ohlcv_cache import OHLCVFrameCache, get_ohlcv_cache, reset_ohlcv_cache
+
+
+def _write_year_file(root: Path, symbol: str, periods: int = 100) -> Path:
+    """테스트용 연도 parquet 파일 생성"""
+    file_dir = root / symbol / "1D"
+    file_dir.mkdir(parents=True, exist_ok=True)
+    dates = pd.date_range('2024-01-01', periods=periods, freq='D')
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'open': np.random.rand(periods) * 100,
+        'high': np.random.rand(periods) * 100,
+        'low': np.random.rand(periods) * 100,
+        'close': np.random.rand(periods) * 100,
+        'volume': np.random.rand(periods) * 1000,
+    })
+    file_path = file_dir / "2024.parquet"
+    df.to_parquet(file_path)
+    return file_path
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """테스트마다 새 전역 캐시 사용"""
+    monkeypatch.setenv("OHLCV_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+    reset_ohlcv_cache()
+    yield get_ohlcv_cache()
+    reset_ohlcv_cache()
+
+
+class TestOHLCVFrameCache:
+    """OHLCVFrameCache 단위 테스트"""
+
+    def test_hit_after_first_load(self, tmp_path):
+        """두 번째 조회는 loader를 호출하지 않음"""
+        file_path = _write_year_file(tmp_path, "BTC_KRW")
+        cache = OHLCVFrameCache(max_bytes=10 * 1024 * 1024)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return pd.read_parquet(file_path)
+
+        first = cache.get_or_load(file_path, loader)
+        second = cache.get_or_load(file_path, loader)
+
+        assert len(calls) == 1
+        assert first is second
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["current_bytes"] > 0
+
+    def test_invalidated_when_file_changes(self, tmp_path):
+        """파일 mtime/size가 바뀌면 다시 읽음"""
+        file_path = _write_year_file(tmp_path, "BTC_KRW", periods=100)
+        cache = OHLCVFrameCache(max_bytes=10 * 1024 * 1024)
+
+        first = cache.get_or_load(file_path, lambda: pd.read_parquet(file_path))
+        assert len(first) == 100
+
+        _write_year_file(tmp_path, "BTC_KRW", periods=150)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache.get_or_load(file_path, lambda: pd.read_parquet(file_path))
+        assert len(second) == 150
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_lru_eviction_under_byte_budget(self, tmp_path):
+        """바이트 예산 초과 시 가장 오래 사용하지 않은 항목 축출"""
+        paths = [_write_year_file(tmp_path, f"COIN{i}_KRW") for i in range(3)]
+        frame_bytes = int(pd.read_parquet(paths[0]).memory_usage(index=True, deep=True).sum())
+        cache = OHLCVFrameCache(max_bytes=frame_bytes * 2)
+
+        cache.get_or_load(paths[0], lambda: pd.read_parquet(paths[0]))
+        cache.get_or_load(paths[1], lambda: pd.read_parquet(paths[1]))
+        # paths[0]을 최근 사용으로 갱신
+        cache.get_or_load(paths[0], lambda: pd.read_parquet(paths[0]))
+        cache.get_or_load(paths[2], lambda: pd.read_parquet(paths[2]))
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["current_bytes"] <= frame_bytes * 2
+
+        # paths[1]이 축출되었으므로 다시 미스
+        misses_before = stats["misses"]
+        cache.get_or_load(paths[1], lambda: pd.read_parquet(paths[1]))
+        assert cache.get_stats()["misses"] == misses_before + 1
+
+    def test_disabled_cache_always_loads(self, tmp_path):
+        """max_bytes=0이면 캐시하지 않음"""
+        file_path = _write_year_file(tmp_path, "BTC_KRW")
+        cache = OHLCVFrameCache(max_bytes=0)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return pd.read_parquet(file_path)
+
+        cache.get_or_load(file_path, loader)
+        cache.get_or_load(file_path, loader)
+
+        assert len(calls) == 2
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestLoadOhlcvDataWithCache:
+    """load_ohlcv_data 캐시 연동 테스트"""
+
+    def test_repeated_loads_hit_cache(self, tmp_path, fresh_cache):
+        """같은 연도 파일 반복 조회 시 캐시 적중, 결과 동일"""
+        _write_year_file(tmp_path, "BTC_KRW")
+
+        kwargs = dict(
+            symbols=["BTC_KRW"],
+            start_date="2024-01-10",
+            end_date="2024-02-10",
+            timeframe="1d",
+            data_root=str(tmp_path),
+        )
+        first = load_ohlcv_data(**kwargs)
+        second = load_ohlcv_data(**kwargs)
+
+        pd.testing.assert_frame_equal(first, second)
+        stats = fresh_cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_caller_mutation_does_not_corrupt_cache(self, tmp_path, fresh_cache):
+        """반환된 프레임을 수정해도 캐시된 프레임은 그대로"""
+        _write_year_file(tmp_path, "BTC_KRW")
+
+        kwargs = dict(
+            symbols=["BTC_KRW"],
+            start_date="2024-01-01",
+            end_date="2024-12-31",
+            timeframe="1d",
+            data_root=str(tmp_path),
+        )
+        first = load_ohlcv_data(**kwargs)
+        expected_close = first['close'].copy()
+        first['close'] = 0.0
+
+        second = load_ohlcv_data(**kwargs)
+        pd.testing.assert_series_equal(second['close'], expected_close)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
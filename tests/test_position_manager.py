@@ -4,10 +4,14 @@ PositionManager 유닛 테스트
 포지션 진입/청산, 손익 계산, 포지션 조회를 검증합니다.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 
+from backend.app.simulation.mark_to_market import PositionBook
+from backend.app.simulation.performance_tracker import PerformanceAccumulator
 from backend.app.simulation.position_manager import PositionManager, Position
 from backend.app.market_data.candle_builder import CandleData
 from backend.app.strategies.base import Signal
@@ -117,7 +121,7 @@ class TestPositionEntry:
         """포지션 진입 성공 검증"""
         manager = PositionManager()
         mock_db = Mock(spec=DatabaseManager)
-        mock_db.insert_position.return_value = 123
+        mock_db.insert_position_async.return_value = 123
 
         manager.db = mock_db
         manager.session_id = 'test-session'
@@ -139,7 +143,7 @@ class TestPositionEntry:
         assert position.quantity == 0.1
 
         # DB 호출 검증
-        mock_db.insert_position.assert_called_once()
+        mock_db.insert_position_async.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_enter_position_already_open(self):
@@ -169,7 +173,7 @@ class TestPositionEntry:
         )
 
         assert position_id is None
-        mock_db.insert_position.assert_not_called()
+        mock_db.insert_position_async.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_enter_position_different_symbols(self):
@@ -178,7 +182,7 @@ class TestPositionEntry:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.insert_position.side_effect = [123, 124]
+        mock_db.insert_position_async.side_effect = [123, 124]
 
         # 첫 번째 포지션 진입 (KRW-BTC)
         await manager.enter_position(
@@ -211,8 +215,8 @@ class TestPositionClosing:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.update_position_on_close.return_value = None
-        mock_db.insert_trade.return_value = 456
+        mock_db.update_position_on_close_async.return_value = None
+        mock_db.insert_trade_async.return_value = 456
 
         # 오픈 포지션 설정
         position = Position(
@@ -239,17 +243,23 @@ class TestPositionClosing:
         assert 'KRW-BTC:volume_zone_breakout' not in manager.positions
 
         # DB 호출 검증
-        mock_db.update_position_on_close.assert_called_once()
-        mock_db.insert_trade.assert_called_once()
+        mock_db.update_position_on_close_async.assert_called_once()
+        mock_db.insert_trade_async.assert_called_once()
 
         # 거래 정보 검증
-        trade_args = mock_db.insert_trade.call_args[1]
+        trade_args = mock_db.insert_trade_async.call_args[1]
         assert trade_args['symbol'] == 'KRW-BTC'
         assert trade_args['strategy_name'] == 'volume_zone_breakout'
         assert trade_args['exit_price'] == 51000.0
         # realized_pnl = 0.1 * (51000 - 50000) - 50 - 0 = 100 - 50 = 50
         assert trade_args['realized_pnl'] == 50.0
 
+        # 누적 성과 반영
+        assert manager.performance.total_trades == 1
+        assert manager.performance.win_count == 1
+        assert manager.performance.total_pnl == 50.0
+        assert manager.performance.total_capital == 5000.0
+
     @pytest.mark.asyncio
     async def test_close_position_not_found(self):
         """포지션 없이 청산 시도 검증"""
@@ -267,7 +277,7 @@ class TestPositionClosing:
         )
 
         assert trade_id is None
-        mock_db.update_position_on_close.assert_not_called()
+        mock_db.update_position_on_close_async.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_close_position_with_loss(self):
@@ -276,8 +286,8 @@ class TestPositionClosing:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.update_position_on_close.return_value = None
-        mock_db.insert_trade.return_value = 456
+        mock_db.update_position_on_close_async.return_value = None
+        mock_db.insert_trade_async.return_value = 456
 
         # 오픈 포지션 설정
         position = Position(
@@ -301,7 +311,7 @@ class TestPositionClosing:
         )
 
         # 거래 정보 검증
-        trade_args = mock_db.insert_trade.call_args[1]
+        trade_args = mock_db.insert_trade_async.call_args[1]
         # realized_pnl = 0.1 * (49000 - 50000) - 50 = -100 - 50 = -150
         assert trade_args['realized_pnl'] == -150.0
 
@@ -312,8 +322,8 @@ class TestPositionClosing:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.update_position_on_close.return_value = None
-        mock_db.insert_trade.return_value = 456
+        mock_db.update_position_on_close_async.return_value = None
+        mock_db.insert_trade_async.return_value = 456
 
         # 오픈 포지션 설정
         position = Position(
@@ -336,7 +346,7 @@ class TestPositionClosing:
         )
 
         # 슬리피지가 자동 계산되었는지 검증
-        trade_args = mock_db.insert_trade.call_args[1]
+        trade_args = mock_db.insert_trade_async.call_args[1]
 
         # 자동 계산된 슬리피지 = exit_price * quantity * slippage_rate
         # = 51000 * 0.1 * 0.0002 = 1.02
@@ -355,8 +365,8 @@ class TestPositionClosing:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.update_position_on_close.return_value = None
-        mock_db.insert_trade.return_value = 456
+        mock_db.update_position_on_close_async.return_value = None
+        mock_db.insert_trade_async.return_value = 456
 
         # 오픈 포지션 설정
         position = Position(
@@ -381,7 +391,7 @@ class TestPositionClosing:
         )
 
         # 전달된 슬리피지가 사용되었는지 검증
-        trade_args = mock_db.insert_trade.call_args[1]
+        trade_args = mock_db.insert_trade_async.call_args[1]
         assert trade_args['slippage_amount'] == explicit_slippage
 
         # realized_pnl = 0.1 * (51000 - 50000) - 50 - 5.0 = 100 - 50 - 5.0 = 45.0
@@ -429,8 +439,10 @@ class TestUnrealizedPnLUpdate:
         assert position.current_price == 51000.0
         assert position.unrealized_pnl > 0
 
-        # DB 호출 검증
-        mock_db.update_position_unrealized_pnl.assert_called_once()
+        # DB 반영은 플러시 시 일괄 처리
+        mock_db.update_positions_unrealized_pnl_async.assert_not_called()
+        await manager.flush_marks()
+        mock_db.update_positions_unrealized_pnl_async.assert_called_once_with([(123, 51000.0)])
 
     @pytest.mark.asyncio
     async def test_update_unrealized_pnl_multiple_positions(self):
@@ -477,7 +489,145 @@ class TestUnrealizedPnLUpdate:
         # 두 포지션 모두 업데이트되었는지 검증
         assert position1.current_price == 51000.0
         assert position2.current_price == 51000.0
-        assert mock_db.update_position_unrealized_pnl.call_count == 2
+
+        await manager.flush_marks()
+        mock_db.update_positions_unrealized_pnl_async.assert_called_once_with(
+            [(1, 51000.0), (2, 51000.0)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_marks_are_coalesced_per_flush(self):
+        """플러시 주기 안의 여러 캔들은 UPDATE 1회 + 포지션당 콜백 1회 (최신 가격)"""
+        manager = PositionManager()
+        manager.db = Mock(spec=DatabaseManager)
+        manager.mark_flush_interval = 0.02
+        updated = []
+        manager.set_position_updated_callback(
+            AsyncMock(side_effect=lambda position: updated.append(
+                (position.position_id, position.current_price)
+            ))
+        )
+
+        for i, symbol in enumerate(['KRW-BTC', 'KRW-BTC', 'KRW-ETH']):
+            manager.positions[f'{symbol}:s{i}'] = Position(
+                position_id=i + 1, symbol=symbol, strategy_name=f's{i}',
+                entry_time=datetime.now(), entry_price=100.0, quantity=1.0,
+            )
+
+        for close in [101.0, 102.0, 103.0]:
+            await manager.update_unrealized_pnl(CandleData(
+                symbol='KRW-BTC', timeframe='1m', timestamp=datetime.now(),
+                open=close, high=close, low=close, close=close, volume=1.0,
+            ))
+        assert updated == []
+
+        await asyncio.sleep(0.1)
+
+        manager.db.update_positions_unrealized_pnl_async.assert_called_once_with(
+            [(1, 103.0), (2, 103.0)]
+        )
+        assert sorted(updated) == [(1, 103.0), (2, 103.0)]
+
+    @pytest.mark.asyncio
+    async def test_closed_position_is_not_flushed(self):
+        """플러시 전에 청산된 포지션은 반영 대상에서 제외"""
+        manager = PositionManager()
+        manager.db = Mock(spec=DatabaseManager)
+        manager.positions['KRW-BTC:s1'] = Position(
+            position_id=1, symbol='KRW-BTC', strategy_name='s1',
+            entry_time=datetime.now(), entry_price=100.0, quantity=1.0,
+        )
+
+        await manager.update_unrealized_pnl(CandleData(
+            symbol='KRW-BTC', timeframe='1m', timestamp=datetime.now(),
+            open=110.0, high=110.0, low=110.0, close=110.0, volume=1.0,
+        ))
+        position = manager.positions.pop('KRW-BTC:s1')
+
+        assert await manager.flush_marks() == 0
+        manager.db.update_positions_unrealized_pnl_async.assert_not_called()
+        # 분리된 포지션은 마지막 평가 값을 유지
+        assert position.current_price == 110.0
+        assert position.unrealized_pnl == pytest.approx(10.0)
+
+
+class TestPositionBook:
+    """심볼별 배열 저장소 테스트"""
+
+    def test_vectorized_mark_matches_update_price(self):
+        """배열 평가 결과가 Position.update_price와 동일"""
+        book = PositionBook()
+        expected = []
+        for i in range(20):
+            position = Position(
+                position_id=i, symbol='KRW-BTC', strategy_name=f's{i}',
+                entry_time=datetime.now(), entry_price=100.0 + i,
+                quantity=0.1 * (i + 1), fee_amount=0.01 * i,
+            )
+            book[f'KRW-BTC:s{i}'] = position
+            reference = Position(
+                position_id=i, symbol='KRW-BTC', strategy_name=f's{i}',
+                entry_time=datetime.now(), entry_price=100.0 + i,
+                quantity=0.1 * (i + 1), fee_amount=0.01 * i,
+            )
+            reference.update_price(107.5)
+            expected.append(reference)
+
+        book.book('KRW-BTC').mark(107.5)
+
+        for i, reference in enumerate(expected):
+            position = book[f'KRW-BTC:s{i}']
+            assert position.current_price == reference.current_price
+            assert position.unrealized_pnl == pytest.approx(reference.unrealized_pnl)
+            assert position.unrealized_pnl_pct == pytest.approx(reference.unrealized_pnl_pct)
+
+    def test_remove_swaps_last_slot(self):
+        """삭제 시 마지막 슬롯이 빈 자리로 이동하고 나머지 값 유지"""
+        book = PositionBook()
+        for i in range(3):
+            book[f'KRW-BTC:s{i}'] = Position(
+                position_id=i, symbol='KRW-BTC', strategy_name=f's{i}',
+                entry_time=datetime.now(), entry_price=100.0 * (i + 1), quantity=1.0,
+            )
+        book['KRW-ETH:s0'] = Position(
+            position_id=9, symbol='KRW-ETH', strategy_name='s0',
+            entry_time=datetime.now(), entry_price=10.0, quantity=1.0,
+        )
+
+        del book['KRW-BTC:s0']
+        btc = book.book('KRW-BTC')
+        assert btc.size == 2
+        assert btc.price_rows() == [(2, 300.0), (1, 200.0)]
+        assert book['KRW-BTC:s2']._slot == 0
+
+        btc.mark(400.0)
+        assert book['KRW-BTC:s1'].unrealized_pnl == pytest.approx(200.0)
+        assert book['KRW-BTC:s2'].unrealized_pnl == pytest.approx(100.0)
+
+        book.pop('KRW-ETH:s0')
+        assert book.book('KRW-ETH') is None
+        assert [b.symbol for b in book.books()] == ['KRW-BTC']
+
+    def test_every_mutator_updates_books(self):
+        """setdefault/popitem/clear도 심볼별 저장소를 우회하지 않음"""
+        book = PositionBook()
+        for i, symbol in enumerate(['KRW-BTC', 'KRW-ETH']):
+            book.setdefault(f'{symbol}:s1', Position(
+                position_id=i, symbol=symbol, strategy_name='s1',
+                entry_time=datetime.now(), entry_price=100.0, quantity=1.0,
+            ))
+        assert [b.symbol for b in book.books()] == ['KRW-BTC', 'KRW-ETH']
+
+        _, position = book.popitem()
+        assert book.book(position.symbol) is None
+        assert position._book is None
+
+        with pytest.raises(TypeError):
+            book |= {}
+        assert not hasattr(book, 'copy')
+
+        book.clear()
+        assert book.books() == [] and book == {}
 
 
 class TestSignalHandling:
@@ -490,7 +640,7 @@ class TestSignalHandling:
         mock_db = Mock(spec=DatabaseManager)
 
         manager.db = mock_db
-        mock_db.insert_position.return_value = 123
+        mock_db.insert_position_async.return_value = 123
 
         signal = Mock(spec=Signal)
         signal.side = 'BUY'
@@ -501,7 +651,7 @@ class TestSignalHandling:
 
         # 포지션이 진입되었는지 검증
         assert 'KRW-BTC:strategy1' in manager.positions
-        mock_db.insert_position.assert_called_once()
+        mock_db.insert_position_async.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_on_signal_sell(self):
@@ -531,8 +681,8 @@ class TestSignalHandling:
 
         # 포지션이 청산되었는지 검증
         assert 'KRW-BTC:strategy1' not in manager.positions
-        mock_db.update_position_on_close.assert_called_once()
-        mock_db.insert_trade.assert_called_once()
+        mock_db.update_position_on_close_async.assert_called_once()
+        mock_db.insert_trade_async.assert_called_once()
 
 
 class TestPositionQuerying:
@@ -637,3 +787,49 @@ class TestPositionQuerying:
         assert summary['total_unrealized_pnl'] > 0  # 위에서 정의된 수수료에 따라 달라짐
         assert 'KRW-BTC' in summary['positions_by_symbol']
         assert 'KRW-ETH' in summary['positions_by_symbol']
+
+
+class TestPerformanceAccumulator:
+    """누적 성과 집계 테스트"""
+
+    def test_matches_full_recomputation_beyond_100_trades(self):
+        """100건 이상에서도 전체 재계산(청산 순서 기준)과 동일"""
+        import random
+
+        rng = random.Random(7)
+        trades = [
+            (rng.uniform(-50, 60), rng.uniform(90, 110), rng.uniform(0.1, 2.0))
+            for _ in range(250)
+        ]
+        accumulator = PerformanceAccumulator()
+        for pnl, entry_price, quantity in trades:
+            accumulator.record_trade(pnl, entry_price, quantity)
+
+        total_pnl = sum(pnl for pnl, _, _ in trades)
+        total_capital = sum(entry_price * quantity for _, entry_price, quantity in trades)
+        cumulative = peak = max_drawdown = 0.0
+        for pnl, _, _ in trades:
+            cumulative += pnl
+            peak = max(peak, cumulative)
+            max_drawdown = max(max_drawdown, peak - cumulative)
+
+        snapshot = accumulator.snapshot()
+        assert snapshot['total_trades'] == 250
+        assert snapshot['win_count'] == sum(1 for pnl, _, _ in trades if pnl > 0)
+        assert snapshot['lose_count'] == sum(1 for pnl, _, _ in trades if pnl < 0)
+        assert snapshot['total_pnl'] == round(total_pnl, 2)
+        assert snapshot['total_pnl_pct'] == round(total_pnl / total_capital * 100, 2)
+        assert snapshot['max_drawdown'] == round(max_drawdown, 2)
+
+    def test_empty_snapshot(self):
+        """거래가 없으면 0 값"""
+        snapshot = PerformanceAccumulator().snapshot()
+        assert snapshot == {
+            'total_pnl': 0.0,
+            'total_pnl_pct': 0.0,
+            'win_rate': 0.0,
+            'max_drawdown': 0.0,
+            'total_trades': 0,
+            'win_count': 0,
+            'lose_count': 0,
+        }
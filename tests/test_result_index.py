@@ -0,0 +1,145 @@
+"""
+히스토리 인덱스(ResultIndex) 테스트
+
+SQLite 인덱스의 필터/정렬/페이지네이션, 스키마 생성 횟수와 기존 인덱스 마이그레이션을 검증합니다.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.result_index import ResultIndex
+from backend.app.result_manager import ResultManager
+
+
+@pytest.fixture
+def temp_data_root():
+    """임시 데이터 루트 디렉토리"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+def _save_run(data_root, run_id, strategy="volume_zone_breakout", avg_returns=(1.0,),
+              total_signals=10, start_date="2024-01-01", end_date="2024-06-30"):
+    result_data = {
+        "run_id": run_id,
+        "strategy": strategy,
+        "symbols": [
+            {"symbol": f"SYM{i}_KRW", "avg_return": value}
+            for i, value in enumerate(avg_returns)
+        ],
+        "start_date": start_date,
+        "end_date": end_date,
+        "timeframe": "1d",
+        "total_signals": total_signals,
+        "execution_time": 1.0,
+    }
+    assert ResultManager.save_result(data_root, run_id, result_data)
+
+
+class TestResultIndex:
+    """ResultIndex 조회 테스트"""
+
+    def test_return_filter_uses_stored_average(self, temp_data_root):
+        """수익률 필터는 저장된 심볼 평균 수익률로 판정"""
+        _save_run(temp_data_root, "loss", avg_returns=(-2.0, 0.0))
+        _save_run(temp_data_root, "flat", avg_returns=(0.5, 1.5))
+        _save_run(temp_data_root, "gain", avg_returns=(4.0, 6.0))
+
+        # 결과 파일이 없어도 인덱스만으로 필터링
+        for run_id in ("loss", "flat", "gain"):
+            os.remove(os.path.join(temp_data_root, "results", f"{run_id}.json"))
+
+        history = ResultManager.get_history(temp_data_root, min_return=1.0)
+        assert [item["run_id"] for item in history["items"]] == ["gain", "flat"]
+
+        history = ResultManager.get_history(temp_data_root, min_return=0.0, max_return=2.0)
+        assert [item["run_id"] for item in history["items"]] == ["flat"]
+
+    def test_filters_and_pagination(self, temp_data_root):
+        """전략/신호 수/기간 필터와 최신순 페이지네이션"""
+        for i in range(5):
+            _save_run(
+                temp_data_root, f"run-{i}",
+                strategy="volume_long_candle" if i % 2 else "volume_zone_breakout",
+                total_signals=i * 10,
+                start_date=f"2024-0{i + 1}-01",
+            )
+
+        history = ResultManager.get_history(temp_data_root, limit=2, offset=1)
+        assert history["total"] == 5
+        assert [item["run_id"] for item in history["items"]] == ["run-3", "run-2"]
+
+        history = ResultManager.get_history(temp_data_root, strategy="volume_long_candle")
+        assert [item["run_id"] for item in history["items"]] == ["run-3", "run-1"]
+
+        history = ResultManager.get_history(temp_data_root, min_signals=15, max_signals=35)
+        assert [item["run_id"] for item in history["items"]] == ["run-3", "run-2"]
+
+        history = ResultManager.get_history(temp_data_root, date_from="2024-03-01")
+        assert [item["run_id"] for item in history["items"]] == ["run-4", "run-3", "run-2"]
+
+    def test_overwrite_keeps_position(self, temp_data_root):
+        """같은 run_id 재저장 시 값은 갱신되고 순서는 유지"""
+        _save_run(temp_data_root, "first", total_signals=1)
+        _save_run(temp_data_root, "second")
+        _save_run(temp_data_root, "first", total_signals=99)
+
+        history = ResultManager.get_history(temp_data_root)
+        assert [item["run_id"] for item in history["items"]] == ["second", "first"]
+        assert history["items"][1]["total_signals"] == 99
+        assert history["items"][1]["symbols"] == ["SYM0_KRW"]
+
+    def test_backfill_from_legacy_index(self, temp_data_root):
+        """index.db가 없으면 기존 index.json/index.journal과 결과 파일로 채움"""
+        _save_run(temp_data_root, "old", avg_returns=(-1.0,))
+        _save_run(temp_data_root, "new", avg_returns=(3.0,))
+        _save_run(temp_data_root, "newest", avg_returns=(5.0,))
+        items = ResultManager.get_history(temp_data_root)["items"]
+        os.remove(ResultIndex.get_db_path(temp_data_root))
+
+        # 이전 형식: 스냅샷(최신순) + 저널 추가분 (같은 run_id는 스냅샷 위치에서 교체)
+        results_dir = os.path.join(temp_data_root, "results")
+        with open(os.path.join(results_dir, "index.json"), "w") as f:
+            json.dump({"generation": 1, "items": [items[1], items[2]]}, f)
+        with open(os.path.join(results_dir, "index.journal"), "w") as f:
+            f.write(json.dumps({"generation": 1}) + "\n")
+            f.write(json.dumps(items[0]) + "\n")
+            f.write(json.dumps({**items[2], "total_signals": 77}) + "\n")
+
+        history = ResultManager.get_history(temp_data_root, min_return=0.0)
+
+        assert [item["run_id"] for item in history["items"]] == ["newest", "new"]
+        history = ResultManager.get_history(temp_data_root)
+        assert [item["run_id"] for item in history["items"]] == ["newest", "new", "old"]
+        assert history["items"][2]["total_signals"] == 77
+        assert ResultManager.get_latest_run_id(temp_data_root) == "newest"
+
+    def test_schema_created_once_per_process(self, temp_data_root):
+        """스키마 생성은 DB 경로별 최초 연결에서만 실행"""
+        _save_run(temp_data_root, "first")
+
+        scripts = []
+
+        class RecordingConnection(sqlite3.Connection):
+            def executescript(self, script):
+                scripts.append(script)
+                return super().executescript(script)
+
+        connect = sqlite3.connect
+        with patch("backend.app.result_index.sqlite3.connect",
+                   side_effect=lambda *args, **kwargs: connect(*args, factory=RecordingConnection, **kwargs)):
+            _save_run(temp_data_root, "second")
+            ResultManager.get_history(temp_data_root)
+            assert ResultManager.get_latest_run_id(temp_data_root) == "second"
+        assert scripts == []
+
+        # DB 파일이 삭제되면 다시 생성
+        os.remove(ResultIndex.get_db_path(temp_data_root))
+        assert ResultManager.get_latest_run_id(temp_data_root) is None
@@ -334,13 +334,12 @@ class TestResultManager:
         result_file = os.path.join(temp_data_root, "results", f"{run_id}.json")
         assert os.path.exists(result_file)
 
-        # 인덱스 파일이 생성되었는지 확인
-        index_file = os.path.join(temp_data_root, "results", "index.json")
-        assert os.path.exists(index_file)
+        # 인덱스 DB가 생성되었는지 확인 (이전 형식 인덱스 파일은 쓰지 않음)
+        assert os.path.exists(os.path.join(temp_data_root, "results", "index.db"))
+        assert not os.path.exists(os.path.join(temp_data_root, "results", "index.journal"))
 
         # 인덱스 내용 검증
-        with open(index_file, "r") as f:
-            index_data = json.load(f)
+        index_data = ResultManager.get_history(temp_data_root)
 
         assert "items" in index_data
         assert len(index_data["items"]) == 1
@@ -460,11 +459,143 @@ class TestResultManager:
         ResultManager.save_result(temp_data_root, run_id, result_data)
 
         # 인덱스 확인
-        index_file = os.path.join(temp_data_root, "results", "index.json")
-        with open(index_file, "r") as f:
-            index_data = json.load(f)
+        index_data = ResultManager.get_history(temp_data_root)
 
         # 동일한 run_id의 항목이 하나만 있어야 함
         matching_items = [item for item in index_data["items"] if item["run_id"] == run_id]
         assert len(matching_items) == 1
         assert matching_items[0]["total_signals"] == 20  # 업데이트된 값
+
+
+def _make_result_data(run_id: str, num_signals: int = 3) -> dict:
+    """심볼 결과를 포함한 BacktestResponse 호환 dict"""
+    symbols = []
+    for symbol, base_return in [("BTC_KRW", 0.02), ("ETH_KRW", -0.01)]:
+        signals = [
+            {
+                "symbol": symbol,
+                "type": "buy",
+                "timestamp": f"2024-01-{i + 1:02d}T15:00:00+00:00",
+                "entry_price": 100.0 + i,
+                "exit_price": 101.0 + i,
+                "return_pct": base_return,
+            }
+            for i in range(num_signals)
+        ]
+        curve = [
+            {"timestamp": f"2024-01-{i + 1:02d}", "equity": 1.0 + base_return * (i + 1), "drawdown": None}
+            for i in range(num_signals)
+        ]
+        symbols.append({
+            "symbol": symbol,
+            "is_active": True,
+            "signals": signals,
+            "win_rate": 1.0 if base_return > 0 else 0.0,
+            "avg_return": base_return * 100,
+            "max_drawdown": 0.0,
+            "avg_hold_bars": 1.0,
+            "performance_curve": curve,
+        })
+    return {
+        "version": "1.1.0",
+        "run_id": run_id,
+        "strategy": "volume_zone_breakout",
+        "params": {"volume_window": 10},
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-31",
+        "timeframe": "1d",
+        "symbols": symbols,
+        "total_signals": num_signals * 2,
+        "execution_time": 1.5,
+        "metadata": None,
+        "description": None,
+    }
+
+
+class TestParquetResultFormat:
+    """RESULT_FILE_FORMAT=parquet 결과 저장/조회 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def parquet_format(self, monkeypatch):
+        monkeypatch.setenv("RESULT_FILE_FORMAT", "parquet")
+
+    def test_save_writes_parquet_tables(self, temp_data_root):
+        """run.json + 3개 Parquet 테이블 저장, JSON 결과 파일은 생성하지 않음"""
+        run_id = "parquet-run"
+        assert ResultManager.save_result(temp_data_root, run_id, _make_result_data(run_id))
+
+        result_dir = os.path.join(temp_data_root, "results", run_id)
+        for filename in ("run.json", "symbol_summary.parquet",
+                         "symbol_signals.parquet", "performance_curve.parquet"):
+            assert os.path.exists(os.path.join(result_dir, filename))
+        assert not os.path.exists(os.path.join(temp_data_root, "results", f"{run_id}.json"))
+        assert ResultManager.result_exists(temp_data_root, run_id)
+        assert ResultManager.get_latest_run_id(temp_data_root) == run_id
+
+    def test_round_trip_matches_json_format(self, temp_data_root, monkeypatch):
+        """Parquet에서 복원한 결과가 JSON 형식 조회 결과와 동일"""
+        run_id = "round-trip"
+        result_data = _make_result_data(run_id)
+        ResultManager.save_result(temp_data_root, run_id, result_data)
+        from_parquet = ResultManager.get_result(temp_data_root, run_id)
+
+        monkeypatch.setenv("RESULT_FILE_FORMAT", "json")
+        ResultManager.save_result(temp_data_root, run_id, _make_result_data(run_id))
+        assert not os.path.exists(os.path.join(temp_data_root, "results", run_id))
+        from_json = ResultManager.get_result(temp_data_root, run_id)
+
+        assert from_parquet == from_json
+
+    def test_get_result_without_signals(self, temp_data_root):
+        """signals/performance_curve 제외 조회"""
+        run_id = "summary-only"
+        ResultManager.save_result(temp_data_root, run_id, _make_result_data(run_id))
+
+        result = ResultManager.get_result(
+            temp_data_root, run_id, include_signals=False, include_performance_curve=False
+        )
+
+        assert [sym["symbol"] for sym in result["symbols"]] == ["BTC_KRW", "ETH_KRW"]
+        for sym in result["symbols"]:
+            assert "signals" not in sym
+            assert "performance_curve" not in sym
+            assert sym["is_active"] is True
+
+    def test_symbol_toggle_persists(self, temp_data_root):
+        """is_active 변경 후 재저장 시 반영"""
+        run_id = "toggle"
+        ResultManager.save_result(temp_data_root, run_id, _make_result_data(run_id))
+
+        result = ResultManager.get_result(temp_data_root, run_id)
+        result["symbols"][1]["is_active"] = False
+        assert ResultManager.save_result(temp_data_root, run_id, result)
+
+        reloaded = ResultManager.get_result(temp_data_root, run_id)
+        assert [sym["is_active"] for sym in reloaded["symbols"]] == [True, False]
+        assert len(reloaded["symbols"][1]["signals"]) == 3
+
+    def test_empty_symbols(self, temp_data_root):
+        """심볼 결과가 없는 실행도 저장/조회 가능"""
+        run_id = "empty"
+        result_data = _make_result_data(run_id)
+        result_data["symbols"] = []
+        ResultManager.save_result(temp_data_root, run_id, result_data)
+
+        assert ResultManager.get_result(temp_data_root, run_id)["symbols"] == []
+
+    def test_history_return_filter_uses_summary(self, temp_data_root):
+        """수익률 필터가 심볼 요약의 평균 수익률로 동작"""
+        low = _make_result_data("low")
+        high = _make_result_data("high")
+        for sym in high["symbols"]:
+            sym["avg_return"] = 5.0
+        ResultManager.save_result(temp_data_root, "low", low)
+        ResultManager.save_result(temp_data_root, "high", high)
+
+        history = ResultManager.get_history(temp_data_root, min_return=1.0)
+
+        assert [item["run_id"] for item in history["items"]] == ["high"]
+        assert ResultManager.get_symbol_summaries(temp_data_root, "high", columns=["avg_return"]) == [
+            {"symbol": "BTC_KRW", "avg_return": 5.0},
+            {"symbol": "ETH_KRW", "avg_return": 5.0},
+        ]
@@ -10,7 +10,14 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from backend.app.strategies.base import Signal, BacktestResult
-from backend.app.strategies.volume_long_candle import VolumeLongCandleStrategy
+from backend.app.strategies.metrics import (
+    calculate_entry_exit_prices,
+    calculate_returns,
+    calculate_metrics,
+    calculate_trade_arrays,
+    calculate_metrics_from_arrays,
+)
+from backend.app.strategies.volume_long_candle import VolumeLongCandleStrategy, _RollingVolumeMean
 from backend.app.strategies.volume_zone_breakout import VolumeZoneBreakoutStrategy
 
 
@@ -221,6 +228,104 @@ class TestVolumeZoneBreakout:
         if result.samples == 0:
             assert result.max_drawdown == 0.0
 
+    @pytest.mark.parametrize("seed,params", [
+        (0, {}),
+        (1, {'volume_window': 10, 'top_percentile': 0.2, 'breakout_buffer': 0.0, 'num_bins': 20}),
+        (2, {'volume_window': 30, 'top_percentile': 0.05, 'breakout_buffer': 0.01, 'num_bins': 7}),
+        (3, {'volume_window': 15, 'top_percentile': 0.5, 'breakout_buffer': 0.0, 'include_wicks': False}),
+        (4, {'volume_window': 5, 'top_percentile': 1.0, 'num_bins': 3, 'hold_period_bars': 3}),
+    ])
+    def test_vectorized_engine_matches_loop(self, seed, params):
+        """vectorized 엔진과 loop 엔진의 신호/수익률이 정확히 일치"""
+        rng = np.random.default_rng(seed)
+        n = 400
+        close = 100 + np.cumsum(rng.normal(0, 1.5, n))
+        open_ = close + rng.normal(0, 0.8, n)
+        high = np.maximum(open_, close) + rng.uniform(0, 1.5, n)
+        low = np.minimum(open_, close) - rng.uniform(0, 1.5, n)
+        # 높이가 0인 캔들 포함
+        flat = rng.choice(n, size=20, replace=False)
+        open_[flat] = close[flat]
+        high[flat] = close[flat]
+        low[flat] = close[flat]
+
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=n, freq='h', tz='UTC'),
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': rng.uniform(100, 5000, n),
+        })
+
+        strategy = VolumeZoneBreakoutStrategy()
+        loop_result = strategy.run(df, {**params, 'engine': 'loop'})
+        vectorized_result = strategy.run(df, {**params, 'engine': 'vectorized'})
+
+        assert loop_result.samples > 0
+        assert vectorized_result.signals == loop_result.signals
+        assert vectorized_result.entry_exit_pairs == loop_result.entry_exit_pairs
+        assert vectorized_result.returns == loop_result.returns
+        assert vectorized_result.max_drawdown == loop_result.max_drawdown
+
+    @pytest.mark.parametrize("seed,params", [
+        (5, {'volume_window': 3, 'top_percentile': 0.05, 'num_bins': 13, 'include_wicks': False}),
+        (6, {'volume_window': 4, 'top_percentile': 0.2, 'num_bins': 20}),
+        (7, {'volume_window': 25, 'top_percentile': 0.5, 'num_bins': 7, 'include_wicks': False}),
+    ])
+    def test_engines_match_with_zero_volume_windows(self, seed, params):
+        """총 거래량이 0인 윈도우는 신호 없이 슬라이드 (loop/vectorized/실시간 모드 일치)"""
+        rng = np.random.default_rng(seed)
+        n = 300
+        # bin 경계(첫 윈도우) 범위를 벗어나지 않도록 평균 회귀 가격
+        close = 100 + rng.normal(0, 3, n)
+        open_ = close + rng.normal(0, 0.8, n)
+        volume = rng.uniform(100, 5000, n)
+        # 흩어진 0 거래량 캔들 + 윈도우 전체가 0인 구간
+        volume[rng.random(n) < 0.3] = 0.0
+        volume[100:140] = 0.0
+
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-01', periods=n, freq='h', tz='UTC'),
+            'open': open_,
+            'high': np.maximum(open_, close) + rng.uniform(0, 1.5, n),
+            'low': np.minimum(open_, close) - rng.uniform(0, 1.5, n),
+            'close': close,
+            'volume': volume,
+        })
+
+        strategy = VolumeZoneBreakoutStrategy()
+        loop_result = strategy.run(df, {**params, 'engine': 'loop'})
+        vectorized_result = strategy.run(df, {**params, 'engine': 'vectorized'})
+        streamed = _stream_signals(VolumeZoneBreakoutStrategy(), df, params, params['volume_window'])
+
+        assert vectorized_result.signals == loop_result.signals
+        assert vectorized_result.returns == loop_result.returns
+        assert [s.timestamp for s in streamed] == [s.timestamp for s in loop_result.signals]
+        assert [s.confidence for s in streamed] == [s.confidence for s in loop_result.signals]
+        # 0 거래량 구간이 지나면 다시 신호 생성
+        assert any(s.timestamp > df['timestamp'].iloc[140 + params['volume_window']]
+                   for s in loop_result.signals)
+
+    def test_vectorized_engine_chunked_state(self, monkeypatch, sample_ohlcv_data):
+        """청크 경계를 넘어가는 윈도우 상태도 loop 엔진과 일치"""
+        monkeypatch.setattr(VolumeZoneBreakoutStrategy, 'VECTORIZED_CHUNK_BARS', 7)
+        strategy = VolumeZoneBreakoutStrategy()
+        params = {'volume_window': 10, 'top_percentile': 0.2, 'breakout_buffer': 0.0}
+
+        loop_result = strategy.run(sample_ohlcv_data, {**params, 'engine': 'loop'})
+        vectorized_result = strategy.run(sample_ohlcv_data, {**params, 'engine': 'vectorized'})
+
+        assert vectorized_result.signals == loop_result.signals
+        assert vectorized_result.returns == loop_result.returns
+
+    def test_invalid_engine(self, sample_ohlcv_data):
+        """지원하지 않는 엔진은 ValueError"""
+        strategy = VolumeZoneBreakoutStrategy()
+
+        with pytest.raises(ValueError):
+            strategy.run(sample_ohlcv_data, {'engine': 'gpu'})
+
 
 class TestMetricsCalculation:
     """성과 지표 계산 테스트"""
@@ -301,6 +406,39 @@ class TestMetricsCalculation:
         except ValueError:
             pytest.fail("BacktestResult validation failed")
 
+    @pytest.mark.parametrize("hold_period_bars", [1, 3, 50])
+    def test_trade_arrays_match_list_functions(self, sample_ohlcv_data, hold_period_bars):
+        """배열 기반 거래 계산이 리스트 기반 함수와 동일한 결과"""
+        df = sample_ohlcv_data.reset_index(drop=True)
+        signal_indices = [0, 5, 22, 57, 80, 98, 99]
+
+        pairs = calculate_entry_exit_prices(signal_indices, df, hold_period_bars)
+        returns = calculate_returns(pairs)
+        expected_metrics = calculate_metrics(returns, hold_period_bars)
+
+        trades = calculate_trade_arrays(signal_indices, df['close'].values, hold_period_bars)
+        metrics = calculate_metrics_from_arrays(trades, hold_period_bars)
+
+        assert trades.entry_exit_pairs() == pairs
+        assert trades.returns.tolist() == returns
+        assert metrics['win_rate'] == expected_metrics['win_rate']
+        assert metrics['avg_return'] == pytest.approx(expected_metrics['avg_return'])
+        assert metrics['max_drawdown'] == expected_metrics['max_drawdown']
+
+        # 자본 곡선은 거래별 복리 누적
+        equity = 1.0
+        for i, ret in enumerate(returns):
+            equity *= (1.0 + ret / 100.0)
+            assert trades.equity[i] == equity
+        assert (trades.drawdown <= 0).all()
+
+    def test_metrics_from_empty_trades(self):
+        """빈 거래 배열은 ValueError"""
+        trades = calculate_trade_arrays([], np.array([1.0, 2.0]), 1)
+
+        with pytest.raises(ValueError):
+            calculate_metrics_from_arrays(trades, 1)
+
 
 class TestSignalValidation:
     """Signal 데이터 검증 테스트"""
@@ -741,5 +879,102 @@ class TestPhase2Metadata:
         assert current_version < "2.0.0", "Current version should be < 2.0.0"
 
 
+
+def _stream_signals(strategy, df, params, history_bars):
+    """앞 history_bars개로 초기화한 뒤 나머지 캔들을 process_candle로 처리"""
+    strategy.initialize_with_history(df.iloc[:history_bars], params)
+    signals = []
+    for row in df.iloc[history_bars:].to_dict('records'):
+        signal = strategy.process_candle(row)
+        if signal is not None:
+            signals.append(signal)
+    return signals
+
+
+def _random_walk_ohlcv(n, seed):
+    """신호가 충분히 나오는 랜덤 워크 OHLCV 데이터"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    open_ = close + rng.normal(0, 1, n)
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 1, n),
+        'low': np.minimum(open_, close) - rng.uniform(0, 1, n),
+        'close': close,
+        'volume': rng.lognormal(7, 1, n),
+    })
+
+
+class TestRealtimeStreaming:
+    """실시간 모드(initialize_with_history + process_candle)와 배치 run() 신호 일치 테스트"""
+
+    @pytest.mark.parametrize('history_bars', [0, 5, 30, 200])
+    @pytest.mark.parametrize('params', [
+        {'vol_ma_window': 20, 'vol_multiplier': 1.5, 'body_pct': 0.005},
+        {'vol_ma_window': 3, 'vol_multiplier': 1.1, 'body_pct': 0.001},
+    ])
+    def test_volume_long_candle_matches_batch(self, params, history_bars):
+        df = _random_walk_ohlcv(600, seed=1)
+        expected = [
+            s for s in VolumeLongCandleStrategy().run(df, params).signals
+            if s.timestamp >= df['timestamp'].iloc[history_bars]
+        ]
+        assert expected
+
+        signals = _stream_signals(VolumeLongCandleStrategy(), df, params, history_bars)
+
+        assert [s.timestamp for s in signals] == [s.timestamp for s in expected]
+        assert [s.price for s in signals] == [s.price for s in expected]
+        assert [s.confidence for s in signals] == [s.confidence for s in expected]
+
+    @pytest.mark.parametrize('history_bars', [0, 5, 30, 200])
+    @pytest.mark.parametrize('params', [
+        {'volume_window': 10, 'top_percentile': 0.2},
+        {'volume_window': 25, 'top_percentile': 0.3, 'breakout_buffer': 0.001,
+         'num_bins': 7, 'include_wicks': False},
+    ])
+    def test_volume_zone_breakout_matches_batch(self, params, history_bars):
+        df = _random_walk_ohlcv(600, seed=2)
+        expected = [
+            s for s in VolumeZoneBreakoutStrategy().run(df, {**params, 'engine': 'loop'}).signals
+            if s.timestamp >= df['timestamp'].iloc[history_bars]
+        ]
+        assert expected
+
+        signals = _stream_signals(VolumeZoneBreakoutStrategy(), df, params, history_bars)
+
+        assert [s.timestamp for s in signals] == [s.timestamp for s in expected]
+        assert [s.price for s in signals] == [s.price for s in expected]
+        assert [s.confidence for s in signals] == [s.confidence for s in expected]
+
+    @pytest.mark.parametrize('window', [1, 3, 20, 57])
+    def test_rolling_volume_mean_matches_pandas(self, window):
+        """증분 이동평균이 pandas rolling().mean()과 비트 단위까지 일치"""
+        rng = np.random.default_rng(window)
+        volume = rng.lognormal(7, 2, 3000)
+        volume[rng.random(3000) < 0.05] = 0.0
+        volume[rng.random(3000) < 0.05] = volume[0]  # 동일 값 연속 구간
+
+        expected = pd.Series(volume).rolling(window, min_periods=1).mean().to_numpy()
+        rolling = _RollingVolumeMean(window)
+        actual = np.array([rolling.update(v) for v in volume])
+
+        assert np.array_equal(actual, expected)
+
+    def test_buffers_stay_bounded(self):
+        """처리한 캔들 수와 무관하게 버퍼 크기는 윈도우로 고정"""
+        df = _random_walk_ohlcv(300, seed=3)
+
+        long_candle = VolumeLongCandleStrategy()
+        _stream_signals(long_candle, df, {'vol_ma_window': 20}, history_bars=50)
+        assert len(long_candle._vol_mean.values) == 20
+
+        zone = VolumeZoneBreakoutStrategy()
+        _stream_signals(zone, df, {'volume_window': 10}, history_bars=50)
+        assert len(zone._window_candles) == 10
+        assert zone._warmup_candles == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -11,7 +11,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
-from backend.app.simulation.strategy_runner import StrategyRunner, StrategyConfig
+from backend.app.simulation.strategy_runner import StrategyRunner, StrategyConfig, StrategyRegistry
 from backend.app.market_data.candle_builder import CandleData
 from backend.app.strategies.base import Signal
 from backend.app.database import DatabaseManager
@@ -270,11 +270,58 @@ class TestStrategyInitialization:
         runner.db = mock_db
         runner.strategies['KRW-BTC:volume_zone_breakout'] = config
 
-        # 히스토리 없이도 초기화 가능
+        # 히스토리 없이도 초기화 가능 (빈 윈도우 + 등록 파라미터)
         await runner.initialize_strategy('KRW-BTC', 'volume_zone_breakout')
 
         assert config.is_initialized is True
-        mock_strategy.initialize_with_history.assert_not_called()
+        mock_strategy.initialize_with_history.assert_called_once()
+        df, params = mock_strategy.initialize_with_history.call_args[0]
+        assert df.empty
+        assert params is config.params
+
+    @pytest.mark.asyncio
+    async def test_initialize_strategy_no_history_keeps_params(self):
+        """히스토리가 없어도 등록 파라미터로 실시간 판정 (기본값으로 대체되지 않음)"""
+        from backend.app.strategies.volume_long_candle import VolumeLongCandleStrategy
+
+        runner = StrategyRunner()
+        mock_db = AsyncMock(spec=DatabaseManager)
+        mock_db.fetch_all_async.return_value = []
+        runner.db = mock_db
+
+        params = {'vol_ma_window': 3, 'vol_multiplier': 10.0, 'body_pct': 0.05}
+        config = StrategyConfig('KRW-BTC', 'volume_long_candle', params)
+        config.strategy_instance = VolumeLongCandleStrategy()
+        runner.strategies['KRW-BTC:volume_long_candle'] = config
+
+        await runner.initialize_strategy('KRW-BTC', 'volume_long_candle')
+
+        strategy = config.strategy_instance
+        assert strategy._vol_mean.values.maxlen == 3
+        assert strategy._vol_multiplier == 10.0
+        assert strategy._body_pct == 0.05
+
+        # 거래량 평균의 2배는 기본 배수(1.5)로는 신호지만 등록 배수(10)로는 신호 아님
+        start = datetime(2024, 1, 1)
+        for i, volume in enumerate([100.0, 100.0, 100.0, 200.0]):
+            candle = {
+                'timestamp': start + timedelta(minutes=i),
+                'open': 100.0, 'high': 111.0, 'low': 99.0, 'close': 110.0, 'volume': volume,
+            }
+            assert strategy.process_candle(candle) is None
+
+    def test_process_candle_requires_initialization(self):
+        """initialize_with_history() 없이 process_candle() 호출 시 명확한 오류"""
+        from backend.app.strategies.volume_long_candle import VolumeLongCandleStrategy
+        from backend.app.strategies.volume_zone_breakout import VolumeZoneBreakoutStrategy
+
+        candle = {
+            'timestamp': datetime(2024, 1, 1),
+            'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.0, 'volume': 10.0,
+        }
+        for strategy in (VolumeLongCandleStrategy(), VolumeZoneBreakoutStrategy()):
+            with pytest.raises(RuntimeError, match='initialize_with_history'):
+                strategy.process_candle(candle)
 
     @pytest.mark.asyncio
     async def test_initialize_strategy_already_initialized(self):
@@ -490,7 +537,7 @@ class TestSignalGeneration:
         """신호 생성 및 DB 저장 검증"""
         runner = StrategyRunner()
         mock_db = Mock(spec=DatabaseManager)
-        mock_db.insert_signal.return_value = 123
+        mock_db.insert_signal_async.return_value = 123
 
         runner.db = mock_db
         runner.on_signal = AsyncMock()
@@ -504,7 +551,7 @@ class TestSignalGeneration:
         await runner._on_signal_generated(signal, 'KRW-BTC', 'volume_zone_breakout')
 
         # DB에 저장되었는지 확인
-        mock_db.insert_signal.assert_called_once()
+        mock_db.insert_signal_async.assert_called_once()
         # 콜백 호출 확인
         runner.on_signal.assert_called_once_with(signal, 'KRW-BTC', 'volume_zone_breakout')
 
@@ -543,7 +590,7 @@ class TestSignalGeneration:
         # 콜백 없어도 에러 없음
         await runner._on_signal_generated(signal, 'KRW-BTC', 'volume_zone_breakout')
 
-        mock_db.insert_signal.assert_called_once()
+        mock_db.insert_signal_async.assert_called_once()
 
 
 class TestStrategyRunnerLifecycle:
@@ -644,3 +691,107 @@ class TestStrategyRetrieval:
         assert status['session_id'] == 'test-session-456'
         assert status['strategy_count'] == 1
         assert len(status['strategies']) == 1
+
+
+def _config(symbol, strategy_name, signal=None):
+    config = StrategyConfig(symbol, strategy_name, {})
+    config.strategy_instance = Mock()
+    config.strategy_instance.process_candle.return_value = signal
+    config.is_initialized = True
+    return config
+
+
+def _candle(symbol):
+    return CandleData(
+        symbol=symbol,
+        timeframe='1m',
+        timestamp=datetime(2024, 1, 1, 9, 0),
+        open=100.0,
+        high=101.0,
+        low=99.0,
+        close=100.5,
+        volume=1000.0,
+    )
+
+
+class TestSymbolDispatch:
+    """심볼별 디스패치 인덱스 및 일괄 처리 테스트"""
+
+    def test_registry_index_follows_mutations(self):
+        """추가/교체/삭제 시 심볼 인덱스 갱신"""
+        registry = StrategyRegistry()
+        registry['KRW-BTC:s1'] = _config('KRW-BTC', 's1')
+        registry['KRW-BTC:s2'] = _config('KRW-BTC', 's2')
+        registry['KRW-ETH:s1'] = _config('KRW-ETH', 's1')
+
+        assert [c.strategy_name for c in registry.for_symbol('KRW-BTC')] == ['s1', 's2']
+
+        # 같은 키를 다른 심볼 설정으로 교체
+        registry['KRW-BTC:s2'] = _config('KRW-XRP', 's2')
+        assert [c.strategy_name for c in registry.for_symbol('KRW-BTC')] == ['s1']
+        assert len(registry.for_symbol('KRW-XRP')) == 1
+
+        del registry['KRW-ETH:s1']
+        registry.pop('KRW-BTC:s1')
+        assert registry.for_symbol('KRW-ETH') == []
+        assert registry.symbols() == ['KRW-XRP']
+
+    def test_registry_index_follows_every_mutator(self):
+        """setdefault/popitem/update/clear도 심볼 인덱스를 우회하지 않음"""
+        registry = StrategyRegistry()
+        registry.setdefault('KRW-BTC:s1', _config('KRW-BTC', 's1'))
+        registry.update({'KRW-ETH:s1': _config('KRW-ETH', 's1')})
+        assert registry.symbols() == ['KRW-BTC', 'KRW-ETH']
+
+        key, config = registry.popitem()
+        assert registry.for_symbol(config.symbol) == []
+        assert len(registry) == 1
+
+        # 인덱스를 거치지 않는 dict 전용 연산은 제공하지 않음
+        with pytest.raises(TypeError):
+            registry |= {'KRW-XRP:s1': _config('KRW-XRP', 's1')}
+        assert not hasattr(registry, 'copy')
+
+        registry.clear()
+        assert registry.symbols() == [] and len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_process_candle_only_touches_symbol_strategies(self):
+        """다른 심볼 전략은 조회/실행하지 않고, 캔들 dict는 전략 간 공유"""
+        runner = StrategyRunner()
+        btc1 = _config('KRW-BTC', 's1')
+        btc2 = _config('KRW-BTC', 's2')
+        runner.strategies['KRW-BTC:s1'] = btc1
+        runner.strategies['KRW-BTC:s2'] = btc2
+        others = [_config(f'KRW-C{i}', 's1') for i in range(100)]
+        for config in others:
+            runner.strategies[f'{config.symbol}:s1'] = config
+
+        await runner.process_candle(_candle('KRW-BTC'))
+
+        first_arg = btc1.strategy_instance.process_candle.call_args[0][0]
+        assert btc2.strategy_instance.process_candle.call_args[0][0] is first_arg
+        assert first_arg['close'] == 100.5
+        assert all(not c.strategy_instance.process_candle.called for c in others)
+
+    @pytest.mark.asyncio
+    async def test_process_candles_batch(self):
+        """같은 분에 마감된 캔들을 일괄 평가한 후 신호 처리"""
+        runner = StrategyRunner()
+        runner.on_signal = AsyncMock()
+
+        signal = Signal(timestamp=datetime(2024, 1, 1, 9, 0), side='BUY', price=100.5, confidence=0.8)
+        runner.strategies['KRW-BTC:s1'] = _config('KRW-BTC', 's1', signal)
+        runner.strategies['KRW-ETH:s1'] = _config('KRW-ETH', 's1', signal)
+        failing = _config('KRW-XRP', 's1')
+        failing.strategy_instance.process_candle.side_effect = RuntimeError('boom')
+        runner.strategies['KRW-XRP:s1'] = failing
+
+        count = await runner.process_candles(
+            [_candle('KRW-BTC'), _candle('KRW-XRP'), _candle('KRW-ETH'), _candle('KRW-DOGE')]
+        )
+
+        assert count == 2
+        called_symbols = [call.args[1] for call in runner.on_signal.call_args_list]
+        assert called_symbols == ['KRW-BTC', 'KRW-ETH']
+
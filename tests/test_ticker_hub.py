@@ -0,0 +1,182 @@
+"""
+TickerHub 유닛 테스트
+
+업스트림 구독 공유, 구독자별 마켓 단위 병합, 업스트림 수명 관리, 스냅샷/델타 계산,
+/ws/tickers/krw 중계를 검증합니다.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.market_data.ticker_hub import (
+    MockTickerFeed,
+    TickerHub,
+    normalize_ticker,
+    ticker_delta,
+    ticker_snapshot,
+)
+
+
+async def _markets():
+    return ['KRW-BTC', 'KRW-ETH']
+
+
+def _upbit_ticker(code, price):
+    return {
+        'type': 'ticker', 'code': code, 'trade_price': price, 'change_rate': 0.01,
+        'acc_trade_volume_24h': 10, 'acc_trade_price_24h': 1000,
+    }
+
+
+class DelayedTickerFeed(MockTickerFeed):
+    """연결 후 잠시 뒤부터 시세를 전달하는 피드 (스냅샷 이후 수신 보장)"""
+
+    async def stream(self, market_codes):
+        await asyncio.sleep(0.05)
+        async for ticker in super().stream(market_codes):
+            yield ticker
+
+
+class TestTickerHub:
+    """TickerHub 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_upstream_shared_by_subscribers(self):
+        """구독자 수와 무관하게 업스트림 1개, 같은 직렬화 결과를 전달"""
+        feed = MockTickerFeed()
+        hub = TickerHub(_markets, feed=feed)
+        subscriptions = [hub.subscribe() for _ in range(5)]
+
+        feed.push(_upbit_ticker('KRW-BTC', 100))
+        batches = [await asyncio.wait_for(s.next_batch(), timeout=1) for s in subscriptions]
+
+        assert feed.connections == 1
+        assert hub.get_status()['upstream_connects'] == 1
+        frames = [batch[0][1] for batch in batches]
+        assert all(frame is frames[0] for frame in frames)
+        assert json.loads(frames[0]) == {
+            'type': 'ticker', 'market': 'KRW-BTC', 'trade_price': 100.0, 'change_rate': 0.01,
+            'acc_trade_volume_24h': 10.0, 'acc_trade_price_24h': 1000.0,
+        }
+        assert hub.latest['KRW-BTC']['trade_price'] == 100.0
+
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_latest_per_market(self):
+        """느린 구독자의 대기열은 마켓별 최신 시세로 합쳐짐"""
+        feed = MockTickerFeed()
+        hub = TickerHub(_markets, feed=feed)
+        subscription = hub.subscribe()
+
+        for price in (100, 101, 102):
+            feed.push(_upbit_ticker('KRW-BTC', price))
+        feed.push(_upbit_ticker('KRW-ETH', 5))
+        await asyncio.sleep(0.01)
+
+        batch = subscription.drain()
+        assert [(t['market'], t['trade_price']) for t, _ in batch] == [
+            ('KRW-BTC', 102.0), ('KRW-ETH', 5.0),
+        ]
+        assert subscription.coalesced == 2
+
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_upstream_follows_subscribers(self):
+        """마지막 구독자가 나가면 업스트림 종료, 다시 구독하면 재연결"""
+        feed = MockTickerFeed()
+        hub = TickerHub(_markets, feed=feed)
+
+        first = hub.subscribe()
+        await asyncio.sleep(0.01)
+        hub.unsubscribe(first)
+        await asyncio.sleep(0.01)
+        assert not hub.get_status()['upstream_running']
+
+        hub.subscribe()
+        await asyncio.sleep(0.01)
+        assert hub.get_status()['upstream_running']
+        assert feed.connections == 2
+
+        await hub.close()
+
+
+class TestSnapshotDelta:
+    """스냅샷 + 델타 메시지 테스트"""
+
+    def test_snapshot_is_columnar(self):
+        snapshot = ticker_snapshot([normalize_ticker(_upbit_ticker('KRW-BTC', 100))])
+        assert snapshot['fields'] == [
+            'market', 'trade_price', 'change_rate', 'acc_trade_volume_24h', 'acc_trade_price_24h',
+        ]
+        assert snapshot['data'] == [['KRW-BTC', 100.0, 0.01, 10.0, 1000.0]]
+
+    def test_delta_contains_only_changed_fields(self):
+        """바뀐 마켓의 바뀐 필드만, 새 마켓은 전체 필드"""
+        state = {'KRW-BTC': normalize_ticker(_upbit_ticker('KRW-BTC', 100))}
+
+        changes = ticker_delta(state, [
+            normalize_ticker(_upbit_ticker('KRW-BTC', 101)),
+            normalize_ticker(_upbit_ticker('KRW-ETH', 5)),
+        ])
+        assert changes == {
+            'KRW-BTC': {'trade_price': 101.0},
+            'KRW-ETH': {
+                'trade_price': 5.0, 'change_rate': 0.01,
+                'acc_trade_volume_24h': 10.0, 'acc_trade_price_24h': 1000.0,
+            },
+        }
+        assert state['KRW-BTC']['trade_price'] == 101.0
+
+        # 같은 값 재수신은 델타 없음
+        assert ticker_delta(state, [normalize_ticker(_upbit_ticker('KRW-BTC', 101))]) == {}
+
+
+class TestTickerWebSocket:
+    """/ws/tickers/krw 중계 테스트"""
+
+    def test_clients_share_hub(self):
+        """여러 클라이언트가 같은 허브를 통해 시세 수신"""
+        feed = MockTickerFeed()
+        hub = TickerHub(_markets, feed=feed)
+        feed.push(_upbit_ticker('KRW-BTC', 100))
+
+        with patch('backend.app.routers.markets.get_ticker_hub', return_value=hub), \
+                patch('backend.app.routers.markets.get_cached_tickers', return_value=None):
+            client = TestClient(app)
+            with client.websocket_connect('/api/markets/ws/tickers/krw') as ws:
+                message = ws.receive_json()
+
+        assert message['type'] == 'ticker'
+        assert message['market'] == 'KRW-BTC'
+        assert feed.connections == 1
+
+    def test_delta_mode(self):
+        """delta 모드: 캐시 전체 스냅샷 후 바뀐 필드만 전송"""
+        feed = DelayedTickerFeed()
+        hub = TickerHub(_markets, feed=feed)
+        cached = [
+            {'market': 'KRW-BTC', 'trade_price': 100, 'change_rate': 0.01,
+             'acc_trade_volume_24h': 10, 'acc_trade_price_24h': 1000},
+            {'market': 'KRW-ETH', 'trade_price': 5, 'change_rate': 0.01,
+             'acc_trade_volume_24h': 10, 'acc_trade_price_24h': 1000},
+        ]
+        feed.push(_upbit_ticker('KRW-BTC', 100))  # 스냅샷과 같은 값 → 델타 없음
+        feed.push(_upbit_ticker('KRW-ETH', 6))
+
+        with patch('backend.app.routers.markets.get_ticker_hub', return_value=hub), \
+                patch('backend.app.routers.markets.get_cached_tickers', return_value=cached):
+            client = TestClient(app)
+            with client.websocket_connect('/api/markets/ws/tickers/krw?mode=delta&interval_ms=50') as ws:
+                snapshot = ws.receive_json()
+                delta = ws.receive_json()
+
+        assert snapshot['type'] == 'snapshot'
+        assert [row[0] for row in snapshot['data']] == ['KRW-BTC', 'KRW-ETH']
+        assert delta == {'type': 'delta', 'data': {'KRW-ETH': {'trade_price': 6.0}}}
@@ -0,0 +1,212 @@
+"""
+SimulationWebSocketServer 유닛 테스트
+
+이벤트 히스토리 링 버퍼, 재연결 시 재전송(sync), 1회 직렬화 브로드캐스트를 검증합니다.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.app.simulation.event_history import EventRingBuffer
+from backend.app.simulation.websocket_server import (
+    ClientConnection,
+    EventType,
+    PerformanceMetrics,
+    Signal,
+    SimulationWebSocketServer,
+)
+
+
+class FakeWebSocket:
+    """전송 메시지를 기록하는 WebSocket 대체"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+class SlowWebSocket(FakeWebSocket):
+    """release 전까지 전송이 멈추는 WebSocket"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.closed = False
+
+    async def send(self, message):
+        await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=''):
+        self.closed = True
+
+
+def _add_client(server, client_id, websocket, symbols=()):
+    server.clients[client_id] = ClientConnection(
+        client_id=client_id, websocket=websocket, subscribed_symbols=set(symbols),
+    )
+
+
+def _signal(i=0):
+    return Signal(
+        timestamp='2024-01-01T00:00:00', symbol='KRW-BTC', strategy='s1',
+        side='BUY', price=100.0 + i, confidence=0.5,
+    )
+
+
+def _server_with_events(count, capacity=None):
+    server = SimulationWebSocketServer()
+    if capacity is not None:
+        server.global_events = EventRingBuffer(capacity)
+    for i in range(count):
+        symbol = 'KRW-BTC' if i % 2 == 0 else 'KRW-ETH'
+        server._save_to_event_history(
+            f'e{i}', EventType.SIGNAL_CREATED, {'symbol': symbol, 'n': i}, symbol=symbol,
+        )
+    return server
+
+
+class TestEventRingBuffer:
+    """EventRingBuffer 테스트"""
+
+    def test_wraparound_keeps_latest_events(self):
+        """용량 초과 시 오래된 이벤트 만료, 순서 유지"""
+        ring = EventRingBuffer(4)
+        for i in range(10):
+            ring.append(f'e{i}', 'signal_created', f'payload-{i}')
+
+        assert len(ring) == 4
+        assert [entry.event_id for entry in ring.entries()] == ['e6', 'e7', 'e8', 'e9']
+        assert ring.latest().event_id == 'e9'
+        assert not ring.contains('e5')
+        assert ring.entries_after('e5') is None
+
+    def test_entries_after_is_slice(self):
+        """기준 이벤트 이후 구간 (링 경계를 넘는 경우 포함)"""
+        ring = EventRingBuffer(5)
+        for i in range(7):
+            ring.append(f'e{i}', 'signal_created', f'payload-{i}')
+
+        assert [entry.payload for entry in ring.entries_after('e3')] == [
+            'payload-4', 'payload-5', 'payload-6',
+        ]
+        assert ring.entries_after('e6') == []
+
+
+class TestHistorySync:
+    """재연결 동기화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sync_resends_stored_payloads_after_last_event(self):
+        """last_event_id 이후 이벤트를 저장된 JSON 그대로 재전송 (심볼 필터)"""
+        server = _server_with_events(10)
+        websocket = FakeWebSocket()
+
+        await server._resend_history_events(websocket, 'c1', 'e5', ['KRW-BTC'])
+
+        replayed = [json.loads(message) for message in websocket.sent[:-1]]
+        assert [event['event_id'] for event in replayed] == ['e6', 'e8']
+        assert websocket.sent[0] == server.global_events.entries_after('e5')[0].payload
+
+        complete = json.loads(websocket.sent[-1])
+        assert complete['data']['type'] == 'sync_complete'
+        assert complete['data']['resent_count'] == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_falls_back_to_full_history(self):
+        """만료된 last_event_id는 보관 중인 전체 히스토리 재전송"""
+        server = _server_with_events(10, capacity=3)
+        websocket = FakeWebSocket()
+
+        await server._resend_history_events(websocket, 'c1', 'e0', [])
+
+        replayed = [json.loads(message) for message in websocket.sent[:3]]
+        assert [event['event_id'] for event in replayed] == ['e7', 'e8', 'e9']
+        notices = [json.loads(message)['data']['type'] for message in websocket.sent[3:]]
+        assert notices == ['sync_fallback', 'sync_complete']
+
+    def test_symbol_history_is_bounded(self):
+        """심볼별 히스토리는 MAX_EVENTS_PER_SYMBOL개까지만 보존"""
+        server = SimulationWebSocketServer()
+        server.MAX_EVENTS_PER_SYMBOL = 3
+        for i in range(5):
+            server._save_to_event_history(
+                f'e{i}', EventType.POSITION_UPDATED, {'symbol': 'KRW-BTC'}, symbol='KRW-BTC',
+            )
+
+        assert [entry.event_id for entry in server.event_history['KRW-BTC']] == ['e2', 'e3', 'e4']
+
+
+class TestBroadcast:
+    """1회 직렬화 브로드캐스트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_serialized_once_and_filtered_by_subscription(self):
+        """구독 클라이언트는 같은 JSON 문자열을 받고, 히스토리에는 1건만 저장"""
+        server = SimulationWebSocketServer()
+        btc_a, btc_b, eth = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        _add_client(server, 'a', btc_a, ['KRW-BTC'])
+        _add_client(server, 'b', btc_b, ['KRW-BTC'])
+        _add_client(server, 'c', eth, ['KRW-ETH'])
+
+        await server.broadcast_signal(_signal(), symbol='KRW-BTC')
+        await asyncio.sleep(0.01)
+
+        assert len(btc_a.sent) == 1 and btc_a.sent[0] is btc_b.sent[0]
+        assert eth.sent == []
+        assert len(server.global_events) == 1
+
+        event_id = json.loads(btc_a.sent[0])['event_id']
+        metrics = server.get_client_metrics()
+        assert metrics['a']['last_event_id'] == event_id
+        assert metrics['a']['sent'] == 1
+        assert metrics['c']['sent'] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """느린 클라이언트는 큐가 차면 오래된 이벤트를 버리고, 다른 클라이언트는 계속 수신"""
+        server = SimulationWebSocketServer()
+        server.SEND_QUEUE_SIZE = 3
+        fast, slow = FakeWebSocket(), SlowWebSocket()
+        _add_client(server, 'fast', fast)
+        _add_client(server, 'slow', slow)
+
+        metrics = PerformanceMetrics(
+            timestamp='t', total_pnl=0.0, total_pnl_pct=0.0, win_rate=0.0,
+            max_drawdown=0.0, total_trades=0, win_count=0, lose_count=0,
+        )
+        for _ in range(10):
+            await server.broadcast_performance(metrics)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert len(fast.sent) == 10
+        assert server.get_client_metrics()['slow']['queue_depth'] == 3
+        # 전송 중인 1건 + 큐 3건을 제외한 6건 폐기
+        assert server.get_client_metrics()['slow']['dropped'] == 6
+
+        slow.release.set()
+        await asyncio.sleep(0.01)
+        assert len(slow.sent) == 4
+        assert json.loads(slow.sent[-1])['event_id'] == json.loads(fast.sent[-1])['event_id']
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy(self):
+        """disconnect 정책에서는 큐가 가득 찬 클라이언트 연결 종료"""
+        server = SimulationWebSocketServer()
+        server.SEND_QUEUE_SIZE = 1
+        server.SLOW_CLIENT_POLICY = 'disconnect'
+        slow = SlowWebSocket()
+        _add_client(server, 'slow', slow)
+
+        for i in range(3):
+            await server.broadcast_signal(_signal(i))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert 'slow' not in server.clients
+        assert slow.closed
@@ -0,0 +1,119 @@
+"""
+구체화된 지표 저장소 / 지표 구체화 작업 단위 테스트
+
+원본 파일이 바뀐 심볼만 재계산, 버전 증가, 수집 작업 연결,
+조건 검색이 원본 캔들 대신 저장소를 읽는지 검증합니다.
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.jobs.data_ingestion import batch_fetch_candles_job
+from backend.app.jobs.indicator_materialization import materialize_indicators_job
+from backend.app.services.indicator_store import IndicatorStore
+from backend.app.services.screener_engine import indicator_row
+from backend.app.services.screener_service import ScreenerService
+
+
+def _write_candles(root, data_symbol, closes):
+    """DATA_ROOT/{symbol}/1D/2024.parquet 작성"""
+    path = root / data_symbol / '1D'
+    path.mkdir(parents=True, exist_ok=True)
+    closes = np.asarray(closes, dtype=float)
+    pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=len(closes), freq='D'),
+        'open': closes, 'high': closes, 'low': closes, 'close': closes,
+        'volume': np.full(len(closes), 1000.0),
+    }).to_parquet(path / '2024.parquet')
+    return path / '2024.parquet'
+
+
+def _bump_mtime(path, seconds=10):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + seconds))
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    _write_candles(tmp_path, 'BTC_KRW', np.linspace(100, 200, 70))
+    _write_candles(tmp_path, 'ETH_KRW', np.linspace(200, 100, 70))
+    return tmp_path
+
+
+class TestMaterializeIndicatorsJob:
+    """materialize_indicators_job 테스트"""
+
+    def test_only_changed_symbols_are_recomputed(self, data_root):
+        symbols = ['KRW-BTC', 'KRW-ETH', 'KRW-NODATA']
+
+        first = materialize_indicators_job(symbols, data_root=str(data_root))
+        assert first['updated'] == ['KRW-BTC', 'KRW-ETH']
+        assert first['version'] == 1
+
+        # 바뀐 파일 없음 → 재계산 없음, 버전 유지
+        second = materialize_indicators_job(symbols, data_root=str(data_root))
+        assert second['updated'] == []
+        assert second['version'] == 1
+
+        path = _write_candles(data_root, 'ETH_KRW', np.linspace(100, 300, 70))
+        _bump_mtime(path)
+        third = materialize_indicators_job(symbols, data_root=str(data_root))
+        assert third['updated'] == ['KRW-ETH']
+        assert third['version'] == 2
+
+        store = IndicatorStore(str(data_root))
+        frame = store.read()
+        assert list(frame.index) == ['KRW-BTC', 'KRW-ETH']
+        assert frame.at['KRW-ETH', 'ma_alignment'] == 'golden_cross'
+        assert store.stale_symbols(symbols) == []
+
+    def test_store_panel_matches_direct_rows(self, data_root):
+        """저장소 패널 값이 원본으로 직접 계산한 값과 동일"""
+        materialize_indicators_job(['KRW-BTC'], data_root=str(data_root))
+        panel = IndicatorStore(str(data_root)).load_panel()
+
+        df = pd.read_parquet(data_root / 'BTC_KRW' / '1D' / '2024.parquet')
+        expected = indicator_row(df)
+        row = panel.row('KRW-BTC')
+        for name, value in expected.items():
+            assert row[name] == (value if isinstance(value, str) else pytest.approx(value))
+
+    def test_chained_after_batch_fetch(self, data_root):
+        """배치 수집 후 성공한 1D 심볼만 구체화"""
+        async def fake_fetch(symbols, timeframes, days=30, overwrite=False):
+            return [
+                {'success': symbol != 'KRW-ETH', 'symbol': symbol, 'timeframe': timeframe}
+                for symbol in symbols for timeframe in timeframes
+            ]
+
+        with patch('backend.app.jobs.data_ingestion.fetch_candle_streams', side_effect=fake_fetch), \
+                patch.dict(os.environ, {'DATA_ROOT': str(data_root)}):
+            result = batch_fetch_candles_job(['KRW-BTC', 'KRW-ETH'], ['1H', '1D'])
+
+        assert result['indicators']['updated'] == ['KRW-BTC']
+        assert list(IndicatorStore(str(data_root)).read().index) == ['KRW-BTC']
+
+
+class TestScreenerReadsStore:
+    """조건 검색의 저장소 사용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_screener_uses_materialized_values(self, data_root):
+        """저장소가 심볼을 모두 포함하면 원본 캔들을 읽지 않음"""
+        materialize_indicators_job(['KRW-BTC', 'KRW-ETH'], data_root=str(data_root))
+        service = ScreenerService()
+        service.store = IndicatorStore(str(data_root))
+
+        with patch('backend.app.services.screener_service.redis_client', None), \
+                patch('backend.app.services.screener_service.load_symbol_data') as mock_load:
+            matched = await service.filter_symbols(
+                [{'type': 'ma_alignment', 'operator': '==', 'value': 'golden_cross'}],
+                symbols=['KRW-BTC', 'KRW-ETH', 'KRW-NODATA'],
+            )
+
+        assert matched == ['KRW-BTC']
+        mock_load.assert_not_called()
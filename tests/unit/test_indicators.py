@@ -342,3 +342,70 @@ class TestErrorHandling:
         """None DataFrame"""
         with pytest.raises(ValueError):
             calculator.calculate_change_rate(None, '1D')
+
+
+class TestSinglePassCalculation:
+    """단일 패스 calculate_all / calculate_batch 테스트"""
+
+    @pytest.fixture
+    def calculator(self):
+        return IndicatorCalculator()
+
+    @staticmethod
+    def _random_df(length, seed):
+        rng = np.random.default_rng(seed)
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.02, length))
+        return pd.DataFrame({'close': close, 'volume': rng.uniform(100, 1000, length)})
+
+    @staticmethod
+    def _per_method(calculator, df):
+        """개별 메서드로 계산한 결과"""
+        result = {}
+        for period in ('1D', '1W', '1M'):
+            suffix = period.lower()
+            result[f'change_rate_{suffix}'] = calculator.calculate_change_rate(df, period)
+            result[f'volume_{suffix}'] = calculator.calculate_volume(df, period)
+            result[f'trade_amount_{suffix}'] = calculator.calculate_trade_amount(df, period)
+        result['ma_divergence_20'] = calculator.calculate_ma_divergence(df, 20)
+        result['ma_divergence_60'] = calculator.calculate_ma_divergence(df, 60)
+        result['ma_alignment'] = calculator.check_ma_alignment(df, [5, 20, 60])
+        return result
+
+    @pytest.mark.parametrize('length', [1, 2, 6, 7, 19, 20, 59, 60, 61, 300])
+    def test_matches_individual_methods(self, calculator, length):
+        """데이터 길이와 관계없이 개별 메서드 결과와 동일"""
+        df = self._random_df(length, seed=length)
+        result = calculator.calculate_all(df)
+        expected = self._per_method(calculator, df)
+
+        assert result.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, str):
+                assert result[key] == value
+            else:
+                assert result[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+
+    def test_batch_matches_calculate_all(self, calculator):
+        """2차원 배치 결과가 심볼별 calculate_all과 동일"""
+        from backend.app.indicators.calculator import stack_tails
+
+        frames = [self._random_df(length, seed=i) for i, length in enumerate([3, 30, 60, 500])]
+        batch = calculator.calculate_batch(*stack_tails(frames))
+
+        for i, df in enumerate(frames):
+            single = calculator.calculate_all(df)
+            for key, value in single.items():
+                assert batch[key][i] == value, key
+        assert np.isnan(batch['ma_60'][1]) and not np.isnan(batch['ma_60'][2])
+
+    def test_only_tail_is_used(self, calculator):
+        """TAIL_WINDOW 이전 히스토리는 결과에 영향 없음"""
+        df = self._random_df(200, seed=1)
+        shuffled_head = df.copy()
+        shuffled_head.loc[:100, 'close'] = 1.0
+
+        assert calculator.calculate_all(df) == calculator.calculate_all(shuffled_head)
+
+    def test_missing_volume_raises(self, calculator):
+        with pytest.raises(ValueError):
+            calculator.calculate_all(pd.DataFrame({'close': [1.0, 2.0]}))
@@ -0,0 +1,138 @@
+"""
+조건 검색 엔진 (IndicatorPanel) 단위 테스트
+
+심볼 전체 벡터 평가가 기존 심볼 단위 평가와 같은 결과를 내는지,
+패널 재사용과 평가 속도를 검증합니다.
+"""
+
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.screener_engine import IndicatorPanel, indicator_row
+from backend.app.services.screener_service import ScreenerService
+
+CONDITION_SETS = [
+    [{'type': 'change_rate', 'operator': '>', 'value': 0, 'period': '1D'}],
+    [{'type': 'change_rate', 'operator': '<=', 'value': -0.01, 'period': '1W'}],
+    [{'type': 'volume', 'operator': '>=', 'value': 20000, 'period': '1M'}],
+    [{'type': 'trade_amount', 'operator': '<', 'value': 1e6, 'period': '1D'}],
+    [{'type': 'ma_divergence', 'operator': '>', 'value': 1.0}],
+    [{'type': 'ma_alignment', 'operator': '==', 'value': 'golden_cross'}],
+    [{'type': 'ma_alignment', 'operator': '==', 'value': 'dead_cross', 'ma_periods': [5, 20]}],
+    [
+        {'type': 'change_rate', 'operator': '>', 'value': 0, 'period': '1D'},
+        {'type': 'volume', 'operator': '>', 'value': 1000, 'period': '1D'},
+    ],
+]
+
+
+def _random_frames(count, seed=7):
+    """심볼별 랜덤 OHLCV (일부는 짧은 히스토리)"""
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for i in range(count):
+        length = 3 if i % 10 == 0 else 80
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.03, length))
+        volume = rng.uniform(500, 1500, length)
+        frames[f'KRW-C{i}'] = pd.DataFrame({'close': close, 'volume': volume})
+    return frames
+
+
+class TestIndicatorPanel:
+    """IndicatorPanel 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('logic', ['AND', 'OR'])
+    async def test_matches_per_symbol_evaluation(self, logic):
+        """벡터 평가 결과가 심볼 단위 평가와 동일"""
+        frames = _random_frames(40)
+        panel = IndicatorPanel.from_rows({s: indicator_row(df) for s, df in frames.items()})
+        service = ScreenerService()
+
+        for conditions in CONDITION_SETS:
+            expected = [
+                symbol for symbol, df in frames.items()
+                if await service._evaluate_symbol_with_cached_data(symbol, df, conditions, logic)
+            ]
+            assert panel.screen(conditions, logic) == expected, conditions
+
+    def test_missing_symbol_never_matches(self):
+        """지표가 없는 심볼은 어떤 조건에도 매칭되지 않음"""
+        frames = _random_frames(2)
+        panel = IndicatorPanel.from_rows({
+            'KRW-C0': indicator_row(frames['KRW-C1']),
+            'KRW-NONE': None,
+        })
+
+        assert panel.screen([{'type': 'volume', 'operator': '>=', 'value': 0}]) == ['KRW-C0']
+        assert panel.screen(
+            [{'type': 'ma_alignment', 'operator': '==', 'value': 'mixed'}], 'OR',
+            symbols=['KRW-NONE', 'KRW-UNKNOWN'],
+        ) == []
+
+    def test_screen_200_symbols(self):
+        """200개 심볼 조건 5개 평가는 밀리초 단위"""
+        frames = _random_frames(200)
+        panel = IndicatorPanel.from_rows({s: indicator_row(df) for s, df in frames.items()})
+        conditions = [c for conditions in CONDITION_SETS[:5] for c in conditions]
+
+        started = time.perf_counter()
+        for _ in range(100):
+            panel.screen(conditions, 'OR')
+        elapsed = (time.perf_counter() - started) / 100
+
+        assert elapsed < 0.005
+
+
+class TestPanelReuse:
+    """ScreenerService 패널 재사용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_panel_reused_across_conditions(self):
+        """조건이 바뀌어도 패널 만료 전에는 데이터를 다시 로드하지 않음"""
+        frames = _random_frames(5)
+        service = ScreenerService()
+        symbols = list(frames)
+
+        with patch('backend.app.services.screener_service.redis_client', None), \
+                patch('backend.app.services.screener_service.load_symbol_data',
+                      side_effect=lambda symbol: frames[symbol]) as mock_load:
+            for conditions in CONDITION_SETS:
+                await service.filter_symbols(conditions, symbols=symbols, logic='AND')
+
+            assert mock_load.call_count == len(symbols)
+
+            # 패널에 없는 심볼이 요청되면 재계산
+            frames['KRW-NEW'] = frames['KRW-C1']
+            await service.filter_symbols(CONDITION_SETS[0], symbols=[*symbols, 'KRW-NEW'])
+            assert mock_load.call_count == 2 * len(symbols) + 1
+
+    @pytest.mark.asyncio
+    async def test_unsupported_ma_periods_fall_back_to_per_symbol(self):
+        """패널에 없는 MA 기간 조합은 심볼별 계산 결과로 매칭 (빈 결과 아님)"""
+        frames = _random_frames(20)
+        service = ScreenerService()
+        symbols = list(frames)
+
+        for value in ('golden_cross', 'dead_cross'):
+            conditions = [{'type': 'ma_alignment', 'operator': '==', 'value': value, 'ma_periods': [10, 50]}]
+            assert not IndicatorPanel.supports(conditions[0])
+
+            expected = [
+                symbol for symbol, df in frames.items()
+                if await service._evaluate_symbol_with_cached_data(symbol, df, conditions, 'AND')
+            ]
+            assert expected
+
+            with patch('backend.app.services.screener_service.redis_client', None), \
+                    patch('backend.app.services.screener_service.load_symbol_data',
+                          side_effect=lambda symbol: frames[symbol]):
+                assert await service.filter_symbols(conditions, symbols=symbols) == expected
+
+        # 패널은 만들지 않음
+        assert service._panel is None
+
@@ -310,12 +310,8 @@ class TestResultManagerAtomicWrite:
             # 결과 저장
             ResultManager.save_result(tmpdir, "test-index-001", result_data)
 
-            # 인덱스 파일 확인
-            index_file = os.path.join(tmpdir, "results", "index.json")
-            assert os.path.exists(index_file)
-
-            with open(index_file, "r", encoding="utf-8") as f:
-                index_data = json.load(f)
+            # 인덱스 확인 (index.db)
+            index_data = ResultManager.get_history(tmpdir)
 
             assert "items" in index_data
             assert len(index_data["items"]) > 0